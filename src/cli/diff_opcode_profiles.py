@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+"""
+Compare two opcode profile summaries produced by `fill --opcode-profile`.
+
+Tests with the same name are compared on their opcode counts, gas per opcode,
+gas used and, optionally, t8n wall time, without loading any fixture file.
+"""
+
+from pathlib import Path
+from typing import Dict, List
+
+import click
+
+from pytest_plugins.filler.opcode_profile import (
+    GAS_USED_COLUMN,
+    OPCODE_COUNT_COLUMN_PREFIX,
+    OPCODE_GAS_COLUMN_PREFIX,
+    T8N_TIME_COLUMN,
+    OpcodeProfileRow,
+    opcode_columns,
+    read_opcode_profile_summary,
+)
+
+
+def rename_tests(
+    rows: Dict[str, OpcodeProfileRow], remove_from_test_names: List[str]
+) -> Dict[str, OpcodeProfileRow]:
+    """Remove the given strings from the test names of the summary rows."""
+    renamed_rows = {}
+    for test_name, row in rows.items():
+        for s in remove_from_test_names:
+            test_name = test_name.replace(s, "")
+        renamed_rows[test_name] = row
+    return renamed_rows
+
+
+def compare_opcode_columns(
+    base_row: OpcodeProfileRow, patch_row: OpcodeProfileRow, prefix: str
+) -> Dict[str, int]:
+    """
+    Compare the opcode values of two summary rows for the given column prefix
+    and return the differences.
+    """
+    base_values = opcode_columns(base_row, prefix)
+    patch_values = opcode_columns(patch_row, prefix)
+    differences = {}
+    for opcode in base_values.keys() | patch_values.keys():
+        diff = patch_values.get(opcode, 0) - base_values.get(opcode, 0)
+        if diff != 0:
+            differences[opcode] = diff
+    return differences
+
+
+def format_difference(diff: int) -> str:
+    """Format an integer difference with its sign."""
+    return f"+{diff}" if diff > 0 else str(diff)
+
+
+@click.command()
+@click.argument("base", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.argument("patch", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option(
+    "--show-common",
+    is_flag=True,
+    help="Print tests that contain identical opcode profiles.",
+)
+@click.option(
+    "--show-missing",
+    is_flag=True,
+    help="Print tests only found in one of the summaries.",
+)
+@click.option(
+    "--show-time",
+    is_flag=True,
+    help="Print the change in t8n wall time of every common test.",
+)
+@click.option(
+    "--remove-from-test-names",
+    "-r",
+    multiple=True,
+    help="String to be removed from the test name, in case the test names have changed, "
+    "in order to make the comparison easier. "
+    "Can be specified multiple times.",
+)
+def main(
+    base: Path,
+    patch: Path,
+    show_common: bool,
+    show_missing: bool,
+    show_time: bool,
+    remove_from_test_names: List[str],
+) -> None:
+    """Compare two opcode profile summaries and print their differences."""
+    base_rows = rename_tests(read_opcode_profile_summary(base), remove_from_test_names)
+    patch_rows = rename_tests(read_opcode_profile_summary(patch), remove_from_test_names)
+
+    common_names = base_rows.keys() & patch_rows.keys()
+    only_in_base = base_rows.keys() - patch_rows.keys()
+    only_in_patch = patch_rows.keys() - base_rows.keys()
+
+    print("Summary:")
+    print(f"  Common tests: {len(common_names)}")
+    print(f"  Only in {base.name}: {len(only_in_base)}")
+    print(f"  Only in {patch.name}: {len(only_in_patch)}")
+
+    if show_missing:
+        for file_name, names in [(base.name, only_in_base), (patch.name, only_in_patch)]:
+            if names:
+                print(f"\nTests only in {file_name}:")
+                for name in sorted(names):
+                    print(f"  {name}")
+
+    differences_found = False
+    common_with_same_profile = 0
+    for test_name in sorted(common_names):
+        base_row = base_rows[test_name]
+        patch_row = patch_rows[test_name]
+        lines = []
+        gas_used_diff = int(patch_row[GAS_USED_COLUMN]) - int(base_row[GAS_USED_COLUMN])
+        if gas_used_diff != 0:
+            lines.append(f"  {format_difference(gas_used_diff)} gas used")
+        for prefix, unit in [
+            (OPCODE_COUNT_COLUMN_PREFIX, ""),
+            (OPCODE_GAS_COLUMN_PREFIX, " gas"),
+        ]:
+            differences = compare_opcode_columns(base_row, patch_row, prefix)
+            for opcode, diff in sorted(differences.items()):
+                lines.append(f"  {format_difference(diff)} {opcode}{unit}")
+
+        if lines:
+            differences_found = True
+        elif show_common:
+            common_with_same_profile += 1
+        if show_time:
+            base_time = float(base_row[T8N_TIME_COLUMN])
+            patch_time = float(patch_row[T8N_TIME_COLUMN])
+            lines.append(f"  t8n time: {base_time:.3f}s -> {patch_time:.3f}s")
+
+        if lines:
+            print(f"\n{test_name}:")
+            print("\n".join(lines))
+        elif show_common:
+            print(f"\n{test_name}: No differences")
+
+    if not differences_found:
+        print("\nNo differences found in opcode profiles between common tests!")
+    elif show_common:
+        print(f"\n{common_with_same_profile} tests have identical opcode profiles")
+
+
+if __name__ == "__main__":
+    main()
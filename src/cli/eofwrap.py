@@ -9,13 +9,25 @@ Example Usage:
     ```console
     eofwrap <input_dir/file_path> <output_dir_path>
     ```
+
+2. Wrap tests using 8 worker processes, each with its own t8n instance
+
+    ```console
+    eofwrap <input_dir/file_path> <output_dir_path> -n 8
+    ```
+
+The results of each run are cached in the output directory, keyed by the
+content hash of the input files and of the wrapped EOF containers, so that
+re-running over a grown input directory only wraps the new or changed files.
 """
 
+import hashlib
 import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, cast, no_type_check
+from typing import Any, Dict, List, Tuple, cast, no_type_check
 
 import click
 
@@ -37,47 +49,206 @@ from ethereum_test_vm import Bytecode
 
 from .evm_bytes import OpcodeWithOperands, process_evm_bytes
 
+EOFWRAP_CACHE_FILE_NAME = ".eofwrap_cache.json"
+# Bump when a change of the wrapping logic invalidates the cached results
+EOFWRAP_CACHE_VERSION = 1
+
 
 @click.command()
 @click.argument("input_path", type=click.Path(exists=True, dir_okay=True, file_okay=True))
 @click.argument("output_dir", type=click.Path(dir_okay=True, file_okay=False))
 @click.option("--traces", is_flag=True, type=bool)
-def eof_wrap(input_path: str, output_dir: str, traces: bool) -> None:
+@click.option(
+    "-n",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of processes wrapping the input files, each with its own t8n instance.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    type=bool,
+    help=(
+        f"Wrap all the input files, ignoring the results of previous runs cached in "
+        f"`{EOFWRAP_CACHE_FILE_NAME}` in the output directory."
+    ),
+)
+def eof_wrap(input_path: str, output_dir: str, traces: bool, workers: int, no_cache: bool) -> None:
     """
     Wrap JSON blockchain test file(s) found at `input_path`, output to
     `output_dir`.
     """
-    eof_wrapper = EofWrapper()
-
     try:
-        EvmOneTransitionTool()
+        t8n_version = EvmOneTransitionTool().version()
     except CLINotFoundInPathError:
         print(f"Error: {EvmOneTransitionTool.default_binary} must be in the PATH.")
         sys.exit(1)
     except Exception as e:
         raise Exception(f"Unexpected exception: {e}") from e
 
-    if os.path.isfile(input_path):
-        file = os.path.basename(input_path)
-        out_file = "eof_wrapped_" + file
-        out_path = os.path.join(output_dir, out_file)
-
-        eof_wrapper.wrap_file(input_path, out_path, traces)
-    else:
-        for subdir, _, files in os.walk(input_path):
-            for file in files:
-                rel_dir = Path(subdir).relative_to(input_path)
-                out_file = "eof_wrapped_" + file
-                out_path = os.path.join(output_dir, rel_dir, out_file)
-                in_path = os.path.join(subdir, file)
+    cache_path = Path(output_dir) / EOFWRAP_CACHE_FILE_NAME
+    cache = EofWrapCache(t8n_version) if no_cache else EofWrapCache.load(cache_path, t8n_version)
 
-                eof_wrapper.wrap_file(in_path, out_path, traces)
+    eof_wrapper = EofWrapper()
+    cached_file_count = 0
+    pending_files: List[Tuple[str, str, str, str]] = []
+    for in_path, out_path in input_files(input_path, output_dir):
+        key = os.path.relpath(out_path, output_dir)
+        file_hash = hashlib.sha256(Path(in_path).read_bytes()).hexdigest()
+        cached_file = cache.files.get(key)
+        if (
+            cached_file is not None
+            and cached_file["hash"] == file_hash
+            and (
+                not cached_file["metrics"][EofWrapper.FILES_GENERATED] or os.path.isfile(out_path)
+            )
+        ):
+            eof_wrapper.merge(cached_file["metrics"], cached_file["unique_eof"])
+            cached_file_count += 1
+            continue
+        pending_files.append((key, file_hash, in_path, out_path))
+
+    def add_result(key: str, file_hash: str, result: WrappedFileResult) -> None:
+        metrics, unique_eof, validations = result
+        eof_wrapper.merge(metrics, unique_eof)
+        cache.files[key] = {"hash": file_hash, "metrics": metrics, "unique_eof": unique_eof}
+        cache.validations.update(validations)
 
+    try:
+        if workers == 1:
+            init_worker(traces, cache.validations)
+            for key, file_hash, in_path, out_path in pending_files:
+                add_result(key, file_hash, wrap_file_in_worker(in_path, out_path, traces))
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=init_worker,
+                initargs=(traces, cache.validations),
+            ) as executor:
+                futures = {
+                    executor.submit(wrap_file_in_worker, in_path, out_path, traces): (
+                        key,
+                        file_hash,
+                    )
+                    for key, file_hash, in_path, out_path in pending_files
+                }
+                for future in as_completed(futures):
+                    add_result(*futures[future], future.result())
+    finally:
+        cache.save(cache_path)
+
+    print(
+        f"Wrapped {len(pending_files)} file(s), reused the cached results of "
+        f"{cached_file_count} unchanged file(s)."
+    )
     os.makedirs(output_dir, exist_ok=True)
     with open(os.path.join(output_dir, "metrics.json"), "w") as f:
         json.dump(eof_wrapper.metrics, f, indent=4)
 
 
+def input_files(input_path: str, output_dir: str) -> List[Tuple[str, str]]:
+    """
+    Return the path of each JSON blockchain test file found at `input_path`
+    and the path of its wrapped output file in `output_dir`.
+    """
+    if os.path.isfile(input_path):
+        file = os.path.basename(input_path)
+        return [(input_path, os.path.join(output_dir, "eof_wrapped_" + file))]
+    files = []
+    for subdir, _, file_names in os.walk(input_path):
+        rel_dir = Path(subdir).relative_to(input_path)
+        for file in file_names:
+            out_path = os.path.join(output_dir, rel_dir, "eof_wrapped_" + file)
+            files.append((os.path.join(subdir, file), out_path))
+    return files
+
+
+class EofWrapCache:
+    """
+    Results of previous runs over the same output directory: the metrics of
+    each wrapped file, keyed by its output path and valid while the content
+    hash of its input file is unchanged, and the EOF validation result of
+    each wrapped container, keyed by the content hash of the container.
+
+    The cache is discarded when the evmone version or the wrapping logic
+    changes.
+    """
+
+    t8n_version: str
+    files: Dict[str, Dict[str, Any]]
+    validations: Dict[str, str]
+
+    def __init__(self, t8n_version: str) -> None:
+        """Initialize an empty cache."""
+        self.t8n_version = t8n_version
+        self.files = {}
+        self.validations = {}
+
+    @classmethod
+    def load(cls, path: Path, t8n_version: str) -> "EofWrapCache":
+        """
+        Load the cache from a file, or return an empty cache if the file
+        doesn't exist or was written by another version.
+        """
+        cache = cls(t8n_version)
+        if not path.is_file():
+            return cache
+        try:
+            contents = json.loads(path.read_text())
+        except json.JSONDecodeError:
+            return cache
+        if (
+            contents.get("version") == EOFWRAP_CACHE_VERSION
+            and contents.get("t8n_version") == t8n_version
+        ):
+            cache.files = contents["files"]
+            cache.validations = contents["validations"]
+        return cache
+
+    def save(self, path: Path) -> None:
+        """Write the cache to a file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_text(
+            json.dumps(
+                {
+                    "version": EOFWRAP_CACHE_VERSION,
+                    "t8n_version": self.t8n_version,
+                    "files": self.files,
+                    "validations": self.validations,
+                }
+            )
+        )
+        temp_path.replace(path)
+
+
+# Metrics, unique EOF codes and new container validation results of a file
+WrappedFileResult = Tuple[Dict[str, Any], List[str], Dict[str, str]]
+
+# t8n instance and container validation results of the current process
+_worker_state: Tuple[EvmOneTransitionTool, Dict[str, str]] | None = None
+
+
+def init_worker(traces: bool, validations: Dict[str, str]) -> None:
+    """
+    Initialize the t8n instance and validation results shared by all the
+    files wrapped by the current process.
+    """
+    global _worker_state
+    _worker_state = (EvmOneTransitionTool(trace=traces), dict(validations))
+
+
+def wrap_file_in_worker(in_path: str, out_path: str, traces: bool) -> WrappedFileResult:
+    """Wrap a file using the t8n instance of the current process."""
+    assert _worker_state is not None, "worker not initialized"
+    t8n, validations = _worker_state
+    eof_wrapper = EofWrapper(t8n=t8n, validations=validations)
+    eof_wrapper.wrap_file(in_path, out_path, traces)
+    return eof_wrapper.metrics, sorted(eof_wrapper.unique_eof), eof_wrapper.new_validations
+
+
 class BlockchainFixtures(EthereumTestRootModel):
     """
     Class needed due to some of the `ethereum/tests` fixtures not having the
@@ -115,10 +286,23 @@ class EofWrapper:
     # Breakdown of runtime test failures summing up to `fixtures_cant_generate`
     GENERATION_ERRORS = "generation_errors"
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        t8n: EvmOneTransitionTool | None = None,
+        validations: Dict[str, str] | None = None,
+    ) -> None:
         """
         Initialize EofWrapper with metrics tracking and unique EOF set.
+
+        The t8n instance, created on first use if not given, is reused for
+        all the wrapped fixtures. The EOF validation results, keyed by the
+        content hash of the container, are shared with the given dictionary
+        and the ones obtained by this wrapper are also kept in
+        `new_validations`.
         """
+        self.t8n = t8n
+        self.validations = {} if validations is None else validations
+        self.new_validations: Dict[str, str] = {}
         self.metrics = {
             self.FILES_GENERATED: 0,
             self.FILES_SKIPPED: 0,
@@ -135,6 +319,20 @@ class EofWrapper:
         }
         self.unique_eof: set[str] = set()
 
+    def merge(self, metrics: Dict[str, Any], unique_eof: List[str]) -> None:
+        """Merge the metrics and unique EOF codes of another wrapper."""
+        for key, value in metrics.items():
+            if key == self.UNIQUE_ACCOUNTS_WRAPPED:
+                continue
+            if isinstance(value, dict):
+                counters = cast(dict[Any, Any], self.metrics[key])
+                for counter_key, count in value.items():
+                    counters[counter_key] = counters.get(counter_key, 0) + count
+            else:
+                self.metrics[key] = cast(int, self.metrics[key]) + value
+        self.unique_eof.update(unique_eof)
+        self.metrics[self.UNIQUE_ACCOUNTS_WRAPPED] = len(self.unique_eof)
+
     file_skip_list = [
         "Pyspecs",
         # EXTCODE* opcodes return different results for EOF targets and that is
@@ -284,7 +482,9 @@ class EofWrapper:
 
         pre = fixture.pre
 
-        t8n = EvmOneTransitionTool(trace=traces)
+        if self.t8n is None:
+            self.t8n = EvmOneTransitionTool(trace=traces)
+        t8n = self.t8n
 
         test = BlockchainTest(
             genesis_environment=env,
@@ -348,10 +548,13 @@ class EofWrapper:
         return result
 
     def _validate_eof(self, container: Container, metrics: bool = True) -> bool:
-        eof_parse = EOFParse()
-
-        result = eof_parse.run(input_value=to_hex(container))
-        actual_message = result.stdout.strip()
+        container_hash = hashlib.sha256(bytes(container)).hexdigest()
+        actual_message = self.validations.get(container_hash)
+        if actual_message is None:
+            result = EOFParse().run(input_value=to_hex(container))
+            actual_message = result.stdout.strip()
+            self.validations[container_hash] = actual_message
+            self.new_validations[container_hash] = actual_message
         if "OK" not in actual_message:
             if metrics:
                 _inc_counter(
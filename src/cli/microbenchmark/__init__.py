@@ -0,0 +1,28 @@
+"""
+Microbenchmarks of the framework's own hot paths.
+
+The benchmarks use synthetic inputs sized like the ones of real fill
+workloads and run offline, without transition tool or client. Run them and
+compare the results against a stored baseline with the `microbenchmark`
+command.
+"""
+
+from .benchmarks import BENCHMARKS, Microbenchmark, microbenchmark
+from .runner import (
+    MicrobenchmarkComparison,
+    MicrobenchmarkResult,
+    MicrobenchmarkResults,
+    compare_results,
+    run_microbenchmark,
+)
+
+__all__ = (
+    "BENCHMARKS",
+    "Microbenchmark",
+    "MicrobenchmarkComparison",
+    "MicrobenchmarkResult",
+    "MicrobenchmarkResults",
+    "compare_results",
+    "microbenchmark",
+    "run_microbenchmark",
+)
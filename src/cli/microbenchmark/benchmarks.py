@@ -0,0 +1,231 @@
+"""
+Microbenchmark definitions.
+
+Each benchmark is a generator function that sets up its inputs, yields the
+function to time and cleans up once the benchmark is complete, like a pytest
+fixture. The timed function is called many times, so it must not depend on
+the state left by previous calls.
+"""
+
+import shutil
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Dict, Generator, List
+
+from ethereum_rlp import rlp
+from ethereum_types.bytes import Bytes
+from ethereum_types.numeric import Uint
+
+from ethereum_test_base_types import Account, TestPrivateKey
+from ethereum_test_fixtures import BaseFixture, FixtureCollector, StateFixture
+from ethereum_test_fixtures.collector import TestInfo
+from ethereum_test_fixtures.state import (
+    FixtureConfig,
+    FixtureEnvironment,
+    FixtureForkPost,
+    FixtureTransaction,
+)
+from ethereum_test_forks import Cancun
+from ethereum_test_types import Alloc, Transaction
+from ethereum_test_types.trie import bytes_to_nibble_list, keccak256, patricialize
+from ethereum_test_vm import Bytecode
+from ethereum_test_vm import Opcodes as Op
+
+# Sizes of the synthetic inputs, in the range of the ones of the tests filled
+# for the benchmark and static test suites
+TRIE_ENTRIES = 1_000
+BYTECODE_OPCODES = 1_000
+TRANSACTIONS = 100
+TRANSACTION_DATA_SIZE = 1_024
+ALLOC_ACCOUNTS = 500
+ALLOC_STORAGE_SLOTS = 10
+ALLOC_CODE_SIZE = 128
+FIXTURE_FILES = 10
+FIXTURES_PER_FILE = 10
+
+MicrobenchmarkFunction = Callable[[], Generator[Callable[[], Any], None, None]]
+
+
+@dataclass(frozen=True)
+class Microbenchmark:
+    """A registered microbenchmark."""
+
+    name: str
+    description: str
+    setup: Callable[[], ContextManager[Callable[[], Any]]]
+
+
+BENCHMARKS: Dict[str, Microbenchmark] = {}
+
+
+def microbenchmark(name: str) -> Callable[[MicrobenchmarkFunction], MicrobenchmarkFunction]:
+    """Register a microbenchmark under the given name."""
+
+    def decorator(func: MicrobenchmarkFunction) -> MicrobenchmarkFunction:
+        assert name not in BENCHMARKS, f"Duplicate microbenchmark name: {name}"
+        assert func.__doc__ is not None, f"Microbenchmark {name} has no description"
+        BENCHMARKS[name] = Microbenchmark(
+            name=name,
+            description=func.__doc__.strip().splitlines()[0],
+            setup=contextmanager(func),
+        )
+        return func
+
+    return decorator
+
+
+def synthetic_alloc(accounts: int = ALLOC_ACCOUNTS) -> Alloc:
+    """Return an allocation of contracts with code and storage."""
+    return Alloc(
+        {
+            0x1000 + i: Account(
+                nonce=1,
+                balance=10**18 + i,
+                code=bytes([i % 256]) * ALLOC_CODE_SIZE,
+                storage={
+                    slot: i * ALLOC_STORAGE_SLOTS + slot
+                    for slot in range(1, ALLOC_STORAGE_SLOTS + 1)
+                },
+            )
+            for i in range(accounts)
+        }
+    )
+
+
+def synthetic_transactions(count: int = TRANSACTIONS) -> List[Transaction]:
+    """Return unsigned transactions with calldata."""
+    return [
+        Transaction(
+            ty=2,
+            nonce=i,
+            to=0x1000 + i,
+            value=i,
+            gas_limit=1_000_000,
+            data=bytes([i % 256]) * TRANSACTION_DATA_SIZE,
+            secret_key=TestPrivateKey,
+        )
+        for i in range(count)
+    ]
+
+
+def synthetic_state_fixture(alloc: Alloc) -> StateFixture:
+    """Return a state test fixture with the given pre and post allocation."""
+    tx = synthetic_transactions(1)[0].with_signature_and_sender()
+    fixture = StateFixture(
+        env=FixtureEnvironment(),
+        pre=alloc,
+        transaction=FixtureTransaction.from_transaction(tx),
+        post={
+            Cancun: [
+                FixtureForkPost(
+                    state_root=alloc.state_root(),
+                    logs_hash=0,
+                    tx_bytes=tx.rlp(),
+                    state=alloc,
+                )
+            ]
+        },
+        config=FixtureConfig(),
+    )
+    fixture.fill_info(
+        "t8n-version",
+        "Synthetic state test fixture.",
+        fixture_source_url="https://github.com/ethereum/execution-spec-tests",
+        ref_spec=None,
+        _info_metadata={},
+    )
+    return fixture
+
+
+def reset_fixture_cache(fixture: BaseFixture) -> None:
+    """Drop the cached JSON representation and hash of a fixture."""
+    fixture.__dict__.pop("json_dict", None)
+    fixture.__dict__.pop("hash", None)
+
+
+@microbenchmark("trie_patricialize")
+def trie_patricialize() -> Generator[Callable[[], Any], None, None]:
+    """Build the merkle patricia trie nodes of a secured trie."""
+    obj = {
+        bytes_to_nibble_list(keccak256(Bytes(i.to_bytes(32, "big")))): rlp.encode(Uint(i))
+        for i in range(TRIE_ENTRIES)
+    }
+    yield lambda: patricialize(obj, Uint(0))
+
+
+@microbenchmark("bytecode_concatenation")
+def bytecode_concatenation() -> Generator[Callable[[], Any], None, None]:
+    """Concatenate opcodes one by one, as the code generators do."""
+    opcodes = [Op.SSTORE(i, Op.ADD(Op.CALLDATALOAD(i * 32), i)) for i in range(BYTECODE_OPCODES)]
+
+    def concatenate() -> bytes:
+        code = Bytecode()
+        for opcode in opcodes:
+            code += opcode
+        return bytes(code)
+
+    yield concatenate
+
+
+@microbenchmark("transaction_signing")
+def transaction_signing() -> Generator[Callable[[], Any], None, None]:
+    """Sign transactions and recover their sender."""
+    transactions = synthetic_transactions()
+    yield lambda: [tx.with_signature_and_sender() for tx in transactions]
+
+
+@microbenchmark("alloc_state_root")
+def alloc_state_root() -> Generator[Callable[[], Any], None, None]:
+    """Compute the state root of an allocation of contracts with storage."""
+    alloc = synthetic_alloc()
+    yield alloc.state_root
+
+
+@microbenchmark("fixture_model_dump")
+def fixture_model_dump() -> Generator[Callable[[], Any], None, None]:
+    """Serialize a state test fixture to its JSON representation."""
+    fixture = synthetic_state_fixture(synthetic_alloc())
+    yield lambda: fixture.model_dump(
+        mode="json", by_alias=True, exclude_none=True, exclude={"info"}
+    )
+
+
+@microbenchmark("fixture_collector_dump")
+def fixture_collector_dump() -> Generator[Callable[[], Any], None, None]:
+    """Collect state test fixtures and write them to their fixture files."""
+    fixture = synthetic_state_fixture(synthetic_alloc(accounts=50))
+    fixtures = [fixture.model_copy() for _ in range(FIXTURE_FILES * FIXTURES_PER_FILE)]
+    tmp_path = Path(tempfile.mkdtemp(prefix="microbenchmark-"))
+    filler_path = tmp_path / "tests"
+    infos = [
+        TestInfo(
+            name=f"test_{i}[fork_Cancun-state_test-{j}]",
+            id=f"tests/cancun/test_module_{i}.py::test_{i}[fork_Cancun-state_test-{j}]",
+            original_name=f"test_{i}",
+            module_path=filler_path / "cancun" / f"test_module_{i}.py",
+        )
+        for i in range(FIXTURE_FILES)
+        for j in range(FIXTURES_PER_FILE)
+    ]
+
+    def dump() -> None:
+        output_dir = tmp_path / "fixtures"
+        shutil.rmtree(output_dir, ignore_errors=True)
+        collector = FixtureCollector(
+            output_dir=output_dir,
+            fill_static_tests=False,
+            single_fixture_per_file=False,
+            filler_path=filler_path,
+        )
+        for info, fixture in zip(infos, fixtures, strict=True):
+            # Each fixture is serialized once when filling
+            reset_fixture_cache(fixture)
+            collector.add_fixture(info, fixture)
+        collector.dump_fixtures()
+
+    try:
+        yield dump
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
@@ -0,0 +1,203 @@
+"""
+Command line interface of the microbenchmarks.
+
+```console
+uv run microbenchmark run --output baseline.json
+uv run microbenchmark run --compare baseline.json
+uv run microbenchmark compare baseline.json current.json
+```
+"""
+
+import fnmatch
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from .benchmarks import BENCHMARKS, Microbenchmark
+from .runner import (
+    DEFAULT_MIN_ROUND_TIME,
+    DEFAULT_ROUNDS,
+    DEFAULT_THRESHOLD,
+    MicrobenchmarkResults,
+    compare_results,
+    run_microbenchmark,
+)
+
+console = Console(highlight=False)
+
+threshold_option = click.option(
+    "--threshold",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_THRESHOLD,
+    show_default=True,
+    help="Relative slowdown of a benchmark, against the baseline, reported as a regression.",
+)
+
+
+def format_time(seconds: float) -> str:
+    """Format a duration with a suitable unit."""
+    for unit, factor in [("s", 1.0), ("ms", 1e3), ("µs", 1e6)]:
+        if seconds * factor >= 1:
+            return f"{seconds * factor:.3f} {unit}"
+    return f"{seconds * 1e9:.1f} ns"
+
+
+def select_benchmarks(patterns: Tuple[str, ...]) -> List[Microbenchmark]:
+    """Return the benchmarks matching any of the given glob patterns."""
+    if not patterns:
+        return list(BENCHMARKS.values())
+    return [
+        benchmark
+        for name, benchmark in BENCHMARKS.items()
+        if any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+    ]
+
+
+def print_comparison(
+    baseline: MicrobenchmarkResults, current: MicrobenchmarkResults, threshold: float
+) -> bool:
+    """
+    Print the comparison of the results against the baseline and return
+    whether any benchmark regressed.
+    """
+    table = Table(
+        title=f"Comparison against {baseline.commit}",
+        show_header=True,
+        header_style="bold magenta",
+    )
+    table.add_column("Benchmark")
+    table.add_column("Baseline", justify="right")
+    table.add_column("Current", justify="right")
+    table.add_column("Change", justify="right")
+    regressions = []
+    for comparison in compare_results(baseline, current):
+        style = ""
+        if comparison.is_regression(threshold):
+            regressions.append(comparison.name)
+            style = "bold red"
+        elif comparison.change < -threshold:
+            style = "green"
+        table.add_row(
+            comparison.name,
+            format_time(comparison.baseline),
+            format_time(comparison.current),
+            f"{comparison.change:+.1%}",
+            style=style,
+        )
+    console.print(table)
+    if regressions:
+        console.print(
+            f"[bold red]{len(regressions)} benchmark(s) slower than the baseline by more than "
+            f"{threshold:.0%}: {', '.join(regressions)}[/bold red]"
+        )
+    return bool(regressions)
+
+
+@click.group(context_settings={"help_option_names": ["-h", "--help"]})
+def microbenchmark() -> None:
+    """Run microbenchmarks of the framework's own hot paths."""
+    pass
+
+
+@microbenchmark.command(name="list")
+def list_benchmarks() -> None:
+    """List the available microbenchmarks."""
+    for benchmark in BENCHMARKS.values():
+        console.print(f"[bold]{benchmark.name}[/bold]: {benchmark.description}")
+
+
+@microbenchmark.command()
+@click.option(
+    "-k",
+    "patterns",
+    multiple=True,
+    help="Only run the benchmarks whose name matches this glob pattern. Can be repeated.",
+)
+@click.option(
+    "--rounds",
+    type=click.IntRange(min=1),
+    default=DEFAULT_ROUNDS,
+    show_default=True,
+    help="Number of timed rounds of each benchmark.",
+)
+@click.option(
+    "--min-round-time",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_MIN_ROUND_TIME,
+    show_default=True,
+    help="Minimum duration of a round in seconds, used to calibrate the calls per round.",
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write the results to this JSON file, e.g. to use them as a baseline.",
+)
+@click.option(
+    "--compare",
+    "baseline_path",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Compare the results against the baseline stored in this JSON file.",
+)
+@threshold_option
+def run(
+    patterns: Tuple[str, ...],
+    rounds: int,
+    min_round_time: float,
+    output: Path | None,
+    baseline_path: Path | None,
+    threshold: float,
+) -> None:
+    """
+    Run the microbenchmarks, exiting with an error if compared against a
+    baseline and any of them regressed.
+    """
+    benchmarks = select_benchmarks(patterns)
+    if not benchmarks:
+        raise click.BadParameter(f"No benchmark matches {', '.join(patterns)}", param_hint="'-k'")
+    results = MicrobenchmarkResults()
+    table = Table(title="Microbenchmarks", show_header=True, header_style="bold magenta")
+    table.add_column("Benchmark")
+    table.add_column("Min", justify="right")
+    table.add_column("Median", justify="right")
+    table.add_column("Calls per round", justify="right")
+    for benchmark in benchmarks:
+        with console.status(f"Running {benchmark.name}..."):
+            result = run_microbenchmark(benchmark, rounds=rounds, min_round_time=min_round_time)
+        results.results[benchmark.name] = result
+        table.add_row(
+            benchmark.name, format_time(result.min), format_time(result.median), str(result.loops)
+        )
+    console.print(table)
+
+    if output is not None:
+        results.to_file(output)
+        console.print(f"Results written to {output}")
+    if baseline_path is not None:
+        baseline = MicrobenchmarkResults.from_file(baseline_path)
+        if print_comparison(baseline, results, threshold):
+            sys.exit(1)
+
+
+@microbenchmark.command()
+@click.argument("baseline", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.argument("current", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@threshold_option
+def compare(baseline: Path, current: Path, threshold: float) -> None:
+    """
+    Compare two microbenchmark result files, exiting with an error if any
+    benchmark regressed.
+    """
+    if print_comparison(
+        MicrobenchmarkResults.from_file(baseline),
+        MicrobenchmarkResults.from_file(current),
+        threshold,
+    ):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    microbenchmark()
@@ -0,0 +1,107 @@
+"""Run the microbenchmarks and compare their results against a baseline."""
+
+import platform
+import statistics
+import timeit
+from pathlib import Path
+from typing import Dict, List
+
+from pydantic import BaseModel, Field
+
+from ethereum_test_tools.utility.versioning import get_current_commit_hash_or_tag
+
+from .benchmarks import Microbenchmark
+
+DEFAULT_ROUNDS = 5
+DEFAULT_MIN_ROUND_TIME = 0.2
+DEFAULT_THRESHOLD = 0.2
+
+
+class MicrobenchmarkResult(BaseModel):
+    """Timings of a microbenchmark, in seconds per call."""
+
+    loops: int
+    """Number of calls timed in each round."""
+    times: List[float]
+    """Time per call of each round."""
+
+    @property
+    def min(self) -> float:
+        """Return the time per call of the fastest round."""
+        return min(self.times)
+
+    @property
+    def median(self) -> float:
+        """Return the median time per call of the rounds."""
+        return statistics.median(self.times)
+
+
+class MicrobenchmarkResults(BaseModel):
+    """Results of a microbenchmark run."""
+
+    commit: str = Field(default_factory=lambda: get_current_commit_hash_or_tag(shorten_hash=True))
+    python_version: str = Field(default_factory=platform.python_version)
+    machine: str = Field(default_factory=platform.machine)
+    results: Dict[str, MicrobenchmarkResult] = Field(default_factory=dict)
+
+    @classmethod
+    def from_file(cls, path: Path) -> "MicrobenchmarkResults":
+        """Load the results from a JSON file."""
+        return cls.model_validate_json(path.read_text())
+
+    def to_file(self, path: Path) -> None:
+        """Write the results to a JSON file."""
+        path.write_text(self.model_dump_json(indent=2))
+
+
+class MicrobenchmarkComparison(BaseModel):
+    """Comparison of the results of a microbenchmark against its baseline."""
+
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Return the relative change of the time per call."""
+        return self.current / self.baseline - 1
+
+    def is_regression(self, threshold: float) -> bool:
+        """Return whether the benchmark slowed down more than the threshold."""
+        return self.change > threshold
+
+
+def run_microbenchmark(
+    benchmark: Microbenchmark,
+    rounds: int = DEFAULT_ROUNDS,
+    min_round_time: float = DEFAULT_MIN_ROUND_TIME,
+) -> MicrobenchmarkResult:
+    """
+    Time a microbenchmark: the number of calls per round is calibrated so
+    that each round takes at least `min_round_time` seconds.
+    """
+    with benchmark.setup() as func:
+        timer = timeit.Timer(func)
+        loops = 1
+        while timer.timeit(loops) < min_round_time:
+            loops *= 2
+        times = timer.repeat(repeat=rounds, number=loops)
+    return MicrobenchmarkResult(loops=loops, times=[time / loops for time in times])
+
+
+def compare_results(
+    baseline: MicrobenchmarkResults, current: MicrobenchmarkResults
+) -> List[MicrobenchmarkComparison]:
+    """
+    Compare the fastest round of the benchmarks found in both results, which
+    is the least affected by the noise of other processes.
+    """
+    return [
+        MicrobenchmarkComparison(
+            name=name,
+            baseline=baseline.results[name].min,
+            current=result.min,
+        )
+        for name, result in current.results.items()
+        if name in baseline.results
+    ]
@@ -11,6 +11,8 @@ import click
 import pytest
 from rich.console import Console
 
+from .import_profile import ImportProfiler
+
 CURRENT_FOLDER = Path(realpath(__file__)).parent
 PACKAGE_INSTALL_FOLDER = CURRENT_FOLDER.parent.parent
 PYTEST_INI_FOLDER = CURRENT_FOLDER / "pytest_ini_files"
@@ -73,8 +75,19 @@ class PytestRunner:
             pytest_cmd = f"pytest {' '.join(pytest_args)}"
             self.console.print(f"Executing: [bold]{pytest_cmd}[/bold]")
 
+        if self._is_import_profile():
+            with ImportProfiler() as import_profiler:
+                result = pytest.main(pytest_args, plugins=[import_profiler])
+            import_profiler.report(self.console)
+            return result
+
         return pytest.main(pytest_args)
 
+    def _is_import_profile(self) -> bool:
+        """Check if the import profile of the session is requested."""
+        ctx = click.get_current_context(silent=True)
+        return ctx is not None and bool(ctx.params.get("import_profile_flag"))
+
     def _is_verbose(self, args: List[str]) -> bool:
         """Check if verbose output is requested."""
         return any(arg in ["-v", "--verbose", "-vv", "-vvv"] for arg in args)
@@ -203,4 +216,13 @@ def common_pytest_options(func: Callable[..., Any]) -> Callable[..., Any]:
         help="Show pytest's help message.",
     )(func)
 
+    func = click.option(
+        "--import-profile",
+        "import_profile_flag",
+        is_flag=True,
+        default=False,
+        expose_value=True,
+        help="Show the time spent importing modules during the session's startup.",
+    )(func)
+
     return click.argument("pytest_args", nargs=-1, type=click.UNPROCESSED)(func)
@@ -39,7 +39,7 @@ def create_consume_command(
 def get_command_logic_test_paths(command_name: str) -> List[Path]:
     """Determine the command paths based on the command name and hive flag."""
     base_path = Path("pytest_plugins/consume")
-    if command_name in ["engine", "rlp"]:
+    if command_name in ["engine", "enginex", "rlp"]:
         command_logic_test_paths = [
             base_path / "simulators" / "simulator_logic" / f"test_via_{command_name}.py"
         ]
@@ -110,6 +110,15 @@ def engine() -> None:
     pass
 
 
+@consume_command(is_hive=True)
+def enginex() -> None:
+    """
+    Client consumes via the Engine API, sharing a client between the tests of
+    each pre-allocation group.
+    """
+    pass
+
+
 @consume_command(is_hive=True)
 def sync() -> None:
     """Client consumes via the Engine API with sync testing."""
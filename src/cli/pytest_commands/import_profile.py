@@ -0,0 +1,220 @@
+"""
+Profile the imports of a pytest session to show where its startup time goes.
+
+Enabled with the `--import-profile` flag of the pytest-based commands, e.g.:
+
+```console
+uv run fill --import-profile --collect-only tests/cancun
+```
+
+The profiler wraps `builtins.__import__` and `importlib.import_module` while
+`pytest.main` runs, times each import that loads new modules and reports the
+slowest modules and packages, next to the duration of the startup (plugin
+loading and configuration) and collection phases of the session.
+
+Only the main process is profiled: with `-n`, the imports of the xdist workers
+are not included in the report.
+"""
+
+import builtins
+import importlib
+import sys
+from dataclasses import dataclass
+from importlib.util import resolve_name
+from time import perf_counter
+from types import TracebackType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Type
+
+import pytest
+from rich.console import Console
+from rich.table import Table
+
+DEFAULT_TOP_ENTRIES = 20
+
+
+@dataclass
+class ImportTiming:
+    """Time spent importing a module, excluding and including its imports."""
+
+    self_time: float = 0.0
+    cumulative_time: float = 0.0
+
+
+def imported_module_names(
+    name: str,
+    globals: Optional[Mapping[str, Any]] = None,  # noqa: A002
+    locals: Optional[Mapping[str, Any]] = None,  # noqa: A002
+    fromlist: Sequence[str] = (),
+    level: int = 0,
+) -> List[str]:
+    """
+    Return the names of the modules an `__import__` call can load: the
+    imported module and the submodules imported from it.
+    """
+    del locals
+    if level > 0:
+        package = globals.get("__package__") if globals else None
+        if not package:
+            # Left to the import itself to fail
+            return []
+        name = resolve_name("." * level + name, package)
+    return [name] + [f"{name}.{item}" for item in fromlist or () if item != "*"]
+
+
+class ImportProfiler:
+    """
+    Record the time spent importing each module during a pytest session.
+
+    Used as a context manager around `pytest.main`, and passed to it as a
+    plugin to record the end of the startup and collection phases.
+    """
+
+    top_entries: int
+    timings: Dict[str, ImportTiming]
+    phases: Dict[str, float]
+    _child_times: List[float]
+    _original_import: Callable[..., Any]
+    _original_import_module: Callable[..., Any]
+
+    def __init__(self, top_entries: int = DEFAULT_TOP_ENTRIES) -> None:
+        """Initialize the profiler."""
+        self.top_entries = top_entries
+        self.timings = {}
+        self.phases = {}
+        self._child_times = []
+        self._original_import = builtins.__import__
+        self._original_import_module = importlib.import_module
+
+    def _timed_import(
+        self,
+        module_names: List[str],
+        import_function: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Call an import function and, if it loaded one of the given modules,
+        record the time spent for the first one loaded.
+        """
+        missing_module_names = [name for name in module_names if name not in sys.modules]
+        if not missing_module_names:
+            return import_function(*args, **kwargs)
+        start = perf_counter()
+        self._child_times.append(0.0)
+        try:
+            return import_function(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            child_time = self._child_times.pop()
+            loaded_module_names = [name for name in missing_module_names if name in sys.modules]
+            if loaded_module_names:
+                timing = self.timings.setdefault(loaded_module_names[0], ImportTiming())
+                timing.self_time += elapsed - child_time
+                timing.cumulative_time += elapsed
+                if self._child_times:
+                    self._child_times[-1] += elapsed
+            elif self._child_times:
+                # Nothing was loaded, only the imports done meanwhile count
+                self._child_times[-1] += child_time
+
+    def profiled_import(self, *args: Any, **kwargs: Any) -> Any:
+        """Replace `builtins.__import__` to record the import times."""
+        return self._timed_import(
+            imported_module_names(*args, **kwargs), self._original_import, *args, **kwargs
+        )
+
+    def profiled_import_module(self, name: str, package: Optional[str] = None) -> Any:
+        """Replace `importlib.import_module` to record the import times."""
+        module_name = resolve_name(name, package) if name.startswith(".") else name
+        return self._timed_import([module_name], self._original_import_module, name, package)
+
+    def __enter__(self) -> "ImportProfiler":
+        """Start profiling the imports."""
+        builtins.__import__ = self.profiled_import
+        importlib.import_module = self.profiled_import_module
+        self.phases["start"] = perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Stop profiling the imports."""
+        self.phases["end"] = perf_counter()
+        builtins.__import__ = self._original_import
+        importlib.import_module = self._original_import_module
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_configure(self, config: pytest.Config) -> None:
+        """Record the end of the startup phase."""
+        del config
+        self.phases["configured"] = perf_counter()
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection(self, session: pytest.Session) -> None:
+        """Record the start of the collection phase."""
+        del session
+        self.phases["collection_start"] = perf_counter()
+
+    def pytest_collection_finish(self, session: pytest.Session) -> None:
+        """Record the end of the collection phase."""
+        del session
+        self.phases["collection_finish"] = perf_counter()
+
+    def phase_duration(self, start: str, end: str) -> float | None:
+        """Return the duration between two recorded points of the session."""
+        if start not in self.phases or end not in self.phases:
+            return None
+        return self.phases[end] - self.phases[start]
+
+    def package_timings(self) -> Dict[str, float]:
+        """Return the self import time of each top-level package."""
+        packages: Dict[str, float] = {}
+        for name, timing in self.timings.items():
+            package = name.split(".")[0]
+            packages[package] = packages.get(package, 0.0) + timing.self_time
+        return packages
+
+    def report(self, console: Console) -> None:
+        """Print the import profile of the session."""
+        total_import_time = sum(timing.self_time for timing in self.timings.values())
+        summary = Table(title="Session phases", show_header=True, header_style="bold magenta")
+        summary.add_column("Phase")
+        summary.add_column("Duration (s)", justify="right")
+        for phase, start, end in [
+            ("Startup (plugins and configuration)", "start", "configured"),
+            ("Collection", "collection_start", "collection_finish"),
+            ("Total", "start", "end"),
+        ]:
+            duration = self.phase_duration(start, end)
+            if duration is not None:
+                summary.add_row(phase, f"{duration:.3f}")
+        summary.add_row(f"Imports ({len(self.timings)} modules)", f"{total_import_time:.3f}")
+        console.print(summary)
+
+        package_table = Table(
+            title=f"Top {self.top_entries} packages by import time",
+            show_header=True,
+            header_style="bold magenta",
+        )
+        package_table.add_column("Package")
+        package_table.add_column("Self (s)", justify="right")
+        package_timings = sorted(self.package_timings().items(), key=lambda item: -item[1])
+        for package, self_time in package_timings[: self.top_entries]:
+            package_table.add_row(package, f"{self_time:.3f}")
+        console.print(package_table)
+
+        module_table = Table(
+            title=f"Top {self.top_entries} modules by import time",
+            show_header=True,
+            header_style="bold magenta",
+        )
+        module_table.add_column("Module")
+        module_table.add_column("Self (s)", justify="right")
+        module_table.add_column("Cumulative (s)", justify="right")
+        module_timings = sorted(self.timings.items(), key=lambda item: -item[1].self_time)
+        for name, timing in module_timings[: self.top_entries]:
+            module_table.add_row(name, f"{timing.self_time:.3f}", f"{timing.cumulative_time:.3f}")
+        console.print(module_table)
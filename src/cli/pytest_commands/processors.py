@@ -102,6 +102,9 @@ class HiveEnvironmentProcessor(ArgumentProcessor):
 
         if self.command_name == "engine":
             modified_args.extend(["-p", "pytest_plugins.consume.simulators.engine.conftest"])
+        elif self.command_name == "enginex":
+            modified_args.extend(["-p", "pytest_plugins.consume.simulators.enginex.conftest"])
+            modified_args = self._handle_pre_alloc_grouping(modified_args)
         elif self.command_name == "sync":
             modified_args.extend(["-p", "pytest_plugins.consume.simulators.sync.conftest"])
         elif self.command_name == "rlp":
@@ -110,6 +113,16 @@ class HiveEnvironmentProcessor(ArgumentProcessor):
             raise ValueError(f"Unknown command name: {self.command_name}")
         return modified_args
 
+    def _handle_pre_alloc_grouping(self, args: List[str]) -> List[str]:
+        """
+        Distribute the test cases to the xdist workers grouped by
+        pre-allocation group, unless another distribution mode is requested.
+        """
+        is_parallel = any(arg.startswith(("-n", "--numprocesses")) for arg in args)
+        if is_parallel and not any(arg.startswith("--dist") for arg in args):
+            return args + ["--dist", "loadgroup"]
+        return args
+
     def _has_regex_or_sim_limit(self, args: List[str]) -> bool:
         """Check if args already contain --regex or --sim.limit."""
         return "--regex" in args or "--sim.limit" in args
@@ -150,6 +163,16 @@ class ConsumeCommandProcessor(ArgumentProcessor):
         """Process consume-specific arguments."""
         if self.is_hive:
             return self._handle_timing_data_stdout(args)
+        return self._handle_fixture_file_grouping(args)
+
+    def _handle_fixture_file_grouping(self, args: List[str]) -> List[str]:
+        """
+        Distribute the test cases to the xdist workers grouped by fixture
+        file, unless another distribution mode is requested.
+        """
+        is_parallel = any(arg.startswith(("-n", "--numprocesses")) for arg in args)
+        if is_parallel and not any(arg.startswith("--dist") for arg in args):
+            return args + ["--dist", "loadgroup"]
         return args
 
     def _handle_timing_data_stdout(self, args: List[str]) -> List[str]:
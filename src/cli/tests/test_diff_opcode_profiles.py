@@ -0,0 +1,50 @@
+"""Tests for the diff_opcode_profiles click CLI."""
+
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from ethereum_clis import OpcodeCount, OpcodeProfile
+from ethereum_test_forks import Prague
+from pytest_plugins.filler.opcode_profile import (
+    opcode_profile_row,
+    write_opcode_profile_summary,
+)
+
+from ..diff_opcode_profiles import main
+
+
+def write_summary(path: Path, test: str, opcode_count: dict[str, int], gas_used: int) -> Path:
+    """Write a summary file with a single test."""
+    write_opcode_profile_summary(
+        path,
+        [
+            opcode_profile_row(
+                test=test,
+                fork=Prague,
+                gas_benchmark_value=1_000_000,
+                profile=OpcodeProfile(
+                    opcode_count=OpcodeCount.model_validate(opcode_count),
+                    gas_used=gas_used,
+                    t8n_calls=1,
+                ),
+            )
+        ],
+    )
+    return path
+
+
+def test_diff_opcode_profiles(tmp_path: Path) -> None:
+    """Test that the opcode count and gas used differences are printed."""
+    base = write_summary(tmp_path / "base.csv", "test_a[v1]", {"ADD": 10, "MUL": 2}, 21_040)
+    patch = write_summary(tmp_path / "patch.csv", "test_a[v2]", {"ADD": 12}, 21_036)
+
+    result = CliRunner().invoke(main, [str(base), str(patch), "-r", "[v1]", "-r", "[v2]"])
+    assert result.exit_code == 0, result.output
+    assert "Common tests: 1" in result.output
+    assert "test_a:\n  -4 gas used\n  +2 ADD\n  -2 MUL\n" in result.output
+
+    result = CliRunner().invoke(main, [str(base), str(patch)])
+    assert result.exit_code == 0, result.output
+    assert "Common tests: 0" in result.output
+    assert "No differences found" in result.output
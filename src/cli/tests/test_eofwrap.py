@@ -1,5 +1,6 @@
 """Tests for the eofwrap module and click CLI."""
 
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -8,7 +9,7 @@ from ethereum_test_base_types.conversions import to_hex
 from ethereum_test_tools import Opcodes as Op
 from ethereum_test_types.eof.v1 import Container
 
-from ..eofwrap import wrap_code
+from ..eofwrap import EOFWRAP_CACHE_FILE_NAME, EofWrapCache, EofWrapper, wrap_code
 
 
 @pytest.mark.parametrize(
@@ -50,3 +51,48 @@ from ..eofwrap import wrap_code
 def test_wrap_code(code: Any, result: Any) -> None:
     """Tests for the EOF wrapping logic and heuristics."""
     assert wrap_code(bytes(code)) == result
+
+
+def test_eof_wrapper_merge() -> None:
+    """Test merging the metrics of the files wrapped by other processes."""
+    eof_wrapper = EofWrapper()
+    first = EofWrapper()
+    first.metrics[EofWrapper.FILES_GENERATED] = 1
+    first.metrics[EofWrapper.ACCOUNTS_WRAPPED] = 2
+    first.metrics[EofWrapper.VALIDATION_ERRORS] = {"err_a": 1}
+    second = EofWrapper()
+    second.metrics[EofWrapper.FILES_SKIPPED] = 1
+    second.metrics[EofWrapper.ACCOUNTS_WRAPPED] = 1
+    second.metrics[EofWrapper.VALIDATION_ERRORS] = {"err_a": 2, "err_b": 1}
+
+    eof_wrapper.merge(first.metrics, ["0xef0001", "0xef0002"])
+    eof_wrapper.merge(second.metrics, ["0xef0002"])
+
+    assert eof_wrapper.metrics[EofWrapper.FILES_GENERATED] == 1
+    assert eof_wrapper.metrics[EofWrapper.FILES_SKIPPED] == 1
+    assert eof_wrapper.metrics[EofWrapper.ACCOUNTS_WRAPPED] == 3
+    assert eof_wrapper.metrics[EofWrapper.UNIQUE_ACCOUNTS_WRAPPED] == 2
+    assert eof_wrapper.metrics[EofWrapper.VALIDATION_ERRORS] == {"err_a": 3, "err_b": 1}
+
+
+def test_eof_wrap_cache(tmp_path: Path) -> None:
+    """
+    Test that the cache is persisted and discarded when written by another
+    evmone version.
+    """
+    cache_path = tmp_path / EOFWRAP_CACHE_FILE_NAME
+    cache = EofWrapCache("evmone 0.1.0")
+    cache.files["eof_wrapped_test.json"] = {
+        "hash": "00",
+        "metrics": EofWrapper().metrics,
+        "unique_eof": [],
+    }
+    cache.validations["11"] = "OK 00"
+    cache.save(cache_path)
+
+    loaded = EofWrapCache.load(cache_path, "evmone 0.1.0")
+    assert loaded.files == cache.files
+    assert loaded.validations == cache.validations
+
+    assert EofWrapCache.load(cache_path, "evmone 0.2.0").files == {}
+    assert EofWrapCache.load(tmp_path / "missing.json", "evmone 0.1.0").files == {}
@@ -0,0 +1,75 @@
+"""Test the import profile of pytest sessions."""
+
+import builtins
+import importlib
+import textwrap
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
+from ..pytest_commands.import_profile import ImportProfiler, imported_module_names
+
+
+def test_imported_module_names() -> None:
+    """Test the names of the modules an `__import__` call can load."""
+    assert imported_module_names("a.b") == ["a.b"]
+    assert imported_module_names("a", None, None, ["b", "*"]) == ["a", "a.b"]
+    assert imported_module_names("c", {"__package__": "a.b"}, None, ["d"], 1) == [
+        "a.b.c",
+        "a.b.c.d",
+    ]
+    assert imported_module_names("", {"__package__": "a.b"}, None, ["c"], 2) == ["a", "a.c"]
+
+
+def test_import_profiler(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that the profiler records the self and cumulative import time of the
+    modules loaded while it is active, and restores the import functions.
+    """
+    package = tmp_path / "profiled_package"
+    package.mkdir()
+    (package / "__init__.py").write_text("from . import outer\n")
+    (package / "outer.py").write_text(
+        textwrap.dedent(
+            """\
+            import time
+
+            from . import inner
+
+            time.sleep(0.05)
+            """
+        )
+    )
+    (package / "inner.py").write_text("import time\n\ntime.sleep(0.1)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    original_import = builtins.__import__
+    original_import_module = importlib.import_module
+    with ImportProfiler() as import_profiler:
+        importlib.import_module("profiled_package")
+    assert builtins.__import__ is original_import
+    assert importlib.import_module is original_import_module
+
+    timings = import_profiler.timings
+    assert set(timings) == {
+        "profiled_package",
+        "profiled_package.outer",
+        "profiled_package.inner",
+    }
+    inner, outer, package_timing = (
+        timings["profiled_package.inner"],
+        timings["profiled_package.outer"],
+        timings["profiled_package"],
+    )
+    assert inner.self_time >= 0.1
+    assert outer.self_time >= 0.05
+    assert outer.cumulative_time - outer.self_time >= 0.1
+    assert package_timing.cumulative_time - package_timing.self_time >= 0.15
+    assert import_profiler.package_timings()["profiled_package"] >= 0.15
+
+    console = Console(record=True, width=120)
+    import_profiler.report(console)
+    output = console.export_text()
+    assert "Top 20 modules by import time" in output
+    assert "profiled_package.inner" in output
@@ -0,0 +1,99 @@
+"""Test the microbenchmarks of the framework and their comparison command."""
+
+from pathlib import Path
+from typing import Dict
+
+import pytest
+from click.testing import CliRunner
+
+from ..microbenchmark import (
+    BENCHMARKS,
+    MicrobenchmarkResult,
+    MicrobenchmarkResults,
+    compare_results,
+    run_microbenchmark,
+)
+from ..microbenchmark.cli import microbenchmark
+
+
+def results(times: Dict[str, float]) -> MicrobenchmarkResults:
+    """Return results with a single round per benchmark."""
+    return MicrobenchmarkResults(
+        commit="0123abcd",
+        results={
+            name: MicrobenchmarkResult(loops=1, times=[time]) for name, time in times.items()
+        },
+    )
+
+
+@pytest.mark.parametrize("name", BENCHMARKS)
+def test_microbenchmark(name: str) -> None:
+    """Test that each microbenchmark can be set up, timed and cleaned up."""
+    result = run_microbenchmark(BENCHMARKS[name], rounds=2, min_round_time=0)
+    assert result.loops == 1
+    assert len(result.times) == 2
+    assert 0 < result.min <= result.median
+
+
+def test_compare_results() -> None:
+    """
+    Test that the fastest rounds of the benchmarks found in both results are
+    compared.
+    """
+    baseline = results({"a": 1.0, "b": 2.0, "removed": 1.0})
+    current = MicrobenchmarkResults(
+        commit="4567cdef",
+        results={
+            "a": MicrobenchmarkResult(loops=2, times=[1.5, 1.2]),
+            "b": MicrobenchmarkResult(loops=2, times=[1.0, 1.1]),
+            "added": MicrobenchmarkResult(loops=1, times=[1.0]),
+        },
+    )
+    comparisons = {
+        comparison.name: comparison for comparison in compare_results(baseline, current)
+    }
+    assert set(comparisons) == {"a", "b"}
+    assert comparisons["a"].change == pytest.approx(0.2)
+    assert comparisons["a"].is_regression(0.1)
+    assert not comparisons["a"].is_regression(0.25)
+    assert comparisons["b"].change == pytest.approx(-0.5)
+    assert not comparisons["b"].is_regression(0.0)
+
+
+def test_compare_command(tmp_path: Path) -> None:
+    """Test that the compare command fails only if a benchmark regressed."""
+    baseline_path = tmp_path / "baseline.json"
+    results({"a": 1.0, "b": 1.0}).to_file(baseline_path)
+    current_path = tmp_path / "current.json"
+    results({"a": 1.1, "b": 0.5}).to_file(current_path)
+    assert MicrobenchmarkResults.from_file(current_path).results["a"].min == 1.1
+
+    runner = CliRunner()
+    result = runner.invoke(microbenchmark, ["compare", str(baseline_path), str(current_path)])
+    assert result.exit_code == 0, result.output
+    result = runner.invoke(
+        microbenchmark,
+        ["compare", str(baseline_path), str(current_path), "--threshold", "0.05"],
+    )
+    assert result.exit_code == 1
+    assert "1 benchmark(s) slower than the baseline by more than 5%: a" in result.output
+
+
+def test_run_command(tmp_path: Path) -> None:
+    """Test that the run command writes its results and compares them."""
+    output_path = tmp_path / "results.json"
+    runner = CliRunner()
+    args = ["run", "-k", "bytecode_*", "--rounds", "1", "--min-round-time", "0"]
+    result = runner.invoke(microbenchmark, [*args, "--output", str(output_path)])
+    assert result.exit_code == 0, result.output
+    assert list(MicrobenchmarkResults.from_file(output_path).results) == ["bytecode_concatenation"]
+
+    baseline_path = tmp_path / "baseline.json"
+    results({"bytecode_concatenation": 1e-9}).to_file(baseline_path)
+    result = runner.invoke(microbenchmark, [*args, "--compare", str(baseline_path)])
+    assert result.exit_code == 1
+    assert "bytecode_concatenation" in result.output
+
+    result = runner.invoke(microbenchmark, ["run", "-k", "unknown"])
+    assert result.exit_code == 2
+    assert "No benchmark matches unknown" in result.output
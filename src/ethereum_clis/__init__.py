@@ -5,9 +5,14 @@ tools.
 
 from .cli_types import (
     BlockExceptionWithMessage,
+    OpcodeCount,
+    OpcodeGas,
+    OpcodeProfile,
     Result,
     Traces,
+    TracesDigestOptions,
     TransactionExceptionWithMessage,
+    TransactionTracesDigest,
     TransitionToolOutput,
 )
 from .clis.besu import BesuTransitionTool
@@ -45,9 +50,14 @@ __all__ = (
     "Nethtest",
     "NethtestFixtureConsumer",
     "NimbusTransitionTool",
+    "OpcodeCount",
+    "OpcodeGas",
+    "OpcodeProfile",
     "Result",
     "Traces",
+    "TracesDigestOptions",
     "TransactionExceptionWithMessage",
+    "TransactionTracesDigest",
     "TransitionTool",
     "TransitionToolOutput",
     "UnknownCLIError",
@@ -1,10 +1,30 @@
 """Types used in the transition tool interactions."""
 
+import hashlib
 import json
+import logging
+from collections import deque
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Annotated, Any, Dict, List, Self
+from typing import (
+    Annotated,
+    Any,
+    ClassVar,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Self,
+    Tuple,
+    Type,
+)
 
-from pydantic import Field, PlainSerializer, PlainValidator
+from pydantic import BaseModel, Field, PlainSerializer, PlainValidator, TypeAdapter
 
 from ethereum_test_base_types import (
     Bloom,
@@ -80,6 +100,287 @@ class TraceLine(CamelModel):
         return True
 
 
+def _to_int(value: int | str) -> int:
+    """Convert a trace value, either an integer or a hex string, to int."""
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+
+class TraceRecord(NamedTuple):
+    """
+    Lightweight, unvalidated, representation of a single trace line used to
+    process traces without building a `TraceLine` model per EVM step.
+    """
+
+    pc: int
+    op: int
+    gas: int
+    gas_cost: int | None
+    mem_size: int
+    stack: Tuple[int | None, ...]
+    depth: int
+    refund: int
+    op_name: str
+    error: str | None
+
+    @classmethod
+    def from_json(cls, trace_json: Dict[str, Any]) -> "TraceRecord":
+        """Create a record from a decoded trace line."""
+        gas_cost = trace_json.get("gasCost")
+        return cls(
+            pc=trace_json["pc"],
+            op=trace_json["op"],
+            gas=_to_int(trace_json["gas"]),
+            gas_cost=None if gas_cost is None else _to_int(gas_cost),
+            mem_size=trace_json["memSize"],
+            stack=tuple(None if v is None else _to_int(v) for v in trace_json["stack"]),
+            depth=trace_json["depth"],
+            refund=trace_json["refund"],
+            op_name=trace_json["opName"],
+            error=trace_json.get("error"),
+        )
+
+
+class TraceFileReader:
+    """
+    Stream the trace lines of a single transaction from a .jsonl file.
+
+    The output and gas used of the transaction, contained in the last line of
+    the file, are available once the file has been fully iterated.
+    """
+
+    def __init__(self, trace_file_path: Path):
+        """Initialize the reader, the file is not opened until iterated."""
+        self.trace_file_path = trace_file_path
+        self.output: str | None = None
+        self.gas_used: int | None = None
+
+    def iter_json(self) -> Generator[Dict[str, Any], None, None]:
+        """Yield every decoded trace line in the file."""
+        with self.trace_file_path.open() as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                trace_json = json.loads(line)
+                if "gasUsed" in trace_json and "output" in trace_json:
+                    self.output = trace_json["output"]
+                    self.gas_used = _to_int(trace_json["gasUsed"])
+                    continue
+                yield trace_json
+
+    def __iter__(self) -> Iterator[TraceRecord]:
+        """Yield a lightweight record for every trace line in the file."""
+        return (TraceRecord.from_json(trace_json) for trace_json in self.iter_json())
+
+
+def normalized_trace_records(
+    records: Iterable[TraceRecord], enable_post_processing: bool
+) -> Generator[Tuple[Any, ...], None, None]:
+    """
+    Yield the trace records without the gas counter, which is the only value
+    allowed to differ between equivalent traces.
+
+    If `enable_post_processing` is set, the result of the GAS opcode is
+    masked from the stack, as in `TransactionTraces.remove_gas`.
+    """
+    previous: TraceRecord | None = None
+    for record in records:
+        stack = record.stack
+        if (
+            enable_post_processing
+            and previous is not None
+            and previous.op_name == "GAS"
+            and record.depth == previous.depth
+            and stack
+        ):
+            stack = stack[:-1] + (None,)
+        yield (
+            record.pc,
+            record.op,
+            record.mem_size,
+            stack,
+            record.depth,
+            record.refund,
+            record.op_name,
+            record.error,
+        )
+        previous = record
+
+
+def _tracked_records(
+    records: Iterable[TraceRecord], window: Deque[TraceRecord]
+) -> Generator[TraceRecord, None, None]:
+    """Yield the records, appending each one to `window` first."""
+    for record in records:
+        window.append(record)
+        yield record
+
+
+def _log_trace_divergence(first_line: int, window: Iterable[TraceRecord]) -> None:
+    """Log the trace records of the interval that diverges from a reference."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    lines = "\n".join(json.dumps(record._asdict()) for record in window)
+    logger.debug(f"Traces diverge from the reference after line {first_line}:\n{lines}")
+
+
+@dataclass(frozen=True)
+class TransactionTracesDigest:
+    """
+    Rolling digest of the traces of a single transaction, ignoring the gas
+    counter.
+
+    A checkpoint of the rolling digest is kept every `CHECKPOINT_INTERVAL`
+    lines, plus one for the full traces, so a comparison against it can stop
+    close to the first line that diverges while keeping its size bounded.
+    """
+
+    CHECKPOINT_INTERVAL: ClassVar[int] = 128
+
+    output: str | None
+    gas_used: int | None
+    line_count: int
+    checkpoints: List[bytes]
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[TraceRecord],
+        *,
+        enable_post_processing: bool,
+        reference: "TransactionTracesDigest | None" = None,
+    ) -> "TransactionTracesDigest | None":
+        """
+        Compute the digest of the given trace records.
+
+        Output and gas used must be set afterwards with `with_result`. If a
+        `reference` digest is given, returns None as soon as a checkpoint
+        diverges from it, without consuming the rest of the records, and logs
+        the records since the last matching checkpoint, which contain the
+        first diverging line.
+        """
+        window: Deque[TraceRecord] = deque(maxlen=cls.CHECKPOINT_INTERVAL)
+        if reference is not None:
+            records = _tracked_records(records, window)
+        rolling_digest = hashlib.blake2b(digest_size=16)
+        checkpoints: List[bytes] = []
+        line_count = 0
+        for line in normalized_trace_records(records, enable_post_processing):
+            rolling_digest.update(repr(line).encode())
+            line_count += 1
+            if line_count % cls.CHECKPOINT_INTERVAL == 0:
+                checkpoints.append(rolling_digest.digest())
+                if reference is None:
+                    continue
+                if (
+                    len(reference.checkpoints) < len(checkpoints)
+                    or reference.checkpoints[len(checkpoints) - 1] != checkpoints[-1]
+                ):
+                    _log_trace_divergence(line_count - len(window), window)
+                    return None
+                window.clear()
+        checkpoints.append(rolling_digest.digest())
+        if reference is not None and checkpoints != reference.checkpoints:
+            if reference.line_count != line_count:
+                logger.debug(
+                    f"Traces have different lengths: {line_count} != {reference.line_count}."
+                )
+            _log_trace_divergence(line_count - len(window), window)
+            return None
+        return cls(output=None, gas_used=None, line_count=line_count, checkpoints=checkpoints)
+
+    @classmethod
+    def from_file(
+        cls,
+        trace_file_path: Path,
+        *,
+        enable_post_processing: bool,
+        reference: "TransactionTracesDigest | None" = None,
+    ) -> "TransactionTracesDigest | None":
+        """
+        Compute the digest of a single transaction's traces .jsonl file
+        without materializing the traces.
+        """
+        reader = TraceFileReader(trace_file_path)
+        digest = cls.from_records(
+            reader, enable_post_processing=enable_post_processing, reference=reference
+        )
+        if digest is None:
+            return None
+        return digest.with_result(
+            output=reader.output,
+            gas_used=reader.gas_used,
+            enable_post_processing=enable_post_processing,
+        )
+
+    def with_result(
+        self, *, output: str | None, gas_used: int | None, enable_post_processing: bool
+    ) -> "TransactionTracesDigest":
+        """
+        Return a copy of the digest including the transaction's output and,
+        unless post-processing is enabled, its gas used.
+        """
+        return replace(
+            self,
+            output=output,
+            gas_used=None if enable_post_processing or gas_used is None else int(gas_used),
+        )
+
+    def matches(self, other: "TransactionTracesDigest") -> bool:
+        """Return True if both digests belong to equivalent traces."""
+        if self.line_count != other.line_count:
+            logger.debug(
+                f"Traces have different lengths: {self.line_count} != {other.line_count}."
+            )
+            return False
+        if self.output != other.output:
+            logger.debug(f"Traces have different outputs: {self.output} != {other.output}.")
+            return False
+        if self.gas_used != other.gas_used:
+            logger.debug(f"Traces have different gas used: {self.gas_used} != {other.gas_used}.")
+            return False
+        if self.checkpoints != other.checkpoints:
+            logger.debug("Traces are not equivalent.")
+            return False
+        return True
+
+
+@dataclass(frozen=True)
+class TracesDigestOptions:
+    """
+    Request to digest the traces of a t8n evaluation straight from its trace
+    files, optionally comparing them against the digest of the traces of a
+    reference evaluation.
+    """
+
+    enable_post_processing: bool
+    reference: List[TransactionTracesDigest] | None = None
+
+    def digest_files(self, trace_file_paths: List[Path]) -> List[TransactionTracesDigest] | None:
+        """
+        Return the digest of every transaction's trace file, or None if the
+        traces diverge from the reference, stopping at the first divergence.
+        """
+        reference = self.reference
+        if reference is not None and len(reference) != len(trace_file_paths):
+            logger.debug(
+                f"Different number of trace files: {len(trace_file_paths)} != {len(reference)}."
+            )
+            return None
+        digests: List[TransactionTracesDigest] = []
+        for i, trace_file_path in enumerate(trace_file_paths):
+            tx_reference = None if reference is None else reference[i]
+            digest = TransactionTracesDigest.from_file(
+                trace_file_path,
+                enable_post_processing=self.enable_post_processing,
+                reference=tx_reference,
+            )
+            if digest is None or (tx_reference is not None and not digest.matches(tx_reference)):
+                logger.debug(f"Trace file {i} is not equivalent.")
+                return None
+            digests.append(digest)
+        return digests
+
+
 class TransactionTraces(CamelModel):
     """Traces of a single transaction."""
 
@@ -90,12 +391,9 @@ class TransactionTraces(CamelModel):
     @classmethod
     def from_file(cls, trace_file_path: Path) -> Self:
         """Read a single transaction's traces from a .jsonl file."""
-        trace_lines = trace_file_path.read_text().splitlines()
-        trace_dict: Dict[str, Any] = {}
-        if "gasUsed" in trace_lines[-1] and "output" in trace_lines[-1]:
-            trace_dict |= json.loads(trace_lines.pop())
-        trace_dict["traces"] = [TraceLine.model_validate_json(line) for line in trace_lines]
-        return cls.model_validate(trace_dict)
+        reader = TraceFileReader(trace_file_path)
+        traces = [TraceLine.model_validate(trace_json) for trace_json in reader.iter_json()]
+        return cls(traces=traces, output=reader.output, gas_used=reader.gas_used)
 
     @staticmethod
     def remove_gas(traces: List[TraceLine]) -> None:
@@ -222,6 +520,32 @@ class OpcodeCount(EthereumTestRootModel):
             new_dict[match_key] = self.root[match_key] + other.root[match_key]
         return self.__class__(new_dict)
 
+    @staticmethod
+    def trace_line_value(trace: TraceLine) -> int:
+        """Return the amount a trace line contributes to its opcode entry."""
+        del trace
+        return 1
+
+    @classmethod
+    def from_traces(cls, traces: Traces) -> Self:
+        """Compute the opcode entries from the traces of a t8n evaluation."""
+        values: Dict[str, int] = {}
+        for transaction_traces in traces.root:
+            for trace in transaction_traces.traces:
+                values[trace.op_name] = values.get(trace.op_name, 0) + cls.trace_line_value(trace)
+        return cls.model_validate(values)
+
+
+class OpcodeGas(OpcodeCount):
+    """
+    Gas consumed per opcode, as reported by the `gasCost` of the trace lines.
+    """
+
+    @staticmethod
+    def trace_line_value(trace: TraceLine) -> int:
+        """Return the gas cost of the trace line."""
+        return 0 if trace.gas_cost is None else int(trace.gas_cost)
+
 
 class Result(CamelModel):
     """Result of a transition tool output."""
@@ -250,6 +574,7 @@ class Result(CamelModel):
         BlockExceptionWithMessage | UndefinedException | None, ExceptionMapperValidator
     ] = None
     traces: Traces | None = None
+    traces_digest: List[TransactionTracesDigest] | None = Field(None, exclude=True)
     opcode_count: OpcodeCount | None = None
 
 
@@ -261,6 +586,52 @@ class TransitionToolInput(CamelModel):
     env: Environment
     blob_params: ForkBlobSchedule | None = None
 
+    STREAM_ALLOC_CHUNK_SIZE: ClassVar[int] = 1024
+    """Number of accounts serialized at a time by `iter_json_chunks`."""
+
+    def iter_json_chunks(self, **kwargs: Any) -> Generator[bytes, None, None]:
+        """
+        Serialize the input to JSON bytes in chunks of at most
+        `STREAM_ALLOC_CHUNK_SIZE` accounts, so the complete JSON document is
+        never held in memory.
+
+        The concatenation of the chunks is equivalent to
+        `model_dump_json(**kwargs)`.
+        """
+        yield b'{"alloc":{'
+        accounts = iter(self.alloc.root.items())
+        separator = b""
+        while chunk := dict(islice(accounts, self.STREAM_ALLOC_CHUNK_SIZE)):
+            chunk_json = Alloc.__pydantic_serializer__.to_json(
+                Alloc.model_construct(root=chunk), **kwargs
+            )
+            yield separator + chunk_json[1:-1]
+            separator = b","
+        other_fields_json = self.__pydantic_serializer__.to_json(self, exclude={"alloc"}, **kwargs)
+        yield b"}," + other_fields_json[1:]
+
+    def json_files(self, **kwargs: Any) -> Dict[str, bytes]:
+        """
+        Serialize each field to its own JSON document, keyed by the field
+        alias, as expected by the file inputs of the t8n tools.
+
+        Fields set to None are omitted when `exclude_none` is passed.
+        """
+        json_files: Dict[str, bytes] = {}
+        for name, field_info in type(self).model_fields.items():
+            value = getattr(self, name)
+            if value is None and kwargs.get("exclude_none"):
+                continue
+            key = field_info.alias if kwargs.get("by_alias") and field_info.alias else name
+            json_files[key] = field_type_adapter(type(self), name).dump_json(value, **kwargs)
+        return json_files
+
+
+@lru_cache(maxsize=None)
+def field_type_adapter(model: Type[BaseModel], name: str) -> TypeAdapter:
+    """Return the type adapter of a field of a model."""
+    return TypeAdapter(model.model_fields[name].annotation)
+
 
 class TransitionToolOutput(CamelModel):
     """Transition tool output."""
@@ -270,6 +641,41 @@ class TransitionToolOutput(CamelModel):
     body: Bytes | None = None
 
 
+class OpcodeProfile(CamelModel):
+    """
+    Profile of the transition tool evaluations performed to fill a test.
+
+    Opcode counts are taken from the t8n tool when supported, and otherwise
+    from the traces. Gas per opcode is only available when traces are
+    collected.
+    """
+
+    opcode_count: OpcodeCount | None = None
+    opcode_gas: OpcodeGas | None = None
+    gas_used: int = 0
+    t8n_calls: int = 0
+    t8n_time: float = 0.0
+
+    def add_output(self, output: TransitionToolOutput, *, t8n_time: float) -> None:
+        """Add the output of a t8n evaluation that took `t8n_time` seconds."""
+        result = output.result
+        self.t8n_calls += 1
+        self.t8n_time += t8n_time
+        self.gas_used += int(result.gas_used)
+        opcode_count = result.opcode_count
+        if opcode_count is None and result.traces is not None:
+            opcode_count = OpcodeCount.from_traces(result.traces)
+        if opcode_count is not None:
+            self.opcode_count = (
+                opcode_count if self.opcode_count is None else self.opcode_count + opcode_count
+            )
+        if result.traces is not None:
+            opcode_gas = OpcodeGas.from_traces(result.traces)
+            self.opcode_gas = (
+                opcode_gas if self.opcode_gas is None else self.opcode_gas + opcode_gas
+            )
+
+
 class TransitionToolContext(CamelModel):
     """Transition tool context."""
 
@@ -19,7 +19,7 @@ from ethereum_test_exceptions import (
 )
 from ethereum_test_forks import Fork
 
-from ..cli_types import TransitionToolOutput
+from ..cli_types import TracesDigestOptions, TransitionToolOutput
 from ..transition_tool import TransitionTool, dump_files_to_directory, model_dump_config
 
 
@@ -106,6 +106,7 @@ class BesuTransitionTool(TransitionTool):
         transition_tool_data: TransitionTool.TransitionToolData,
         debug_output_path: str = "",
         slow_request: bool = False,
+        traces_digest: TracesDigestOptions | None = None,
     ) -> TransitionToolOutput:
         """Execute `evm t8n` with the specified arguments."""
         del slow_request
@@ -184,7 +185,9 @@ class BesuTransitionTool(TransitionTool):
             )
 
         if self.trace and self.besu_trace_dir:
-            self.collect_traces(output.result.receipts, self.besu_trace_dir, debug_output_path)
+            self.collect_traces(
+                output.result, self.besu_trace_dir, debug_output_path, traces_digest
+            )
             for i, r in enumerate(output.result.receipts):
                 trace_file_name = f"trace-{i}-{r.transaction_hash}.jsonl"
                 os.remove(os.path.join(self.besu_trace_dir.name, trace_file_name))
@@ -7,14 +7,13 @@ import shutil
 import subprocess
 import tempfile
 import textwrap
-from functools import cache
 from pathlib import Path
 from typing import Any, ClassVar, Dict, List, Optional
 
 import pytest
 
 from ethereum_clis.file_utils import dump_files_to_directory
-from ethereum_clis.fixture_consumer_tool import FixtureConsumerTool
+from ethereum_clis.fixture_consumer_tool import FixtureConsumerTool, cache_fixture_file_results
 from ethereum_test_exceptions import (
     EOFException,
     ExceptionBase,
@@ -129,7 +128,7 @@ class EvmoneFixtureConsumerCommon:
     def _skip_message(self, fixture_format: FixtureFormat) -> str:
         return f"Fixture format {fixture_format.format_name} not supported by {self.binary}"
 
-    @cache  # noqa
+    @cache_fixture_file_results
     def consume_test_file(
         self,
         fixture_path: Path,
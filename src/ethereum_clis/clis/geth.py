@@ -20,7 +20,7 @@ from ethereum_test_fixtures import BlockchainFixture, FixtureFormat, StateFixtur
 from ethereum_test_forks import Fork
 
 from ..ethereum_cli import EthereumCLI
-from ..fixture_consumer_tool import FixtureConsumerTool
+from ..fixture_consumer_tool import FixtureConsumerTool, cache_fixture_file_results
 from ..transition_tool import TransitionTool, dump_files_to_directory
 
 
@@ -229,21 +229,22 @@ class GethFixtureConsumer(
 ):
     """Geth's implementation of the fixture consumer."""
 
-    def consume_blockchain_test(
+    def _consume_test_file(
         self,
+        subcommand: str,
         fixture_path: Path,
         fixture_name: Optional[str] = None,
         debug_output_path: Optional[Path] = None,
-    ) -> None:
+    ) -> List[Dict[str, Any]]:
         """
-        Consume a single blockchain test.
+        Execute the tests of a fixture file, or only the tests matching
+        `fixture_name` if specified, and return their results.
 
-        The `evm blocktest` command takes the `--run` argument which can be
-        used to select a specific fixture from the fixture file when executing.
+        The results are returned even if the command exits with a non-zero
+        exit code because of failing tests.
         """
-        subcommand = "blocktest"
-        global_options = []
-        subcommand_options = []
+        global_options: List[str] = []
+        subcommand_options: List[str] = []
         if debug_output_path:
             global_options += ["--verbosity", "100"]
             subcommand_options += ["--trace"]
@@ -258,30 +259,87 @@ class GethFixtureConsumer(
             + subcommand_options
             + [str(fixture_path)]
         )
-
         result = self._run_command(command)
 
         if debug_output_path:
             self._consume_debug_dump(command, result, fixture_path, debug_output_path)
 
-        if result.returncode != 0:
+        try:
+            result_json = json.loads(result.stdout)
+        except json.JSONDecodeError:
+            result_json = None
+        if result.returncode != 0 and not isinstance(result_json, list):
             raise Exception(
                 f"Unexpected exit code:\n{' '.join(command)}\n\n Error:\n{result.stderr}"
             )
-
-        result_json = json.loads(result.stdout)
         if not isinstance(result_json, list):
-            raise Exception(f"Unexpected result from evm blocktest: {result_json}")
+            raise Exception(f"Unexpected result from evm {subcommand}: {result_json}")
+        return result_json
 
-        if any(not test_result["pass"] for test_result in result_json):
-            exception_text = "Blockchain test failed: \n" + "\n".join(
+    @staticmethod
+    def _check_test_results(
+        test_type: str,
+        file_results: List[Dict[str, Any]],
+        fixture_name: Optional[str] = None,
+    ) -> None:
+        """
+        Check the result of the test named `fixture_name` if specified, or
+        otherwise the results of all the tests of the file.
+        """
+        if fixture_name:
+            test_result = [
+                test_result for test_result in file_results if test_result["name"] == fixture_name
+            ]
+            assert len(test_result) < 2, f"Multiple test results for {fixture_name}"
+            assert len(test_result) == 1, f"Test result for {fixture_name} missing"
+            assert test_result[0]["pass"], f"{test_type} test failed: {test_result[0]['error']}"
+        elif any(not test_result["pass"] for test_result in file_results):
+            exception_text = f"{test_type} test failed: \n" + "\n".join(
                 f"{test_result['name']}: " + test_result["error"]
-                for test_result in result_json
+                for test_result in file_results
                 if not test_result["pass"]
             )
             raise Exception(exception_text)
 
-    @cache  # noqa
+    @cache_fixture_file_results
+    def consume_blockchain_test_file(
+        self,
+        fixture_path: Path,
+        debug_output_path: Optional[Path] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Consume an entire blockchain test file.
+
+        The results of all the tests of the file are cached, so
+        `consume_blockchain_test` can select the result that was requested
+        without calling the command for every test.
+        """
+        return self._consume_test_file("blocktest", fixture_path, None, debug_output_path)
+
+    def consume_blockchain_test(
+        self,
+        fixture_path: Path,
+        fixture_name: Optional[str] = None,
+        debug_output_path: Optional[Path] = None,
+    ) -> None:
+        """
+        Consume a single blockchain test.
+
+        Uses the cached result from `consume_blockchain_test_file` when a
+        single test is requested without debug output. Otherwise, the command
+        is called directly, with the `--run` argument of `evm blocktest` to
+        only execute (and trace) the requested test, if any.
+        """
+        if debug_output_path or not fixture_name:
+            file_results = self._consume_test_file(
+                "blocktest", fixture_path, fixture_name, debug_output_path
+            )
+            self._check_test_results("Blockchain", file_results)
+            return
+        file_results = self.consume_blockchain_test_file(fixture_path=fixture_path)
+        self._check_test_results("Blockchain", file_results, fixture_name)
+
+    @cache_fixture_file_results
     def consume_state_test_file(
         self,
         fixture_path: Path,
@@ -295,34 +353,7 @@ class GethFixtureConsumer(
         function is cached in order to only call the command once and
         `consume_state_test` can simply select the result that was requested.
         """
-        subcommand = "statetest"
-        global_options: List[str] = []
-        subcommand_options: List[str] = []
-        if debug_output_path:
-            global_options += ["--verbosity", "100"]
-            subcommand_options += ["--trace"]
-
-        command = (
-            [str(self.binary)]
-            + global_options
-            + [subcommand]
-            + subcommand_options
-            + [str(fixture_path)]
-        )
-        result = self._run_command(command)
-
-        if debug_output_path:
-            self._consume_debug_dump(command, result, fixture_path, debug_output_path)
-
-        if result.returncode != 0:
-            raise Exception(
-                f"Unexpected exit code:\n{' '.join(command)}\n\n Error:\n{result.stderr}"
-            )
-
-        result_json = json.loads(result.stdout)
-        if not isinstance(result_json, list):
-            raise Exception(f"Unexpected result from evm statetest: {result_json}")
-        return result_json
+        return self._consume_test_file("statetest", fixture_path, None, debug_output_path)
 
     def consume_state_test(
         self,
@@ -340,21 +371,7 @@ class GethFixtureConsumer(
             fixture_path=fixture_path,
             debug_output_path=debug_output_path,
         )
-        if fixture_name:
-            test_result = [
-                test_result for test_result in file_results if test_result["name"] == fixture_name
-            ]
-            assert len(test_result) < 2, f"Multiple test results for {fixture_name}"
-            assert len(test_result) == 1, f"Test result for {fixture_name} missing"
-            assert test_result[0]["pass"], f"State test failed: {test_result[0]['error']}"
-        else:
-            if any(not test_result["pass"] for test_result in file_results):
-                exception_text = "State test failed: \n" + "\n".join(
-                    f"{test_result['name']}: " + test_result["error"]
-                    for test_result in file_results
-                    if not test_result["pass"]
-                )
-                raise Exception(exception_text)
+        self._check_test_results("State", file_results, fixture_name)
 
     def consume_fixture(
         self,
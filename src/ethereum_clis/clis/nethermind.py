@@ -16,7 +16,7 @@ from ethereum_test_fixtures import BlockchainFixture, EOFFixture, FixtureFormat,
 
 from ..ethereum_cli import EthereumCLI
 from ..file_utils import dump_files_to_directory
-from ..fixture_consumer_tool import FixtureConsumerTool
+from ..fixture_consumer_tool import FixtureConsumerTool, cache_fixture_file_results
 
 
 class Nethtest(EthereumCLI):
@@ -136,7 +136,7 @@ class NethtestFixtureConsumer(
             command += ["--trace"]
         return tuple(command)
 
-    @cache  # noqa
+    @cache_fixture_file_results
     def consume_state_test_file(
         self,
         fixture_path: Path,
@@ -244,7 +244,7 @@ class NethtestFixtureConsumer(
                 f"{' '.join(command)}"
             )
 
-    @cache  # noqa
+    @cache_fixture_file_results
     def consume_eof_test_file(
         self,
         fixture_path: Path,
@@ -1,12 +1,22 @@
 """Methods to work with the filesystem and json."""
 
 import os
+import shutil
 import stat
+import tempfile
+from contextlib import contextmanager
 from json import dump
-from typing import Any, Dict
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Iterator, List
+from weakref import finalize
 
 from pydantic import BaseModel, RootModel
 
+MEMORY_BACKED_DIRECTORY = Path("/dev/shm")
+MEMORY_BACKED_DIRECTORY_MIN_FREE_BYTES = 256 * 1024 * 1024
+DISABLE_MEMORY_BACKED_DIRECTORY_ENV_VAR = "EEST_DISABLE_DEV_SHM"
+
 
 def write_json_file(data: Dict[str, Any], file_path: str) -> None:
     """Write a JSON file to the given path."""
@@ -45,3 +55,119 @@ def dump_files_to_directory(output_path: str, files: Dict[str, Any]) -> None:
             if "x" in flags:
                 file_mode |= stat.S_IEXEC
             os.chmod(file_path, file_mode)
+
+
+def memory_backed_temp_dir() -> str | None:
+    """
+    Return the memory-backed directory in which temporary work directories
+    should be created, or None to use the default temporary directory.
+
+    The memory-backed directory is not used if it is disabled through the
+    `EEST_DISABLE_DEV_SHM` environment variable, or if it has less than
+    `MEMORY_BACKED_DIRECTORY_MIN_FREE_BYTES` of free space, e.g. the 64 MB
+    `/dev/shm` of Docker containers.
+    """
+    if os.environ.get(DISABLE_MEMORY_BACKED_DIRECTORY_ENV_VAR, "").lower() in ("1", "true", "yes"):
+        return None
+    if not MEMORY_BACKED_DIRECTORY.is_dir() or not os.access(MEMORY_BACKED_DIRECTORY, os.W_OK):
+        return None
+    try:
+        free_bytes = shutil.disk_usage(MEMORY_BACKED_DIRECTORY).free
+    except OSError:
+        return None
+    if free_bytes < MEMORY_BACKED_DIRECTORY_MIN_FREE_BYTES:
+        return None
+    return str(MEMORY_BACKED_DIRECTORY)
+
+
+def clear_directory(path: str) -> None:
+    """Remove the files in a directory tree, keeping its directories."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                clear_directory(entry.path)
+            else:
+                os.unlink(entry.path)
+
+
+def remove_directories(paths: List[str]) -> None:
+    """Remove the given directory trees."""
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+class WorkDirectoryPool:
+    """
+    Pool of reusable temporary work directories, created in memory-backed
+    storage when available.
+
+    Directories are emptied, keeping their subdirectories, when released, and
+    removed when the pool is garbage collected or the interpreter exits.
+    """
+
+    def __init__(self, *, prefix: str, subdirectories: List[str] | None = None) -> None:
+        """Initialize the pool; directories are created on demand."""
+        self.prefix = prefix
+        self.subdirectories = subdirectories or []
+        self.temp_dir = memory_backed_temp_dir()
+        self._lock = Lock()
+        self._free: List[str] = []
+        self._all: List[str] = []
+        finalize(self, remove_directories, self._all)
+
+    def fall_back_to_default_temp_dir(self) -> bool:
+        """
+        Create the following work directories in the default temporary
+        directory, e.g. after running out of memory-backed storage, and remove
+        the free directories created in memory-backed storage.
+
+        Return False if the pool already uses the default temporary directory.
+        """
+        with self._lock:
+            if self.temp_dir is None:
+                return False
+            self.temp_dir = None
+            stale, self._free = self._free, []
+            for path in stale:
+                self._all.remove(path)
+        remove_directories(stale)
+        return True
+
+    def _create(self) -> str:
+        """Create a work directory, with its subdirectories, in the pool."""
+        path = tempfile.mkdtemp(prefix=self.prefix, dir=self.temp_dir)
+        try:
+            for subdirectory in self.subdirectories:
+                os.mkdir(os.path.join(path, subdirectory))
+        except OSError:
+            remove_directories([path])
+            raise
+        with self._lock:
+            self._all.append(path)
+        return path
+
+    @contextmanager
+    def acquire(self) -> Iterator[str]:
+        """Return an empty work directory for the duration of the context."""
+        with self._lock:
+            path = self._free.pop() if self._free else None
+        if path is None:
+            try:
+                path = self._create()
+            except OSError:
+                if not self.fall_back_to_default_temp_dir():
+                    raise
+                path = self._create()
+        try:
+            yield path
+        finally:
+            with self._lock:
+                reusable = os.path.dirname(path) == (self.temp_dir or tempfile.gettempdir())
+                if not reusable:
+                    self._all.remove(path)
+            if reusable:
+                clear_directory(path)
+                with self._lock:
+                    self._free.append(path)
+            else:
+                remove_directories([path])
@@ -1,11 +1,32 @@
 """Fixture consumer tool abstract class."""
 
-from typing import List, Type
+from functools import lru_cache
+from typing import Callable, List, Type, TypeVar
 
 from ethereum_test_fixtures import FixtureConsumer, FixtureFormat
 
 from .ethereum_cli import EthereumCLI
 
+F = TypeVar("F", bound=Callable)
+
+FIXTURE_FILE_CACHE_SIZE = 16
+"""
+Number of fixture files whose results are kept in memory by the consumers that
+execute whole fixture files at once.
+"""
+
+
+def cache_fixture_file_results(method: F) -> F:
+    """
+    Cache the results of a consumer method that executes a whole fixture file,
+    keeping the results of the `FIXTURE_FILE_CACHE_SIZE` most recently
+    executed files.
+
+    `consume direct` schedules the test cases of the same fixture file one
+    after the other on the same worker, so each file is only executed once.
+    """
+    return lru_cache(maxsize=FIXTURE_FILE_CACHE_SIZE)(method)  # type: ignore[return-value]
+
 
 class FixtureConsumerTool(FixtureConsumer, EthereumCLI):
     """
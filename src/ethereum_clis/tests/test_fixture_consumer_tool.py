@@ -0,0 +1,66 @@
+"""Test the fixture consumer tools that execute whole fixture files."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from ethereum_clis import GethFixtureConsumer
+from ethereum_test_fixtures import BlockchainFixture, StateFixture
+
+FAKE_EVM = """\
+import json, sys
+with open({calls_file!r}, "a") as f:
+    f.write(" ".join(sys.argv[1:]) + "\\n")
+results = [
+    {{"name": "test_a", "pass": True, "error": ""}},
+    {{"name": "test_b", "pass": False, "error": "invalid state root"}},
+]
+if "--run" in sys.argv:
+    results = [r for r in results if r["name"] == sys.argv[sys.argv.index("--run") + 1]]
+print(json.dumps(results))
+sys.exit(0 if all(r["pass"] for r in results) else 1)
+"""
+
+
+@pytest.fixture
+def calls_file(tmp_path: Path) -> Path:
+    """Return the file where the fake evm records its calls."""
+    return tmp_path / "calls.txt"
+
+
+@pytest.fixture
+def geth_fixture_consumer(tmp_path: Path, calls_file: Path) -> GethFixtureConsumer:
+    """Return a geth fixture consumer that calls a fake evm."""
+    binary = tmp_path / "evm"
+    binary.write_text(
+        f"#!{sys.executable}\n" + FAKE_EVM.format(calls_file=str(calls_file)),
+    )
+    binary.chmod(0o755)
+    return GethFixtureConsumer(binary=binary)
+
+
+@pytest.mark.parametrize(
+    "fixture_format,subcommand",
+    [(BlockchainFixture, "blocktest"), (StateFixture, "statetest")],
+)
+def test_consume_fixture_file_once(
+    tmp_path: Path,
+    calls_file: Path,
+    geth_fixture_consumer: GethFixtureConsumer,
+    fixture_format: type,
+    subcommand: str,
+) -> None:
+    """
+    Test that the tests of a fixture file are consumed with a single call of
+    the tool, and that the result of each test is checked separately.
+    """
+    fixture_path = tmp_path / "fixtures.json"
+    fixture_path.write_text(json.dumps({}))
+    geth_fixture_consumer.consume_fixture(fixture_format, fixture_path, fixture_name="test_a")
+    with pytest.raises(AssertionError, match="invalid state root"):
+        geth_fixture_consumer.consume_fixture(fixture_format, fixture_path, fixture_name="test_b")
+    with pytest.raises(AssertionError, match="test_c missing"):
+        geth_fixture_consumer.consume_fixture(fixture_format, fixture_path, fixture_name="test_c")
+    assert calls_file.read_text().splitlines() == [f"{subcommand} {fixture_path}"]
@@ -0,0 +1,227 @@
+"""Test the comparison of transaction traces."""
+
+import json
+from pathlib import Path
+from typing import Generator, List
+
+import pytest
+
+from ethereum_clis import ExecutionSpecsTransitionTool
+from ethereum_clis.cli_types import (
+    OpcodeCount,
+    OpcodeGas,
+    Result,
+    TraceLine,
+    TraceRecord,
+    Traces,
+    TracesDigestOptions,
+    TransactionTraces,
+    TransactionTracesDigest,
+)
+from ethereum_test_base_types import Hash
+from ethereum_test_types import TransactionReceipt
+
+
+def trace_line(op_name: str, gas: int, stack: List[int], depth: int = 1) -> TraceLine:
+    """Return a trace line for the given opcode."""
+    return TraceLine(
+        pc=0,
+        op=0,
+        gas=gas,
+        gas_cost=2,
+        mem_size=0,
+        stack=stack,
+        depth=depth,
+        refund=0,
+        op_name=op_name,
+    )
+
+
+def transaction_traces(gas_limit: int, gas_used: int = 21_010) -> Traces:
+    """
+    Return the traces of a transaction that pushes the remaining gas to the
+    stack.
+    """
+    return Traces(
+        root=[
+            TransactionTraces(
+                traces=[
+                    trace_line("PUSH1", gas_limit, []),
+                    trace_line("GAS", gas_limit - 3, [1]),
+                    trace_line("POP", gas_limit - 5, [1, gas_limit - 7]),
+                    trace_line("STOP", gas_limit - 7, [1]),
+                ],
+                output="0x",
+                gas_used=gas_used,
+            )
+        ]
+    )
+
+
+def write_trace_file(path: Path, traces: TransactionTraces) -> Path:
+    """Write the traces to a .jsonl file in the format output by t8n tools."""
+    lines = [trace.model_dump_json(by_alias=True, exclude_none=True) for trace in traces.traces]
+    lines.append(json.dumps({"output": traces.output, "gasUsed": hex(traces.gas_used or 0)}))
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+@pytest.mark.parametrize("enable_post_processing", [False, True])
+def test_trace_file_digest(tmp_path: Path, enable_post_processing: bool) -> None:
+    """
+    Test that comparing the digests of trace files gives the same result as
+    comparing the materialized traces.
+    """
+    base = transaction_traces(100_000).root[0]
+    base_file = write_trace_file(tmp_path / "base.jsonl", base)
+    assert TransactionTraces.from_file(base_file) == base
+    base_digest = TransactionTracesDigest.from_file(
+        base_file, enable_post_processing=enable_post_processing
+    )
+    assert base_digest is not None
+
+    for i, other in enumerate(
+        [
+            transaction_traces(100_000),
+            transaction_traces(50_000),
+            transaction_traces(100_000, gas_used=21_011),
+        ]
+    ):
+        other_file = write_trace_file(tmp_path / f"other-{i}.jsonl", other.root[0])
+        other_digest = TransactionTracesDigest.from_file(
+            other_file, enable_post_processing=enable_post_processing
+        )
+        assert other_digest is not None
+        assert other_digest.matches(base_digest) == base.are_equivalent(
+            other.root[0], enable_post_processing
+        )
+
+
+def test_traces_digest_options(tmp_path: Path) -> None:
+    """
+    Test that non-gas differences between trace files are detected when
+    comparing them against a reference digest.
+    """
+    base_file = write_trace_file(tmp_path / "base.jsonl", transaction_traces(100_000).root[0])
+    reference = TracesDigestOptions(enable_post_processing=True).digest_files([base_file])
+    assert reference is not None
+
+    def matches(traces: TransactionTraces, enable_post_processing: bool = True) -> bool:
+        options = TracesDigestOptions(
+            enable_post_processing=enable_post_processing, reference=reference
+        )
+        trace_file = write_trace_file(tmp_path / "other.jsonl", traces)
+        return options.digest_files([trace_file]) is not None
+
+    assert matches(transaction_traces(50_000).root[0])
+    assert not matches(transaction_traces(50_000).root[0], enable_post_processing=False)
+
+    different_stack = transaction_traces(50_000).root[0]
+    different_stack.traces[3].stack = [2]  # type: ignore[list-item]
+    assert not matches(different_stack)
+
+    different_length = transaction_traces(50_000).root[0]
+    different_length.traces.pop()
+    assert not matches(different_length)
+
+    options = TracesDigestOptions(enable_post_processing=True, reference=reference)
+    assert options.digest_files([base_file, base_file]) is None
+
+
+def test_trace_file_digest_early_exit(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """
+    Test that the digest computation stops at the first checkpoint that
+    diverges from the reference digest, logging only the records of the
+    diverging interval.
+    """
+    monkeypatch.setattr(TransactionTracesDigest, "CHECKPOINT_INTERVAL", 2)
+
+    def records(
+        traces: TransactionTraces, consumed: List[TraceRecord]
+    ) -> Generator[TraceRecord, None, None]:
+        for trace in traces.traces:
+            record = TraceRecord.from_json(trace.model_dump(mode="json", by_alias=True))
+            consumed.append(record)
+            yield record
+
+    reference = TransactionTracesDigest.from_records(
+        records(transaction_traces(100_000).root[0], []), enable_post_processing=False
+    )
+    assert reference is not None
+    assert len(reference.checkpoints) == 3
+
+    diverging = transaction_traces(100_000).root[0]
+    diverging.traces[2].pc = 1
+    consumed: List[TraceRecord] = []
+    with caplog.at_level("DEBUG", logger="ethereum_clis.cli_types"):
+        assert (
+            TransactionTracesDigest.from_records(
+                records(diverging, consumed), enable_post_processing=False, reference=reference
+            )
+            is None
+        )
+    assert len(consumed) == 4
+    assert "after line 2:" in caplog.text
+    logged_records = caplog.text.split("after line 2:\n", 1)[1].strip().splitlines()
+    assert (
+        [TraceRecord(**json.loads(line)) for line in logged_records]
+        == [
+            record._replace(stack=list(record.stack))  # type: ignore[arg-type]
+            for record in consumed[2:]
+        ]
+    )
+
+
+def test_collect_traces_against_reference(tmp_path: Path) -> None:
+    """
+    Test that traces compared against a reference digest are never
+    materialized, whether they diverge from it or not.
+    """
+    tool = object.__new__(ExecutionSpecsTransitionTool)
+    tx_hash = Hash(1)
+    trace_file = tmp_path / f"trace-0-{tx_hash}.jsonl"
+
+    def collect(gas_limit: int, traces_digest: TracesDigestOptions) -> Result:
+        write_trace_file(trace_file, transaction_traces(gas_limit).root[0])
+        result = Result(
+            state_root=Hash(0),
+            transactions_trie=Hash(0),
+            receipts_root=Hash(0),
+            logs_hash=Hash(0),
+            logs_bloom=0,
+            receipts=[TransactionReceipt(transaction_hash=tx_hash)],
+            gas_used=0,
+        )
+        tool.collect_traces(result, str(tmp_path), traces_digest=traces_digest)
+        return result
+
+    base = collect(100_000, TracesDigestOptions(enable_post_processing=True))
+    assert base.traces == transaction_traces(100_000)
+    assert base.traces_digest is not None
+
+    options = TracesDigestOptions(enable_post_processing=True, reference=base.traces_digest)
+    assert collect(50_000, options).traces is None
+    assert tool.get_traces() == [base.traces]
+
+    diverging = collect(
+        50_000, TracesDigestOptions(enable_post_processing=False, reference=base.traces_digest)
+    )
+    assert diverging.traces_digest is None
+    assert diverging.traces is None
+    assert tool.get_traces() == [base.traces]
+
+
+def test_opcode_count_and_gas_from_traces() -> None:
+    """Test that opcode counts and gas per opcode are computed from traces."""
+    traces = transaction_traces(100_000)
+    traces.append(transaction_traces(50_000).root[0])
+
+    opcode_count = OpcodeCount.from_traces(traces)
+    assert opcode_count.model_dump() == {"PUSH1": 2, "GAS": 2, "POP": 2, "STOP": 2}
+
+    opcode_gas = OpcodeGas.from_traces(traces)
+    assert isinstance(opcode_gas, OpcodeGas)
+    assert opcode_gas.model_dump() == {"PUSH1": 4, "GAS": 4, "POP": 4, "STOP": 4}
+    assert (opcode_gas + opcode_gas).model_dump()["STOP"] == 8
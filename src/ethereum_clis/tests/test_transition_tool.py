@@ -1,9 +1,17 @@
 """Test the transition tool and subclasses."""
 
+import errno
+import json
 import shutil
 import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Type
+from typing import Any, Dict, List, Type
 
 import pytest
 
@@ -14,7 +22,16 @@ from ethereum_clis import (
     GethTransitionTool,
     NimbusTransitionTool,
     TransitionTool,
+    file_utils,
 )
+from ethereum_clis.cli_types import TransitionToolInput
+from ethereum_clis.clis.execution_specs import ExecutionSpecsExceptionMapper
+from ethereum_clis.file_utils import WorkDirectoryPool
+from ethereum_clis.transition_tool import model_dump_config, run_streaming_process
+from ethereum_test_base_types import Account, Address
+from ethereum_test_forks import Prague
+from ethereum_test_specs.helpers import find_minimum_gas_limit
+from ethereum_test_types import Alloc, Environment, Transaction
 
 
 def test_default_tool() -> None:
@@ -87,3 +104,296 @@ def test_unknown_binary_path() -> None:
     """
     with pytest.raises(CLINotFoundInPathError):
         TransitionTool.from_binary_path(binary_path=Path("unknown_binary_path"))
+
+
+def stream_test_input(account_count: int) -> TransitionToolInput:
+    """Return a transition tool input with the given number of accounts."""
+    return TransitionToolInput(
+        alloc=Alloc(
+            {
+                Address(0x1000 + i): Account(balance=i, nonce=1, storage={1: i})
+                for i in range(account_count)
+            }
+        ),
+        txs=[Transaction().with_signature_and_sender()],
+        env=Environment(),
+    )
+
+
+@pytest.mark.parametrize("account_count", [0, 1, 5])
+def test_input_json_chunks(monkeypatch: pytest.MonkeyPatch, account_count: int) -> None:
+    """Test that the chunked input serialization matches `model_dump_json`."""
+    monkeypatch.setattr(TransitionToolInput, "STREAM_ALLOC_CHUNK_SIZE", 2)
+    t8n_input = stream_test_input(account_count)
+    chunks = list(t8n_input.iter_json_chunks(**model_dump_config))
+    assert len(chunks) == 2 + (account_count + 1) // 2
+    assert json.loads(b"".join(chunks)) == json.loads(
+        t8n_input.model_dump_json(**model_dump_config)
+    )
+
+
+def test_input_json_chunks_memory(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that the chunked input serialization never holds a significant part
+    of the serialized input in memory.
+    """
+    monkeypatch.setattr(TransitionToolInput, "STREAM_ALLOC_CHUNK_SIZE", 100)
+    t8n_input = stream_test_input(5_000)
+    tracemalloc.start()
+    try:
+        t8n_input.model_dump_json(**model_dump_config).encode()
+        _, model_dump_json_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for _ in t8n_input.iter_json_chunks(**model_dump_config):
+            pass
+        _, chunks_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert chunks_peak < model_dump_json_peak / 4
+
+
+@pytest.mark.parametrize("indent", [None, 4])
+def test_input_json_files(indent: int | None) -> None:
+    """Test that the per-file input serialization matches `model_dump`."""
+    t8n_input = stream_test_input(5)
+    json_files = t8n_input.json_files(indent=indent, **model_dump_config)
+    model_dump = t8n_input.model_dump(mode="json", **model_dump_config)
+    assert json_files.keys() == model_dump.keys()
+    for key, contents in json_files.items():
+        assert json.loads(contents) == model_dump[key]
+
+
+def test_work_directory_pool() -> None:
+    """
+    Test that work directories are emptied and reused once released, and
+    removed with the pool.
+    """
+    pool = WorkDirectoryPool(prefix="t8n-test-", subdirectories=["input", "output"])
+    with pool.acquire() as work_dir:
+        (Path(work_dir) / "input" / "alloc.json").write_text("{}")
+        (Path(work_dir) / "opcodes.json").write_text("{}")
+        with pool.acquire() as other_work_dir:
+            assert other_work_dir != work_dir
+    with pool.acquire() as reused_work_dir:
+        assert reused_work_dir in (work_dir, other_work_dir)
+        assert sorted(p.name for p in Path(work_dir).rglob("*")) == ["input", "output"]
+    del pool
+    assert not Path(work_dir).exists()
+    assert not Path(other_work_dir).exists()
+
+
+def test_memory_backed_temp_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Test that the memory-backed directory is not used when disabled or short
+    of free space.
+    """
+    monkeypatch.setattr(file_utils, "MEMORY_BACKED_DIRECTORY", tmp_path)
+    monkeypatch.setattr(file_utils, "MEMORY_BACKED_DIRECTORY_MIN_FREE_BYTES", 1)
+    monkeypatch.delenv(file_utils.DISABLE_MEMORY_BACKED_DIRECTORY_ENV_VAR, raising=False)
+    assert file_utils.memory_backed_temp_dir() == str(tmp_path)
+
+    monkeypatch.setenv(file_utils.DISABLE_MEMORY_BACKED_DIRECTORY_ENV_VAR, "1")
+    assert file_utils.memory_backed_temp_dir() is None
+
+    monkeypatch.setenv(file_utils.DISABLE_MEMORY_BACKED_DIRECTORY_ENV_VAR, "0")
+    monkeypatch.setattr(file_utils, "MEMORY_BACKED_DIRECTORY_MIN_FREE_BYTES", 2**80)
+    assert file_utils.memory_backed_temp_dir() is None
+
+
+def test_work_directory_pool_fallback(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Test that the pool falls back to the default temporary directory when a
+    work directory cannot be created in memory-backed storage, and after
+    running out of it.
+    """
+    memory_backed = tmp_path / "shm"
+    memory_backed.mkdir()
+    monkeypatch.setattr(file_utils, "memory_backed_temp_dir", lambda: str(memory_backed))
+    default_temp_dir = tempfile.gettempdir()
+
+    pool = WorkDirectoryPool(prefix="t8n-test-", subdirectories=["input"])
+    with pool.acquire() as work_dir:
+        assert Path(work_dir).parent == memory_backed
+        with pool.acquire() as in_use_work_dir:
+            pass
+        assert pool.fall_back_to_default_temp_dir()
+        assert not Path(in_use_work_dir).exists()
+    assert not Path(work_dir).exists()
+    with pool.acquire() as work_dir:
+        assert Path(work_dir).parent == Path(default_temp_dir)
+    assert not pool.fall_back_to_default_temp_dir()
+
+    monkeypatch.setattr(file_utils, "memory_backed_temp_dir", lambda: str(tmp_path / "missing"))
+    pool = WorkDirectoryPool(prefix="t8n-test-", subdirectories=["input"])
+    with pool.acquire() as work_dir:
+        assert Path(work_dir).parent == Path(default_temp_dir)
+    assert pool.temp_dir is None
+
+
+def test_evaluate_filesystem_out_of_space(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Test that an evaluation that runs out of memory-backed storage is retried
+    once in the default temporary directory.
+    """
+    monkeypatch.setattr(file_utils, "memory_backed_temp_dir", lambda: str(tmp_path))
+    t8n = object.__new__(GethTransitionTool)
+    work_dirs: List[str] = []
+
+    def evaluate_in_work_dir(*, work_dir: str, **kwargs: Any) -> Any:
+        del kwargs
+        work_dirs.append(work_dir)
+        if len(work_dirs) != 2:
+            raise OSError(errno.ENOSPC, "No space left on device")
+        return work_dir
+
+    monkeypatch.setattr(t8n, "_evaluate_filesystem_in_work_dir", evaluate_in_work_dir)
+    assert t8n._evaluate_filesystem(t8n_data=None) == work_dirs[-1]  # type: ignore[arg-type]
+    assert [Path(work_dir).parent for work_dir in work_dirs] == [
+        tmp_path,
+        Path(tempfile.gettempdir()),
+    ]
+    with pytest.raises(OSError):
+        t8n._evaluate_filesystem(t8n_data=None)  # type: ignore[arg-type]
+
+
+class FakeT8nServer:
+    """
+    Fake t8n server that echoes the gas limit of every request as its `_info`
+    metadata, and which can be broken to drop every connection until it is
+    restarted.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the fake server, which is not started yet."""
+        self.starts = 0
+        self.broken_instance = 0
+        self.server: ThreadingHTTPServer | None = None
+
+    def start(self) -> str:
+        """Start a new server instance and return its URL."""
+        self.starts += 1
+        instance = self.starts
+        fake_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:  # noqa: N802
+                request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                # Let concurrent requests overlap.
+                time.sleep(0.05)
+                if fake_server.broken_instance == instance:
+                    self.close_connection = True
+                    return
+                gas_limit = request["input"]["env"]["currentGasLimit"]
+                zero_hash = "0x" + "00" * 32
+                body = json.dumps(
+                    {
+                        "alloc": {},
+                        "result": {
+                            "stateRoot": zero_hash,
+                            "txRoot": zero_hash,
+                            "receiptsRoot": zero_hash,
+                            "logsHash": zero_hash,
+                            "logsBloom": "0x" + "00" * 256,
+                            "receipts": [],
+                            "gasUsed": "0x0",
+                        },
+                        "_info_metadata": {"gasLimit": gas_limit},
+                    }
+                ).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: Any) -> None:
+                del args
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return f"http://127.0.0.1:{self.server.server_address[1]}/"
+
+    def stop(self) -> None:
+        """Stop the running server instance, if any."""
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+
+def test_parallel_probes_server(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that concurrent gas limit probes on a single server-mode tool restart
+    a failing server only once, and keep the `_info` metadata of each
+    thread's evaluations apart.
+    """
+    monkeypatch.setenv("NO_PROXY", "*")
+    server = FakeT8nServer()
+    t8n = object.__new__(ExecutionSpecsTransitionTool)
+    t8n.exception_mapper = ExecutionSpecsExceptionMapper()
+    t8n.trace = False
+
+    def start_server() -> None:
+        t8n.server_url = server.start()
+
+    monkeypatch.setattr(t8n, "start_server", start_server)
+    monkeypatch.setattr(t8n, "shutdown", server.stop)
+    metadata: Dict[int, int] = {}
+    metadata_lock = threading.Lock()
+
+    def info_gas_limit() -> int:
+        assert t8n._info_metadata is not None
+        return int(t8n._info_metadata["gasLimit"], 16)
+
+    def evaluate(gas_limit: int) -> None:
+        t8n.evaluate(
+            transition_tool_data=TransitionTool.TransitionToolData(
+                alloc=Alloc(),
+                txs=[],
+                env=Environment(gas_limit=gas_limit),
+                fork=Prague,
+                chain_id=1,
+                reward=0,
+                blob_schedule=None,
+            )
+        )
+        with metadata_lock:
+            metadata[gas_limit] = info_gas_limit()
+
+    def verify_gas_limit(gas_limit: int) -> bool:
+        evaluate(gas_limit)
+        return gas_limit >= 50_000
+
+    try:
+        evaluate(100_000)
+        server.broken_instance = server.starts
+        assert (
+            find_minimum_gas_limit(verify_gas_limit, maximum_gas_limit=100_000, parallel_probes=4)
+            == 50_000
+        )
+    finally:
+        server.stop()
+
+    assert server.starts == 2
+    assert len(metadata) > 4
+    assert all(value == gas_limit for gas_limit, value in metadata.items())
+    assert info_gas_limit() == 100_000
+
+
+def test_run_streaming_process() -> None:
+    """
+    Test that a process is fed its input chunk by chunk while its outputs are
+    read, with inputs larger than the pipe buffers.
+    """
+    chunks = [bytes([i]) * 100_000 for i in range(20)]
+    script = (
+        "import sys; data = sys.stdin.buffer.read(); "
+        "sys.stderr.write(str(len(data))); sys.stdout.buffer.write(data[::-1])"
+    )
+    result = run_streaming_process([sys.executable, "-c", script], iter(chunks))
+    assert result.returncode == 0
+    assert result.stderr == b"2000000"
+    assert result.stdout == b"".join(chunks)[::-1]
+
+    result = run_streaming_process([sys.executable, "-c", "import sys; sys.exit(3)"], chunks)
+    assert result.returncode == 3
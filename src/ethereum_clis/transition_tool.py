@@ -1,5 +1,6 @@
 """Transition tool abstract class."""
 
+import errno
 import json
 import os
 import shutil
@@ -10,7 +11,19 @@ import time
 from abc import abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, ClassVar, Dict, List, LiteralString, Mapping, Optional, Type
+from threading import Lock, Thread, local
+from typing import (
+    IO,
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    LiteralString,
+    Mapping,
+    Optional,
+    Type,
+)
 from urllib.parse import urlencode
 
 from requests import Response
@@ -24,11 +37,14 @@ from ethereum_test_exceptions import ExceptionMapper
 from ethereum_test_forks import Fork
 from ethereum_test_forks.helpers import get_development_forks, get_forks
 from ethereum_test_types import Alloc, Environment, Transaction
+from pytest_plugins.custom_logging import get_logger
+from pytest_plugins.filler.fill_timing import fill_timing_span
 
 from .cli_types import (
     OpcodeCount,
+    Result,
     Traces,
-    TransactionReceipt,
+    TracesDigestOptions,
     TransactionTraces,
     TransitionToolContext,
     TransitionToolInput,
@@ -36,7 +52,9 @@ from .cli_types import (
     TransitionToolRequest,
 )
 from .ethereum_cli import EthereumCLI
-from .file_utils import dump_files_to_directory, write_json_file
+from .file_utils import WorkDirectoryPool, dump_files_to_directory
+
+logger = get_logger(__name__)
 
 model_dump_config: Mapping = {"by_alias": True, "exclude_none": True}
 
@@ -45,6 +63,75 @@ model_dump_config: Mapping = {"by_alias": True, "exclude_none": True}
 NORMAL_SERVER_TIMEOUT = 600
 SLOW_REQUEST_TIMEOUT = 600
 
+_work_directories_lock = Lock()
+# Serializes the start and restarts of t8n servers, which can be requested by
+# concurrent evaluations of the same tool.
+_server_lock = Lock()
+
+
+STREAM_READ_SIZE = 1 << 20
+
+
+def read_stream(stream: IO[bytes]) -> bytearray:
+    """
+    Read a stream until its end into a single buffer that grows in place,
+    instead of joining a list of chunks at the end.
+    """
+    data = bytearray()
+    while chunk := stream.read(STREAM_READ_SIZE):
+        data += chunk
+    return data
+
+
+def run_streaming_process(
+    args: List[str], input_chunks: Iterable[bytes]
+) -> subprocess.CompletedProcess[bytearray]:
+    """
+    Run a process, writing its stdin chunk by chunk as the chunks are
+    generated, while its stdout and stderr are read concurrently.
+
+    Unlike `subprocess.run(input=...)`, the complete input is never held in
+    memory, and the outputs are not copied once the process finishes.
+    """
+    process = subprocess.Popen(
+        args, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    assert process.stdin is not None
+    assert process.stdout is not None
+    assert process.stderr is not None
+    stdin, stderr_stream = process.stdin, process.stderr
+    input_errors: List[BaseException] = []
+    stderr = bytearray()
+
+    def write_input() -> None:
+        try:
+            for chunk in input_chunks:
+                stdin.write(chunk)
+        except BrokenPipeError:
+            # The process exited early, its stderr explains why.
+            pass
+        except BaseException as e:
+            input_errors.append(e)
+        finally:
+            try:
+                stdin.close()
+            except BrokenPipeError:
+                pass
+
+    def read_stderr() -> None:
+        stderr.extend(read_stream(stderr_stream))
+
+    threads = [Thread(target=write_input), Thread(target=read_stderr)]
+    for thread in threads:
+        thread.start()
+    stdout = read_stream(process.stdout)
+    for thread in threads:
+        thread.join()
+    returncode = process.wait()
+    if input_errors:
+        raise input_errors[0]
+    return subprocess.CompletedProcess(args, returncode, stdout, stderr)
+
 
 def get_valid_transition_tool_names() -> set[str]:
     """
@@ -72,6 +159,7 @@ class TransitionTool(EthereumCLI):
     t8n_use_stream: bool = False
     t8n_use_server: bool = False
     server_url: str | None = None
+    _server_generation: int = 0
     process: Optional[subprocess.Popen] = None
     supports_opcode_count: ClassVar[bool] = False
 
@@ -93,7 +181,7 @@ class TransitionTool(EthereumCLI):
         self.exception_mapper = exception_mapper
         super().__init__(binary=binary)
         self.trace = trace
-        self._info_metadata: Optional[Dict[str, Any]] = {}
+        self._info_metadata = {}
 
     def __init_subclass__(cls) -> None:
         """Register all subclasses of TransitionTool as possible tools."""
@@ -115,6 +203,47 @@ class TransitionTool(EthereumCLI):
         """Perform any cleanup tasks related to the tested tool."""
         pass
 
+    @property
+    def _thread_state(self) -> local:
+        """Return the state of the tool that is local to the current thread."""
+        return self.__dict__.setdefault("_thread_local_state", local())
+
+    @property
+    def _info_metadata(self) -> Optional[Dict[str, Any]]:
+        """
+        Return the test `_info` metadata returned by the last evaluation
+        performed by the current thread.
+
+        Evaluations can run concurrently on the same tool, e.g. the gas limit
+        probes of the gas optimization mode, so the metadata is kept per
+        thread and the one of the main thread's evaluations is never
+        overwritten by a probe.
+        """
+        return getattr(self._thread_state, "info_metadata", {})
+
+    @_info_metadata.setter
+    def _info_metadata(self, value: Optional[Dict[str, Any]]) -> None:
+        self._thread_state.info_metadata = value
+
+    @property
+    def work_directories(self) -> WorkDirectoryPool:
+        """
+        Return the pool of work directories used to evaluate the tool through
+        the filesystem, created on first use.
+
+        Each pytest-xdist worker has its own tool instance, so work directories
+        are reused across the evaluations of the worker, and are created in
+        memory-backed storage when available.
+        """
+        with _work_directories_lock:
+            work_directories = getattr(self, "_work_directories", None)
+            if work_directories is None:
+                work_directories = WorkDirectoryPool(
+                    prefix="t8n-", subdirectories=["input", "output"]
+                )
+                self._work_directories = work_directories
+            return work_directories
+
     def reset_traces(self) -> None:
         """Reset the internal trace storage for a new test to begin."""
         self.traces = None
@@ -134,27 +263,39 @@ class TransitionTool(EthereumCLI):
 
     def collect_traces(
         self,
-        receipts: List[TransactionReceipt],
-        temp_dir: tempfile.TemporaryDirectory,
+        result: Result,
+        temp_dir: tempfile.TemporaryDirectory | str,
         debug_output_path: str = "",
-    ) -> Traces:
+        traces_digest: TracesDigestOptions | None = None,
+    ) -> None:
         """
-        Collect the traces from the t8n tool output and store them in the
-        traces list.
+        Collect the traces from the t8n tool output into the result and store
+        them in the traces list.
+
+        If `traces_digest` is given, the digest of the traces is also computed
+        while streaming the trace files. When it is compared against a
+        reference, the traces are never materialized nor stored, only the
+        records around the first divergence are logged.
         """
-        traces: Traces = Traces(root=[])
-        temp_dir_path = Path(temp_dir.name)
-        for i, r in enumerate(receipts):
-            trace_file_name = f"trace-{i}-{r.transaction_hash}.jsonl"
-            trace_file_path = temp_dir_path / trace_file_name
-            if debug_output_path:
-                shutil.copy(
-                    trace_file_path,
-                    Path(debug_output_path) / trace_file_name,
-                )
-            traces.append(TransactionTraces.from_file(trace_file_path))
+        temp_dir_path = Path(temp_dir if isinstance(temp_dir, str) else temp_dir.name)
+        with fill_timing_span("trace collection"):
+            trace_file_paths: List[Path] = []
+            for i, r in enumerate(result.receipts):
+                trace_file_name = f"trace-{i}-{r.transaction_hash}.jsonl"
+                trace_file_path = temp_dir_path / trace_file_name
+                if debug_output_path:
+                    shutil.copy(
+                        trace_file_path,
+                        Path(debug_output_path) / trace_file_name,
+                    )
+                trace_file_paths.append(trace_file_path)
+            if traces_digest is not None:
+                result.traces_digest = traces_digest.digest_files(trace_file_paths)
+                if traces_digest.reference is not None:
+                    return
+            traces = Traces(root=[TransactionTraces.from_file(path) for path in trace_file_paths])
+        result.traces = traces
         self.append_traces(traces)
-        return traces
 
     @dataclass
     class TransitionToolData:
@@ -237,22 +378,65 @@ class TransitionTool(EthereumCLI):
         *,
         t8n_data: TransitionToolData,
         debug_output_path: str = "",
+        traces_digest: TracesDigestOptions | None = None,
     ) -> TransitionToolOutput:
         """
         Execute a transition tool using the filesystem for its inputs and
-        outputs.
+        outputs, in a reusable work directory of this tool.
+
+        If the memory-backed storage of the work directories runs out of
+        space, the evaluation is retried in the default temporary directory.
         """
-        temp_dir = tempfile.TemporaryDirectory()
-        os.mkdir(os.path.join(temp_dir.name, "input"))
-        os.mkdir(os.path.join(temp_dir.name, "output"))
+        try:
+            with self.work_directories.acquire() as work_dir:
+                return self._evaluate_filesystem_in_work_dir(
+                    t8n_data=t8n_data,
+                    work_dir=work_dir,
+                    debug_output_path=debug_output_path,
+                    traces_digest=traces_digest,
+                )
+        except OSError as e:
+            if (
+                e.errno != errno.ENOSPC
+                or not self.work_directories.fall_back_to_default_temp_dir()
+            ):
+                raise
+            logger.warning("Out of memory-backed storage, using the default temporary directory.")
+        with self.work_directories.acquire() as work_dir:
+            return self._evaluate_filesystem_in_work_dir(
+                t8n_data=t8n_data,
+                work_dir=work_dir,
+                debug_output_path=debug_output_path,
+                traces_digest=traces_digest,
+            )
 
-        input_contents = t8n_data.to_input().model_dump(mode="json", **model_dump_config)
+    def _evaluate_filesystem_in_work_dir(
+        self,
+        *,
+        t8n_data: TransitionToolData,
+        work_dir: str,
+        debug_output_path: str = "",
+        traces_digest: TracesDigestOptions | None = None,
+    ) -> TransitionToolOutput:
+        """
+        Write the inputs of the transition tool to the given empty work
+        directory, execute it and parse its outputs.
 
-        input_paths = {
-            k: os.path.join(temp_dir.name, "input", f"{k}.json") for k in input_contents.keys()
-        }
-        for key, file_path in input_paths.items():
-            write_json_file(input_contents[key], file_path)
+        Each input file is serialized and written in a single pass, indented
+        only when the debug output is requested, and the output files are
+        validated directly from their contents.
+        """
+        with fill_timing_span("input serialization"):
+            input_contents = t8n_data.to_input().json_files(
+                indent=4 if debug_output_path else None, **model_dump_config
+            )
+
+            input_paths = {
+                k: os.path.join(work_dir, "input", f"{k}.json") for k in input_contents.keys()
+            }
+            for key, file_path in input_paths.items():
+                with open(file_path, "wb") as f:
+                    f.write(input_contents[key])
 
         output_paths = {
             output: os.path.join("output", f"{output}.json") for output in ["alloc", "result"]
@@ -273,7 +457,7 @@ class TransitionTool(EthereumCLI):
             "--input.txs",
             input_paths["txs"],
             "--output.basedir",
-            temp_dir.name,
+            work_dir,
             "--output.result",
             output_paths["result"],
             "--output.alloc",
@@ -303,16 +487,17 @@ class TransitionTool(EthereumCLI):
         if self.trace:
             args.append("--trace")
 
-        result = subprocess.run(
-            args,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+        with fill_timing_span("execution"):
+            result = subprocess.run(
+                args,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
 
         if debug_output_path:
             if os.path.exists(debug_output_path):
                 shutil.rmtree(debug_output_path)
-            shutil.copytree(temp_dir.name, debug_output_path)
+            shutil.copytree(work_dir, debug_output_path)
             t8n_output_base_dir = os.path.join(debug_output_path, "t8n.sh.out")
             t8n_call = " ".join(args)
             for file_path in input_paths.values():  # update input paths
@@ -321,7 +506,7 @@ class TransitionTool(EthereumCLI):
                 )
             # use a new output path for basedir and outputs
             t8n_call = t8n_call.replace(
-                temp_dir.name,
+                work_dir,
                 t8n_output_base_dir,
             )
             t8n_script = textwrap.dedent(
@@ -348,19 +533,20 @@ class TransitionTool(EthereumCLI):
             raise Exception("failed to evaluate: " + result.stderr.decode())
 
         for key, file_path in output_paths.items():
-            output_paths[key] = os.path.join(temp_dir.name, file_path)
-
-        output_contents = {}
-        for key, file_path in output_paths.items():
-            if "txs.rlp" in file_path:
-                continue
-            with open(file_path, "r+") as file:
-                output_contents[key] = json.load(file)
-        output = TransitionToolOutput.model_validate(
-            output_contents, context={"exception_mapper": self.exception_mapper}
-        )
+            output_paths[key] = os.path.join(work_dir, file_path)
+
+        with fill_timing_span("output parsing"):
+            # The body (txs.rlp) is not needed by the callers and is not
+            # parsed.
+            output = TransitionToolOutput(
+                alloc=Alloc.model_validate_json(Path(output_paths["alloc"]).read_bytes()),
+                result=Result.model_validate_json(
+                    Path(output_paths["result"]).read_bytes(),
+                    context={"exception_mapper": self.exception_mapper},
+                ),
+            )
         if self.supports_opcode_count:
-            opcode_count_file_path = Path(temp_dir.name) / "opcodes.json"
+            opcode_count_file_path = Path(work_dir) / "opcodes.json"
             if opcode_count_file_path.exists():
                 opcode_count = OpcodeCount.model_validate_json(opcode_count_file_path.read_text())
                 output.result.opcode_count = opcode_count
@@ -374,11 +560,7 @@ class TransitionTool(EthereumCLI):
                     )
 
         if self.trace:
-            output.result.traces = self.collect_traces(
-                output.result.receipts, temp_dir, debug_output_path
-            )
-
-        temp_dir.cleanup()
+            self.collect_traces(output.result, work_dir, debug_output_path, traces_digest)
 
         return output
 
@@ -388,6 +570,17 @@ class TransitionTool(EthereumCLI):
         time.sleep(0.1)
         self.start_server()
 
+    def _restart_server_once(self, generation: int) -> None:
+        """
+        Restart the server unless it was already restarted since `generation`
+        was read, so concurrent requests that fail at the same time only
+        restart it once, and retry against the restarted server.
+        """
+        with _server_lock:
+            if self._server_generation == generation:
+                self._restart_server()
+                self._server_generation = generation + 1
+
     def _server_post(
         self,
         data: Dict[str, Any],
@@ -401,15 +594,18 @@ class TransitionTool(EthereumCLI):
         post_delay = 0.1
 
         while True:
+            with _server_lock:
+                generation = self._server_generation
+                server_url = self.server_url
             try:
                 response = Session().post(
-                    f"{self.server_url}?{urlencode(url_args, doseq=True)}",
+                    f"{server_url}?{urlencode(url_args, doseq=True)}",
                     json=data,
                     timeout=timeout,
                 )
                 break
             except (RequestsConnectionError, ReadTimeout) as e:
-                self._restart_server()
+                self._restart_server_once(generation)
                 retries -= 1
                 if retries == 0:
                     raise e
@@ -433,13 +629,15 @@ class TransitionTool(EthereumCLI):
         *,
         t8n_data: TransitionToolData,
         debug_output_path: str = "",
+        traces_digest: TracesDigestOptions | None = None,
         timeout: int,
     ) -> TransitionToolOutput:
         """
         Execute the transition tool sending inputs and outputs via a server.
         """
-        request_data = t8n_data.get_request_data()
-        request_data_json = request_data.model_dump(mode="json", **model_dump_config)
+        with fill_timing_span("input serialization"):
+            request_data = t8n_data.get_request_data()
+            request_data_json = request_data.model_dump(mode="json", **model_dump_config)
 
         temp_dir = tempfile.TemporaryDirectory()
         request_data_json["trace"] = self.trace
@@ -465,22 +663,24 @@ class TransitionTool(EthereumCLI):
                 },
             )
 
-        response = self._server_post(
-            data=request_data_json, url_args=self._generate_post_args(t8n_data), timeout=timeout
-        )
-        response_json = response.json()
+        with fill_timing_span("execution"):
+            response = self._server_post(
+                data=request_data_json,
+                url_args=self._generate_post_args(t8n_data),
+                timeout=timeout,
+            )
+        with fill_timing_span("output parsing"):
+            response_json = response.json()
 
-        # pop optional test ``_info`` metadata from response, if present
-        self._info_metadata = response_json.pop("_info_metadata", {})
+            # pop optional test ``_info`` metadata from response, if present
+            self._info_metadata = response_json.pop("_info_metadata", {})
 
-        output: TransitionToolOutput = TransitionToolOutput.model_validate(
-            response_json, context={"exception_mapper": self.exception_mapper}
-        )
+            output: TransitionToolOutput = TransitionToolOutput.model_validate(
+                response_json, context={"exception_mapper": self.exception_mapper}
+            )
 
         if self.trace:
-            output.result.traces = self.collect_traces(
-                output.result.receipts, temp_dir, debug_output_path
-            )
+            self.collect_traces(output.result, temp_dir, debug_output_path, traces_digest)
         temp_dir.cleanup()
 
         if debug_output_path:
@@ -506,6 +706,7 @@ class TransitionTool(EthereumCLI):
         *,
         t8n_data: TransitionToolData,
         debug_output_path: str = "",
+        traces_digest: TracesDigestOptions | None = None,
     ) -> TransitionToolOutput:
         """
         Execute a transition tool using stdin and stdout for its inputs and
@@ -515,22 +716,18 @@ class TransitionTool(EthereumCLI):
         args = self.construct_args_stream(t8n_data, temp_dir)
 
         stdin = t8n_data.to_input()
-
-        result = subprocess.run(
-            args,
-            input=stdin.model_dump_json(**model_dump_config).encode(),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+        with fill_timing_span("execution"):
+            result = run_streaming_process(args, stdin.iter_json_chunks(**model_dump_config))
 
         self.dump_debug_stream(debug_output_path, temp_dir, stdin, args, result)
 
         if result.returncode != 0:
             raise Exception("failed to evaluate: " + result.stderr.decode())
 
-        output: TransitionToolOutput = TransitionToolOutput.model_validate_json(
-            result.stdout, context={"exception_mapper": self.exception_mapper}
-        )
+        with fill_timing_span("output parsing"):
+            output: TransitionToolOutput = TransitionToolOutput.model_validate_json(
+                result.stdout, context={"exception_mapper": self.exception_mapper}
+            )
 
         if debug_output_path:
             dump_files_to_directory(
@@ -543,9 +740,7 @@ class TransitionTool(EthereumCLI):
             )
 
         if self.trace:
-            output.result.traces = self.collect_traces(
-                output.result.receipts, temp_dir, debug_output_path
-            )
+            self.collect_traces(output.result, temp_dir, debug_output_path, traces_digest)
 
         temp_dir.cleanup()
         return output
@@ -663,6 +858,7 @@ class TransitionTool(EthereumCLI):
         transition_tool_data: TransitionToolData,
         debug_output_path: str = "",
         slow_request: bool = False,
+        traces_digest: TracesDigestOptions | None = None,
     ) -> TransitionToolOutput:
         """
         Execute the relevant evaluate method as required by the `t8n` tool.
@@ -671,20 +867,25 @@ class TransitionTool(EthereumCLI):
         can be overridden.
         """
         if self.t8n_use_server:
-            if not self.server_url:
-                self.start_server()
+            with _server_lock:
+                if not self.server_url:
+                    self.start_server()
             return self._evaluate_server(
                 t8n_data=transition_tool_data,
                 debug_output_path=debug_output_path,
+                traces_digest=traces_digest,
                 timeout=SLOW_REQUEST_TIMEOUT if slow_request else NORMAL_SERVER_TIMEOUT,
             )
 
         if self.t8n_use_stream:
             return self._evaluate_stream(
-                t8n_data=transition_tool_data, debug_output_path=debug_output_path
+                t8n_data=transition_tool_data,
+                debug_output_path=debug_output_path,
+                traces_digest=traces_digest,
             )
 
         return self._evaluate_filesystem(
             t8n_data=transition_tool_data,
             debug_output_path=debug_output_path,
+            traces_digest=traces_digest,
         )
@@ -2,12 +2,49 @@
 
 import re
 from abc import ABC
-from typing import Any, ClassVar, Dict, Generic, List
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, Dict, Generic, List, Tuple
 
 from pydantic import BaseModel, BeforeValidator, ValidationInfo
 
 from .exceptions import ExceptionBase, ExceptionBoundTypeVar, UndefinedException
 
+MESSAGE_CACHE_SIZE = 1024
+"""Number of recently matched messages cached by each exception mapper."""
+
+
+class ExceptionMessageMatcher:
+    """
+    Match error messages against the substring and regex mappings of an
+    exception mapper, caching the results of recently matched messages.
+    """
+
+    substrings: Tuple[Tuple[ExceptionBase, str], ...]
+    patterns: Tuple[Tuple[ExceptionBase, re.Pattern], ...]
+    match: Callable[[str], Tuple[ExceptionBase, ...]]
+
+    def __init__(
+        self,
+        mapping_substring: Dict[ExceptionBase, str],
+        mapping_regex: Dict[ExceptionBase, str],
+    ) -> None:
+        """Compile the mappings of an exception mapper."""
+        self.substrings = tuple(mapping_substring.items())
+        self.patterns = tuple(
+            (exception, re.compile(regex)) for exception, regex in mapping_regex.items()
+        )
+        self.match = lru_cache(maxsize=MESSAGE_CACHE_SIZE)(self._match)
+
+    def _match(self, message: str) -> Tuple[ExceptionBase, ...]:
+        """
+        Return the exceptions of all the substrings and regexes that match the
+        message, in mapping order.
+        """
+        return tuple(
+            [exception for exception, substring in self.substrings if substring in message]
+            + [exception for exception, pattern in self.patterns if pattern.search(message)]
+        )
+
 
 class ExceptionMapper(ABC):
     """
@@ -16,7 +53,7 @@ class ExceptionMapper(ABC):
     """
 
     mapper_name: str
-    _mapping_compiled_regex: Dict[ExceptionBase, re.Pattern]
+    _message_matcher: ClassVar[ExceptionMessageMatcher]
 
     mapping_substring: ClassVar[Dict[ExceptionBase, str]]
     """
@@ -31,8 +68,8 @@ class ExceptionMapper(ABC):
     """
     Mapping of exception to regex that should be present in the error message.
 
-    Items in this mapping are compiled into regex patterns for faster matching,
-    and then used for regex matching (`pattern.search(message)`).
+    Items in this mapping are compiled into regex patterns when the subclass is
+    created, and then used for regex matching (`pattern.search(message)`).
     """
     reliable: ClassVar[bool] = True
     """
@@ -40,6 +77,17 @@ class ExceptionMapper(ABC):
     accurately mapped to the exceptions in this class.
     """
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Compile the mappings of the subclass into a message matcher shared by
+        all of its instances.
+        """
+        super().__init_subclass__(**kwargs)
+        mapping_substring = getattr(cls, "mapping_substring", None)
+        mapping_regex = getattr(cls, "mapping_regex", None)
+        if mapping_substring is not None and mapping_regex is not None:
+            cls._message_matcher = ExceptionMessageMatcher(mapping_substring, mapping_regex)
+
     def __init__(self) -> None:
         """Initialize the exception mapper."""
         # Ensure that the subclass has properly defined mapping_substring
@@ -47,23 +95,14 @@ class ExceptionMapper(ABC):
         assert self.mapping_substring is not None, "mapping_substring must be defined in subclass"
         assert self.mapping_regex is not None, "mapping_regex must be defined in subclass"
         self.mapper_name = self.__class__.__name__
-        self._mapping_compiled_regex = {
-            exception: re.compile(message) for exception, message in self.mapping_regex.items()
-        }
 
     def message_to_exception(
         self, exception_string: str
     ) -> List[ExceptionBase] | UndefinedException:
         """Match a formatted string to an exception."""
-        exceptions: List[ExceptionBase] = []
-        for exception, substring in self.mapping_substring.items():
-            if substring in exception_string:
-                exceptions.append(exception)
-        for exception, pattern in self._mapping_compiled_regex.items():
-            if pattern.search(exception_string):
-                exceptions.append(exception)
+        exceptions = self._message_matcher.match(exception_string)
         if exceptions:
-            return exceptions
+            return list(exceptions)
         return UndefinedException(exception_string, mapper_name=self.mapper_name)
 
 
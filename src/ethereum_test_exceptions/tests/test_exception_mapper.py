@@ -0,0 +1,47 @@
+"""Test suite for the exception mapper."""
+
+from ..exception_mapper import ExceptionMapper
+from ..exceptions import BlockException, TransactionException, UndefinedException
+
+
+class ExampleExceptionMapper(ExceptionMapper):
+    """Exception mapper with substring and regex mappings."""
+
+    mapping_substring = {
+        TransactionException.NONCE_MISMATCH_TOO_LOW: "nonce too low",
+        TransactionException.INTRINSIC_GAS_TOO_LOW: "intrinsic gas too low",
+    }
+    mapping_regex = {
+        BlockException.INCORRECT_BLOB_GAS_USED: r"blob gas used \d+ != \d+",
+        TransactionException.NONCE_MISMATCH_TOO_LOW: r"(?i)NONCE \d+ too low",
+    }
+
+
+def test_message_to_exception() -> None:
+    """
+    Test that all the matching substrings and regexes are returned in mapping
+    order, and that repeated messages return the same exceptions.
+    """
+    mapper = ExampleExceptionMapper()
+    message = "intrinsic gas too low, nonce too low, blob gas used 1 != 2"
+    expected = [
+        TransactionException.NONCE_MISMATCH_TOO_LOW,
+        TransactionException.INTRINSIC_GAS_TOO_LOW,
+        BlockException.INCORRECT_BLOB_GAS_USED,
+    ]
+    assert mapper.message_to_exception(message) == expected
+    exceptions = mapper.message_to_exception(message)
+    assert isinstance(exceptions, list)
+    exceptions.clear()
+    assert mapper.message_to_exception(message) == expected
+    assert mapper.message_to_exception("Nonce 5 too low") == [
+        TransactionException.NONCE_MISMATCH_TOO_LOW
+    ]
+
+
+def test_message_to_undefined_exception() -> None:
+    """Test that an unmatched message returns an undefined exception."""
+    exception = ExampleExceptionMapper().message_to_exception("unknown error")
+    assert isinstance(exception, UndefinedException)
+    assert exception == "unknown error"
+    assert exception.mapper_name == "ExampleExceptionMapper"
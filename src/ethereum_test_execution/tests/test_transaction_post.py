@@ -0,0 +1,92 @@
+"""Test the post-state verification of the transaction post execute format."""
+
+from typing import Dict, List, Mapping, Sequence
+
+import pytest
+
+from ethereum_test_base_types import Account, Address, Alloc, Hash
+from ethereum_test_forks import Cancun
+from ethereum_test_rpc import AccountState
+
+from ..transaction_post import TransactionPost
+
+
+class FakeEthRPC:
+    """RPC returning the state of the accounts from a fixed state."""
+
+    def __init__(self, state: Dict[Address, AccountState]) -> None:
+        """Initialize the RPC with the state of the accounts."""
+        self.state = state
+        self.requested_storage_keys: List[Mapping[Address, Sequence[Hash]]] = []
+
+    def get_accounts(
+        self, storage_keys: Mapping[Address, Sequence[Hash]]
+    ) -> Dict[Address, AccountState]:
+        """Return the state of the accounts, with the requested storage."""
+        self.requested_storage_keys.append(storage_keys)
+        empty = AccountState(balance=0, code=b"", nonce=0, storage={})
+        accounts = {}
+        for address, keys in storage_keys.items():
+            account = self.state.get(address, empty)
+            accounts[address] = account.model_copy(
+                update={"storage": {key: account.storage.get(key, Hash(0)) for key in keys}}
+            )
+        return accounts
+
+
+CONTRACT = Address(0x1000)
+EMPTY = Address(0x2000)
+STATE = {
+    CONTRACT: AccountState(balance=10, code=b"\x60\x01", nonce=1, storage={Hash(1): Hash(2)}),
+}
+
+
+@pytest.mark.parametrize(
+    "post,error",
+    [
+        pytest.param(
+            {CONTRACT: Account(balance=10, nonce=1, storage={1: 2, 3: 0}), EMPTY: None},
+            None,
+            id="valid",
+        ),
+        pytest.param(
+            {CONTRACT: Account(storage={1: 3})},
+            f"Storage value at 0x01 of {CONTRACT} is {Hash(2)},expected 0x03.",
+            id="storage_mismatch",
+        ),
+        pytest.param(
+            {CONTRACT: Account(nonce=2)},
+            f"Nonce of {CONTRACT} is 1, expected 0x02.",
+            id="nonce_mismatch",
+        ),
+        pytest.param(
+            {CONTRACT: None},
+            f"Balance of {CONTRACT} is 10, expected 0.",
+            id="unexpected_account",
+        ),
+    ],
+)
+def test_post_state_verification(post: Dict, error: str | None) -> None:
+    """
+    Test that the state of all the post accounts is requested at once and
+    verified in memory.
+    """
+    eth_rpc = FakeEthRPC(STATE)
+    transaction_post = TransactionPost(blocks=[], post=Alloc(post))
+
+    def execute() -> None:
+        transaction_post.execute(
+            fork=Cancun,
+            eth_rpc=eth_rpc,  # type: ignore[arg-type]
+            engine_rpc=None,
+            request=None,  # type: ignore[arg-type]
+        )
+
+    if error is None:
+        execute()
+    else:
+        with pytest.raises(AssertionError) as exc_info:
+            execute()
+        assert str(exc_info.value).startswith(error)
+    assert len(eth_rpc.requested_storage_keys) == 1
+    assert set(eth_rpc.requested_storage_keys[0]) == set(Alloc(post).root)
@@ -1,6 +1,6 @@
 """Simple transaction-send then post-check execution format."""
 
-from typing import ClassVar, List
+from typing import ClassVar, Dict, List
 
 import pytest
 from pytest import FixtureRequest
@@ -82,8 +82,8 @@ class TransactionPost(BaseExecute):
         if not self.skip_gas_used_validation and self.expected_benchmark_gas_used is not None:
             total_gas_used = 0
             # Fetch transaction receipts to get actual gas used
-            for tx_hash in all_tx_hashes:
-                receipt = eth_rpc.get_transaction_receipt(tx_hash)
+            receipts = eth_rpc.get_transaction_receipts(all_tx_hashes)
+            for tx_hash, receipt in zip(all_tx_hashes, receipts, strict=True):
                 assert receipt is not None, f"Failed to get receipt for transaction {tx_hash}"
                 gas_used = int(receipt["gasUsed"], 16)
                 total_gas_used += gas_used
@@ -95,10 +95,21 @@ class TransactionPost(BaseExecute):
                 f"difference: {total_gas_used - self.expected_benchmark_gas_used}"
             )
 
+        # Retrieve the state of all the post accounts up front, in batch
+        # requests, and compare it in memory
+        storage_keys: Dict[Address, List[Hash]] = {}
         for address, account in self.post.root.items():
-            balance = eth_rpc.get_balance(address)
-            code = eth_rpc.get_code(address)
-            nonce = eth_rpc.get_transaction_count(address)
+            storage_keys[address] = (
+                [Hash(key) for key in account.storage.keys()]
+                if account is not None and "storage" in account.model_fields_set
+                else []
+            )
+        account_states = eth_rpc.get_accounts(storage_keys)
+        for address, account in self.post.root.items():
+            account_state = account_states[address]
+            balance = account_state.balance
+            code = account_state.code
+            nonce = account_state.nonce
             if account is None:
                 assert balance == 0, f"Balance of {address} is {balance}, expected 0."
                 assert code == b"", f"Code of {address} is {code}, expected 0x."
@@ -118,7 +129,7 @@ class TransactionPost(BaseExecute):
                     )
                 if "storage" in account.model_fields_set:
                     for key, value in account.storage.items():
-                        storage_value = eth_rpc.get_storage_at(address, Hash(key))
+                        storage_value = account_state.storage[Hash(key)]
                         assert storage_value == value, (
                             f"Storage value at {key} of {address} is {storage_value},"
                             f"expected {value}."
@@ -9,7 +9,7 @@ from .blockchain import (
     BlockchainFixture,
     BlockchainFixtureCommon,
 )
-from .collector import FixtureCollector, TestInfo
+from .collector import FixtureCollector, FixtureOutputWriter, TestInfo
 from .consume import FixtureConsumer
 from .eof import EOFFixture
 from .pre_alloc_groups import PreAllocGroup, PreAllocGroups
@@ -29,6 +29,7 @@ __all__ = [
     "FixtureConsumer",
     "FixtureFillingPhase",
     "FixtureFormat",
+    "FixtureOutputWriter",
     "LabeledFixtureFormat",
     "PreAllocGroups",
     "PreAllocGroup",
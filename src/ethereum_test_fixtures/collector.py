@@ -7,9 +7,11 @@ import json
 import os
 import re
 import sys
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import ClassVar, Dict, Literal, Optional, Tuple
+from typing import ClassVar, Deque, Dict, Literal, Optional, Tuple
 
 from ethereum_test_base_types import to_json
 
@@ -104,6 +106,54 @@ class TestInfo:
         return module_path
 
 
+class FixtureOutputWriter:
+    """
+    Write fixture files from a background thread, so the serialization and
+    output of the fixtures overlaps with the filling of the following tests.
+
+    The background thread shares the GIL with the filling, so the output only
+    overlaps with the time spent waiting on the transition tool.
+
+    Files are written one at a time, in the order they are submitted, so
+    several writes of the same file are applied in order. At most
+    `max_pending` writes are queued; submitting further writes waits for the
+    oldest ones, bounding the memory held by the queued fixtures.
+
+    Errors raised while writing a file are re-raised by the next call to
+    `submit` or `wait`.
+    """
+
+    max_pending: int
+    _executor: ThreadPoolExecutor
+    _pending: Deque[Future]
+
+    def __init__(self, *, max_pending: int = 64) -> None:
+        """Initialize the writer and its background thread."""
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fixture-output")
+        self._pending = deque()
+
+    def submit(self, fixtures: Fixtures, file_path: Path) -> None:
+        """Queue the fixtures to be collected into the given file."""
+        while self._pending and (
+            self._pending[0].done() or len(self._pending) >= self.max_pending
+        ):
+            self._pending.popleft().result()
+        self._pending.append(self._executor.submit(fixtures.collect_into_file, file_path))
+
+    def wait(self) -> None:
+        """Wait until all queued files are written."""
+        while self._pending:
+            self._pending.popleft().result()
+
+    def shutdown(self) -> None:
+        """Wait for the queued files and stop the background thread."""
+        try:
+            self.wait()
+        finally:
+            self._executor.shutdown(cancel_futures=True)
+
+
 @dataclass(kw_only=True)
 class FixtureCollector:
     """Collects all fixtures generated by the test cases."""
@@ -114,6 +164,7 @@ class FixtureCollector:
     filler_path: Path
     base_dump_dir: Optional[Path] = None
     flush_interval: int = 1000
+    output_writer: Optional[FixtureOutputWriter] = None
 
     # Internal state
     all_fixtures: Dict[Path, Fixtures] = field(default_factory=dict)
@@ -167,12 +218,17 @@ class FixtureCollector:
             os.makedirs(fixture_path.parent, exist_ok=True)
             if len({fixture.__class__ for fixture in fixtures.values()}) != 1:
                 raise TypeError("All fixtures in a single file must have the same format.")
-            fixtures.collect_into_file(fixture_path)
+            if self.output_writer is not None:
+                self.output_writer.submit(fixtures, fixture_path)
+            else:
+                fixtures.collect_into_file(fixture_path)
 
         self.all_fixtures.clear()
 
     def verify_fixture_files(self, evm_fixture_verification: FixtureConsumer) -> None:
         """Run `evm [state|block]test` on each fixture."""
+        if self.output_writer is not None:
+            self.output_writer.wait()
         for fixture_path, name_fixture_dict in self.all_fixtures.items():
             for _fixture_name, fixture in name_fixture_dict.items():
                 if evm_fixture_verification.can_consume(fixture.__class__):
@@ -0,0 +1,82 @@
+"""Test cases for the ethereum_test_fixtures.collector module."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ..collector import FixtureCollector, FixtureOutputWriter
+from ..collector import TestInfo as FixtureTestInfo
+from ..file import Fixtures
+from ..transaction import FixtureResult, TransactionFixture
+
+
+def transaction_fixture(intrinsic_gas: int) -> TransactionFixture:
+    """Return a transaction fixture with the given intrinsic gas."""
+    fixture = TransactionFixture(
+        txbytes="0x1234",
+        result={"Paris": FixtureResult(intrinsic_gas=intrinsic_gas)},
+    )
+    fixture.fill_info(
+        "t8n-version",
+        "test_case_description",
+        fixture_source_url="fixture_source_url",
+        ref_spec=None,
+        _info_metadata={},
+    )
+    return fixture
+
+
+def test_fixture_output_writer_order(tmp_path: Path) -> None:
+    """
+    Test that the writes of the same file are applied in order, with a queue
+    shorter than the number of writes.
+    """
+    file_path = tmp_path / "fixtures.json"
+    writer = FixtureOutputWriter(max_pending=2)
+    for i in range(10):
+        writer.submit(Fixtures(root={f"test_{i}": transaction_fixture(i)}), file_path)
+    writer.shutdown()
+    fixtures = json.loads(file_path.read_text())
+    assert list(fixtures) == sorted(f"test_{i}" for i in range(10))
+    assert fixtures["test_9"]["result"]["Paris"]["intrinsicGas"] == "0x09"
+
+
+def test_fixture_output_writer_error(tmp_path: Path) -> None:
+    """Test that an error raised while writing a file is re-raised."""
+    file_path = tmp_path / "fixtures.json"
+    file_path.mkdir()
+    writer = FixtureOutputWriter()
+    writer.submit(Fixtures(root={"test": transaction_fixture(0)}), file_path)
+    with pytest.raises(IsADirectoryError):
+        writer.shutdown()
+
+
+def test_collector_with_output_writer(tmp_path: Path) -> None:
+    """
+    Test that the collector writes the same files with and without an output
+    writer.
+    """
+    info = FixtureTestInfo(
+        name="test_a[fork_Paris-transaction_test]",
+        id="tests/paris/test_module.py::test_a[fork_Paris-transaction_test]",
+        original_name="test_a",
+        module_path=tmp_path / "tests" / "paris" / "test_module.py",
+    )
+    written_files = []
+    for output_writer in [None, FixtureOutputWriter()]:
+        output_dir = tmp_path / ("sync" if output_writer is None else "async")
+        collector = FixtureCollector(
+            output_dir=output_dir,
+            fill_static_tests=False,
+            single_fixture_per_file=False,
+            filler_path=tmp_path / "tests",
+            output_writer=output_writer,
+        )
+        fixture_path = collector.add_fixture(info, transaction_fixture(1))
+        collector.dump_fixtures()
+        if output_writer is not None:
+            output_writer.shutdown()
+        written_files.append(fixture_path.relative_to(output_dir))
+        assert json.loads(fixture_path.read_text())[info.id]["result"]["Paris"]
+    assert written_files[0] == written_files[1]
@@ -1,11 +1,75 @@
 """Decorators for the fork methods."""
 
-from typing import Callable, TypeVar
+from functools import wraps
+from inspect import signature
+from typing import Any, Callable, Dict, Tuple, TypeVar
+
+from pydantic import BaseModel
 
 F = TypeVar("F", bound=Callable)
 
+MEMOIZED_FORK_METHOD_PARAMETERS = frozenset({"block_number", "timestamp"})
+
 
 def prefer_transition_to_method(method: F) -> F:
     """Call the `fork_to` implementation when transitioning."""
     method.__prefer_transition_to_method__ = True  # type: ignore
     return method
+
+
+def copy_fork_method_result(result: Any) -> Any:
+    """
+    Return a deep copy of a memoized fork method result that the caller can
+    safely modify, including its nested values, without affecting the cached
+    value.
+
+    Lists, dictionaries and sets are copied recursively, while their immutable
+    items (integers, bytes, opcodes, etc.) and immutable results (booleans,
+    frozen dataclasses, calculator functions, etc.) are returned as-is.
+    """
+    if isinstance(result, list):
+        return [copy_fork_method_result(item) for item in result]
+    if isinstance(result, dict):
+        return {key: copy_fork_method_result(value) for key, value in result.items()}
+    if isinstance(result, set):
+        return result.copy()
+    if isinstance(result, BaseModel):
+        return result.model_copy(deep=True)
+    return result
+
+
+def memoize_fork_method(method: F) -> F:
+    """
+    Memoize the result of a pure fork method, keyed on the fork class and the
+    `block_number` and `timestamp` arguments.
+
+    Mutable results are copied recursively on every call, so the returned
+    values, and their nested values, can be modified by the caller, e.g.
+    `super()` chains that extend the result of the parent fork. The original
+    method is available via `__wrapped__`.
+    """
+    parameters = signature(method).parameters
+    assert set(parameters) - {"cls"} <= MEMOIZED_FORK_METHOD_PARAMETERS, (
+        f"Method {method.__name__} cannot be memoized"
+    )
+    defaults = {
+        name: parameters[name].default
+        for name in sorted(MEMOIZED_FORK_METHOD_PARAMETERS)
+        if name in parameters
+    }
+    results: Dict[Tuple[Any, ...], Any] = {}
+
+    @wraps(method)
+    def memoized_method(cls: Any, **kwargs: Any) -> Any:
+        if kwargs.keys() - defaults.keys():
+            # Let the original method raise the appropriate error.
+            return method(cls, **kwargs)
+        key = (cls, *(kwargs.get(name, default) for name, default in defaults.items()))
+        try:
+            result = results[key]
+        except KeyError:
+            result = results[key] = method(cls, **kwargs)
+        return copy_fork_method_result(result)
+
+    memoized_method.__memoized_fork_method__ = True  # type: ignore
+    return memoized_method  # type: ignore
@@ -1,10 +1,12 @@
 """Abstract base class for Ethereum forks."""
 
 from abc import ABC, ABCMeta, abstractmethod
+from functools import cache
 from typing import (
     Any,
     ClassVar,
     Dict,
+    FrozenSet,
     List,
     Literal,
     Mapping,
@@ -21,7 +23,7 @@ from ethereum_test_base_types import AccessList, Address, BlobSchedule
 from ethereum_test_base_types.conversions import BytesConvertible
 from ethereum_test_vm import EVMCodeType, Opcodes
 
-from .base_decorators import prefer_transition_to_method
+from .base_decorators import memoize_fork_method, prefer_transition_to_method
 from .gas_costs import GasCosts
 
 
@@ -191,6 +193,18 @@ class BaseForkMeta(ABCMeta):
         """
         return fork_cls.transitions_to() if hasattr(fork_cls, "transitions_to") else fork_cls
 
+    @staticmethod
+    @cache
+    def _fork_ancestors(fork_cls: "BaseForkMeta") -> FrozenSet[type]:
+        """
+        Return the set of classes `fork_cls` inherits from, including itself.
+
+        Forks are immutable classes, so the set is computed only once per fork
+        and turns every fork comparison into a constant-time set lookup
+        instead of an `ABCMeta.__subclasscheck__` call.
+        """
+        return frozenset(fork_cls.__mro__)
+
     @staticmethod
     def _is_subclass_of(a: "BaseForkMeta", b: "BaseForkMeta") -> bool:
         """
@@ -199,7 +213,7 @@ class BaseForkMeta(ABCMeta):
         """
         a = BaseForkMeta._maybe_transitioned(a)
         b = BaseForkMeta._maybe_transitioned(b)
-        return issubclass(a, b)
+        return b in BaseForkMeta._fork_ancestors(a)
 
     def __gt__(cls, other: "BaseForkMeta") -> bool:
         """Compare if a fork is newer than some other fork (cls > other)."""
@@ -267,6 +281,13 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
         assert issubclass(base_class, BaseFork)
         if base_class != BaseFork:
             base_class._children.add(cls)
+        # Fork methods are pure functions of the fork, block number and
+        # timestamp, so their results are memoized to avoid rebuilding them
+        # through the `super()` chains on every call.
+        for method_name in BaseFork.__abstractmethods__ & cls.__dict__.keys():
+            method = cls.__dict__[method_name]
+            if isinstance(method, classmethod):
+                setattr(cls, method_name, classmethod(memoize_fork_method(method.__func__)))
 
     # Header information abstract methods
     @classmethod
@@ -1,6 +1,7 @@
 """Helper methods to resolve forks during test filling."""
 
 import re
+from functools import cache
 from typing import Annotated, Any, Callable, FrozenSet, List, Optional, Set, Type
 
 from pydantic import (
@@ -120,13 +121,14 @@ def get_from_until_fork_set(
     forks_until: Set[Type[BaseFork]],
 ) -> Set[Type[BaseFork]]:
     """Get fork range from forks_from to forks_until."""
-    resulting_set = set()
-    for fork_from in forks_from:
-        for fork_until in forks_until:
-            for fork in forks:
-                if fork <= fork_until and fork >= fork_from:
-                    resulting_set.add(fork)
-    return resulting_set
+    # Every (fork_from, fork_until) pair is considered, so a fork is in range
+    # if it comes after any of `forks_from` and before any of `forks_until`.
+    return {
+        fork
+        for fork in forks
+        if any(fork >= fork_from for fork_from in forks_from)
+        and any(fork <= fork_until for fork_until in forks_until)
+    }
 
 
 def get_forks_with_no_parents(
@@ -217,16 +219,20 @@ def transition_fork_from_to(
     return None
 
 
+@cache
+def _transition_forks_to(fork_to: Type[BaseFork]) -> FrozenSet[Type[BaseFork]]:
+    """Return the (memoized) transition forks to the specified fork."""
+    return frozenset(
+        transition_fork
+        for transition_fork in get_transition_forks()
+        if issubclass(transition_fork, TransitionBaseClass)
+        and transition_fork.transitions_to() == fork_to
+    )
+
+
 def transition_fork_to(fork_to: Type[BaseFork]) -> Set[Type[BaseFork]]:
     """Return transition fork that transitions to the specified fork."""
-    transition_forks: Set[Type[BaseFork]] = set()
-    for transition_fork in get_transition_forks():
-        if not issubclass(transition_fork, TransitionBaseClass):
-            continue
-        if transition_fork.transitions_to() == fork_to:
-            transition_forks.add(transition_fork)
-
-    return transition_forks
+    return set(_transition_forks_to(fork_to))
 
 
 def forks_from_until(
@@ -1,5 +1,6 @@
 """Test fork utilities."""
 
+from inspect import signature
 from typing import Dict, cast
 
 import pytest
@@ -7,11 +8,13 @@ from pydantic import BaseModel
 
 from ethereum_test_base_types import BlobSchedule
 
+from ..base_fork import BaseFork
 from ..forks.forks import (
     BPO1,
     BPO2,
     BPO3,
     BPO4,
+    Amsterdam,
     Berlin,
     Cancun,
     Frontier,
@@ -43,6 +46,8 @@ from ..helpers import (
     forks_from_until,
     get_deployed_forks,
     get_forks,
+    get_from_until_fork_set,
+    get_transition_forks,
     transition_fork_from_to,
     transition_fork_to,
 )
@@ -280,6 +285,97 @@ def test_transition_fork_comparison() -> None:
     ]
 
 
+def test_fork_comparison_matches_inheritance() -> None:
+    """
+    Test that the memoized fork comparisons match the inheritance-based fork
+    ordering for every pair of forks, including branching forks such as BPO
+    forks and Amsterdam, which both descend from Osaka.
+    """
+    forks = get_forks() + list(get_transition_forks())
+    for fork_a in forks:
+        for fork_b in forks:
+            transitioned_a = getattr(fork_a, "transitions_to", lambda fork=fork_a: fork)()
+            transitioned_b = getattr(fork_b, "transitions_to", lambda fork=fork_b: fork)()
+            expected_ge = fork_a is fork_b or issubclass(transitioned_a, transitioned_b)
+            assert (fork_a >= fork_b) == expected_ge, f"{fork_a} >= {fork_b}"
+            assert (fork_b <= fork_a) == expected_ge, f"{fork_b} <= {fork_a}"
+    assert not BPO1 >= Amsterdam
+    assert not Amsterdam >= BPO1
+
+
+def test_from_until_fork_set() -> None:
+    """Test the fork range computed from multiple from/until forks."""
+    all_forks = set(get_forks())
+    assert get_from_until_fork_set(all_forks, {Berlin}, {Paris}) == {Berlin, London, Paris}
+    assert get_from_until_fork_set(all_forks, {Paris, Berlin}, {London}) == {Berlin, London}
+    assert get_from_until_fork_set(all_forks, {Osaka}, {BPO1, Amsterdam}) == {
+        Osaka,
+        BPO1,
+        Amsterdam,
+    }
+    assert get_from_until_fork_set(all_forks, {Paris}, {Berlin}) == set()
+    # The returned transition fork sets are copies of the memoized sets.
+    transition_fork_to(Shanghai).add(Shanghai)
+    assert transition_fork_to(Shanghai) == {ParisToShanghaiAtTime15k}
+
+
+@pytest.mark.parametrize("block_number,timestamp", [(0, 0), (5, 15_000), (10_000, 10_000_000)])
+def test_memoized_fork_methods(block_number: int, timestamp: int) -> None:
+    """
+    Test that the memoized fork methods return the same values as the
+    original, uncached, fork methods for every fork.
+    """
+    for fork in get_forks():
+        for method_name in sorted(BaseFork.__abstractmethods__):
+            method = getattr(fork, method_name)
+            original_method = method.__func__.__wrapped__
+            kwargs = {
+                name: value
+                for name, value in [("block_number", block_number), ("timestamp", timestamp)]
+                if name in signature(original_method).parameters
+            }
+            try:
+                expected = original_method(fork, **kwargs)
+            except Exception as e:
+                with pytest.raises(type(e)):
+                    method(**kwargs)
+                continue
+            cached = method(**kwargs)
+            if callable(expected):
+                # Calculators are closures, the memoized one is always reused.
+                assert callable(cached) and cached is method(**kwargs)
+                continue
+            assert cached == expected, f"{fork}.{method_name}"
+            assert method(**kwargs) == expected, f"{fork}.{method_name}"
+
+
+def test_memoized_fork_method_results_are_copies() -> None:
+    """Test that modifying a memoized fork method result does not leak."""
+    precompiles = Prague.precompiles()
+    precompiles.clear()
+    assert Prague.precompiles() == Prague.precompiles.__func__.__wrapped__(Prague)  # type: ignore[attr-defined]
+
+    blob_schedule = Cancun.blob_schedule()
+    assert blob_schedule is not None and "Cancun" in blob_schedule.root
+    blob_schedule.root.clear()
+    assert Cancun.blob_schedule() == Cancun.blob_schedule.__func__.__wrapped__(Cancun)  # type: ignore[attr-defined]
+    assert "Cancun" in Cancun.blob_schedule().root  # type: ignore[union-attr]
+
+    pre_allocation = Prague.pre_allocation_blockchain()
+    address, account = next(
+        (address, account) for address, account in pre_allocation.items() if account["storage"]
+    )
+    account["storage"].clear()
+    account["nonce"] = 1234
+    assert (
+        Prague.pre_allocation_blockchain()[address]
+        == (
+            Prague.pre_allocation_blockchain.__func__.__wrapped__(Prague)[address]  # type: ignore[attr-defined]
+        )
+    )
+    assert Prague.pre_allocation_blockchain()[address]["storage"]
+
+
 def test_get_forks() -> None:  # noqa: D103
     all_forks = get_forks()
     assert all_forks[0] == FIRST_DEPLOYED
@@ -12,6 +12,7 @@ from .rpc import (
     SendTransactionExceptionError,
 )
 from .rpc_types import (
+    AccountState,
     BlobAndProofV1,
     BlobAndProofV2,
     EthConfigResponse,
@@ -20,6 +21,7 @@ from .rpc_types import (
 )
 
 __all__ = [
+    "AccountState",
     "AdminRPC",
     "BlobAndProofV1",
     "BlobAndProofV2",
@@ -7,10 +7,9 @@ import os
 import time
 from itertools import count
 from pprint import pprint
-from typing import Any, ClassVar, Dict, List, Literal
+from typing import Any, ClassVar, Dict, List, Literal, Mapping, Sequence, Tuple
 
 import requests
-from jwt import encode
 from pydantic import ValidationError
 from tenacity import (
     before_sleep_log,
@@ -25,6 +24,7 @@ from ethereum_test_types import Transaction
 from pytest_plugins.custom_logging import get_logger
 
 from .rpc_types import (
+    AccountState,
     EthConfigResponse,
     ForkchoiceState,
     ForkchoiceUpdateResponse,
@@ -77,17 +77,27 @@ class BaseRPC:
 
     namespace: ClassVar[str]
     response_validation_context: Any | None
+    max_batch_size: int = 100
+    batch_supported: bool
 
     def __init__(
         self,
         url: str,
         *,
         response_validation_context: Any | None = None,
+        session: requests.Session | None = None,
     ):
-        """Initialize BaseRPC class with the given url."""
+        """
+        Initialize BaseRPC class with the given url.
+
+        If a `session` is given, its persistent connection is reused for all
+        the requests.
+        """
         self.url = url
         self.request_id_counter = count(1)
         self.response_validation_context = response_validation_context
+        self.session = session
+        self.batch_supported = True
 
     def __init_subclass__(cls, namespace: str | None = None) -> None:
         """
@@ -110,7 +120,7 @@ class BaseRPC:
     def _make_request(
         self,
         url: str,
-        json_payload: dict[str, Any],
+        json_payload: dict[str, Any] | List[dict[str, Any]],
         headers: dict[str, str],
         timeout: int | None,
     ) -> requests.Response:
@@ -126,6 +136,8 @@ class BaseRPC:
           application-level issues rather than transient network problems
         """
         logger.debug(f"Making HTTP request to {url}, timeout={timeout}")
+        if self.session is not None:
+            return self.session.post(url, json=json_payload, headers=headers, timeout=timeout)
         return requests.post(url, json=json_payload, headers=headers, timeout=timeout)
 
     def post_request(
@@ -179,6 +191,81 @@ class BaseRPC:
         result = response_json["result"]
         return result
 
+    def post_batch_request(
+        self,
+        *,
+        calls: Sequence[Tuple[str, List[Any]]],
+        timeout: int | None = None,
+    ) -> List[Any]:
+        """
+        Send JSON-RPC calls, given as method and parameters, in batch requests
+        of at most `max_batch_size` calls and return their results in order.
+
+        Falls back to sending the calls one by one if the server doesn't
+        support batch requests.
+        """
+        results: List[Any] = []
+        for start in range(0, len(calls), self.max_batch_size):
+            chunk = calls[start : start + self.max_batch_size]
+            if self.batch_supported:
+                chunk_results = self._post_batch(chunk, timeout)
+                if chunk_results is not None:
+                    results.extend(chunk_results)
+                    continue
+                logger.warning(
+                    f"RPC server at {self.url} doesn't support batch requests, "
+                    "sending the requests one by one."
+                )
+                self.batch_supported = False
+            results.extend(
+                self.post_request(method=method, params=params, timeout=timeout)
+                for method, params in chunk
+            )
+        return results
+
+    def _post_batch(
+        self, calls: Sequence[Tuple[str, List[Any]]], timeout: int | None
+    ) -> List[Any] | None:
+        """
+        Send a single batch request and return the results of its calls, or
+        `None` if the server rejected the batch.
+        """
+        assert self.namespace, "RPC namespace not set"
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "method": f"{self.namespace}_{method}",
+                "params": params,
+                "id": next(self.request_id_counter),
+            }
+            for method, params in calls
+        ]
+        headers = {"Content-Type": "application/json"}
+
+        logger.debug(
+            f"Sending RPC batch request to {self.url}, calls={len(calls)}, timeout={timeout}..."
+        )
+
+        response = self._make_request(self.url, payload, headers, timeout)
+        response.raise_for_status()
+        response_json = response.json()
+        if not isinstance(response_json, list):
+            # Servers without batch support reply with a single error
+            return None
+
+        responses = {item.get("id"): item for item in response_json}
+        results = []
+        for request in payload:
+            item = responses.get(request["id"])
+            assert item is not None, (
+                f"RPC batch response didn't contain a response for {request['method']}"
+            )
+            if "error" in item:
+                raise JSONRPCError(**item["error"])
+            assert "result" in item, "RPC response didn't contain a result field"
+            results.append(item["result"])
+        return results
+
 
 class EthRPC(BaseRPC):
     """
@@ -317,6 +404,17 @@ class EthRPC(BaseRPC):
         )
         return response
 
+    def get_transaction_receipts(
+        self, transaction_hashes: Sequence[Hash]
+    ) -> List[dict[str, Any] | None]:
+        """
+        `eth_getTransactionReceipt`: Returns the receipts of a list of
+        transactions, retrieved in batch requests.
+        """
+        return self.post_batch_request(
+            calls=[("getTransactionReceipt", [f"{tx_hash}"]) for tx_hash in transaction_hashes]
+        )
+
     def get_storage_at(
         self, address: Address, position: Hash, block_number: BlockNumberType = "latest"
     ) -> Hash:
@@ -376,6 +474,35 @@ class EthRPC(BaseRPC):
         """
         return [self.send_transaction(tx) for tx in transactions]
 
+    def get_accounts(
+        self,
+        storage_keys: Mapping[Address, Sequence[Hash]],
+        block_number: BlockNumberType = "latest",
+    ) -> Dict[Address, AccountState]:
+        """
+        Retrieve the balance, code, nonce and the values of the given storage
+        keys of a set of accounts, in batch requests.
+        """
+        block = hex(block_number) if isinstance(block_number, int) else block_number
+        calls: List[Tuple[str, List[Any]]] = []
+        for address, keys in storage_keys.items():
+            calls.append(("getBalance", [f"{address}", block]))
+            calls.append(("getCode", [f"{address}", block]))
+            calls.append(("getTransactionCount", [f"{address}", block]))
+            calls.extend(("getStorageAt", [f"{address}", f"{key}", block]) for key in keys)
+        results = iter(self.post_batch_request(calls=calls))
+
+        accounts: Dict[Address, AccountState] = {}
+        for address, keys in storage_keys.items():
+            balance, code, nonce = next(results), next(results), next(results)
+            accounts[address] = AccountState(
+                balance=int(balance, 16),
+                code=Bytes(code),
+                nonce=int(nonce, 16),
+                storage={key: Hash(next(results)) for key in keys},
+            )
+        return accounts
+
     def storage_at_keys(
         self, account: Address, keys: List[Hash], block_number: BlockNumberType = "latest"
     ) -> Dict[Hash, Hash]:
@@ -498,6 +625,9 @@ class EngineRPC(BaseRPC):
         Send JSON-RPC POST request to the client RPC server at port defined in
         the url.
         """
+        # Imported here, as PyJWT is only needed to talk to the Engine API
+        from jwt import encode
+
         if extra_headers is None:
             extra_headers = {}
         jwt_token = encode(
@@ -522,11 +652,22 @@ class EngineRPC(BaseRPC):
         `engine_newPayloadVX`: Attempts to execute the given payload on an
         execution client.
         """
+        return self.new_payload_json(self.new_payload_params(*params), version=version)
+
+    @staticmethod
+    def new_payload_params(*params: Any) -> List[Any]:
+        """Serialize the parameters of an `engine_newPayloadVX` to JSON."""
+        return [to_json(param) for param in params]
+
+    def new_payload_json(self, params: List[Any], *, version: int) -> PayloadStatus:
+        """
+        `engine_newPayloadVX`: Attempts to execute the given payload on an
+        execution client, with its parameters already serialized to JSON.
+        """
         method = f"newPayloadV{version}"
-        params_list = [to_json(param) for param in params]
 
         return PayloadStatus.model_validate(
-            self.post_request(method=method, params=params_list),
+            self.post_request(method=method, params=params),
             context=self.response_validation_context,
         )
 
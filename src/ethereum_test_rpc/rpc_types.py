@@ -50,6 +50,18 @@ class JSONRPCError(Exception):
         return f"JSONRPCError(code={self.code}, message={self.message})"
 
 
+class AccountState(CamelModel):
+    """
+    State of an account retrieved from the client: its balance, code, nonce
+    and the values of the requested storage keys.
+    """
+
+    balance: int
+    code: Bytes
+    nonce: int
+    storage: Dict[Hash, Hash]
+
+
 class TransactionByHashResponse(Transaction):
     """Represents the response of a transaction by hash request."""
 
@@ -0,0 +1,196 @@
+"""Test the JSON-RPC clients against a local HTTP server."""
+
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from typing import Any, Dict, Generator, List, Tuple
+
+import pytest
+import requests
+
+from ethereum_test_base_types import Address, Bytes, Hash
+from ethereum_test_rpc import EngineRPC, EthRPC
+from ethereum_test_rpc.rpc_types import JSONRPCError, PayloadStatusEnum
+
+
+class EngineRequestHandler(BaseHTTPRequestHandler):
+    """Reply VALID to every request, recording the requests and connections."""
+
+    protocol_version = "HTTP/1.1"
+    requests: List[Tuple[Tuple[str, int], Dict[str, Any]]] = []
+
+    def do_POST(self) -> None:  # noqa: N802
+        """Record the request and reply with a valid payload status."""
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.requests.append((self.client_address, request))
+        body = json.dumps(
+            {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "result": {"status": "VALID", "latestValidHash": None, "validationError": None},
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        """Silence the request logs."""
+        del args
+
+
+@pytest.fixture
+def engine_url() -> Generator[str, None, None]:
+    """Serve a fake Engine API on a local port."""
+    EngineRequestHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), EngineRequestHandler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("persistent_connection", [False, True])
+def test_new_payload_json(engine_url: str, persistent_connection: bool) -> None:
+    """
+    Test that pre-serialized payload parameters are sent as-is, over a single
+    connection when a session is given.
+    """
+    session = requests.Session() if persistent_connection else None
+    engine_rpc = EngineRPC(engine_url, session=session)
+    params = [{"blockHash": "0x01"}, [], "0x02"]
+    for _ in range(3):
+        status = engine_rpc.new_payload_json(params, version=3)
+        assert status.status == PayloadStatusEnum.VALID
+    if session is not None:
+        session.close()
+
+    assert [request["method"] for _, request in EngineRequestHandler.requests] == [
+        "engine_newPayloadV3"
+    ] * 3
+    assert all(request["params"] == params for _, request in EngineRequestHandler.requests)
+    connections = {client_address for client_address, _ in EngineRequestHandler.requests}
+    assert len(connections) == (1 if persistent_connection else 3)
+
+
+class EthRequestHandler(BaseHTTPRequestHandler):
+    """
+    Reply to the `eth` state requests from a fixed state, recording the
+    requests, and optionally rejecting batch requests.
+    """
+
+    protocol_version = "HTTP/1.1"
+    requests: List[Any] = []
+    batch_supported = True
+    state: Dict[str, Dict[str, Any]] = {
+        "0x0000000000000000000000000000000000001000": {
+            "balance": "0x0a",
+            "code": "0x6001",
+            "nonce": "0x01",
+            "storage": {"0x" + "00" * 31 + "01": "0x" + "00" * 31 + "02"},
+        },
+    }
+
+    def reply(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the response to a single request."""
+        method, params = request["method"], request["params"]
+        account = self.state.get(params[0], {}) if params else {}
+        if method == "eth_getStorageAt":
+            result = account.get("storage", {}).get(params[1], "0x" + "00" * 32)
+        elif method == "eth_getBalance":
+            result = account.get("balance", "0x0")
+        elif method == "eth_getCode":
+            result = account.get("code", "0x")
+        elif method == "eth_getTransactionCount":
+            result = account.get("nonce", "0x0")
+        else:
+            return {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "error": {"code": -32601, "message": f"the method {method} does not exist"},
+            }
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+    def do_POST(self) -> None:  # noqa: N802
+        """Record the request and reply from the state."""
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.requests.append(request)
+        if not isinstance(request, list):
+            response: Any = self.reply(request)
+        elif self.batch_supported:
+            # Reply in reverse order, the responses are matched by id
+            response = [self.reply(item) for item in reversed(request)]
+        else:
+            response = {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {"code": -32600, "message": "batch requests are not supported"},
+            }
+        body = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        """Silence the request logs."""
+        del args
+
+
+@pytest.fixture
+def eth_url() -> Generator[str, None, None]:
+    """Serve a fake `eth` RPC on a local port."""
+    EthRequestHandler.requests = []
+    EthRequestHandler.batch_supported = True
+    server = ThreadingHTTPServer(("127.0.0.1", 0), EthRequestHandler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("batch_supported", [True, False])
+def test_get_accounts(eth_url: str, batch_supported: bool) -> None:
+    """
+    Test that the state of the accounts is retrieved in batch requests of at
+    most `max_batch_size` calls, or one by one if batches are not supported.
+    """
+    EthRequestHandler.batch_supported = batch_supported
+    eth_rpc = EthRPC(eth_url)
+    eth_rpc.max_batch_size = 4
+    contract, empty = Address(0x1000), Address(0x2000)
+    accounts = eth_rpc.get_accounts({contract: [Hash(1), Hash(3)], empty: [Hash(1)]})
+
+    assert accounts[contract].balance == 10
+    assert accounts[contract].code == Bytes("0x6001")
+    assert accounts[contract].nonce == 1
+    assert accounts[contract].storage == {Hash(1): Hash(2), Hash(3): Hash(0)}
+    assert accounts[empty].balance == 0
+    assert accounts[empty].code == b""
+    assert accounts[empty].nonce == 0
+    assert accounts[empty].storage == {Hash(1): Hash(0)}
+
+    batches = [request for request in EthRequestHandler.requests if isinstance(request, list)]
+    single_requests = [
+        request for request in EthRequestHandler.requests if not isinstance(request, list)
+    ]
+    if batch_supported:
+        assert [len(batch) for batch in batches] == [4, 4, 1]
+        assert single_requests == []
+    else:
+        # The first batch is rejected, and no other batch is attempted
+        assert len(batches) == 1
+        assert len(single_requests) == 9
+        assert not eth_rpc.batch_supported
+
+
+def test_batch_request_error(eth_url: str) -> None:
+    """Test that an error response within a batch is raised."""
+    eth_rpc = EthRPC(eth_url)
+    with pytest.raises(JSONRPCError, match="the method eth_unknown does not exist"):
+        eth_rpc.post_batch_request(calls=[("getBalance", ["0x00", "latest"]), ("unknown", [])])
@@ -3,6 +3,7 @@
 import math
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Callable, ClassVar, Dict, Generator, List, Sequence, Type
 
 import pytest
@@ -31,7 +32,33 @@ from ethereum_test_vm import Bytecode
 from ethereum_test_vm.opcodes import Opcodes as Op
 
 from .base import BaseTest
-from .blockchain import Block, BlockchainTest
+from .blockchain import Block, BlockchainTest, GenesisCache
+
+BENCHMARK_CACHE_SIZE = 256
+"""
+Maximum number of generated codes and genesis blocks kept in memory by the
+benchmark spec, reused across the gas values and fixture formats of a test.
+"""
+
+benchmark_genesis_cache = GenesisCache(max_size=BENCHMARK_CACHE_SIZE)
+
+
+@lru_cache(maxsize=BENCHMARK_CACHE_SIZE)
+def build_repeated_code(
+    *, repeated_code: Bytecode, setup: Bytecode, cleanup: Bytecode, max_code_size: int
+) -> Bytecode:
+    """
+    Build the looping code that repeats `repeated_code` as many times as it
+    fits in `max_code_size`.
+    """
+    overhead = len(setup) + len(Op.JUMPDEST) + len(cleanup) + len(Op.JUMP(len(setup)))
+    available_space = max_code_size - overhead
+    max_iterations = available_space // len(repeated_code)
+
+    # TODO: Unify the PUSH0 and PUSH1 usage.
+    code = setup + Op.JUMPDEST + repeated_code * max_iterations + cleanup
+    code += Op.JUMP(len(setup)) if len(setup) > 0 else Op.PUSH0 + Op.JUMP
+    return code
 
 
 @dataclass(kw_only=True)
@@ -74,18 +101,12 @@ class BenchmarkCodeGenerator(ABC):
         can fit in the code size limit.
         """
         assert len(repeated_code) > 0, "repeated_code cannot be empty"
-        max_code_size = fork.max_code_size()
-        if setup is None:
-            setup = Bytecode()
-        if cleanup is None:
-            cleanup = Bytecode()
-        overhead = len(setup) + len(Op.JUMPDEST) + len(cleanup) + len(Op.JUMP(len(setup)))
-        available_space = max_code_size - overhead
-        max_iterations = available_space // len(repeated_code)
-
-        # TODO: Unify the PUSH0 and PUSH1 usage.
-        code = setup + Op.JUMPDEST + repeated_code * max_iterations + cleanup
-        code += Op.JUMP(len(setup)) if len(setup) > 0 else Op.PUSH0 + Op.JUMP
+        code = build_repeated_code(
+            repeated_code=repeated_code,
+            setup=Bytecode() if setup is None else setup,
+            cleanup=Bytecode() if cleanup is None else cleanup,
+            max_code_size=fork.max_code_size(),
+        )
         self._validate_code_size(code, fork)
 
         return code
@@ -256,13 +277,17 @@ class BenchmarkTest(BaseTest):
                 "Cannot create BlockchainTest without a code generator, transactions, or blocks"
             )
 
-        return BlockchainTest.from_test(
+        blockchain_test = BlockchainTest.from_test(
             base_test=self,
             genesis_environment=self.env,
             pre=self.pre,
             post=self.post,
             blocks=blocks,
         )
+        # The genesis only depends on the pre-allocation and environment, so it
+        # is shared by the gas values and fixture formats of the same test.
+        blockchain_test._genesis_cache = benchmark_genesis_cache
+        return blockchain_test
 
     def generate(
         self,
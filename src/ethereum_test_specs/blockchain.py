@@ -1,10 +1,13 @@
 """Ethereum blockchain test spec definition and filler."""
 
+import time
+from collections import OrderedDict
+from hashlib import sha256
 from pprint import pprint
 from typing import Any, Callable, ClassVar, Dict, Generator, List, Sequence, Tuple, Type
 
 import pytest
-from pydantic import ConfigDict, Field, field_validator, model_serializer
+from pydantic import ConfigDict, Field, PrivateAttr, field_validator, model_serializer
 
 from ethereum_clis import BlockExceptionWithMessage, Result, TransitionTool
 from ethereum_test_base_types import (
@@ -53,6 +56,7 @@ from ethereum_test_fixtures.common import FixtureBlobSchedule
 from ethereum_test_forks import Fork
 from ethereum_test_types import Alloc, Environment, Removable, Requests, Transaction, Withdrawal
 from ethereum_test_types.block_access_list import BlockAccessList, BlockAccessListExpectation
+from pytest_plugins.filler.fill_timing import fill_timing_span
 
 from .base import BaseTest, OpMode, verify_result
 from .debugging import print_traces
@@ -397,6 +401,49 @@ Default values for the genesis environment that are used to create all genesis
 headers.
 """
 
+GenesisCacheKey = Tuple[Fork, bool, bytes]
+
+
+class GenesisCache(OrderedDict[GenesisCacheKey, Tuple[Alloc, FixtureBlock]]):
+    """
+    Bounded cache of genesis blocks keyed on the fork, whether the fork's
+    blockchain pre-allocation is applied, and a digest of the genesis
+    environment and pre-allocation contents.
+
+    The least recently used entry is evicted once `max_size` is exceeded.
+    """
+
+    max_size: int
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the cache with the given maximum number of entries."""
+        super().__init__()
+        self.max_size = max_size
+
+    @staticmethod
+    def key(
+        *, fork: Fork, apply_pre_allocation_blockchain: bool, env: Environment, pre: Alloc
+    ) -> GenesisCacheKey:
+        """Return the cache key of a genesis block."""
+        digest = sha256(env.model_dump_json().encode())
+        digest.update(pre.model_dump_json().encode())
+        return (fork, apply_pre_allocation_blockchain, digest.digest())
+
+    def get_genesis(self, key: GenesisCacheKey) -> Tuple[Alloc, FixtureBlock] | None:
+        """Return a copy of the cached genesis, if any."""
+        if key not in self:
+            return None
+        self.move_to_end(key)
+        pre_alloc, genesis = self[key]
+        return pre_alloc.model_copy(deep=True), genesis
+
+    def put_genesis(self, key: GenesisCacheKey, pre_alloc: Alloc, genesis: FixtureBlock) -> None:
+        """Store a copy of the genesis, evicting the oldest entry if needed."""
+        self[key] = (pre_alloc.model_copy(deep=True), genesis)
+        self.move_to_end(key)
+        while len(self) > self.max_size:
+            self.popitem(last=False)
+
 
 class BlockchainTest(BaseTest):
     """Filler type that tests multiple blocks (valid or invalid) in a chain."""
@@ -412,6 +459,8 @@ class BlockchainTest(BaseTest):
     verification is only performed based on the state root.
     """
 
+    _genesis_cache: GenesisCache | None = PrivateAttr(None)
+
     supported_fixture_formats: ClassVar[Sequence[FixtureFormat | LabeledFixtureFormat]] = [
         BlockchainFixture,
         BlockchainEngineFixture,
@@ -473,6 +522,17 @@ class BlockchainTest(BaseTest):
             "parent_beacon_block_root must be empty at genesis"
         )
 
+        cache_key: GenesisCacheKey | None = None
+        if self._genesis_cache is not None:
+            cache_key = GenesisCache.key(
+                fork=fork,
+                apply_pre_allocation_blockchain=apply_pre_allocation_blockchain,
+                env=env,
+                pre=self.pre,
+            )
+            if (cached_genesis := self._genesis_cache.get_genesis(cache_key)) is not None:
+                return cached_genesis
+
         pre_alloc = self.pre
         if apply_pre_allocation_blockchain:
             pre_alloc = Alloc.merge(
@@ -481,16 +541,16 @@ class BlockchainTest(BaseTest):
             )
         if empty_accounts := pre_alloc.empty_accounts():
             raise Exception(f"Empty accounts in pre state: {empty_accounts}")
-        state_root = pre_alloc.state_root()
-        genesis = FixtureHeader.genesis(fork, env, state_root)
-
-        return (
-            pre_alloc,
-            FixtureBlockBase(
-                header=genesis,
-                withdrawals=None if env.withdrawals is None else [],
-            ).with_rlp(txs=[]),
-        )
+        with fill_timing_span("genesis state root"):
+            state_root = pre_alloc.state_root()
+        genesis = FixtureBlockBase(
+            header=FixtureHeader.genesis(fork, env, state_root),
+            withdrawals=None if env.withdrawals is None else [],
+        ).with_rlp(txs=[])
+
+        if self._genesis_cache is not None and cache_key is not None:
+            self._genesis_cache.put_genesis(cache_key, pre_alloc, genesis)
+        return pre_alloc, genesis
 
     def generate_block_data(
         self,
@@ -506,7 +566,8 @@ class BlockchainTest(BaseTest):
         """
         env = block.set_environment(previous_env)
         env = env.set_fork_requirements(fork)
-        txs = [tx.with_signature_and_sender() for tx in block.txs]
+        with fill_timing_span("sign transactions"):
+            txs = [tx.with_signature_and_sender() for tx in block.txs]
 
         if failing_tx_count := len([tx for tx in txs if tx.error]) > 0:
             if failing_tx_count > 1:
@@ -519,19 +580,25 @@ class BlockchainTest(BaseTest):
                     + "must be the last transaction in the block"
                 )
 
-        transition_tool_output = t8n.evaluate(
-            transition_tool_data=TransitionTool.TransitionToolData(
-                alloc=previous_alloc,
-                txs=txs,
-                env=env,
-                fork=fork,
-                chain_id=self.chain_id,
-                reward=fork.get_reward(block_number=env.number, timestamp=env.timestamp),
-                blob_schedule=fork.blob_schedule(),
-            ),
-            debug_output_path=self.get_next_transition_tool_output_path(),
-            slow_request=self.is_tx_gas_heavy_test(),
-        )
+        t8n_start_time = time.perf_counter()
+        with fill_timing_span("t8n"):
+            transition_tool_output = t8n.evaluate(
+                transition_tool_data=TransitionTool.TransitionToolData(
+                    alloc=previous_alloc,
+                    txs=txs,
+                    env=env,
+                    fork=fork,
+                    chain_id=self.chain_id,
+                    reward=fork.get_reward(block_number=env.number, timestamp=env.timestamp),
+                    blob_schedule=fork.blob_schedule(),
+                ),
+                debug_output_path=self.get_next_transition_tool_output_path(),
+                slow_request=self.is_tx_gas_heavy_test(),
+            )
+        if self._opcode_profile is not None:
+            self._opcode_profile.add_output(
+                transition_tool_output, t8n_time=time.perf_counter() - t8n_start_time
+            )
 
         if transition_tool_output.result.opcode_count is not None:
             if self._opcode_count is None:
@@ -703,10 +770,11 @@ class BlockchainTest(BaseTest):
     ) -> None:
         """Verify post alloc after all block/s or payload/s are generated."""
         try:
-            if expected_state:
-                expected_state.verify_post_alloc(t8n_state)
-            else:
-                self.post.verify_post_alloc(t8n_state)
+            with fill_timing_span("verify post state"):
+                if expected_state:
+                    expected_state.verify_post_alloc(t8n_state)
+                else:
+                    self.post.verify_post_alloc(t8n_state)
         except Exception as e:
             print_traces(t8n.get_traces())
             raise e
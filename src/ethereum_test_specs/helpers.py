@@ -1,8 +1,9 @@
 """Helper functions."""
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import StrEnum
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
 from ethereum_clis import Result
 from ethereum_test_exceptions import (
@@ -310,3 +311,44 @@ def verify_block(
         got_exception=got_exception,
     )
     info.verify(strict_match=transition_tool_exceptions_reliable)
+
+
+def find_minimum_gas_limit(
+    verify_gas_limit: Callable[[int], bool],
+    *,
+    maximum_gas_limit: int,
+    parallel_probes: int = 1,
+    max_gas_limit_wanted: int | None = None,
+) -> int:
+    """
+    Return the minimum gas limit for which `verify_gas_limit` returns True.
+
+    The search assumes that `maximum_gas_limit` is valid and that any gas
+    limit above a valid one is also valid. Every round evaluates up to
+    `parallel_probes` evenly spaced gas limits concurrently, narrowing the
+    search interval by a factor of `parallel_probes + 1`; with a single probe
+    this is a plain bisection.
+    """
+    assert parallel_probes >= 1, "At least one probe is required"
+    minimum_gas_limit = 0
+    with ThreadPoolExecutor(max_workers=parallel_probes) as executor:
+        while minimum_gas_limit < maximum_gas_limit:
+            interval = maximum_gas_limit - minimum_gas_limit
+            probes = sorted(
+                {
+                    minimum_gas_limit + interval * i // (parallel_probes + 1)
+                    for i in range(1, parallel_probes + 1)
+                }
+            )
+            if len(probes) == 1:
+                results = [verify_gas_limit(probes[0])]
+            else:
+                results = list(executor.map(verify_gas_limit, probes))
+            for gas_limit, valid in zip(probes, results, strict=True):
+                if valid:
+                    maximum_gas_limit = gas_limit
+                    break
+                minimum_gas_limit = gas_limit + 1
+            if max_gas_limit_wanted is not None and minimum_gas_limit > max_gas_limit_wanted:
+                raise Exception(f"Requires more than the minimum {max_gas_limit_wanted} wanted.")
+    return maximum_gas_limit
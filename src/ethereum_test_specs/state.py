@@ -1,12 +1,19 @@
 """Ethereum state test spec definition and filler."""
 
+import time
 from pprint import pprint
+from threading import Lock
 from typing import Any, Callable, ClassVar, Dict, Generator, List, Optional, Sequence, Type
 
 import pytest
 from pydantic import Field
 
-from ethereum_clis import TransitionTool, TransitionToolOutput
+from ethereum_clis import (
+    TracesDigestOptions,
+    TransactionTracesDigest,
+    TransitionTool,
+    TransitionToolOutput,
+)
 from ethereum_test_base_types import HexNumber
 from ethereum_test_exceptions import BlockException, EngineAPIError, TransactionException
 from ethereum_test_execution import (
@@ -36,11 +43,12 @@ from ethereum_test_types import (
     Transaction,
 )
 from pytest_plugins.custom_logging import get_logger
+from pytest_plugins.filler.fill_timing import fill_timing_span
 
 from .base import BaseTest, OpMode
 from .blockchain import Block, BlockchainTest, Header
 from .debugging import print_traces
-from .helpers import verify_transactions
+from .helpers import find_minimum_gas_limit, verify_transactions
 
 logger = get_logger(__name__)
 
@@ -96,15 +104,21 @@ class StateTest(BaseTest):
         *,
         t8n: TransitionTool,
         base_tool_output: TransitionToolOutput,
+        base_traces_digest: List[TransactionTracesDigest],
         fork: Fork,
         current_gas_limit: int,
         pre_alloc: Alloc,
         env: Environment,
         enable_post_processing: bool,
+        debug_output_path: str = "",
     ) -> bool:
-        """Verify a new lower gas limit yields the same transaction outcome."""
-        base_traces = base_tool_output.result.traces
-        assert base_traces is not None, "Traces not collected for gas optimization"
+        """
+        Verify a new lower gas limit yields the same transaction outcome.
+
+        The trace files are streamed and compared against the digest of the
+        base traces, which is computed only once per gas optimization, and the
+        traces are only materialized if they diverge.
+        """
         new_tx = self.tx.copy(gas_limit=current_gas_limit).with_signature_and_sender()
         modified_tool_output = t8n.evaluate(
             transition_tool_data=TransitionTool.TransitionToolData(
@@ -117,15 +131,13 @@ class StateTest(BaseTest):
                 blob_schedule=fork.blob_schedule(),
                 state_test=True,
             ),
-            debug_output_path=self.get_next_transition_tool_output_path(),
+            debug_output_path=debug_output_path,
             slow_request=self.is_tx_gas_heavy_test(),
+            traces_digest=TracesDigestOptions(
+                enable_post_processing=enable_post_processing, reference=base_traces_digest
+            ),
         )
-        modified_traces = modified_tool_output.result.traces
-        assert modified_traces is not None, "Traces not collected for gas optimization"
-        if not base_traces.are_equivalent(
-            modified_tool_output.result.traces,
-            enable_post_processing,
-        ):
+        if modified_tool_output.result.traces_digest is None:
             logger.debug(f"Traces are not equivalent (gas_limit={current_gas_limit})")
             return False
         try:
@@ -283,7 +295,8 @@ class StateTest(BaseTest):
         fork = fork.fork_at(block_number=self.env.number, timestamp=self.env.timestamp)
 
         env = self.env.set_fork_requirements(fork)
-        tx = self.tx.with_signature_and_sender(keep_secret_key=True)
+        with fill_timing_span("sign transactions"):
+            tx = self.tx.with_signature_and_sender(keep_secret_key=True)
         pre_alloc = Alloc.merge(
             Alloc.model_validate(fork.pre_allocation()),
             self.pre,
@@ -291,23 +304,41 @@ class StateTest(BaseTest):
         if empty_accounts := pre_alloc.empty_accounts():
             raise Exception(f"Empty accounts in pre state: {empty_accounts}")
 
-        transition_tool_output = t8n.evaluate(
-            transition_tool_data=TransitionTool.TransitionToolData(
-                alloc=pre_alloc,
-                txs=[tx],
-                env=env,
-                fork=fork,
-                chain_id=self.chain_id,
-                reward=0,  # Reward on state tests is always zero
-                blob_schedule=fork.blob_schedule(),
-                state_test=True,
-            ),
-            debug_output_path=self.get_next_transition_tool_output_path(),
-            slow_request=self.is_tx_gas_heavy_test(),
+        optimize_gas = self._operation_mode in (
+            OpMode.OPTIMIZE_GAS,
+            OpMode.OPTIMIZE_GAS_POST_PROCESSING,
         )
+        enable_post_processing = self._operation_mode == OpMode.OPTIMIZE_GAS_POST_PROCESSING
+
+        t8n_start_time = time.perf_counter()
+        with fill_timing_span("t8n"):
+            transition_tool_output = t8n.evaluate(
+                transition_tool_data=TransitionTool.TransitionToolData(
+                    alloc=pre_alloc,
+                    txs=[tx],
+                    env=env,
+                    fork=fork,
+                    chain_id=self.chain_id,
+                    reward=0,  # Reward on state tests is always zero
+                    blob_schedule=fork.blob_schedule(),
+                    state_test=True,
+                ),
+                debug_output_path=self.get_next_transition_tool_output_path(),
+                slow_request=self.is_tx_gas_heavy_test(),
+                traces_digest=(
+                    TracesDigestOptions(enable_post_processing=enable_post_processing)
+                    if optimize_gas
+                    else None
+                ),
+            )
+        if self._opcode_profile is not None:
+            self._opcode_profile.add_output(
+                transition_tool_output, t8n_time=time.perf_counter() - t8n_start_time
+            )
 
         try:
-            self.post.verify_post_alloc(transition_tool_output.alloc)
+            with fill_timing_span("verify post state"):
+                self.post.verify_post_alloc(transition_tool_output.alloc)
         except Exception as e:
             print_traces(t8n.get_traces())
             raise e
@@ -324,64 +355,42 @@ class StateTest(BaseTest):
             pprint(transition_tool_output.alloc)
             raise e
 
-        if (
-            self._operation_mode == OpMode.OPTIMIZE_GAS
-            or self._operation_mode == OpMode.OPTIMIZE_GAS_POST_PROCESSING
-        ):
-            enable_post_processing = self._operation_mode == OpMode.OPTIMIZE_GAS_POST_PROCESSING
+        if optimize_gas:
             base_tool_output = transition_tool_output
 
-            assert base_tool_output.result.traces is not None, "Traces not found."
+            base_traces_digest = base_tool_output.result.traces_digest
+            assert base_traces_digest is not None, "Traces not found."
 
-            # First try reducing the gas limit only by one, if the validation
-            # fails, it means that the traces change even with the slightest
-            # modification to the gas.
-            if self.verify_modified_gas_limit(
-                t8n=t8n,
-                base_tool_output=base_tool_output,
-                fork=fork,
-                current_gas_limit=self.tx.gas_limit - 1,
-                pre_alloc=pre_alloc,
-                env=env,
-                enable_post_processing=enable_post_processing,
-            ):
-                minimum_gas_limit = 0
-                maximum_gas_limit = int(self.tx.gas_limit)
-                while minimum_gas_limit < maximum_gas_limit:
-                    current_gas_limit = (maximum_gas_limit + minimum_gas_limit) // 2
-                    if self.verify_modified_gas_limit(
-                        t8n=t8n,
-                        base_tool_output=base_tool_output,
-                        fork=fork,
-                        current_gas_limit=current_gas_limit,
-                        pre_alloc=pre_alloc,
-                        env=env,
-                        enable_post_processing=enable_post_processing,
-                    ):
-                        maximum_gas_limit = current_gas_limit
-                    else:
-                        minimum_gas_limit = current_gas_limit + 1
-                        if (
-                            self._gas_optimization_max_gas_limit is not None
-                            and minimum_gas_limit > self._gas_optimization_max_gas_limit
-                        ):
-                            raise Exception(
-                                "Requires more than the minimum "
-                                f"{self._gas_optimization_max_gas_limit} wanted."
-                            )
-
-                assert self.verify_modified_gas_limit(
+            # Gas limits can be verified concurrently, so the debug output
+            # path counter must be protected.
+            debug_output_path_lock = Lock()
+
+            def verify_gas_limit(gas_limit: int) -> bool:
+                with debug_output_path_lock:
+                    debug_output_path = self.get_next_transition_tool_output_path()
+                return self.verify_modified_gas_limit(
                     t8n=t8n,
                     base_tool_output=base_tool_output,
+                    base_traces_digest=base_traces_digest,
                     fork=fork,
-                    current_gas_limit=minimum_gas_limit,
+                    current_gas_limit=gas_limit,
                     pre_alloc=pre_alloc,
                     env=env,
                     enable_post_processing=enable_post_processing,
+                    debug_output_path=debug_output_path,
                 )
-                self._gas_optimization = current_gas_limit
-            else:
+
+            # First try reducing the gas limit only by one, if the validation
+            # fails, it means that the traces change even with the slightest
+            # modification to the gas.
+            if not verify_gas_limit(self.tx.gas_limit - 1):
                 raise Exception("Impossible to compare.")
+            self._gas_optimization = find_minimum_gas_limit(
+                verify_gas_limit,
+                maximum_gas_limit=int(self.tx.gas_limit),
+                parallel_probes=self._gas_optimization_parallel_probes,
+                max_gas_limit_wanted=self._gas_optimization_max_gas_limit,
+            )
 
         if self._operation_mode == OpMode.BENCHMARKING:
             expected_benchmark_gas_used = self.expected_benchmark_gas_used
@@ -5,7 +5,6 @@ import subprocess
 import tempfile
 from typing import Any, Dict, List, Mapping, Tuple, Union
 
-from eth_abi import encode
 from eth_utils import function_signature_to_4byte_selector
 from pydantic import BaseModel, BeforeValidator, Field, PrivateAttr, model_validator
 from pydantic_core import core_schema
@@ -192,6 +191,10 @@ class CodeInFiller(BaseModel, TagDependentData):
 
                 parameter_types = parameter_str.strip("()").split(",")
                 if len(tokens) > 1:
+                    # Imported here, as eth_abi is slow to import and only
+                    # needed by the few static tests using `:abi`
+                    from eth_abi import encode
+
                     function_parameters = encode(
                         [parameter_str],
                         [
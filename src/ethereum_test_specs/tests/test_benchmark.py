@@ -5,9 +5,12 @@ transaction splitting functionality.
 
 import pytest
 
-from ethereum_test_base_types import HexNumber
-from ethereum_test_specs.benchmark import BenchmarkTest
+from ethereum_test_base_types import Account, Address, HexNumber
+from ethereum_test_forks import Prague
+from ethereum_test_specs.benchmark import BenchmarkTest, build_repeated_code
+from ethereum_test_specs.blockchain import GenesisCache
 from ethereum_test_types import Alloc, Environment, Transaction
+from ethereum_test_vm import Opcodes as Op
 
 
 @pytest.mark.parametrize(
@@ -110,3 +113,64 @@ def test_split_transaction_edge_cases(gas_benchmark_value: int, gas_limit_cap: i
         # min of tx.gas_limit and benchmark
         assert benchmark_test.tx is not None, "Transaction should not be None"
         assert split_txs[0].gas_limit == min(benchmark_test.tx.gas_limit, gas_benchmark_value)
+
+
+def test_repeated_code_is_memoized() -> None:
+    """
+    Test that the generated looping code is built once per set of inputs and
+    fits the fork's code size limit.
+    """
+    repeated_code = Op.POP(Op.ADD(1, 2))
+    kwargs = {
+        "repeated_code": repeated_code,
+        "setup": Op.PUSH1(1),
+        "cleanup": Op.STOP,
+        "max_code_size": Prague.max_code_size(),
+    }
+    code = build_repeated_code(**kwargs)
+    assert len(code) <= Prague.max_code_size()
+    assert len(code) > Prague.max_code_size() - len(repeated_code) - 8
+    assert build_repeated_code(**kwargs) is code
+    assert build_repeated_code(**(kwargs | {"max_code_size": 1024})) is not code
+
+
+def test_benchmark_genesis_is_memoized(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that the genesis of a benchmark test is computed once for the same
+    fork, environment and pre-allocation, and that the cache is bounded.
+    """
+    state_root_calls = 0
+    original_state_root = Alloc.state_root
+
+    def counting_state_root(self: Alloc) -> bytes:
+        nonlocal state_root_calls
+        state_root_calls += 1
+        return original_state_root(self)
+
+    monkeypatch.setattr(Alloc, "state_root", counting_state_root)
+    monkeypatch.setattr(
+        "ethereum_test_specs.benchmark.benchmark_genesis_cache", GenesisCache(max_size=1)
+    )
+
+    def make_genesis(code_size: int, *, apply_pre_allocation_blockchain: bool = True) -> bytes:
+        pre = Alloc({Address(0x1000): Account(code=Op.JUMPDEST * code_size)})
+        benchmark_test = BenchmarkTest(pre=pre, tx=Transaction(to=0), env=Environment())
+        blockchain_test = benchmark_test.generate_blockchain_test(fork=Prague)
+        pre_alloc, genesis = blockchain_test.make_genesis(
+            fork=Prague, apply_pre_allocation_blockchain=apply_pre_allocation_blockchain
+        )
+        # Modifying the returned allocation must not affect the cache.
+        pre_alloc.root.clear()
+        return genesis.header.block_hash
+
+    block_hash = make_genesis(100)
+    assert make_genesis(100) == block_hash
+    assert state_root_calls == 1
+
+    make_genesis(100, apply_pre_allocation_blockchain=False)
+    assert state_root_calls == 2
+
+    # The maximum size of one entry evicted the first genesis.
+    assert make_genesis(100) == block_hash
+    assert make_genesis(200) != block_hash
+    assert state_root_calls == 4
@@ -0,0 +1,45 @@
+"""Test the gas limit search used by the gas optimization mode."""
+
+from threading import Lock
+from typing import List
+
+import pytest
+
+from ..helpers import find_minimum_gas_limit
+
+
+@pytest.mark.parametrize("parallel_probes", [1, 2, 3, 8])
+@pytest.mark.parametrize("minimum_valid_gas_limit", [0, 1, 21_000, 99_999, 100_000])
+def test_find_minimum_gas_limit(parallel_probes: int, minimum_valid_gas_limit: int) -> None:
+    """Test that the search finds the minimum valid gas limit."""
+    probed_gas_limits: List[int] = []
+    lock = Lock()
+
+    def verify_gas_limit(gas_limit: int) -> bool:
+        with lock:
+            probed_gas_limits.append(gas_limit)
+        return gas_limit >= minimum_valid_gas_limit
+
+    assert (
+        find_minimum_gas_limit(
+            verify_gas_limit,
+            maximum_gas_limit=100_000,
+            parallel_probes=parallel_probes,
+        )
+        == minimum_valid_gas_limit
+    )
+    assert len(probed_gas_limits) == len(set(probed_gas_limits))
+    if parallel_probes == 1:
+        # Plain bisection.
+        assert len(probed_gas_limits) <= 17
+
+
+def test_find_minimum_gas_limit_max_gas_limit_wanted() -> None:
+    """Test that the search stops when the gas limit exceeds the wanted one."""
+    with pytest.raises(Exception, match="Requires more than the minimum 1000 wanted"):
+        find_minimum_gas_limit(
+            lambda gas_limit: gas_limit >= 50_000,
+            maximum_gas_limit=100_000,
+            parallel_probes=4,
+            max_gas_limit_wanted=1_000,
+        )
@@ -1,110 +1,234 @@
 """
 Module containing tools for generating cross-client Ethereum execution layer
 tests.
+
+The names exported by this package are imported lazily, on first access, so
+that importing a single submodule (e.g. `ethereum_test_tools.utility`) doesn't
+import all the test specs and their dependencies.
 """
 
-from ethereum_test_base_types import (
-    AccessList,
-    Account,
-    Address,
-    Bytes,
-    Hash,
-    Storage,
-    TestAddress,
-    TestAddress2,
-    TestPrivateKey,
-    TestPrivateKey2,
-)
-from ethereum_test_base_types.reference_spec import ReferenceSpec, ReferenceSpecTypes
-from ethereum_test_benchmark import (
-    BenchmarkCodeGenerator,
-    ExtCallGenerator,
-    JumpLoopGenerator,
-)
-from ethereum_test_exceptions import (
-    BlockException,
-    EngineAPIError,
-    EOFException,
-    TransactionException,
-)
-from ethereum_test_fixtures import BaseFixture, FixtureCollector
-from ethereum_test_specs import (
-    BaseTest,
-    BenchmarkTest,
-    BenchmarkTestFiller,
-    BlobsTest,
-    BlobsTestFiller,
-    BlockchainTest,
-    BlockchainTestFiller,
-    EOFStateTest,
-    EOFStateTestFiller,
-    EOFTest,
-    EOFTestFiller,
-    StateTest,
-    StateTestFiller,
-    TransactionTest,
-    TransactionTestFiller,
-)
-from ethereum_test_specs.blockchain import Block, Header
-from ethereum_test_types import (
-    EOA,
-    Alloc,
-    AuthorizationTuple,
-    BalAccountChange,
-    BalBalanceChange,
-    BalCodeChange,
-    BalNonceChange,
-    BalStorageChange,
-    BalStorageSlot,
-    Blob,
-    BlockAccessList,
-    ChainConfig,
-    ConsolidationRequest,
-    DepositRequest,
-    Environment,
-    NetworkWrappedTransaction,
-    Removable,
-    Requests,
-    TestParameterGroup,
-    Transaction,
-    TransactionReceipt,
-    Withdrawal,
-    WithdrawalRequest,
-    add_kzg_version,
-    ceiling_division,
-    compute_create2_address,
-    compute_create_address,
-    compute_eofcreate_address,
-    keccak256,
-)
-from ethereum_test_vm import (
-    Bytecode,
-    EVMCodeType,
-    Macro,
-    Macros,
-    MemoryVariable,
-    Opcode,
-    OpcodeCallArg,
-    Opcodes,
-    UndefinedOpcodes,
-    call_return_code,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
-from .tools_code import (
-    CalldataCase,
-    Case,
-    CodeGasMeasure,
-    Conditional,
-    Initcode,
-    Switch,
-    While,
-)
-from .utility.generators import (
-    DeploymentTestType,
-    generate_system_contract_deploy_test,
-    generate_system_contract_error_test,
-)
-from .utility.pytest import extend_with_defaults
+if TYPE_CHECKING:
+    from ethereum_test_base_types import (
+        AccessList,
+        Account,
+        Address,
+        Bytes,
+        Hash,
+        Storage,
+        TestAddress,
+        TestAddress2,
+        TestPrivateKey,
+        TestPrivateKey2,
+    )
+    from ethereum_test_base_types.reference_spec import ReferenceSpec, ReferenceSpecTypes
+    from ethereum_test_benchmark import (
+        BenchmarkCodeGenerator,
+        ExtCallGenerator,
+        JumpLoopGenerator,
+    )
+    from ethereum_test_exceptions import (
+        BlockException,
+        EngineAPIError,
+        EOFException,
+        TransactionException,
+    )
+    from ethereum_test_fixtures import BaseFixture, FixtureCollector
+    from ethereum_test_specs import (
+        BaseTest,
+        BenchmarkTest,
+        BenchmarkTestFiller,
+        BlobsTest,
+        BlobsTestFiller,
+        BlockchainTest,
+        BlockchainTestFiller,
+        EOFStateTest,
+        EOFStateTestFiller,
+        EOFTest,
+        EOFTestFiller,
+        StateTest,
+        StateTestFiller,
+        TransactionTest,
+        TransactionTestFiller,
+    )
+    from ethereum_test_specs.blockchain import Block, Header
+    from ethereum_test_types import (
+        EOA,
+        Alloc,
+        AuthorizationTuple,
+        BalAccountChange,
+        BalBalanceChange,
+        BalCodeChange,
+        BalNonceChange,
+        BalStorageChange,
+        BalStorageSlot,
+        Blob,
+        BlockAccessList,
+        ChainConfig,
+        ConsolidationRequest,
+        DepositRequest,
+        Environment,
+        NetworkWrappedTransaction,
+        Removable,
+        Requests,
+        TestParameterGroup,
+        Transaction,
+        TransactionReceipt,
+        Withdrawal,
+        WithdrawalRequest,
+        add_kzg_version,
+        ceiling_division,
+        compute_create2_address,
+        compute_create_address,
+        compute_eofcreate_address,
+        keccak256,
+    )
+    from ethereum_test_vm import (
+        Bytecode,
+        EVMCodeType,
+        Macro,
+        Macros,
+        MemoryVariable,
+        Opcode,
+        OpcodeCallArg,
+        Opcodes,
+        UndefinedOpcodes,
+        call_return_code,
+    )
+
+    from .tools_code import (
+        CalldataCase,
+        Case,
+        CodeGasMeasure,
+        Conditional,
+        Initcode,
+        Switch,
+        While,
+    )
+    from .utility.generators import (
+        DeploymentTestType,
+        generate_system_contract_deploy_test,
+        generate_system_contract_error_test,
+    )
+    from .utility.pytest import extend_with_defaults
+
+_LAZY_IMPORTS: Dict[str, Tuple[str, ...]] = {
+    "ethereum_test_base_types": (
+        "AccessList",
+        "Account",
+        "Address",
+        "Bytes",
+        "Hash",
+        "Storage",
+        "TestAddress",
+        "TestAddress2",
+        "TestPrivateKey",
+        "TestPrivateKey2",
+    ),
+    "ethereum_test_base_types.reference_spec": (
+        "ReferenceSpec",
+        "ReferenceSpecTypes",
+    ),
+    "ethereum_test_benchmark": (
+        "BenchmarkCodeGenerator",
+        "ExtCallGenerator",
+        "JumpLoopGenerator",
+    ),
+    "ethereum_test_exceptions": (
+        "BlockException",
+        "EngineAPIError",
+        "EOFException",
+        "TransactionException",
+    ),
+    "ethereum_test_fixtures": (
+        "BaseFixture",
+        "FixtureCollector",
+    ),
+    "ethereum_test_specs": (
+        "BaseTest",
+        "BenchmarkTest",
+        "BenchmarkTestFiller",
+        "BlobsTest",
+        "BlobsTestFiller",
+        "BlockchainTest",
+        "BlockchainTestFiller",
+        "EOFStateTest",
+        "EOFStateTestFiller",
+        "EOFTest",
+        "EOFTestFiller",
+        "StateTest",
+        "StateTestFiller",
+        "TransactionTest",
+        "TransactionTestFiller",
+    ),
+    "ethereum_test_specs.blockchain": (
+        "Block",
+        "Header",
+    ),
+    "ethereum_test_types": (
+        "EOA",
+        "Alloc",
+        "AuthorizationTuple",
+        "BalAccountChange",
+        "BalBalanceChange",
+        "BalCodeChange",
+        "BalNonceChange",
+        "BalStorageChange",
+        "BalStorageSlot",
+        "Blob",
+        "BlockAccessList",
+        "ChainConfig",
+        "ConsolidationRequest",
+        "DepositRequest",
+        "Environment",
+        "NetworkWrappedTransaction",
+        "Removable",
+        "Requests",
+        "TestParameterGroup",
+        "Transaction",
+        "TransactionReceipt",
+        "Withdrawal",
+        "WithdrawalRequest",
+        "add_kzg_version",
+        "ceiling_division",
+        "compute_create2_address",
+        "compute_create_address",
+        "compute_eofcreate_address",
+        "keccak256",
+    ),
+    "ethereum_test_vm": (
+        "Bytecode",
+        "EVMCodeType",
+        "Macro",
+        "Macros",
+        "MemoryVariable",
+        "Opcode",
+        "OpcodeCallArg",
+        "Opcodes",
+        "UndefinedOpcodes",
+        "call_return_code",
+    ),
+    ".tools_code": (
+        "CalldataCase",
+        "Case",
+        "CodeGasMeasure",
+        "Conditional",
+        "Initcode",
+        "Switch",
+        "While",
+    ),
+    ".utility.generators": (
+        "DeploymentTestType",
+        "generate_system_contract_deploy_test",
+        "generate_system_contract_error_test",
+    ),
+    ".utility.pytest": ("extend_with_defaults",),
+}
+_NAME_TO_MODULE: Dict[str, str] = {
+    name: module for module, names in _LAZY_IMPORTS.items() for name in names
+}
 
 __all__ = (
     "AccessList",
@@ -195,5 +319,19 @@ __all__ = (
     "generate_system_contract_deploy_test",
     "generate_system_contract_error_test",
     "keccak256",
-    "vm",
 )
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module of an exported name on first access."""
+    module = _NAME_TO_MODULE.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Return the names of the module, including the lazily imported ones."""
+    return sorted(set(globals()) | set(_NAME_TO_MODULE))
@@ -0,0 +1,36 @@
+"""Test the lazy import of the names exported by `ethereum_test_tools`."""
+
+import subprocess
+import sys
+
+import pytest
+
+import ethereum_test_tools
+
+
+@pytest.mark.parametrize("name", ethereum_test_tools.__all__)
+def test_exported_name(name: str) -> None:
+    """Test that each exported name can be imported and is listed."""
+    assert getattr(ethereum_test_tools, name) is not None
+    assert name in dir(ethereum_test_tools)
+
+
+def test_unknown_name() -> None:
+    """Test that an unknown name raises an `AttributeError`."""
+    with pytest.raises(AttributeError, match="has no attribute 'Unknown'"):
+        ethereum_test_tools.Unknown  # noqa: B018
+
+
+def test_submodule_import_is_lazy() -> None:
+    """
+    Test that importing a submodule of the package doesn't import the test
+    specs, which are only imported on first access.
+    """
+    code = (
+        "import sys\n"
+        "import ethereum_test_tools.utility.versioning\n"
+        "assert 'ethereum_test_specs' not in sys.modules\n"
+        "from ethereum_test_tools import StateTest\n"
+        "assert 'ethereum_test_specs' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
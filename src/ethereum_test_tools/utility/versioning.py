@@ -3,8 +3,6 @@
 import re
 from typing import Union
 
-from git import InvalidGitRepositoryError, Repo
-
 
 def get_current_commit_hash_or_tag(repo_path: str = ".", shorten_hash: bool = False) -> str:
     """
@@ -16,6 +14,10 @@ def get_current_commit_hash_or_tag(repo_path: str = ".", shorten_hash: bool = Fa
         commit hash.
       - Otherwise, return the full commit hash.
     """
+    # Imported here, as GitPython is slow to import and only needed when
+    # filling
+    from git import InvalidGitRepositoryError, Repo
+
     try:
         repo = Repo(repo_path)
         current_commit = repo.head.commit
@@ -1,11 +1,12 @@
 """Blob-related types for Ethereum tests."""
 
+import mmap
 import random
 from enum import Enum
 from hashlib import sha256
 from os.path import realpath
 from pathlib import Path
-from typing import Any, ClassVar, List, Literal, cast
+from typing import Any, ClassVar, Dict, List, Literal, Tuple, cast
 
 import ckzg  # type: ignore
 import platformdirs
@@ -19,6 +20,7 @@ from pytest_plugins.custom_logging import get_logger
 CACHED_BLOBS_DIRECTORY: Path = (
     Path(platformdirs.user_cache_dir("ethereum-execution-spec-tests")) / "cached_blobs"
 )
+BLOB_STORE_SEED_LENGTH = 32
 logger = get_logger(__name__)
 
 
@@ -27,9 +29,11 @@ def clear_blob_cache(cached_blobs_folder_path: Path) -> None:
     if not cached_blobs_folder_path.is_dir():
         return
 
+    BlobStore.stores.clear()
     json_files = list(cached_blobs_folder_path.glob("*.json"))
+    store_files = list(cached_blobs_folder_path.glob("*.bin"))
 
-    for f in json_files:
+    for f in json_files + store_files:
         lock_file_path = f.with_suffix(".lock")
 
         try:
@@ -44,6 +48,141 @@ def clear_blob_cache(cached_blobs_folder_path: Path) -> None:
             return
 
 
+class BlobStore:
+    """
+    Append-only binary file with the data, commitment, proofs and cells of the
+    blobs of the forks with a given amount of cell proofs, keyed by seed.
+
+    The file is shared by all the processes that use blobs (e.g. the xdist
+    workers and later sessions) and read through a memory map. Records are
+    never modified once appended, so they are read without holding the lock,
+    which is only acquired to append records and to index the records
+    appended by other processes.
+    """
+
+    stores: ClassVar[Dict[Tuple[Path, int], "BlobStore"]] = {}
+
+    path: Path
+    lock_path: Path
+    data_length: int
+    commitment_length: int
+    proof_length: int
+    amount_proofs: int
+    cell_length: int
+    amount_cells: int
+    record_length: int
+
+    def __init__(self, directory: Path, fork: Fork) -> None:
+        """Initialize the store of the blobs of the given fork."""
+        amount_cell_proofs = cast(int, fork.get_blob_constant("AMOUNT_CELL_PROOFS"))
+        self.path = directory / f"blobs_cell_proofs_{amount_cell_proofs}.bin"
+        self.lock_path = self.path.with_suffix(".lock")
+        self.data_length = cast(int, fork.get_blob_constant("FIELD_ELEMENTS_PER_BLOB")) * cast(
+            int, fork.get_blob_constant("BYTES_PER_FIELD_ELEMENT")
+        )
+        self.commitment_length = cast(int, fork.get_blob_constant("BYTES_PER_COMMITMENT"))
+        self.proof_length = cast(int, fork.get_blob_constant("BYTES_PER_PROOF"))
+        self.amount_proofs = max(amount_cell_proofs, 1)
+        self.cell_length = cast(int, fork.get_blob_constant("CELL_LENGTH"))
+        self.amount_cells = amount_cell_proofs
+        self.record_length = (
+            BLOB_STORE_SEED_LENGTH
+            + self.data_length
+            + self.commitment_length
+            + self.amount_proofs * self.proof_length
+            + self.amount_cells * self.cell_length
+        )
+        self._offsets: Dict[int, int] = {}
+        self._indexed_length = 0
+        self._inode: int | None = None
+        self._map: mmap.mmap | None = None
+
+    @classmethod
+    def for_fork(cls, fork: Fork) -> "BlobStore":
+        """Return the store of the blobs of the given fork."""
+        amount_cell_proofs = cast(int, fork.get_blob_constant("AMOUNT_CELL_PROOFS"))
+        key = (CACHED_BLOBS_DIRECTORY, amount_cell_proofs)
+        if key not in cls.stores:
+            cls.stores[key] = cls(CACHED_BLOBS_DIRECTORY, fork)
+        return cls.stores[key]
+
+    def _index(self) -> None:
+        """
+        Index the records appended since the last call, must be called with
+        the lock held.
+        """
+        try:
+            stat = self.path.stat()
+            inode, length = stat.st_ino, stat.st_size - stat.st_size % self.record_length
+        except FileNotFoundError:
+            inode, length = None, 0
+        if inode != self._inode or length < self._indexed_length:
+            # The store was cleared (and possibly recreated) since last time.
+            self._offsets = {}
+            self._indexed_length = 0
+            self._inode = inode
+        if length == self._indexed_length:
+            return
+        with open(self.path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), length, access=mmap.ACCESS_READ)
+        for offset in range(self._indexed_length, length, self.record_length):
+            seed = int.from_bytes(
+                self._map[offset : offset + BLOB_STORE_SEED_LENGTH], "big", signed=True
+            )
+            self._offsets.setdefault(seed, offset)
+        self._indexed_length = length
+
+    def read(self, seed: int) -> Tuple[Bytes, Bytes, List[Bytes], List[Bytes]] | None:
+        """
+        Return the data, commitment, proofs and cells of the blob with the
+        given seed, or `None` if the blob is not in the store.
+        """
+        if seed not in self._offsets:
+            with FileLock(self.lock_path):
+                self._index()
+        offset = self._offsets.get(seed)
+        if offset is None:
+            return None
+        assert self._map is not None
+        offset += BLOB_STORE_SEED_LENGTH
+        data = Bytes(self._map[offset : offset + self.data_length])
+        offset += self.data_length
+        commitment = Bytes(self._map[offset : offset + self.commitment_length])
+        offset += self.commitment_length
+        proofs = []
+        for _ in range(self.amount_proofs):
+            proofs.append(Bytes(self._map[offset : offset + self.proof_length]))
+            offset += self.proof_length
+        cells = []
+        for _ in range(self.amount_cells):
+            cells.append(Bytes(self._map[offset : offset + self.cell_length]))
+            offset += self.cell_length
+        return data, commitment, proofs, cells
+
+    def append(
+        self, seed: int, data: bytes, commitment: bytes, proofs: List[bytes], cells: List[bytes]
+    ) -> None:
+        """Append the blob with the given seed to the store."""
+        assert len(proofs) == self.amount_proofs, f"Expected {self.amount_proofs} proofs"
+        assert len(cells) == self.amount_cells, f"Expected {self.amount_cells} cells"
+        record = b"".join(
+            [seed.to_bytes(BLOB_STORE_SEED_LENGTH, "big", signed=True), data, commitment]
+            + proofs
+            + cells
+        )
+        assert len(record) == self.record_length, "Unexpected blob store record length"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with FileLock(self.lock_path):
+            self._index()
+            if seed in self._offsets:
+                return
+            with open(self.path, "ab") as f:
+                # Drop the partial record of an interrupted append, if any.
+                f.truncate(self._indexed_length)
+                f.write(record)
+            self._index()
+
+
 class Blob(CamelModel):
     """Class representing a full blob."""
 
@@ -147,7 +286,11 @@ class Blob(CamelModel):
 
             return commitment
 
-        def get_proof(fork: Fork, data: Bytes) -> List[Bytes] | Bytes:
+        def get_cells_and_proofs(fork: Fork, data: Bytes) -> Tuple[List[bytes], List[bytes]]:
+            """
+            Return the cells and cell proofs of the blob (>=osaka), or no cells
+            and the single blob proof (cancun, prague).
+            """
             # determine whether this fork is <osaka or >= osaka by looking at
             # amount of cell_proofs
             amount_cell_proofs = fork.get_blob_constant("AMOUNT_CELL_PROOFS")
@@ -162,87 +305,57 @@ class Blob(CamelModel):
                     cast(int, fork.get_blob_constant("BYTES_PER_FIELD_ELEMENT")), byteorder="big"
                 )
                 proof, _ = ckzg.compute_kzg_proof(data, z_valid_size, Blob.trusted_setup())
-                return proof
+                return [], [proof]
 
             # >=osaka
             if amount_cell_proofs == 128:
-                _, proofs = ckzg.compute_cells_and_kzg_proofs(
+                cells, proofs = ckzg.compute_cells_and_kzg_proofs(
                     data, Blob.trusted_setup()
-                )  # returns List[byte] of length 128
-                return proofs
+                )  # returns two List[byte] of length 128
+                return cells, proofs
 
             raise AssertionError(
-                f"get_proof() has not been implemented yet for fork: {fork.name()}."
+                f"get_cells_and_proofs() has not been implemented yet for fork: {fork.name()}. "
                 f"Got amount of cell proofs {amount_cell_proofs} but expected 128."
             )
 
-        def get_cells(fork: Fork, data: Bytes) -> List[Bytes] | None:
-            # determine whether this fork is <osaka or >= osaka by looking at
-            # amount of cell_proofs
-            amount_cell_proofs = fork.get_blob_constant("AMOUNT_CELL_PROOFS")
-
-            # cancun, prague
-            if amount_cell_proofs == 0:
-                return None
-
-            # >=osaka
-            if amount_cell_proofs == 128:
-                cells, _ = ckzg.compute_cells_and_kzg_proofs(
-                    data, Blob.trusted_setup()
-                )  # returns List[byte] of length 128
-                return cells  # List[bytes]
-
-            raise AssertionError(
-                f"get_cells() has not been implemented yet for fork: {fork.name()}. Got amount of "
-                f"cell proofs {amount_cell_proofs} but expected 128."
-            )
-
-        # first, create cached blobs dir if necessary
-        if not CACHED_BLOBS_DIRECTORY.exists():
-            CACHED_BLOBS_DIRECTORY.mkdir(
-                parents=True, exist_ok=True
-            )  # create all necessary dirs on the way
-
         # handle transition forks (blob related constants are needed and only
         # available for normal forks)
         fork = fork.fork_at(timestamp=timestamp)
-
-        # if this blob already exists then load from file. use lock
-        blob_location: Path = Blob.get_filepath(fork, seed)
-
-        # use lock to avoid race conditions
-        lock_file_path = blob_location.with_suffix(".lock")
-        with FileLock(lock_file_path):
-            if blob_location.exists():
-                logger.debug(f"Blob exists already, reading it from file {blob_location}")
-                return Blob.from_file(Blob.get_filename(fork, seed))
-
         assert fork.supports_blobs(), f"Provided fork {fork.name()} does not support blobs!"
 
-        # get data for blob parameters
-        data: Bytes = generate_blob_data(seed)
-        commitment: Bytes = get_commitment(data)
-        proof: List[Bytes] | Bytes = get_proof(fork, data)
-        cells: List[Bytes] | None = get_cells(fork, data)
-        versioned_hash: Hash = get_versioned_hash(commitment)
-        name: str = Blob.get_filename(fork, seed)
-
-        blob = Blob(
+        # if this blob already exists then read it from the blob store,
+        # otherwise generate it while holding the lock of this blob, so that
+        # each blob is only generated once across processes while different
+        # blobs are generated in parallel.
+        store = BlobStore.for_fork(fork)
+        stored_blob = store.read(seed)
+        if stored_blob is None:
+            CACHED_BLOBS_DIRECTORY.mkdir(parents=True, exist_ok=True)
+            with FileLock(Blob.get_filepath(fork, seed).with_suffix(".lock")):
+                stored_blob = store.read(seed)
+                if stored_blob is None:
+                    data: Bytes = generate_blob_data(seed)
+                    commitment: Bytes = get_commitment(data)
+                    cells, proofs = get_cells_and_proofs(fork, data)
+                    store.append(seed, data, commitment, proofs, cells)
+                    stored_blob = store.read(seed)
+                    assert stored_blob is not None, f"Blob {seed} missing from the blob store"
+        else:
+            logger.debug(f"Blob exists already, reading it from the blob store {store.path}")
+        data, commitment, stored_proofs, stored_cells = stored_blob
+
+        return Blob(
             data=data,
             commitment=commitment,
-            proof=proof,
-            cells=cells,
-            versioned_hash=versioned_hash,
-            name=name,
+            proof=stored_proofs if store.amount_cells else stored_proofs[0],
+            cells=stored_cells if store.amount_cells else None,
+            versioned_hash=get_versioned_hash(commitment),
+            name=Blob.get_filename(fork, seed),
             fork=fork,
             seed=seed,
             timestamp=timestamp,
         )
-        # for most effective caching temporarily persist every blob that is
-        # created in cache
-        blob.write_to_file()
-
-        return blob
 
     @staticmethod
     def from_file(file_name: str) -> "Blob":
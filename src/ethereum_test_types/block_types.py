@@ -8,7 +8,6 @@ from typing import Any, Dict, Generic, List, Sequence
 import ethereum_rlp as eth_rlp
 from ethereum_types.numeric import Uint
 from pydantic import Field, computed_field
-from trie import HexaryTrie
 
 from ethereum_test_base_types import (
     Address,
@@ -63,6 +62,9 @@ class WithdrawalGeneric(CamelModel, Generic[NumberBoundTypeVar]):
     @staticmethod
     def list_root(withdrawals: Sequence["WithdrawalGeneric"]) -> bytes:
         """Return withdrawals root of a list of withdrawals."""
+        # Imported here, as py-trie is slow to import
+        from trie import HexaryTrie
+
         t = HexaryTrie(db={})
         for i, w in enumerate(withdrawals):
             t.set(eth_rlp.encode(Uint(i)), eth_rlp.encode(w.to_serializable_list()))
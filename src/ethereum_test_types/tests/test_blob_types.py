@@ -2,6 +2,7 @@
 
 import copy
 import time
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -18,7 +19,7 @@ from ethereum_test_forks.forks.transition import (
     ShanghaiToCancunAtTime15k,
 )
 
-from ..blob_types import CACHED_BLOBS_DIRECTORY, Blob, clear_blob_cache
+from ..blob_types import CACHED_BLOBS_DIRECTORY, Blob, BlobStore, clear_blob_cache
 
 
 def increment_counter(timeout: float = 10) -> int:
@@ -106,6 +107,39 @@ def test_blob_creation_and_writing_and_reading(
     increment_counter()
 
 
+@pytest.mark.parametrize("fork", [Cancun, Osaka])
+def test_blob_store(tmp_path: Path, fork: Any) -> None:
+    """
+    Test that the records appended to a blob store are read back by the same
+    and by other store instances, and that partial records are discarded.
+    """
+    store = BlobStore(tmp_path, fork)
+    other_store = BlobStore(tmp_path, fork)
+
+    def record(seed: int) -> Any:
+        return (
+            bytes([seed]) * store.data_length,
+            bytes([seed]) * store.commitment_length,
+            [bytes([seed, i]) * (store.proof_length // 2) for i in range(store.amount_proofs)],
+            [bytes([seed, i]) * (store.cell_length // 2) for i in range(store.amount_cells)],
+        )
+
+    assert store.read(1) is None
+    store.append(1, *record(1))
+    assert store.read(1) == record(1)
+    assert other_store.read(1) == record(1)
+
+    # Simulate an append interrupted by another process.
+    with open(store.path, "ab") as f:
+        f.write(b"\x00" * (store.record_length // 2))
+    other_store.append(2, *record(2))
+    other_store.append(1, *record(2))
+    assert store.path.stat().st_size == 2 * store.record_length
+    assert store.read(2) == record(2)
+    assert store.read(1) == record(1)
+    assert other_store.read(1) == record(1)
+
+
 @pytest.mark.parametrize(
     "corruption_mode",
     [
@@ -17,7 +17,6 @@ from pydantic import (
     model_serializer,
     model_validator,
 )
-from trie import HexaryTrie
 
 from ethereum_test_base_types import (
     AccessList,
@@ -676,6 +675,9 @@ class Transaction(
     @staticmethod
     def list_root(input_txs: List["Transaction"]) -> Hash:
         """Return transactions root of a list of transactions."""
+        # Imported here, as py-trie is slow to import
+        from trie import HexaryTrie
+
         t = HexaryTrie(db={})
         for i, tx in enumerate(input_txs):
             t.set(eth_rlp.encode(Uint(i)), tx.rlp())
@@ -1,6 +1,6 @@
 """Ethereum Virtual Machine bytecode primitives and utilities."""
 
-from typing import Any, Self, SupportsBytes
+from typing import Any, ClassVar, Dict, List, Self, SupportsBytes, Tuple
 
 from pydantic import GetCoreSchemaHandler
 from pydantic_core.core_schema import (
@@ -20,6 +20,11 @@ class Bytecode:
     between two bytecode objects. The stack height is not guaranteed to be
     correct, so the user must take this into consideration.
 
+    Concatenated bytecode keeps references to its segments and is only
+    materialized into a single bytes object when its bytes are first
+    required, so building large contracts by repeated addition is linear in
+    the size of the resulting code.
+
     Parameters
     ----------
     - popped_stack_items: number of items the bytecode pops from the stack
@@ -29,8 +34,12 @@ class Bytecode:
 
     """
 
+    EAGER_CONCATENATION_MAX_LENGTH: ClassVar[int] = 1024
+
     _name_: str = ""
-    _bytes_: bytes
+    _data_: bytes
+    _segments_: "Tuple[Bytecode | bytes, ...] | None"
+    _length_: int
 
     popped_stack_items: int
     pushed_stack_items: int
@@ -96,13 +105,88 @@ class Bytecode:
 
         raise TypeError("Bytecode constructor '__new__' didn't return an instance!")
 
+    @classmethod
+    def _concatenation(
+        cls,
+        segments: "Tuple[Bytecode | bytes, ...]",
+        *,
+        length: int,
+        popped_stack_items: int,
+        pushed_stack_items: int,
+        min_stack_height: int,
+        max_stack_height: int,
+        terminating: bool,
+    ) -> "Bytecode":
+        """
+        Create bytecode from the concatenation of the given segments.
+
+        Small results are joined right away, since that is cheaper than
+        keeping the segments, while larger results are only materialized
+        when their bytes are first requested.
+        """
+        obj = object.__new__(Bytecode)
+        if length <= cls.EAGER_CONCATENATION_MAX_LENGTH:
+            obj._data_ = b"".join(
+                segment if isinstance(segment, bytes) else segment._bytes_ for segment in segments
+            )
+            obj._segments_ = None
+        else:
+            obj._data_ = b""
+            obj._segments_ = segments
+        obj._length_ = length
+        obj._name_ = ""
+        obj.popped_stack_items = popped_stack_items
+        obj.pushed_stack_items = pushed_stack_items
+        obj.min_stack_height = min_stack_height
+        obj.max_stack_height = max_stack_height
+        obj.terminating = terminating
+        return obj
+
+    @property
+    def _bytes_(self) -> bytes:
+        """
+        Return the byte representation, joining the pending concatenated
+        segments the first time it is requested.
+        """
+        if self._segments_ is not None:
+            chunks: List[bytes] = []
+            pending: List[Bytecode | bytes] = [self]
+            while pending:
+                segment = pending.pop()
+                if isinstance(segment, bytes):
+                    chunks.append(segment)
+                elif segment._segments_ is None:
+                    chunks.append(segment._data_)
+                else:
+                    pending.extend(reversed(segment._segments_))
+            self._data_ = b"".join(chunks)
+            self._segments_ = None
+        return self._data_
+
+    @_bytes_.setter
+    def _bytes_(self, value: bytes) -> None:
+        """Set the byte representation."""
+        self._data_ = value
+        self._segments_ = None
+        self._length_ = len(value)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Return the state used to copy and pickle the bytecode, materializing
+        the pending concatenated segments, whose nesting is as deep as the
+        number of additions and would exceed the recursion limit otherwise.
+        """
+        state = self.__dict__.copy()
+        state["_data_"], state["_segments_"] = self._bytes_, None
+        return state
+
     def __bytes__(self) -> bytes:
         """Return the opcode byte representation."""
         return self._bytes_
 
     def __len__(self) -> int:
         """Return the length of the opcode byte representation."""
-        return len(self._bytes_)
+        return self._length_
 
     def __str__(self) -> str:
         """Return the name of the opcode, assigned at Enum creation."""
@@ -150,10 +234,15 @@ class Bytecode:
             return self
 
         if isinstance(other, bytes):
-            c = Bytecode(self)
-            c._bytes_ += other
-            c._name_ = ""
-            return c
+            return Bytecode._concatenation(
+                (self, other),
+                length=len(self) + len(other),
+                popped_stack_items=self.popped_stack_items,
+                pushed_stack_items=self.pushed_stack_items,
+                min_stack_height=self.min_stack_height,
+                max_stack_height=self.max_stack_height,
+                terminating=self.terminating,
+            )
 
         assert isinstance(other, Bytecode), "Can only concatenate Bytecode instances"
         # Figure out the stack height after executing the two opcodes.
@@ -198,8 +287,9 @@ class Bytecode:
         # completed.
         c_max = max(c_min + a_max - a_min, c_min - a_pop + a_push + b_max - b_min)
 
-        return Bytecode(
-            bytes(self) + bytes(other),
+        return Bytecode._concatenation(
+            (self, other),
+            length=len(self) + len(other),
             popped_stack_items=c_pop,
             pushed_stack_items=c_push,
             min_stack_height=c_min,
@@ -225,10 +315,24 @@ class Bytecode:
             raise ValueError("Cannot multiply by a negative number")
         if other == 0:
             return Bytecode()
-        output = self
-        for _ in range(other - 1):
-            output += self
-        return output
+        if other == 1:
+            return self
+        # Closed form of adding the bytecode to itself `other - 1` times: the
+        # i-th repetition starts with the stack shifted by `i * net`.
+        net = self.pushed_stack_items - self.popped_stack_items
+        popped_stack_items = self.popped_stack_items + max(0, -(other - 1) * net)
+        min_stack_height = self.min_stack_height + max(0, -(other - 1) * net)
+        return Bytecode(
+            bytes(self) * other,
+            popped_stack_items=popped_stack_items,
+            pushed_stack_items=popped_stack_items + other * net,
+            min_stack_height=min_stack_height,
+            max_stack_height=min_stack_height
+            + self.max_stack_height
+            - self.min_stack_height
+            + max(0, (other - 1) * net),
+            terminating=self.terminating,
+        )
 
     def hex(self) -> str:
         """
@@ -9,6 +9,7 @@ to @ThreeHrSleep for integrating it in the docstrings.
 """
 
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Callable, Iterable, List, Mapping, Optional, SupportsBytes
 
 from ethereum_test_base_types import to_bytes
@@ -31,16 +32,13 @@ def _get_int_size(n: int) -> int:
 
 KW_ARGS_DEFAULTS_TYPE = Mapping[str, "int | bytes | str | Opcode | Bytecode"]
 
+PUSH_ENCODING_CACHE_SIZE = 1 << 16
 
-def _stack_argument_to_bytecode(
-    arg: "int | bytes | SupportsBytes | str | Opcode | Bytecode | Iterable[int]",
-) -> Bytecode:
-    """Convert stack argument in an opcode or macro to bytecode."""
-    if isinstance(arg, Bytecode):
-        return arg
 
-    # We are going to push a constant to the stack.
-    data_size = 0
+def _stack_argument_to_push_data(
+    arg: "int | bytes | SupportsBytes | str | Iterable[int]",
+) -> bytes:
+    """Convert a constant stack argument to the data portion of a PUSH."""
     if isinstance(arg, int):
         signed = arg < 0
         data_size = _get_int_size(arg)
@@ -50,22 +48,84 @@ def _stack_argument_to_bytecode(
             # Pushing 0 is done with the PUSH1 opcode
             # for compatibility reasons.
             data_size = 1
-        arg = arg.to_bytes(
+        return arg.to_bytes(
             length=data_size,
             byteorder="big",
             signed=signed,
         )
-    else:
-        arg = to_bytes(arg).lstrip(b"\0")  # type: ignore
-        if arg == b"":
-            # Pushing 0 is done with the PUSH1 opcode for
-            # compatibility reasons.
-            arg = b"\x00"
-        data_size = len(arg)
-
-    assert isinstance(arg, bytes)
-    assert data_size > 0
-    new_opcode = _push_opcodes_byte_list[data_size - 1][arg]
+    data = to_bytes(arg).lstrip(b"\0")  # type: ignore
+    if data == b"":
+        # Pushing 0 is done with the PUSH1 opcode for
+        # compatibility reasons.
+        data = b"\x00"
+    return data
+
+
+@lru_cache(maxsize=PUSH_ENCODING_CACHE_SIZE)
+def _cached_push_encoding(arg: int | bytes | str) -> bytes:
+    """
+    Return the encoded PUSH instruction for an immutable constant, most
+    constants used by the tests are small and reused many times.
+    """
+    data = _stack_argument_to_push_data(arg)
+    return bytes(_push_opcodes_byte_list[len(data) - 1]) + data
+
+
+def _push_encoding(arg: "int | bytes | SupportsBytes | str | Iterable[int]") -> bytes:
+    """Return the encoded PUSH instruction that pushes a constant."""
+    if isinstance(arg, (int, bytes, str)):
+        return _cached_push_encoding(arg)
+    data = _stack_argument_to_push_data(arg)
+    return bytes(_push_opcodes_byte_list[len(data) - 1]) + data
+
+
+def _stack_arguments_to_bytecode(
+    args: "Iterable[int | bytes | SupportsBytes | str | Opcode | Bytecode | Iterable[int]]",
+) -> Bytecode:
+    """
+    Convert stack arguments in an opcode or macro to bytecode, in the given
+    order.
+
+    Consecutive constants are encoded straight into a single buffer, which
+    only pushes items to the stack, instead of concatenating a PUSH opcode
+    instance per argument.
+    """
+    bytecode = Bytecode()
+    push_encodings: List[bytes] = []
+    for arg in args:
+        if not isinstance(arg, Bytecode):
+            push_encodings.append(_push_encoding(arg))
+            continue
+        if push_encodings:
+            bytecode += _push_sequence(push_encodings)
+            push_encodings = []
+        bytecode += arg
+    if push_encodings:
+        bytecode += _push_sequence(push_encodings)
+    return bytecode
+
+
+def _push_sequence(push_encodings: List[bytes]) -> Bytecode:
+    """Return the bytecode of a sequence of encoded PUSH instructions."""
+    return Bytecode(
+        b"".join(push_encodings),
+        popped_stack_items=0,
+        pushed_stack_items=len(push_encodings),
+        min_stack_height=0,
+        max_stack_height=len(push_encodings),
+    )
+
+
+def _stack_argument_to_bytecode(
+    arg: "int | bytes | SupportsBytes | str | Opcode | Bytecode | Iterable[int]",
+) -> Bytecode:
+    """Convert stack argument in an opcode or macro to bytecode."""
+    if isinstance(arg, Bytecode):
+        return arg
+
+    # We are going to push a constant to the stack.
+    data = _stack_argument_to_push_data(arg)
+    new_opcode = _push_opcodes_byte_list[len(data) - 1][data]
     return new_opcode
 
 
@@ -289,10 +349,7 @@ class Opcode(Bytecode):
                 f"{len(args)} were provided. Use 'unchecked=True' parameter to ignore this check."
             )
 
-        pre_opcode_bytecode = Bytecode()
-        while len(args) > 0:
-            pre_opcode_bytecode += _stack_argument_to_bytecode(args.pop())
-        return pre_opcode_bytecode + self
+        return _stack_arguments_to_bytecode(reversed(args)) + self
 
     def __lt__(self, other: "Opcode") -> bool:
         """Compare two opcodes by their integer value."""
@@ -343,10 +400,7 @@ class Macro(Bytecode):
         if self.lambda_operation is not None:
             return self.lambda_operation(*args_t)
 
-        pre_opcode_bytecode = Bytecode()
-        for arg in args_t:
-            pre_opcode_bytecode += _stack_argument_to_bytecode(arg)
-        return pre_opcode_bytecode + self
+        return _stack_arguments_to_bytecode(args_t) + self
 
 
 #  Constants
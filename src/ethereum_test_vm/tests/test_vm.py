@@ -1,10 +1,14 @@
 """Test suite for `ethereum_test_vm` module."""
 
+import copy
+import pickle
+from typing import Any, Tuple
+
 import pytest
 
 from ethereum_test_base_types import Address
 
-from ..opcodes import Bytecode
+from ..opcodes import Bytecode, _stack_argument_to_bytecode
 from ..opcodes import Macros as Om
 from ..opcodes import Opcodes as Op
 
@@ -433,6 +437,95 @@ def test_bytecode_concatenation_with_bytes() -> None:
     assert code.terminating == base.terminating
 
 
+@pytest.mark.parametrize(
+    "bytecode",
+    [
+        Op.PUSH0,
+        Op.POP,
+        Op.ADD,
+        Op.SSTORE(0, 1),
+        Op.DUP3 + Op.POP,
+        Op.PUSH0 + Op.POP * 2 + Op.PUSH0 * 3,
+        Op.POP + Op.PUSH0 * 2 + Op.STOP,
+        Bytecode(b"\x00", popped_stack_items=2, pushed_stack_items=1, max_stack_height=5),
+    ],
+)
+@pytest.mark.parametrize("times", [0, 1, 2, 3, 17])
+def test_bytecode_multiplication(bytecode: Bytecode, times: int) -> None:
+    """
+    Test that the closed form used for bytecode multiplication matches the
+    repeated addition of the bytecode.
+    """
+    expected = Bytecode()
+    for _ in range(times):
+        expected += bytecode
+    result = bytecode * times
+    assert result == expected
+    assert result.terminating == expected.terminating
+
+
+def test_bytecode_large_concatenation() -> None:
+    """
+    Test that large concatenations, which are materialized lazily, produce
+    the same bytecode as eagerly joining every piece.
+    """
+    pieces = [Op.PUSH2(i) + Op.POP for i in range(2_000)]
+    code = Bytecode()
+    for piece in pieces:
+        code += piece
+    code += b"\xfe"
+    code = Op.JUMPDEST + code
+    assert len(code) == 1 + 4 * 2_000 + 1
+    assert bytes(code) == bytes(Op.JUMPDEST) + b"".join(bytes(p) for p in pieces) + b"\xfe"
+    assert code == sum(pieces, Op.JUMPDEST) + b"\xfe"
+    assert code.max_stack_height == 1
+
+    code._bytes_ = b"\x00"
+    assert len(code) == 1 and bytes(code) == b"\x00"
+
+
+def test_bytecode_long_concatenation_copy() -> None:
+    """
+    Test that bytecode built by a long chain of additions, whose segments
+    nest as deep as the chain, can be deep-copied and pickled.
+    """
+    code = Bytecode()
+    for _ in range(5_000):
+        code += Op.ADD
+    expected = bytes(Op.ADD) * 5_000
+    assert bytes(copy.deepcopy(code)) == expected
+    unpickled = pickle.loads(pickle.dumps(code))
+    assert unpickled == code
+    assert bytes(unpickled) == expected
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        pytest.param((), id="no_args"),
+        pytest.param((0, 1, 0xFFFF, -1, 2**255, b"", b"\x00\x01", "0x1234"), id="constants"),
+        pytest.param((Op.GAS, 0x1234, Op.DUP1, Op.SLOAD(0), 0, [0, 1]), id="mixed"),
+        pytest.param((Op.POP, Op.PUSH0, 1, Op.ADD, Op.ADD, Address(0x1234)), id="stack_effects"),
+    ],
+)
+def test_opcode_call_stack_arguments(args: Tuple[Any, ...]) -> None:
+    """
+    Test that encoding the stack arguments of an opcode or macro call gives
+    the same bytecode as concatenating a PUSH opcode per constant argument.
+    """
+    expected = Bytecode()
+    for arg in reversed(args):
+        expected += _stack_argument_to_bytecode(arg)
+    expected += Op.CALL
+    assert Op.CALL(*args, unchecked=True) == expected
+
+    expected = Bytecode()
+    for arg in args:
+        expected += _stack_argument_to_bytecode(arg)
+    expected += Om.OOG
+    assert Om.OOG(*args) == expected
+
+
 def test_opcode_kwargs_validation() -> None:
     """Test that invalid keyword arguments raise ValueError."""
     # Test valid kwargs work
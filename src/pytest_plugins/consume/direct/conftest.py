@@ -9,7 +9,7 @@ import json
 import tempfile
 import warnings
 from pathlib import Path
-from typing import Any, Generator
+from typing import Any, Generator, List
 
 import pytest
 
@@ -159,3 +159,34 @@ def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
             for fixture_consumer in metafunc.config.fixture_consumers  # type: ignore[attr-defined]
         ),
     )
+
+
+def fixture_file_group(item: pytest.Item) -> str | None:
+    """
+    Return the fixture file of a test case read from an index file, used to
+    group the test cases that can be consumed with a single call of a tool.
+    """
+    callspec = getattr(item, "callspec", None)
+    if callspec is None:
+        return None
+    test_case = callspec.params.get("test_case")
+    if not isinstance(test_case, TestCaseIndexFile):
+        return None
+    return str(test_case.json_path)
+
+
+def pytest_collection_modifyitems(
+    session: pytest.Session, config: pytest.Config, items: List[pytest.Item]
+) -> None:
+    """
+    Order the test cases by fixture file and mark them with their file as
+    their xdist group, so that all the test cases of a file are consumed one
+    after the other by the same worker (with `--dist loadgroup`), and the
+    consumers that execute whole fixture files execute each file only once.
+    """
+    del session, config
+    groups = {item: fixture_file_group(item) for item in items}
+    items.sort(key=lambda item: groups[item] or "")
+    for item, group in groups.items():
+        if group is not None:
+            item.add_marker(pytest.mark.xdist_group(name=group))
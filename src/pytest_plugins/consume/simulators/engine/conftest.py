@@ -5,9 +5,10 @@ Configures the hive back-end & EL clients for each individual test execution.
 """
 
 import io
-from typing import Mapping
+from typing import Generator, Mapping
 
 import pytest
+import requests
 from hive.client import Client
 
 from ethereum_test_exceptions import ExceptionMapper
@@ -24,22 +25,57 @@ pytest_plugins = (
 )
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the engine simulator command-line options to pytest."""
+    consume_group = parser.getgroup(
+        "consume", "Arguments related to consuming fixtures via a client"
+    )
+    consume_group.addoption(
+        "--pipeline-payloads",
+        action="store_true",
+        dest="pipeline_payloads",
+        default=False,
+        help=(
+            "Serialize all the payloads of a test up front and send each "
+            "`engine_newPayloadVX` right after the response to the previous one over a "
+            "persistent connection, with a single forkchoice update to the last valid payload "
+            "at the end instead of one after every valid payload."
+        ),
+    )
+
+
 def pytest_configure(config: pytest.Config) -> None:
     """Set the supported fixture formats for the engine simulator."""
     config.supported_fixture_formats = [BlockchainEngineFixture]  # type: ignore[attr-defined]
 
 
+@pytest.fixture(scope="session")
+def pipeline_payloads(request: pytest.FixtureRequest) -> bool:
+    """Return whether the payloads of each test are sent pipelined."""
+    return request.config.getoption("pipeline_payloads")
+
+
 @pytest.fixture(scope="function")
-def engine_rpc(client: Client, client_exception_mapper: ExceptionMapper | None) -> EngineRPC:
-    """Initialize engine RPC client for the execution client under test."""
+def engine_rpc(
+    client: Client, client_exception_mapper: ExceptionMapper | None, pipeline_payloads: bool
+) -> Generator[EngineRPC, None, None]:
+    """
+    Initialize engine RPC client for the execution client under test.
+
+    When the payloads are pipelined, all the requests of the test are sent
+    over a single persistent connection.
+    """
+    session = requests.Session() if pipeline_payloads else None
+    response_validation_context = None
     if client_exception_mapper:
-        return EngineRPC(
-            f"http://{client.ip}:8551",
-            response_validation_context={
-                "exception_mapper": client_exception_mapper,
-            },
-        )
-    return EngineRPC(f"http://{client.ip}:8551")
+        response_validation_context = {"exception_mapper": client_exception_mapper}
+    yield EngineRPC(
+        f"http://{client.ip}:8551",
+        response_validation_context=response_validation_context,
+        session=session,
+    )
+    if session is not None:
+        session.close()
 
 
 @pytest.fixture(scope="module")
@@ -0,0 +1 @@
+"""Consume Engine X test functions."""
@@ -14,6 +14,8 @@ from ethereum_clis.clis.reth import RethExceptionMapper
 from ethereum_test_exceptions import ExceptionMapper
 from ethereum_test_fixtures.blockchain import FixtureHeader
 
+from ....pytest_hive.local_client import LOCAL_CLIENT_NAME, LocalClientExceptionMapper
+
 
 class GenesisBlockMismatchExceptionError(Exception):
     """
@@ -80,4 +82,5 @@ EXCEPTION_MAPPERS: Dict[str, ExceptionMapper] = {
     "nimbus": NimbusExceptionMapper(),
     "ethereumjs": EthereumJSExceptionMapper(),
     "ethrex": EthrexExceptionMapper(),
+    LOCAL_CLIENT_NAME: LocalClientExceptionMapper(),
 }
@@ -0,0 +1,246 @@
+"""
+Common pytest fixtures for simulators with multi-test client architecture.
+
+A client is started once per pre-allocation group and shared by all the tests
+of the group, which are ordered (and, with `--dist loadgroup`, distributed to
+the xdist workers) by pre-allocation group and client type.
+"""
+
+import logging
+from pathlib import Path
+from typing import Generator, List, Literal, Tuple
+
+import pytest
+from hive.client import Client, ClientType
+from hive.testing import HiveTest, HiveTestResult, HiveTestSuite
+
+from ethereum_test_fixtures import BlockchainEngineXFixture, PreAllocGroup
+from ethereum_test_fixtures.blockchain import FixtureHeader
+from ethereum_test_fixtures.consume import TestCaseIndexFile, TestCaseStream
+
+from ..consume import FixturesSource
+from .helpers.timing import TimingData
+from .single_test_client import to_buffered_genesis, to_client_environment, to_client_genesis
+
+logger = logging.getLogger(__name__)
+
+
+def pre_alloc_group_client(item: pytest.Item) -> str | None:
+    """
+    Return the pre-allocation group and client type of a test case, used to
+    group the test cases that can be executed against the same client.
+    """
+    callspec = getattr(item, "callspec", None)
+    if callspec is None:
+        return None
+    test_case = callspec.params.get("test_case")
+    client_type = callspec.params.get("client_type")
+    if not isinstance(test_case, (TestCaseIndexFile, TestCaseStream)) or client_type is None:
+        return None
+    if test_case.pre_hash is None:
+        return None
+    return f"{test_case.pre_hash}-{client_type.name}"
+
+
+def pytest_collection_modifyitems(
+    session: pytest.Session, config: pytest.Config, items: List[pytest.Item]
+) -> None:
+    """
+    Order the test cases by pre-allocation group and client type and mark
+    them with their group as their xdist group, so that all the test cases of
+    a group are executed one after the other by the same worker (with
+    `--dist loadgroup`) against a single client.
+    """
+    del session, config
+    groups = {item: pre_alloc_group_client(item) for item in items}
+    items.sort(key=lambda item: groups[item] or "")
+    for item, group in groups.items():
+        if group is not None:
+            item.add_marker(pytest.mark.xdist_group(name=group))
+
+
+class MultiTestClientManager:
+    """
+    Start the client shared by the tests of a pre-allocation group and stop it
+    once a test of another group, or for another client type, is executed.
+
+    Hive stops the clients of a test when the test ends, so each shared client
+    is started within a dedicated hive test that ends when the client is
+    stopped.
+    """
+
+    test_suite: HiveTestSuite
+    pre_alloc_folder: Path
+    key: Tuple[str, str] | None
+    client: Client | None
+    hive_test: HiveTest | None
+    genesis_header: FixtureHeader | None
+    test_count: int
+
+    def __init__(self, test_suite: HiveTestSuite, pre_alloc_folder: Path) -> None:
+        """Initialize the manager without a running client."""
+        self.test_suite = test_suite
+        self.pre_alloc_folder = pre_alloc_folder
+        self.key = None
+        self.client = None
+        self.hive_test = None
+        self.genesis_header = None
+        self.test_count = 0
+
+    def load_pre_alloc_group(self, pre_hash: str) -> PreAllocGroup:
+        """Load a pre-allocation group from the pre-allocation folder."""
+        pre_alloc_group_path = self.pre_alloc_folder / f"{pre_hash}.json"
+        assert pre_alloc_group_path.is_file(), (
+            f"Pre-allocation group file not found: '{pre_alloc_group_path}'"
+        )
+        return PreAllocGroup.model_validate_json(pre_alloc_group_path.read_text())
+
+    def get_client(
+        self,
+        *,
+        pre_hash: str,
+        client_type: ClientType,
+        chain_id: int,
+        check_live_port: Literal[8545, 8551],
+        timing_data: TimingData,
+    ) -> Client:
+        """
+        Return the client of the pre-allocation group, stopping the client of
+        the previous group and starting a new one if the group changed.
+        """
+        key = (pre_hash, client_type.name)
+        if self.client is None or self.key != key:
+            if self.client is not None:
+                with timing_data.time("Stop client"):
+                    self.stop_client()
+            self.start_client(
+                pre_hash=pre_hash,
+                client_type=client_type,
+                chain_id=chain_id,
+                check_live_port=check_live_port,
+                timing_data=timing_data,
+            )
+        assert self.client is not None
+        self.test_count += 1
+        return self.client
+
+    def start_client(
+        self,
+        *,
+        pre_hash: str,
+        client_type: ClientType,
+        chain_id: int,
+        check_live_port: Literal[8545, 8551],
+        timing_data: TimingData,
+    ) -> None:
+        """Start a client with the genesis of the pre-allocation group."""
+        with timing_data.time("Load pre-allocation group"):
+            pre_alloc_group = self.load_pre_alloc_group(pre_hash)
+            genesis_header = pre_alloc_group.genesis
+            client_genesis = to_client_genesis(genesis_header, pre_alloc_group.pre)
+        environment = to_client_environment(pre_alloc_group.fork, chain_id, check_live_port)
+        files = {"/genesis.json": to_buffered_genesis(client_genesis)}
+
+        hive_test = self.test_suite.start_test(
+            name=f"{client_type.name} client for pre-allocation group {pre_hash}",
+            description=(
+                f"Client shared by the {pre_alloc_group.fork.name()} tests of the "
+                f"pre-allocation group {pre_hash}."
+            ),
+        )
+        logger.info(f"Starting client ({client_type.name}) for pre-allocation group {pre_hash}...")
+        with timing_data.time("Start client"):
+            client = hive_test.start_client(
+                client_type=client_type, environment=environment, files=files
+            )
+        if client is None:
+            error_message = (
+                f"Unable to connect to the client container ({client_type.name}) via Hive "
+                f"for pre-allocation group {pre_hash}. Check the client or Hive server logs "
+                "for more information."
+            )
+            hive_test.end(result=HiveTestResult(test_pass=False, details=error_message))
+            pytest.fail(error_message)
+        logger.info(f"Client ({client_type.name}) ready!")
+        self.key = (pre_hash, client_type.name)
+        self.client = client
+        self.hive_test = hive_test
+        self.genesis_header = genesis_header
+        self.test_count = 0
+
+    def stop_client(self) -> None:
+        """Stop the running client, if any, and end its hive test."""
+        if self.client is None:
+            return
+        assert self.hive_test is not None
+        logger.info(f"Stopping client ({self.client.config.client_type.name})...")
+        try:
+            self.client.stop()
+        finally:
+            self.hive_test.end(
+                result=HiveTestResult(
+                    test_pass=True,
+                    details=f"Client shared by {self.test_count} tests.",
+                )
+            )
+            self.key = None
+            self.client = None
+            self.hive_test = None
+            self.genesis_header = None
+        logger.info("Client stopped!")
+
+
+@pytest.fixture(scope="session")
+def pre_alloc_folder(fixtures_source: FixturesSource) -> Path:
+    """Return the folder of the pre-allocation groups of the fixtures."""
+    if fixtures_source.is_stdin:
+        pytest.exit(
+            "Consuming fixtures grouped by pre-allocation group requires a fixtures directory "
+            "containing the pre-allocation group files, fixtures can't be read from stdin.",
+            returncode=pytest.ExitCode.USAGE_ERROR,
+        )
+    return fixtures_source.path / BlockchainEngineXFixture.output_base_dir_name() / "pre_alloc"
+
+
+@pytest.fixture(scope="session")
+def multi_test_client_manager(
+    test_suite: HiveTestSuite, pre_alloc_folder: Path
+) -> Generator[MultiTestClientManager, None, None]:
+    """Manage the clients shared by the tests of each pre-allocation group."""
+    manager = MultiTestClientManager(test_suite, pre_alloc_folder)
+    yield manager
+    manager.stop_client()
+
+
+@pytest.fixture(scope="function")
+def client(
+    hive_test: HiveTest,
+    multi_test_client_manager: MultiTestClientManager,
+    fixture: BlockchainEngineXFixture,
+    client_type: ClientType,
+    check_live_port: Literal[8545, 8551],
+    total_timing_data: TimingData,
+) -> Client:
+    """
+    Return the client of the test's pre-allocation group, starting it if the
+    previous test belonged to another group.
+    """
+    client = multi_test_client_manager.get_client(
+        pre_hash=fixture.pre_hash,
+        client_type=client_type,
+        chain_id=fixture.config.chain_id,
+        check_live_port=check_live_port,
+        timing_data=total_timing_data,
+    )
+    hive_test.register_multi_test_client(client)
+    return client
+
+
+@pytest.fixture(scope="function")
+def genesis_header(
+    client: Client, multi_test_client_manager: MultiTestClientManager
+) -> FixtureHeader:
+    """Provide the genesis header of the test's pre-allocation group."""
+    del client
+    assert multi_test_client_manager.genesis_header is not None
+    return multi_test_client_manager.genesis_header
@@ -8,9 +8,13 @@ responses.
 """
 
 import time
+from itertools import count
+from typing import Any, List
 
+from ethereum_test_base_types import Hash
 from ethereum_test_exceptions import UndefinedException
 from ethereum_test_fixtures import BlockchainEngineFixture
+from ethereum_test_fixtures.blockchain import FixtureEngineNewPayload
 from ethereum_test_rpc import EngineRPC, EthRPC
 from ethereum_test_rpc.rpc_types import ForkchoiceState, JSONRPCError, PayloadStatusEnum
 
@@ -20,8 +24,9 @@ from ..helpers.timing import TimingData
 
 logger = get_logger(__name__)
 
-MAX_RETRIES = 30
-DELAY_BETWEEN_RETRIES_IN_SEC = 1
+INITIAL_FORKCHOICE_TIMEOUT_IN_SEC = 30
+INITIAL_DELAY_BETWEEN_RETRIES_IN_SEC = 0.05
+MAX_DELAY_BETWEEN_RETRIES_IN_SEC = 1
 
 
 class LoggedError(Exception):
@@ -33,12 +38,123 @@ class LoggedError(Exception):
         logger.fail(str(self))
 
 
+def send_new_payload(
+    engine_rpc: EngineRPC,
+    payload: FixtureEngineNewPayload,
+    params: List[Any],
+    strict_exception_matching: bool,
+) -> None:
+    """
+    Send an `engine_newPayloadVX` with its JSON parameters and verify the
+    response against the expected validity, validation error or error code.
+    """
+    logger.info(f"Sending engine_newPayloadV{payload.new_payload_version}...")
+    try:
+        payload_response = engine_rpc.new_payload_json(
+            params,
+            version=payload.new_payload_version,
+        )
+        logger.info(f"Payload response status: {payload_response.status}")
+        expected_validity = (
+            PayloadStatusEnum.VALID if payload.valid() else PayloadStatusEnum.INVALID
+        )
+        if payload_response.status != expected_validity:
+            raise LoggedError(
+                f"unexpected status: want {expected_validity}, got {payload_response.status}"
+            )
+        if payload.error_code is not None:
+            raise LoggedError(
+                f"Client failed to raise expected Engine API error code: {payload.error_code}"
+            )
+        elif payload_response.status == PayloadStatusEnum.INVALID:
+            if payload_response.validation_error is None:
+                raise LoggedError("Client returned INVALID but no validation error was provided.")
+            if isinstance(payload_response.validation_error, UndefinedException):
+                message = (
+                    "Undefined exception message: "
+                    f'expected exception: "{payload.validation_error}", '
+                    f'returned exception: "{payload_response.validation_error}" '
+                    f'(mapper: "{payload_response.validation_error.mapper_name}")'
+                )
+                if strict_exception_matching:
+                    raise LoggedError(message)
+                else:
+                    logger.warning(message)
+            else:
+                if payload.validation_error not in payload_response.validation_error:
+                    message = (
+                        "Client returned unexpected validation error: "
+                        f'got: "{payload_response.validation_error}" '
+                        f'expected: "{payload.validation_error}"'
+                    )
+                    if strict_exception_matching:
+                        raise LoggedError(message)
+                    else:
+                        logger.warning(message)
+
+    except JSONRPCError as e:
+        logger.info(f"JSONRPC error encountered: {e.code} - {e.message}")
+        if payload.error_code is None:
+            raise LoggedError(f"Unexpected error: {e.code} - {e.message}") from e
+        if e.code != payload.error_code:
+            raise LoggedError(
+                f"Unexpected error code: {e.code}, expected: {payload.error_code}"
+            ) from e
+
+
+def send_forkchoice_update(engine_rpc: EngineRPC, head_block_hash: Hash, version: int) -> None:
+    """Send a forkchoice update to the given head and verify it is valid."""
+    logger.info(f"Sending engine_forkchoiceUpdatedV{version}...")
+    forkchoice_response = engine_rpc.forkchoice_updated(
+        forkchoice_state=ForkchoiceState(head_block_hash=head_block_hash),
+        payload_attributes=None,
+        version=version,
+    )
+    status = forkchoice_response.payload_status.status
+    logger.info(f"Forkchoice update response: {status}")
+    if status != PayloadStatusEnum.VALID:
+        raise LoggedError(f"unexpected status: want {PayloadStatusEnum.VALID}, got {status}")
+
+
+def send_initial_forkchoice_update(
+    engine_rpc: EngineRPC, genesis_block_hash: Hash, version: int
+) -> None:
+    """
+    Send a forkchoice update to the genesis block, retrying with an
+    exponential backoff while the client is still starting up.
+    """
+    deadline = time.monotonic() + INITIAL_FORKCHOICE_TIMEOUT_IN_SEC
+    delay = INITIAL_DELAY_BETWEEN_RETRIES_IN_SEC
+    for attempt in count(1):
+        forkchoice_response = engine_rpc.forkchoice_updated(
+            forkchoice_state=ForkchoiceState(head_block_hash=genesis_block_hash),
+            payload_attributes=None,
+            version=version,
+        )
+        status = forkchoice_response.payload_status.status
+        logger.info(f"Initial forkchoice update response attempt {attempt}: {status}")
+        if status != PayloadStatusEnum.SYNCING or time.monotonic() + delay > deadline:
+            break
+        time.sleep(delay)
+        delay = min(delay * 2, MAX_DELAY_BETWEEN_RETRIES_IN_SEC)
+
+    if forkchoice_response.payload_status.status != PayloadStatusEnum.VALID:
+        logger.error(
+            f"Client failed to initialize properly after {attempt} attempts, "
+            f"final status: {forkchoice_response.payload_status.status}"
+        )
+        raise LoggedError(
+            f"unexpected status on forkchoice updated to genesis: {forkchoice_response}"
+        )
+
+
 def test_blockchain_via_engine(
     timing_data: TimingData,
     eth_rpc: EthRPC,
     engine_rpc: EngineRPC,
     fixture: BlockchainEngineFixture,
     strict_exception_matching: bool,
+    pipeline_payloads: bool,
 ) -> None:
     """
     1. Check the client genesis block hash matches
@@ -46,35 +162,16 @@ def test_blockchain_via_engine(
     2. Execute the test case fixture blocks against the client under test using
        the `engine_newPayloadVX` method from the Engine API.
     3. For valid payloads a forkchoice update is performed to finalize the
-       chain.
+       chain; when the payloads are pipelined, a single forkchoice update to
+       the last valid payload is performed after all the payloads are sent.
     """
-    # Send a initial forkchoice update
     with timing_data.time("Initial forkchoice update"):
         logger.info("Sending initial forkchoice update to genesis block...")
-        for attempt in range(1, MAX_RETRIES + 1):
-            forkchoice_response = engine_rpc.forkchoice_updated(
-                forkchoice_state=ForkchoiceState(
-                    head_block_hash=fixture.genesis.block_hash,
-                ),
-                payload_attributes=None,
-                version=fixture.payloads[0].forkchoice_updated_version,
-            )
-            status = forkchoice_response.payload_status.status
-            logger.info(f"Initial forkchoice update response attempt {attempt}: {status}")
-            if status != PayloadStatusEnum.SYNCING:
-                break
-
-            if attempt < MAX_RETRIES:
-                time.sleep(DELAY_BETWEEN_RETRIES_IN_SEC)
-
-        if forkchoice_response.payload_status.status != PayloadStatusEnum.VALID:
-            logger.error(
-                f"Client failed to initialize properly after {MAX_RETRIES} attempts, "
-                f"final status: {forkchoice_response.payload_status.status}"
-            )
-            raise LoggedError(
-                f"unexpected status on forkchoice updated to genesis: {forkchoice_response}"
-            )
+        send_initial_forkchoice_update(
+            engine_rpc,
+            fixture.genesis.block_hash,
+            fixture.payloads[0].forkchoice_updated_version,
+        )
 
     with timing_data.time("Get genesis block"):
         logger.info("Calling getBlockByNumber to get genesis block...")
@@ -89,93 +186,45 @@ def test_blockchain_via_engine(
                 got_genesis_block=genesis_block,
             )
 
+    new_payload_params: List[List[Any]] = []
+    if pipeline_payloads:
+        with timing_data.time("Payloads serialization"):
+            new_payload_params = [
+                EngineRPC.new_payload_params(*payload.params) for payload in fixture.payloads
+            ]
+
     with timing_data.time("Payloads execution") as total_payload_timing:
         logger.info(f"Starting execution of {len(fixture.payloads)} payloads...")
+        last_valid_payload: FixtureEngineNewPayload | None = None
         for i, payload in enumerate(fixture.payloads):
             logger.info(f"Processing payload {i + 1}/{len(fixture.payloads)}...")
             with total_payload_timing.time(f"Payload {i + 1}") as payload_timing:
                 with payload_timing.time(f"engine_newPayloadV{payload.new_payload_version}"):
-                    logger.info(f"Sending engine_newPayloadV{payload.new_payload_version}...")
-                    try:
-                        payload_response = engine_rpc.new_payload(
-                            *payload.params,
-                            version=payload.new_payload_version,
-                        )
-                        logger.info(f"Payload response status: {payload_response.status}")
-                        expected_validity = (
-                            PayloadStatusEnum.VALID
-                            if payload.valid()
-                            else PayloadStatusEnum.INVALID
-                        )
-                        if payload_response.status != expected_validity:
-                            raise LoggedError(
-                                f"unexpected status: want {expected_validity},"
-                                f" got {payload_response.status}"
-                            )
-                        if payload.error_code is not None:
-                            raise LoggedError(
-                                f"Client failed to raise expected Engine API error code: "
-                                f"{payload.error_code}"
-                            )
-                        elif payload_response.status == PayloadStatusEnum.INVALID:
-                            if payload_response.validation_error is None:
-                                raise LoggedError(
-                                    "Client returned INVALID but no validation error was provided."
-                                )
-                            if isinstance(payload_response.validation_error, UndefinedException):
-                                message = (
-                                    "Undefined exception message: "
-                                    f'expected exception: "{payload.validation_error}", '
-                                    f'returned exception: "{payload_response.validation_error}" '
-                                    f'(mapper: "{payload_response.validation_error.mapper_name}")'
-                                )
-                                if strict_exception_matching:
-                                    raise LoggedError(message)
-                                else:
-                                    logger.warning(message)
-                            else:
-                                if (
-                                    payload.validation_error
-                                    not in payload_response.validation_error
-                                ):
-                                    message = (
-                                        "Client returned unexpected validation error: "
-                                        f'got: "{payload_response.validation_error}" '
-                                        f'expected: "{payload.validation_error}"'
-                                    )
-                                    if strict_exception_matching:
-                                        raise LoggedError(message)
-                                    else:
-                                        logger.warning(message)
-
-                    except JSONRPCError as e:
-                        logger.info(f"JSONRPC error encountered: {e.code} - {e.message}")
-                        if payload.error_code is None:
-                            raise LoggedError(f"Unexpected error: {e.code} - {e.message}") from e
-                        if e.code != payload.error_code:
-                            raise LoggedError(
-                                f"Unexpected error code: {e.code}, expected: {payload.error_code}"
-                            ) from e
+                    send_new_payload(
+                        engine_rpc,
+                        payload,
+                        new_payload_params[i]
+                        if pipeline_payloads
+                        else EngineRPC.new_payload_params(*payload.params),
+                        strict_exception_matching,
+                    )
 
                 if payload.valid():
-                    with payload_timing.time(
-                        f"engine_forkchoiceUpdatedV{payload.forkchoice_updated_version}"
-                    ):
-                        # Send a forkchoice update to the engine
-                        version = payload.forkchoice_updated_version
-                        logger.info(f"Sending engine_forkchoiceUpdatedV{version}...")
-                        forkchoice_response = engine_rpc.forkchoice_updated(
-                            forkchoice_state=ForkchoiceState(
-                                head_block_hash=payload.params[0].block_hash,
-                            ),
-                            payload_attributes=None,
-                            version=payload.forkchoice_updated_version,
-                        )
-                        status = forkchoice_response.payload_status.status
-                        logger.info(f"Forkchoice update response: {status}")
-                        if forkchoice_response.payload_status.status != PayloadStatusEnum.VALID:
-                            raise LoggedError(
-                                f"unexpected status: want {PayloadStatusEnum.VALID},"
-                                f" got {forkchoice_response.payload_status.status}"
+                    last_valid_payload = payload
+                    if not pipeline_payloads:
+                        with payload_timing.time(
+                            f"engine_forkchoiceUpdatedV{payload.forkchoice_updated_version}"
+                        ):
+                            send_forkchoice_update(
+                                engine_rpc,
+                                payload.params[0].block_hash,
+                                payload.forkchoice_updated_version,
                             )
+
+        if pipeline_payloads and last_valid_payload is not None:
+            version = last_valid_payload.forkchoice_updated_version
+            with total_payload_timing.time(f"engine_forkchoiceUpdatedV{version}"):
+                send_forkchoice_update(
+                    engine_rpc, last_valid_payload.params[0].block_hash, version
+                )
         logger.info("All payloads processed successfully.")
@@ -0,0 +1,88 @@
+"""
+A hive based simulator that executes blocks against clients using the
+`engine_newPayloadVX` method from the Engine API. The simulator uses the
+`BlockchainEngineXFixtures` to test against clients, sharing a client between
+all the tests of a pre-allocation group.
+
+Each test starts from the genesis of its pre-allocation group: the head of the
+shared client is reset to the genesis block with a forkchoice update before
+the payloads of the test are sent, and each `engine_newPayloadVX` is verified
+against the appropriate VALID/INVALID responses.
+"""
+
+from ethereum_test_fixtures import BlockchainEngineXFixture
+from ethereum_test_fixtures.blockchain import FixtureHeader
+from ethereum_test_rpc import EngineRPC, EthRPC
+
+from ....custom_logging import get_logger
+from ..helpers.exceptions import GenesisBlockMismatchExceptionError
+from ..helpers.timing import TimingData
+from .test_via_engine import (
+    send_forkchoice_update,
+    send_initial_forkchoice_update,
+    send_new_payload,
+)
+
+logger = get_logger(__name__)
+
+
+def test_blockchain_via_enginex(
+    timing_data: TimingData,
+    eth_rpc: EthRPC,
+    engine_rpc: EngineRPC,
+    fixture: BlockchainEngineXFixture,
+    genesis_header: FixtureHeader,
+    strict_exception_matching: bool,
+) -> None:
+    """
+    1. Reset the head of the client to the genesis block of the test's
+       pre-allocation group and check its hash matches.
+    2. Execute the test case fixture blocks against the client under test using
+       the `engine_newPayloadVX` method from the Engine API.
+    3. For valid payloads a forkchoice update is performed to finalize the
+       chain.
+    """
+    with timing_data.time("Reset forkchoice to genesis"):
+        logger.info("Sending forkchoice update to genesis block...")
+        send_initial_forkchoice_update(
+            engine_rpc,
+            genesis_header.block_hash,
+            fixture.payloads[0].forkchoice_updated_version,
+        )
+
+    with timing_data.time("Get genesis block"):
+        logger.info("Calling getBlockByNumber to get genesis block...")
+        genesis_block = eth_rpc.get_block_by_number(0)
+        assert genesis_block is not None, "genesis_block is None"
+        if genesis_block["hash"] != str(genesis_header.block_hash):
+            expected = genesis_header.block_hash
+            got = genesis_block["hash"]
+            logger.fail(f"Genesis block hash mismatch. Expected: {expected}, Got: {got}")
+            raise GenesisBlockMismatchExceptionError(
+                expected_header=genesis_header,
+                got_genesis_block=genesis_block,
+            )
+
+    with timing_data.time("Payloads execution") as total_payload_timing:
+        logger.info(f"Starting execution of {len(fixture.payloads)} payloads...")
+        for i, payload in enumerate(fixture.payloads):
+            logger.info(f"Processing payload {i + 1}/{len(fixture.payloads)}...")
+            with total_payload_timing.time(f"Payload {i + 1}") as payload_timing:
+                with payload_timing.time(f"engine_newPayloadV{payload.new_payload_version}"):
+                    send_new_payload(
+                        engine_rpc,
+                        payload,
+                        EngineRPC.new_payload_params(*payload.params),
+                        strict_exception_matching,
+                    )
+
+                if payload.valid():
+                    with payload_timing.time(
+                        f"engine_forkchoiceUpdatedV{payload.forkchoice_updated_version}"
+                    ):
+                        send_forkchoice_update(
+                            engine_rpc,
+                            payload.params[0].block_hash,
+                            payload.forkchoice_updated_version,
+                        )
+        logger.info("All payloads processed successfully.")
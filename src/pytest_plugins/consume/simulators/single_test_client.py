@@ -11,9 +11,10 @@ import pytest
 from hive.client import Client, ClientType
 from hive.testing import HiveTest
 
-from ethereum_test_base_types import Number, to_json
+from ethereum_test_base_types import Alloc, Number, to_json
 from ethereum_test_fixtures import BlockchainFixtureCommon
 from ethereum_test_fixtures.blockchain import FixtureHeader
+from ethereum_test_forks import Fork
 
 from .helpers.ruleset import (
     ruleset,  # TODO: generate dynamically
@@ -23,17 +24,43 @@ from .helpers.timing import TimingData
 logger = logging.getLogger(__name__)
 
 
+def to_client_genesis(genesis: FixtureHeader, pre: Alloc) -> dict:
+    """Convert a genesis block header and pre-state to a client genesis."""
+    client_genesis = to_json(genesis)
+    alloc = to_json(pre)
+    # NOTE: nethermind requires account keys without '0x' prefix
+    client_genesis["alloc"] = {k.replace("0x", ""): v for k, v in alloc.items()}
+    return client_genesis
+
+
+def to_client_environment(fork: Fork, chain_id: int, check_live_port: Literal[8545, 8551]) -> dict:
+    """Define the environment that hive will start a client with."""
+    assert fork in ruleset, f"fork '{fork}' missing in hive ruleset"
+    hive_chain_id = str(Number(chain_id))
+    return {
+        "HIVE_CHAIN_ID": hive_chain_id,
+        "HIVE_NETWORK_ID": hive_chain_id,  # Use same value for P2P network compatibility
+        "HIVE_FORK_DAO_VOTE": "1",
+        "HIVE_NODETYPE": "full",
+        "HIVE_CHECK_LIVE_PORT": str(check_live_port),
+        **{k: f"{v:d}" for k, v in ruleset[fork].items()},
+    }
+
+
+def to_buffered_genesis(client_genesis: dict) -> io.BufferedReader:
+    """Create a buffered reader for a client genesis state."""
+    genesis_json = json.dumps(client_genesis)
+    genesis_bytes = genesis_json.encode("utf-8")
+    return io.BufferedReader(cast(io.RawIOBase, io.BytesIO(genesis_bytes)))
+
+
 @pytest.fixture(scope="function")
 def client_genesis(fixture: BlockchainFixtureCommon) -> dict:
     """
     Convert the fixture genesis block header and pre-state to a client genesis
     state.
     """
-    genesis = to_json(fixture.genesis)
-    alloc = to_json(fixture.pre)
-    # NOTE: nethermind requires account keys without '0x' prefix
-    genesis["alloc"] = {k.replace("0x", ""): v for k, v in alloc.items()}
-    return genesis
+    return to_client_genesis(fixture.genesis, fixture.pre)
 
 
 @pytest.fixture(scope="function")
@@ -42,16 +69,7 @@ def environment(
     check_live_port: Literal[8545, 8551],
 ) -> dict:
     """Define the environment that hive will start the client with."""
-    assert fixture.fork in ruleset, f"fork '{fixture.fork}' missing in hive ruleset"
-    chain_id = str(Number(fixture.config.chain_id))
-    return {
-        "HIVE_CHAIN_ID": chain_id,
-        "HIVE_NETWORK_ID": chain_id,  # Use same value for P2P network compatibility
-        "HIVE_FORK_DAO_VOTE": "1",
-        "HIVE_NODETYPE": "full",
-        "HIVE_CHECK_LIVE_PORT": str(check_live_port),
-        **{k: f"{v:d}" for k, v in ruleset[fixture.fork].items()},
-    }
+    return to_client_environment(fixture.fork, fixture.config.chain_id, check_live_port)
 
 
 @pytest.fixture(scope="function")
@@ -60,9 +78,7 @@ def buffered_genesis(client_genesis: dict) -> io.BufferedReader:
     Create a buffered reader for the genesis block header of the current test
     fixture.
     """
-    genesis_json = json.dumps(client_genesis)
-    genesis_bytes = genesis_json.encode("utf-8")
-    return io.BufferedReader(cast(io.RawIOBase, io.BytesIO(genesis_bytes)))
+    return to_buffered_genesis(client_genesis)
 
 
 @pytest.fixture(scope="function")
@@ -6,6 +6,7 @@ import pytest
 import rich
 from hive.client import Client
 
+from ...shared.cost_scheduling import TEST_DURATION_PROPERTY
 from .helpers.timing import TimingData
 
 
@@ -28,6 +29,11 @@ def total_timing_data(request: pytest.FixtureRequest) -> Generator[TimingData, N
     """Record timing data for various stages of executing test case."""
     with TimingData("Total (seconds)") as total_timing_data:
         yield total_timing_data
+    assert total_timing_data.start_time is not None and total_timing_data.end_time is not None
+    # Used to schedule the test longest-first in the following runs
+    request.node.user_properties.append(
+        (TEST_DURATION_PROPERTY, total_timing_data.end_time - total_timing_data.start_time)
+    )
     if request.config.getoption("timing_data"):
         rich.print(f"\n{total_timing_data.formatted()}")
     if hasattr(request.node, "rep_call"):  # make available for test reports
@@ -0,0 +1,150 @@
+"""Test the client manager shared by the tests of a pre-allocation group."""
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from ethereum_test_base_types import Account
+from ethereum_test_fixtures import PreAllocGroup
+from ethereum_test_forks import Cancun
+from ethereum_test_types import Alloc, Environment
+
+from ...consume.simulators.helpers.timing import TimingData
+from ...consume.simulators.multi_test_client import MultiTestClientManager
+
+
+class FakeClientType:
+    """Client type exposing a name, like `hive.client.ClientType`."""
+
+    def __init__(self, name: str) -> None:
+        """Initialize the client type."""
+        self.name = name
+
+
+class FakeClientConfig:
+    """Client config exposing the client type it was started with."""
+
+    def __init__(self, client_type: FakeClientType) -> None:
+        """Initialize the client config."""
+        self.client_type = client_type
+
+
+class FakeClient:
+    """Client that records whether it was stopped."""
+
+    def __init__(self, client_type: FakeClientType, environment: Dict, files: Dict) -> None:
+        """Initialize the client with its start parameters."""
+        self.config = FakeClientConfig(client_type)
+        self.environment = environment
+        self.genesis = files["/genesis.json"].read()
+        self.stopped = False
+
+    def stop(self) -> None:
+        """Stop the client."""
+        self.stopped = True
+
+
+class FakeHiveTest:
+    """Hive test that starts fake clients and records its result."""
+
+    def __init__(self, name: str) -> None:
+        """Initialize the hive test."""
+        self.name = name
+        self.clients: List[FakeClient] = []
+        self.result: Any = None
+
+    def start_client(self, **kwargs: Any) -> FakeClient:
+        """Start a fake client."""
+        client = FakeClient(**kwargs)
+        self.clients.append(client)
+        return client
+
+    def end(self, *, result: Any) -> None:
+        """End the hive test with the given result."""
+        self.result = result
+
+
+class FakeHiveTestSuite:
+    """Hive test suite that records the hive tests it started."""
+
+    def __init__(self) -> None:
+        """Initialize the hive test suite."""
+        self.tests: List[FakeHiveTest] = []
+
+    def start_test(self, name: str, description: str) -> FakeHiveTest:
+        """Start a fake hive test."""
+        del description
+        hive_test = FakeHiveTest(name)
+        self.tests.append(hive_test)
+        return hive_test
+
+
+@pytest.fixture
+def pre_alloc_folder(tmp_path: Path) -> Path:
+    """Write two pre-allocation groups to a folder."""
+    for pre_hash, balance in [("0x01", 1), ("0x02", 2)]:
+        pre_alloc_group = PreAllocGroup(
+            environment=Environment().set_fork_requirements(Cancun),
+            fork=Cancun,
+            pre=Alloc({0x1000: Account(balance=balance)}),
+        )
+        pre_alloc_group.to_file(tmp_path / f"{pre_hash}.json")
+    return tmp_path
+
+
+def test_client_shared_by_pre_alloc_group(pre_alloc_folder: Path) -> None:
+    """
+    Test that a client is started once per pre-allocation group and client
+    type, and that the previous client is stopped when the group changes.
+    """
+    test_suite = FakeHiveTestSuite()
+    manager = MultiTestClientManager(test_suite, pre_alloc_folder)  # type: ignore[arg-type]
+    geth = FakeClientType("go-ethereum")
+    besu = FakeClientType("besu")
+
+    def get_client(pre_hash: str, client_type: FakeClientType) -> FakeClient:
+        return manager.get_client(  # type: ignore[return-value]
+            pre_hash=pre_hash,
+            client_type=client_type,  # type: ignore[arg-type]
+            chain_id=1,
+            check_live_port=8551,
+            timing_data=TimingData("Total (seconds)"),
+        )
+
+    first_client = get_client("0x01", geth)
+    assert get_client("0x01", geth) is first_client
+    assert manager.genesis_header is not None
+    first_genesis_hash = manager.genesis_header.block_hash
+    assert not first_client.stopped
+    assert first_client.environment["HIVE_CHAIN_ID"] == "1"
+    assert b'"balance":"0x01"' in first_client.genesis.replace(b" ", b"")
+
+    second_client = get_client("0x02", geth)
+    assert second_client is not first_client
+    assert first_client.stopped
+    assert manager.genesis_header.block_hash != first_genesis_hash
+    assert test_suite.tests[0].result.test_pass
+    assert test_suite.tests[0].result.details == "Client shared by 2 tests."
+
+    third_client = get_client("0x02", besu)
+    assert third_client is not second_client
+    assert second_client.stopped
+
+    manager.stop_client()
+    assert third_client.stopped
+    assert manager.client is None
+    assert [hive_test.result.test_pass for hive_test in test_suite.tests] == [True] * 3
+
+
+def test_missing_pre_alloc_group(tmp_path: Path) -> None:
+    """Test that a missing pre-allocation group file is reported."""
+    manager = MultiTestClientManager(FakeHiveTestSuite(), tmp_path)  # type: ignore[arg-type]
+    with pytest.raises(AssertionError, match="Pre-allocation group file not found"):
+        manager.get_client(
+            pre_hash="0x03",
+            client_type=FakeClientType("go-ethereum"),  # type: ignore[arg-type]
+            chain_id=1,
+            check_live_port=8551,
+            timing_data=TimingData("Total (seconds)"),
+        )
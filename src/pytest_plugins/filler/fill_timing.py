@@ -0,0 +1,229 @@
+"""
+Pytest plugin that records where the time of a fill is spent.
+
+Provides the `--fill-timing` command-line option that records nested
+`perf_counter` spans for the phases of filling each test (pre-allocation
+setup, transaction signing, t8n input serialization, execution and output
+parsing, state root computation, fixture serialization and file output),
+aggregates them across xdist workers, prints a summary table at the end of
+the session and writes a collapsed-stack file next to the fixtures, which can
+be loaded by speedscope or rendered with `flamegraph.pl`.
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import ContextManager, Dict, Generator, Iterator, List, Tuple
+
+import pytest
+from _pytest.terminal import TerminalReporter
+from filelock import FileLock
+
+FILL_TIMING_FILE_NAME = "fill_timing.json"
+FILL_TIMING_COLLAPSED_FILE_NAME = "fill_timing.collapsed"
+FIXTURE_OUTPUT_SPAN = "fixture output"
+TEST_FUNCTION_PHASE = "test function"
+
+SpanStack = Tuple[str, ...]
+
+
+class FillTimer:
+    """
+    Record nested `perf_counter` spans and aggregate them per stack of span
+    names into their total (inclusive) duration and number of calls.
+
+    Spans are only recorded inside a root span, which is tracked per thread,
+    so spans entered from threads outside of a test are ignored.
+    """
+
+    durations: Dict[SpanStack, float]
+    calls: Dict[SpanStack, int]
+
+    def __init__(self) -> None:
+        """Initialize an empty timer."""
+        self.durations = {}
+        self.calls = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, *, root: bool = False) -> Iterator[None]:
+        """Time the enclosed code as a child of the current span."""
+        parent: SpanStack | None = getattr(self._local, "stack", None)
+        if parent is None and not root:
+            yield
+            return
+        stack = (name,) if root or parent is None else (*parent, name)
+        self._local.stack = stack
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._local.stack = parent
+            self.add(stack, elapsed, 1)
+
+    def add(self, stack: SpanStack, duration: float, calls: int) -> None:
+        """Add the duration and number of calls of a span stack."""
+        with self._lock:
+            self.durations[stack] = self.durations.get(stack, 0.0) + duration
+            self.calls[stack] = self.calls.get(stack, 0) + calls
+
+    def to_json(self) -> List[Dict]:
+        """Return the aggregated spans in a JSON-serializable format."""
+        return [
+            {"stack": list(stack), "duration": duration, "calls": self.calls[stack]}
+            for stack, duration in self.durations.items()
+        ]
+
+    def merge_json(self, spans: List[Dict]) -> None:
+        """Merge the spans of a JSON file written by another process."""
+        for span in spans:
+            self.add(tuple(span["stack"]), span["duration"], span["calls"])
+
+    def self_durations(self) -> Dict[SpanStack, float]:
+        """Return the duration of each span stack excluding its children."""
+        self_durations = dict(self.durations)
+        for stack, duration in self.durations.items():
+            if len(stack) > 1 and stack[:-1] in self_durations:
+                self_durations[stack[:-1]] -= duration
+        return self_durations
+
+    def collapsed_stacks(self) -> List[str]:
+        """
+        Return the spans in the collapsed-stack format, with the self
+        duration of each stack in microseconds.
+        """
+        return [
+            f"{';'.join(stack)} {round(duration * 1_000_000)}"
+            for stack, duration in sorted(self.self_durations().items())
+            if duration > 0
+        ]
+
+    def phase_summary(self) -> List[Tuple[str, int, float, float]]:
+        """
+        Return the phase name, number of calls, total duration and self
+        duration of each phase, aggregated across the root spans and sorted by
+        decreasing self duration.
+
+        The self duration of the root span of each test is reported as the
+        test function phase, which includes the setup of the pre-allocation.
+        """
+        summary: Dict[str, List[float]] = {}
+        self_durations = self.self_durations()
+        for stack, duration in self.durations.items():
+            if len(stack) > 1:
+                phase = " > ".join(stack[1:])
+            elif stack[0] == FIXTURE_OUTPUT_SPAN:
+                phase = FIXTURE_OUTPUT_SPAN
+            else:
+                phase = TEST_FUNCTION_PHASE
+            entry = summary.setdefault(phase, [0, 0.0, 0.0])
+            entry[0] += self.calls[stack]
+            entry[1] += duration
+            entry[2] += self_durations[stack]
+        return sorted(
+            ((phase, int(calls), total, own) for phase, (calls, total, own) in summary.items()),
+            key=lambda row: row[3],
+            reverse=True,
+        )
+
+
+_fill_timer: FillTimer | None = None
+
+
+def fill_timing_span(name: str, *, root: bool = False) -> ContextManager[None]:
+    """
+    Return a context manager that times a phase of the fill, or a no-op
+    context manager if `--fill-timing` is not enabled.
+    """
+    if _fill_timer is None:
+        return nullcontext()
+    return _fill_timer.span(name, root=root)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add fill timing command-line options to pytest."""
+    fill_timing_group = parser.getgroup("fill timing", "Arguments defining fill timing output")
+    fill_timing_group.addoption(
+        "--fill-timing",
+        action="store_true",
+        dest="fill_timing",
+        default=False,
+        help=(
+            "Record the time spent in each phase of filling every test, print a summary table "
+            f"and write `.meta/{FILL_TIMING_COLLAPSED_FILE_NAME}` in the output directory, in "
+            "the collapsed-stack format supported by speedscope and flamegraph tools."
+        ),
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Enable the fill timer if requested."""
+    global _fill_timer
+    _fill_timer = FillTimer() if config.getoption("fill_timing") else None
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Disable the fill timer."""
+    del config
+    global _fill_timer
+    _fill_timer = None
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item: pytest.Item) -> Generator[None, None, None]:
+    """Time the call of each test as a root span named after its function."""
+    with fill_timing_span(item.nodeid.split("[")[0], root=True):
+        yield
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """
+    Merge the spans of this process into the fill timing file and, on the
+    main process, write the collapsed-stack file.
+
+    Runs before the filler plugin finalizes (e.g. compresses) the fixture
+    output; each xdist worker merges its own spans.
+    """
+    del exitstatus
+    if _fill_timer is None or session.config.fixture_output.is_stdout:  # type: ignore[attr-defined]
+        return
+    metadata_dir: Path = session.config.fixture_output.metadata_dir  # type: ignore[attr-defined]
+    metadata_dir.mkdir(parents=True, exist_ok=True)
+    timing_file = metadata_dir / FILL_TIMING_FILE_NAME
+    with FileLock(timing_file.with_suffix(".lock")):
+        if timing_file.exists():
+            _fill_timer.merge_json(json.loads(timing_file.read_text()))
+        timing_file.write_text(json.dumps(_fill_timer.to_json()))
+    if hasattr(session.config, "workerinput"):
+        return
+    (metadata_dir / FILL_TIMING_COLLAPSED_FILE_NAME).write_text(
+        "\n".join(_fill_timer.collapsed_stacks()) + "\n"
+    )
+
+
+def pytest_terminal_summary(
+    terminalreporter: TerminalReporter,
+    exitstatus: int,
+    config: pytest.Config,
+) -> None:
+    """Print the time spent in each phase of the fill."""
+    del exitstatus
+    if _fill_timer is None or hasattr(config, "workerinput") or not _fill_timer.durations:
+        return
+    summary = _fill_timer.phase_summary()
+    total = sum(own for _, _, _, own in summary)
+    phase_width = max(len("Phase"), *(len(phase) for phase, _, _, _ in summary))
+    terminalreporter.write_sep("=", " fill timing ")
+    terminalreporter.write_line(
+        f"{'Phase':<{phase_width}} {'Calls':>10} {'Total (s)':>12} {'Self (s)':>12} {'Self %':>7}"
+    )
+    for phase, calls, phase_total, own in summary:
+        share = 100 * own / total if total else 0.0
+        terminalreporter.write_line(
+            f"{phase:<{phase_width}} {calls:>10} {phase_total:>12.3f} {own:>12.3f} {share:>6.1f}%"
+        )
@@ -23,7 +23,7 @@ from filelock import FileLock
 from pytest_metadata.plugin import metadata_key
 
 from cli.gen_index import generate_fixtures_index
-from ethereum_clis import TransitionTool
+from ethereum_clis import OpcodeProfile, TransitionTool
 from ethereum_clis.clis.geth import FixtureConsumerTool
 from ethereum_test_base_types import Account, Address, Alloc, ReferenceSpec
 from ethereum_test_fixtures import (
@@ -31,6 +31,7 @@ from ethereum_test_fixtures import (
     FixtureCollector,
     FixtureConsumer,
     FixtureFillingPhase,
+    FixtureOutputWriter,
     LabeledFixtureFormat,
     PreAllocGroup,
     PreAllocGroups,
@@ -52,6 +53,7 @@ from ..shared.helpers import (
     labeled_format_parameter_set,
 )
 from ..spec_version_checker.spec_version_checker import get_ref_spec_from_module
+from .fill_timing import FIXTURE_OUTPUT_SPAN, fill_timing_span
 from .fixture_output import FixtureOutput
 
 
@@ -543,6 +545,18 @@ def pytest_addoption(parser: pytest.Parser) -> None:
             "file. This can be used to increase the granularity of --verify-fixtures."
         ),
     )
+    test_group.addoption(
+        "--async-fixture-output",
+        action="store_true",
+        dest="async_fixture_output",
+        default=False,
+        help=(
+            "Serialize and write the fixture files from a background thread of each worker, "
+            "overlapping the fixture output with the time spent waiting on the transition "
+            "tool while filling the following tests. Transition tool requests are not run "
+            "concurrently, use -n for that."
+        ),
+    )
     test_group.addoption(
         "--no-html",
         action="store_true",
@@ -642,6 +656,17 @@ def pytest_addoption(parser: pytest.Parser) -> None:
             "fail for that given test. Requires `--optimize-gas`."
         ),
     )
+    optimize_gas_group.addoption(
+        "--optimize-gas-parallel-probes",
+        action="store",
+        dest="optimize_gas_parallel_probes",
+        default=1,
+        type=int,
+        help=(
+            "Number of gas limits evaluated concurrently by the transition tool on each step "
+            "of the gas optimization search. Requires `--optimize-gas` (default: 1)."
+        ),
+    )
     optimize_gas_group.addoption(
         "--optimize-gas-post-processing",
         action="store_true",
@@ -732,6 +757,11 @@ def pytest_configure(config: pytest.Config) -> None:
             )
         else:
             config.op_mode = OpMode.OPTIMIZE_GAS  # type: ignore[attr-defined]
+        if config.getoption("optimize_gas_parallel_probes") < 1:
+            pytest.exit(
+                "--optimize-gas-parallel-probes must be at least 1.",
+                returncode=pytest.ExitCode.USAGE_ERROR,
+            )
 
     config.collect_traces = (  # type: ignore[attr-defined]
         config.getoption("evm_collect_traces") or config.getoption("optimize_gas", False)
@@ -1167,6 +1197,23 @@ def reference_spec(request: pytest.FixtureRequest) -> None | ReferenceSpec:
     return None
 
 
+@pytest.fixture(scope="session")
+def fixture_output_writer(
+    request: pytest.FixtureRequest, fixture_output: FixtureOutput
+) -> Generator[FixtureOutputWriter | None, None, None]:
+    """
+    Return the writer of the fixture files if `--async-fixture-output` is
+    enabled, and wait for all the files to be written at the end of the
+    session.
+    """
+    if not request.config.getoption("async_fixture_output") or fixture_output.is_stdout:
+        yield None
+        return
+    fixture_output_writer = FixtureOutputWriter()
+    yield fixture_output_writer
+    fixture_output_writer.shutdown()
+
+
 @pytest.fixture(scope=get_fixture_collection_scope)  # type: ignore[arg-type]
 def fixture_collector(
     request: pytest.FixtureRequest,
@@ -1175,6 +1222,7 @@ def fixture_collector(
     filler_path: Path,
     base_dump_dir: Path | None,
     fixture_output: FixtureOutput,
+    fixture_output_writer: FixtureOutputWriter | None,
 ) -> Generator[FixtureCollector, None, None]:
     """
     Return configured fixture collector instance used for all tests in one test
@@ -1191,9 +1239,11 @@ def fixture_collector(
         single_fixture_per_file=fixture_output.single_fixture_per_file,
         filler_path=filler_path,
         base_dump_dir=base_dump_dir,
+        output_writer=fixture_output_writer,
     )
     yield fixture_collector
-    fixture_collector.dump_fixtures()
+    with fill_timing_span(FIXTURE_OUTPUT_SPAN, root=True):
+        fixture_collector.dump_fixtures()
     if do_fixture_verification:
         fixture_collector.verify_fixture_files(evm_fixture_verification)
 
@@ -1275,6 +1325,7 @@ def base_test_parametrizer(cls: Type[BaseTest]) -> Any:
         fixture_source_url: str,
         gas_benchmark_value: int,
         witness_generator: Any,
+        opcode_profile: OpcodeProfile | None,
     ) -> Any:
         """
         Fixture used to instantiate an auto-fillable BaseTest object from
@@ -1314,6 +1365,7 @@ def base_test_parametrizer(cls: Type[BaseTest]) -> Any:
                 self._operation_mode = (
                     request.config.op_mode  # type: ignore[attr-defined]
                 )
+                self._opcode_profile = opcode_profile
                 if (
                     self._operation_mode == OpMode.OPTIMIZE_GAS
                     or self._operation_mode == OpMode.OPTIMIZE_GAS_POST_PROCESSING
@@ -1321,6 +1373,9 @@ def base_test_parametrizer(cls: Type[BaseTest]) -> Any:
                     self._gas_optimization_max_gas_limit = request.config.getoption(
                         "optimize_gas_max_gas_limit", None
                     )
+                    self._gas_optimization_parallel_probes = request.config.getoption(
+                        "optimize_gas_parallel_probes", 1
+                    )
 
                 # Get the filling session from config
                 session: FillingSession = request.config.filling_session  # type: ignore
@@ -1338,15 +1393,17 @@ def base_test_parametrizer(cls: Type[BaseTest]) -> Any:
                 # BlockchainEngineXFixture)
                 pre_alloc_hash = None
                 if FixtureFillingPhase.PRE_ALLOC_GENERATION in fixture_format.format_phases:
-                    pre_alloc_hash = self.compute_pre_alloc_group_hash(fork=fork)
-                    group = session.get_pre_alloc_group(pre_alloc_hash)
-                    self.pre = group.pre
+                    with fill_timing_span("pre-alloc group setup"):
+                        pre_alloc_hash = self.compute_pre_alloc_group_hash(fork=fork)
+                        group = session.get_pre_alloc_group(pre_alloc_hash)
+                        self.pre = group.pre
                 try:
-                    fixture = self.generate(
-                        t8n=t8n,
-                        fork=fork,
-                        fixture_format=fixture_format,
-                    )
+                    with fill_timing_span("generate fixture"):
+                        fixture = self.generate(
+                            t8n=t8n,
+                            fork=fork,
+                            fixture_format=fixture_format,
+                        )
                 finally:
                     if (
                         request.config.op_mode  # type: ignore[attr-defined]
@@ -1378,23 +1435,25 @@ def base_test_parametrizer(cls: Type[BaseTest]) -> Any:
                             fixture.post_state, group.pre
                         )
 
-                fixture.fill_info(
-                    t8n.version(),
-                    test_case_description,
-                    fixture_source_url=fixture_source_url,
-                    ref_spec=reference_spec,
-                    _info_metadata=t8n._info_metadata,
-                )
+                with fill_timing_span("fill info"):
+                    fixture.fill_info(
+                        t8n.version(),
+                        test_case_description,
+                        fixture_source_url=fixture_source_url,
+                        ref_spec=reference_spec,
+                        _info_metadata=t8n._info_metadata,
+                    )
 
                 # Generate witness data if witness functionality is enabled via
                 # the witness plugin
                 if witness_generator is not None:
                     witness_generator(fixture)
 
-                fixture_path = fixture_collector.add_fixture(
-                    node_to_test_info(request.node),
-                    fixture,
-                )
+                with fill_timing_span("collect fixture"):
+                    fixture_path = fixture_collector.add_fixture(
+                        node_to_test_info(request.node),
+                        fixture,
+                    )
 
                 # NOTE: Use str for compatibility with pytest-dist
                 request.node.config.fixture_path_absolute = str(fixture_path.absolute())
@@ -0,0 +1,207 @@
+"""
+Pytest plugin that profiles the transition tool evaluations of filled tests.
+
+Provides the `--opcode-profile` command-line option that writes a summary
+file, next to the fixtures, with one row per filled test containing the test's
+fork and gas benchmark value, the gas used, the number and wall time of the
+t8n evaluations, and one column per opcode with the number of executions and
+the gas consumed by the opcode.
+"""
+
+import csv
+from pathlib import Path
+from typing import Dict, Generator, Iterable
+
+import pytest
+from filelock import FileLock
+
+from ethereum_clis import OpcodeProfile
+from ethereum_test_forks import Fork
+
+from ..shared.helpers import is_help_or_collectonly_mode
+from .fixture_output import FixtureOutput
+
+OPCODE_PROFILE_FILE_NAME = "opcode_profile.csv"
+
+TEST_COLUMN = "test"
+FORK_COLUMN = "fork"
+GAS_BENCHMARK_VALUE_COLUMN = "gas_benchmark_value"
+GAS_USED_COLUMN = "gas_used"
+T8N_CALLS_COLUMN = "t8n_calls"
+T8N_TIME_COLUMN = "t8n_time"
+SUMMARY_COLUMNS = [
+    TEST_COLUMN,
+    FORK_COLUMN,
+    GAS_BENCHMARK_VALUE_COLUMN,
+    GAS_USED_COLUMN,
+    T8N_CALLS_COLUMN,
+    T8N_TIME_COLUMN,
+]
+OPCODE_COUNT_COLUMN_PREFIX = "count:"
+OPCODE_GAS_COLUMN_PREFIX = "gas:"
+
+OpcodeProfileRow = Dict[str, str]
+
+
+def opcode_profile_row(
+    *, test: str, fork: Fork, gas_benchmark_value: int, profile: OpcodeProfile
+) -> OpcodeProfileRow:
+    """Return the summary row of the profile of a filled test."""
+    row = {
+        TEST_COLUMN: test,
+        FORK_COLUMN: fork.name(),
+        GAS_BENCHMARK_VALUE_COLUMN: str(gas_benchmark_value),
+        GAS_USED_COLUMN: str(profile.gas_used),
+        T8N_CALLS_COLUMN: str(profile.t8n_calls),
+        T8N_TIME_COLUMN: f"{profile.t8n_time:.6f}",
+    }
+    for prefix, opcode_values in [
+        (OPCODE_COUNT_COLUMN_PREFIX, profile.opcode_count),
+        (OPCODE_GAS_COLUMN_PREFIX, profile.opcode_gas),
+    ]:
+        if opcode_values is not None:
+            for opcode, value in opcode_values.root.items():
+                row[f"{prefix}{opcode}"] = str(value)
+    return row
+
+
+def opcode_columns(row: OpcodeProfileRow, prefix: str) -> Dict[str, int]:
+    """
+    Return the opcode values of a summary row for the given column prefix,
+    skipping the opcodes without a value.
+    """
+    return {
+        column.removeprefix(prefix): int(value)
+        for column, value in row.items()
+        if column.startswith(prefix) and value
+    }
+
+
+def read_opcode_profile_summary(path: Path) -> Dict[str, OpcodeProfileRow]:
+    """Read a summary file and return its rows keyed by test."""
+    with path.open(newline="") as f:
+        return {row[TEST_COLUMN]: row for row in csv.DictReader(f)}
+
+
+def write_opcode_profile_summary(path: Path, rows: Iterable[OpcodeProfileRow]) -> None:
+    """
+    Write a summary file with the given rows, sorted by test, with the fixed
+    columns followed by the sorted opcode columns.
+    """
+    sorted_rows = sorted(rows, key=lambda row: row[TEST_COLUMN])
+    opcode_column_names = sorted(
+        {column for row in sorted_rows for column in row} - set(SUMMARY_COLUMNS)
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_COLUMNS + opcode_column_names, restval="")
+        writer.writeheader()
+        writer.writerows(sorted_rows)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add opcode profile command-line options to pytest."""
+    opcode_profile_group = parser.getgroup(
+        "opcode profile", "Arguments defining the opcode profile output"
+    )
+    opcode_profile_group.addoption(
+        "--opcode-profile",
+        action="store_true",
+        dest="opcode_profile",
+        default=False,
+        help=(
+            "Write a summary of the opcode counts, gas per opcode and t8n wall time of every "
+            f"filled test to `.meta/{OPCODE_PROFILE_FILE_NAME}` in the output directory. "
+            "Opcode counts require a t8n tool that reports them or `--traces`, gas per opcode "
+            "requires `--traces`."
+        ),
+    )
+    opcode_profile_group.addoption(
+        "--opcode-profile-output",
+        action="store",
+        dest="opcode_profile_output",
+        default=None,
+        type=Path,
+        help=(
+            "Path of the opcode profile summary file. Requires `--opcode-profile` "
+            f"(default: `.meta/{OPCODE_PROFILE_FILE_NAME}` in the output directory)."
+        ),
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Initialize the opcode profile rows of the session."""
+    config.opcode_profile_rows = {}  # type: ignore[attr-defined]
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionstart(session: pytest.Session) -> None:
+    """
+    Remove the summary file of a previous session on the main process, so that
+    only the rows of the tests filled in this session are merged into it.
+    """
+    config = session.config
+    if (
+        not config.getoption("opcode_profile")
+        or hasattr(config, "workerinput")
+        or is_help_or_collectonly_mode(config)
+    ):
+        return
+    opcode_profile_output_path(config).unlink(missing_ok=True)
+
+
+@pytest.fixture
+def opcode_profile(
+    request: pytest.FixtureRequest, fork: Fork, gas_benchmark_value: int
+) -> Generator[OpcodeProfile | None, None, None]:
+    """
+    Provide the profile to be filled by the test spec if `--opcode-profile`
+    is enabled, and record its summary row once the test is filled.
+    """
+    if not request.config.getoption("opcode_profile"):
+        yield None
+        return
+    profile = OpcodeProfile()
+    yield profile
+    if profile.t8n_calls == 0:
+        return
+    if fork is None:
+        fork = request.node.fork
+    rows: Dict[str, OpcodeProfileRow] = request.config.opcode_profile_rows  # type: ignore
+    rows[request.node.nodeid] = opcode_profile_row(
+        test=request.node.nodeid,
+        fork=fork,
+        gas_benchmark_value=gas_benchmark_value,
+        profile=profile,
+    )
+
+
+def opcode_profile_output_path(config: pytest.Config) -> Path:
+    """Return the path of the opcode profile summary file."""
+    output_path = config.getoption("opcode_profile_output")
+    if output_path is not None:
+        return output_path
+    fixture_output: FixtureOutput = config.fixture_output  # type: ignore[attr-defined]
+    return fixture_output.metadata_dir / OPCODE_PROFILE_FILE_NAME
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """
+    Merge the opcode profile rows of this process into the summary file.
+
+    Runs before the filler plugin finalizes (e.g. compresses) the fixture
+    output; each xdist worker merges its own rows into the file, which the
+    main process removed at the start of the session.
+    """
+    del exitstatus
+    if not session.config.getoption("opcode_profile"):
+        return
+    rows: Dict[str, OpcodeProfileRow] = session.config.opcode_profile_rows  # type: ignore
+    if not rows:
+        return
+    output_path = opcode_profile_output_path(session.config)
+    with FileLock(output_path.with_suffix(".lock")):
+        if output_path.exists():
+            rows = read_opcode_profile_summary(output_path) | rows
+        write_opcode_profile_summary(output_path, rows.values())
@@ -3,10 +3,13 @@ Static filler pytest plugin that reads test cases from static files and fills
 them into test fixtures.
 """
 
+import functools
+import hashlib
 import inspect
 import itertools
 import json
 import warnings
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, Dict, Generator, List, Self, Tuple, Type
 
@@ -148,151 +151,373 @@ for ch in list(NoIntResolver.yaml_implicit_resolvers):
     ]
 
 
+STATIC_FILLER_CACHE_VERSION = 1
+"""
+Version of the static filler collection cache entries. Bump whenever the
+format of the cached metadata changes.
+"""
+
+
+def encode_mark_argument(value: Any) -> Any:
+    """
+    Encode a mark argument into a JSON-serializable value.
+
+    Raises `TypeError` if the value cannot be stored in the collection cache,
+    in which case the file is simply not cached.
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, ParameterSet):
+        return {
+            "param": {
+                "values": [encode_mark_argument(v) for v in value.values],
+                "marks": [encode_mark(m) for m in value.marks],
+                "id": value.id,
+            }
+        }
+    if isinstance(value, (pytest.Mark, pytest.MarkDecorator)):
+        return {"mark": encode_mark(value)}
+    if isinstance(value, tuple):
+        return {"tuple": [encode_mark_argument(v) for v in value]}
+    if isinstance(value, list):
+        return [encode_mark_argument(v) for v in value]
+    raise TypeError(f"Unable to cache mark argument of type {type(value)}")
+
+
+def decode_mark_argument(value: Any) -> Any:
+    """Decode a mark argument previously encoded by `encode_mark_argument`."""
+    if isinstance(value, list):
+        return [decode_mark_argument(v) for v in value]
+    if isinstance(value, dict):
+        if "param" in value:
+            param = value["param"]
+            return ParameterSet(
+                values=tuple(decode_mark_argument(v) for v in param["values"]),
+                marks=[decode_mark(m) for m in param["marks"]],
+                id=param["id"],
+            )
+        if "mark" in value:
+            return decode_mark(value["mark"])
+        if "tuple" in value:
+            return tuple(decode_mark_argument(v) for v in value["tuple"])
+        raise ValueError(f"Unknown cached mark argument: {value}")
+    return value
+
+
+def encode_mark(mark: pytest.Mark | pytest.MarkDecorator) -> Dict[str, Any]:
+    """Encode a pytest mark into a JSON-serializable dictionary."""
+    if isinstance(mark, pytest.MarkDecorator):
+        mark = mark.mark
+    return {
+        "name": mark.name,
+        "args": [encode_mark_argument(arg) for arg in mark.args],
+        "kwargs": {k: encode_mark_argument(v) for k, v in mark.kwargs.items()},
+    }
+
+
+def decode_mark(entry: Dict[str, Any]) -> pytest.Mark:
+    """Decode a pytest mark previously encoded by `encode_mark`."""
+    return pytest.Mark(
+        entry["name"],
+        tuple(decode_mark_argument(arg) for arg in entry["args"]),
+        {k: decode_mark_argument(v) for k, v in entry["kwargs"].items()},
+        _ispytest=True,
+    )
+
+
+@functools.cache
+def static_parser_fingerprint() -> str:
+    """
+    Return a fingerprint of the source files of all registered static test
+    formats, used to invalidate the collection cache when the parsers change.
+    """
+    source_dirs = sorted(
+        {Path(inspect.getfile(static_format)).parent for static_format in BaseStaticTest.formats}
+        | {Path(__file__).parent}
+    )
+    fingerprint = hashlib.sha256(str(STATIC_FILLER_CACHE_VERSION).encode())
+    for source_dir in source_dirs:
+        for source_file in sorted(source_dir.rglob("*.py")):
+            fingerprint.update(f"{source_file}:{source_file.stat().st_mtime_ns}".encode())
+    return fingerprint.hexdigest()
+
+
+@dataclass(kw_only=True)
+class StaticTestMetadata:
+    """
+    Collection-relevant metadata of a single test defined in a static filler
+    file.
+
+    This is everything `FillerFile.collect` needs in order to generate the
+    test items (validity markers, parametrize combinations, extra marks and
+    the fill function's parameter names), so it can be stored in the
+    collection cache and the full model validation of the test can be deferred
+    until the test's setup.
+    """
+
+    function_marks: List[pytest.Mark]
+    function_parameters: List[str]
+
+    @classmethod
+    def from_fill_function(cls, func: Callable) -> Self:
+        """Extract the metadata from the fill function of a static test."""
+        function_marks: List[pytest.Mark] = []
+        if hasattr(func, "pytestmark"):
+            function_marks = func.pytestmark[:]
+        return cls(
+            function_marks=function_marks,
+            function_parameters=list(inspect.signature(func).parameters),
+        )
+
+    @classmethod
+    def from_cache_entry(cls, entry: Dict[str, Any]) -> Self:
+        """Create the metadata from a collection cache entry."""
+        return cls(
+            function_marks=[decode_mark(mark) for mark in entry["marks"]],
+            function_parameters=entry["parameters"],
+        )
+
+    def to_cache_entry(self) -> Dict[str, Any]:
+        """Convert the metadata into a collection cache entry."""
+        return {
+            "marks": [encode_mark(mark) for mark in self.function_marks],
+            "parameters": self.function_parameters,
+        }
+
+
 class FillerFile(pytest.File):
     """
     Filler file that reads test cases from static files and fills them into
     test fixtures.
+
+    The collection-relevant metadata of every test in the file is stored in
+    pytest's cache, keyed by the file's modification time and content hash.
+    When a cache entry is valid, the file is not parsed during collection and
+    the model validation of each test is deferred until the test's setup,
+    which means tests deselected by `-k`, `--from` or `--until` never pay
+    the validation cost.
     """
 
-    def collect(self: "FillerFile") -> Generator["FillerTestItem", None, None]:
-        """Collect test cases from a single static file."""
-        if not self.path.stem.endswith("Filler"):
-            return
-        with open(self.path, "r") as file:
-            try:
-                loaded_file = (
+    _loaded_file: Dict[str, Any] | None = None
+    _fill_functions: Dict[str, Callable]
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the filler file."""
+        super().__init__(*args, **kwargs)
+        self._fill_functions = {}
+
+    def load_file(self) -> Dict[str, Any]:
+        """Load the raw contents of the static file."""
+        if self._loaded_file is None:
+            with open(self.path, "r") as file:
+                self._loaded_file = (
                     json.load(file)
                     if self.path.suffix == ".json"
                     else yaml.load(file, Loader=NoIntResolver)
                 )
-                for key in loaded_file:
-                    filler = BaseStaticTest.model_validate(loaded_file[key])
-
-                    func = filler.fill_function()
-
-                    function_marks: List[pytest.Mark] = []
-                    if hasattr(func, "pytestmark"):
-                        function_marks = func.pytestmark[:]
-                    parametrize_marks: List[pytest.Mark] = [
-                        mark for mark in function_marks if mark.name == "parametrize"
-                    ]
-
-                    func_parameters = inspect.signature(func).parameters
-
-                    fixture_formats: List[Type[BaseFixture] | LabeledFixtureFormat] = []
-                    spec_parameter_name = ""
-                    for test_type in BaseTest.spec_types.values():
-                        if test_type.pytest_parameter_name() in func_parameters:
-                            assert not spec_parameter_name, "Multiple spec parameters found"
-                            spec_parameter_name = test_type.pytest_parameter_name()
-                            session = self.config.filling_session  # type: ignore[attr-defined]
-                            fixture_formats.extend(
-                                fixture_format
-                                for fixture_format in test_type.supported_fixture_formats
-                                if session.should_generate_format(fixture_format)
-                            )
+        return self._loaded_file
+
+    def get_fill_function(self, key: str) -> Callable:
+        """Validate the static test `key` and return its fill function."""
+        if key not in self._fill_functions:
+            filler = BaseStaticTest.model_validate(self.load_file()[key])
+            self._fill_functions[key] = filler.fill_function()
+        return self._fill_functions[key]
+
+    @property
+    def cache_key(self) -> str:
+        """Key of the file in the pytest cache."""
+        path_hash = hashlib.sha256(str(self.path.absolute()).encode()).hexdigest()
+        return f"static_filler/{path_hash}"
+
+    def get_cached_metadata(self) -> Dict[str, StaticTestMetadata] | None:
+        """
+        Return the cached metadata of all tests in the file, or `None` if the
+        cache is disabled, missing or stale.
+        """
+        cache = getattr(self.config, "cache", None)
+        if cache is None or not self.config.getoption("static_filler_cache"):
+            return None
+        entry = cache.get(self.cache_key, None)
+        if not entry or entry.get("fingerprint") != static_parser_fingerprint():
+            return None
+        stat = self.path.stat()
+        if entry["mtime_ns"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+            # The file might have only been touched, compare the contents.
+            if entry["sha256"] != hashlib.sha256(self.path.read_bytes()).hexdigest():
+                return None
+            entry["mtime_ns"] = stat.st_mtime_ns
+            cache.set(self.cache_key, entry)
+        return {
+            key: StaticTestMetadata.from_cache_entry(test_entry)
+            for key, test_entry in entry["tests"].items()
+        }
+
+    def set_cached_metadata(self, metadata: Dict[str, StaticTestMetadata]) -> None:
+        """Store the metadata of all tests in the file in the pytest cache."""
+        cache = getattr(self.config, "cache", None)
+        if cache is None or not self.config.getoption("static_filler_cache"):
+            return
+        try:
+            tests = {key: entry.to_cache_entry() for key, entry in metadata.items()}
+        except TypeError:
+            # Marks with arguments that cannot be serialized, skip caching.
+            return
+        stat = self.path.stat()
+        cache.set(
+            self.cache_key,
+            {
+                "fingerprint": static_parser_fingerprint(),
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha256": hashlib.sha256(self.path.read_bytes()).hexdigest(),
+                "tests": tests,
+            },
+        )
 
-                    test_fork_set = ValidityMarker.get_test_fork_set_from_markers(
-                        iter(function_marks)
-                    )
-                    if not test_fork_set:
-                        pytest.fail(
-                            "The test function's "
-                            f"'{key}' fork validity markers generate "
-                            "an empty fork range. Please check the arguments to its "
-                            f"markers:  @pytest.mark.valid_from and "
-                            f"@pytest.mark.valid_until."
-                        )
-                    intersection_set = test_fork_set & self.config.selected_fork_set  # type: ignore
-
-                    extra_function_marks: List[pytest.Mark] = [
-                        mark
-                        for mark in function_marks
-                        if mark.name != "parametrize"
-                        and not ValidityMarker.is_validity_or_filter_marker(mark.name)
-                    ]
-
-                    for format_with_or_without_label in fixture_formats:
-                        fixture_format_parameter_set = labeled_format_parameter_set(
-                            format_with_or_without_label
-                        )
-                        fixture_format = (
-                            format_with_or_without_label.format
-                            if isinstance(format_with_or_without_label, LabeledFixtureFormat)
-                            else format_with_or_without_label
+    def get_metadata(self) -> Dict[str, StaticTestMetadata]:
+        """
+        Return the metadata of all tests in the file, from the cache if
+        possible, otherwise by fully validating every test in the file.
+        """
+        metadata = self.get_cached_metadata()
+        if metadata is None:
+            metadata = {
+                key: StaticTestMetadata.from_fill_function(self.get_fill_function(key))
+                for key in self.load_file()
+            }
+            self.set_cached_metadata(metadata)
+        return metadata
+
+    def collect(self: "FillerFile") -> Generator["FillerTestItem", None, None]:
+        """Collect test cases from a single static file."""
+        if not self.path.stem.endswith("Filler"):
+            return
+        try:
+            for key, test_metadata in self.get_metadata().items():
+                function_marks = test_metadata.function_marks
+                parametrize_marks: List[pytest.Mark] = [
+                    mark for mark in function_marks if mark.name == "parametrize"
+                ]
+
+                func_parameters = test_metadata.function_parameters
+
+                fixture_formats: List[Type[BaseFixture] | LabeledFixtureFormat] = []
+                spec_parameter_name = ""
+                for test_type in BaseTest.spec_types.values():
+                    if test_type.pytest_parameter_name() in func_parameters:
+                        assert not spec_parameter_name, "Multiple spec parameters found"
+                        spec_parameter_name = test_type.pytest_parameter_name()
+                        session = self.config.filling_session  # type: ignore[attr-defined]
+                        fixture_formats.extend(
+                            fixture_format
+                            for fixture_format in test_type.supported_fixture_formats
+                            if session.should_generate_format(fixture_format)
                         )
-                        for fork in sorted(intersection_set):
-                            params: Dict[str, Any] = {spec_parameter_name: fixture_format}
-                            fixturenames = [
-                                spec_parameter_name,
-                            ]
-                            marks: List[pytest.Mark] = [
-                                mark  # type: ignore
-                                for mark in fixture_format_parameter_set.marks
-                                if mark.name != "parametrize"
-                            ]
-                            test_id = f"fork_{fork.name()}-{fixture_format_parameter_set.id}"
-                            if "fork" in func_parameters:
-                                params["fork"] = fork
-                            if "pre" in func_parameters:
-                                fixturenames.append("pre")
-                            if "request" in func_parameters:
-                                fixturenames.append("request")
-
-                            if parametrize_marks:
-                                parameter_names, parameter_set_list = (
-                                    get_all_combinations_from_parametrize_marks(parametrize_marks)
+
+                test_fork_set = ValidityMarker.get_test_fork_set_from_markers(iter(function_marks))
+                if not test_fork_set:
+                    pytest.fail(
+                        "The test function's "
+                        f"'{key}' fork validity markers generate "
+                        "an empty fork range. Please check the arguments to its "
+                        f"markers:  @pytest.mark.valid_from and "
+                        f"@pytest.mark.valid_until."
+                    )
+                intersection_set = test_fork_set & self.config.selected_fork_set  # type: ignore
+
+                extra_function_marks: List[pytest.Mark] = [
+                    mark
+                    for mark in function_marks
+                    if mark.name != "parametrize"
+                    and not ValidityMarker.is_validity_or_filter_marker(mark.name)
+                ]
+
+                parameter_names: List[str] = []
+                parameter_set_list: List[ParameterSet] = []
+                if parametrize_marks:
+                    parameter_names, parameter_set_list = (
+                        get_all_combinations_from_parametrize_marks(parametrize_marks)
+                    )
+
+                for format_with_or_without_label in fixture_formats:
+                    fixture_format_parameter_set = labeled_format_parameter_set(
+                        format_with_or_without_label
+                    )
+                    fixture_format = (
+                        format_with_or_without_label.format
+                        if isinstance(format_with_or_without_label, LabeledFixtureFormat)
+                        else format_with_or_without_label
+                    )
+                    for fork in sorted(intersection_set):
+                        params: Dict[str, Any] = {spec_parameter_name: fixture_format}
+                        fixturenames = [
+                            spec_parameter_name,
+                        ]
+                        marks: List[pytest.Mark] = [
+                            mark  # type: ignore
+                            for mark in fixture_format_parameter_set.marks
+                            if mark.name != "parametrize"
+                        ]
+                        test_id = f"fork_{fork.name()}-{fixture_format_parameter_set.id}"
+                        if "fork" in func_parameters:
+                            params["fork"] = fork
+                        if "pre" in func_parameters:
+                            fixturenames.append("pre")
+                        if "request" in func_parameters:
+                            fixturenames.append("request")
+
+                        if parametrize_marks:
+                            for parameter_set in parameter_set_list:
+                                # Copy and extend the params with the parameter
+                                # set
+                                case_marks = (
+                                    marks[:]
+                                    + [
+                                        mark
+                                        for mark in parameter_set.marks
+                                        if mark.name != "parametrize"
+                                    ]
+                                    + extra_function_marks
                                 )
-                                for parameter_set in parameter_set_list:
-                                    # Copy and extend the params with the
-                                    # parameter set
-                                    case_marks = (
-                                        marks[:]
-                                        + [
-                                            mark
-                                            for mark in parameter_set.marks
-                                            if mark.name != "parametrize"
-                                        ]
-                                        + extra_function_marks
-                                    )
-                                    case_params = params.copy() | dict(
-                                        zip(parameter_names, parameter_set.values, strict=True)
-                                    )
-
-                                    yield FillerTestItem.from_parent(
-                                        self,
-                                        original_name=key,
-                                        func=func,
-                                        params=case_params,
-                                        fixturenames=fixturenames,
-                                        name=f"{key}[{test_id}-{parameter_set.id}]",
-                                        fork=fork,
-                                        fixture_format=fixture_format,
-                                        marks=case_marks,
-                                    )
-                            else:
+                                case_params = params.copy() | dict(
+                                    zip(parameter_names, parameter_set.values, strict=True)
+                                )
+
                                 yield FillerTestItem.from_parent(
                                     self,
                                     original_name=key,
-                                    func=func,
-                                    params=params,
+                                    func=self._fill_functions.get(key),
+                                    params=case_params,
                                     fixturenames=fixturenames,
-                                    name=f"{key}[{test_id}]",
+                                    name=f"{key}[{test_id}-{parameter_set.id}]",
                                     fork=fork,
                                     fixture_format=fixture_format,
-                                    marks=marks,
+                                    marks=case_marks,
                                 )
-            except Exception as e:
-                pytest.fail(f"Error loading file {self.path} as a test: {e}")
-                warnings.warn(f"Error loading file {self.path} as a test: {e}", stacklevel=1)
-                return
+                        else:
+                            yield FillerTestItem.from_parent(
+                                self,
+                                original_name=key,
+                                func=self._fill_functions.get(key),
+                                params=params,
+                                fixturenames=fixturenames,
+                                name=f"{key}[{test_id}]",
+                                fork=fork,
+                                fixture_format=fixture_format,
+                                marks=marks,
+                            )
+        except Exception as e:
+            pytest.fail(f"Error loading file {self.path} as a test: {e}")
+            warnings.warn(f"Error loading file {self.path} as a test: {e}", stacklevel=1)
+            return
 
 
 class FillerTestItem(pytest.Item):
     """Filler test item produced from a single test from a static file."""
 
     originalname: str
-    func: Callable
+    func: Callable | None
     params: Dict[str, Any]
     fixturenames: List[str]
     github_url: str = ""
@@ -303,7 +528,7 @@ class FillerTestItem(pytest.Item):
         self,
         *args: Any,
         original_name: str,
-        func: Callable,
+        func: Callable | None,
         params: Dict[str, Any],
         fixturenames: List[str],
         fork: Fork,
@@ -326,7 +551,17 @@ class FillerTestItem(pytest.Item):
                 self.add_marker(marker)  # type: ignore
 
     def setup(self) -> None:
-        """Resolve and apply fixtures before test execution."""
+        """
+        Validate the static test, if it was collected from the cache, and
+        resolve and apply fixtures before test execution.
+        """
+        if self.func is None:
+            filler_file = self.parent
+            assert isinstance(filler_file, FillerFile)
+            try:
+                self.func = filler_file.get_fill_function(self.originalname)
+            except Exception as e:
+                pytest.fail(f"Error loading file {self.path} as a test: {e}")
         self._fixtureinfo = self.session._fixturemanager.getfixtureinfo(
             self,
             None,
@@ -344,6 +579,7 @@ class FillerTestItem(pytest.Item):
 
     def runtest(self) -> None:
         """Execute the test logic for this specific static test."""
+        assert self.func is not None, "Static test was not set up"
         self.func(**self.params)
 
     def reportinfo(self) -> Tuple[Path, int, str]:
@@ -0,0 +1,123 @@
+"""Test the scheduling of tests across xdist workers by estimated cost."""
+
+import json
+import textwrap
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from ...shared.cost_scheduling import (
+    COST_FACTORS_FILE_NAME,
+    TEST_DURATIONS_CACHE_KEY,
+    CostEstimator,
+    fork_agnostic_node_id,
+)
+
+test_module_costs = textwrap.dedent(
+    """\
+    import os
+    import time
+
+    import pytest
+
+
+    def log_start(name):
+        with open("start.log", "a") as f:
+            f.write(f"{os.environ['PYTEST_XDIST_WORKER']} {name}\\n")
+
+
+    @pytest.mark.parametrize("index", range(6))
+    def test_fast(index):
+        log_start(f"test_fast[{index}]")
+
+
+    @pytest.mark.benchmark
+    def test_benchmark():
+        log_start("test_benchmark")
+
+
+    def test_slow():
+        log_start("test_slow")
+        time.sleep(0.5)
+    """
+)
+
+
+def first_test_of_each_worker(start_log: Path) -> List[str]:
+    """Return the first test started by each worker."""
+    first_tests: Dict[str, str] = {}
+    for line in start_log.read_text().splitlines():
+        worker, name = line.split()
+        first_tests.setdefault(worker, name)
+    return list(first_tests.values())
+
+
+def test_cost_estimator(tmp_path: Path) -> None:
+    """
+    Test that tests without recorded duration are estimated from the same
+    test for other forks, or from the median duration and their cost factor.
+    """
+    cost_factors_path = tmp_path / COST_FACTORS_FILE_NAME
+    cost_factors_path.write_text(json.dumps({"test_b.py::test_b[fork_Cancun]": 20.0}))
+    cost_estimator = CostEstimator(
+        durations={
+            "test_a.py::test_a[fork_Cancun-state_test]": 1.0,
+            "test_a.py::test_a[fork_Prague-state_test]": 3.0,
+            "test_c.py::test_c": 0.5,
+        },
+        cost_factors_path=cost_factors_path,
+    )
+    assert fork_agnostic_node_id("test_a.py::test_a[fork_Osaka-state_test]") == (
+        "test_a.py::test_a[fork-state_test]"
+    )
+    # `fork_` in the module and function names is not a fork parameter.
+    fork_id_test = "tests/test_fork_id.py::test_fork_id"
+    assert fork_agnostic_node_id(f"{fork_id_test}[fork_Cancun-state_test]") == (
+        f"{fork_id_test}[fork-state_test]"
+    )
+    assert fork_agnostic_node_id("test_a.py::test_a[state_test-fork_Cancun]") == (
+        "test_a.py::test_a[state_test-fork]"
+    )
+    assert cost_estimator.cost("test_a.py::test_a[fork_Cancun-state_test]") == 1.0
+    assert cost_estimator.cost("test_a.py::test_a[fork_Osaka-state_test]") == 2.0
+    assert cost_estimator.cost("test_b.py::test_b[fork_Cancun]") == 20.0
+    assert cost_estimator.cost("test_d.py::test_d") == 1.0
+
+
+def test_longest_first_scheduling(pytester: pytest.Pytester) -> None:
+    """
+    Test that the tests marked as benchmark are sent first when no duration
+    was recorded, and the longest recorded test is sent first afterwards.
+    """
+    pytester.makeini(
+        textwrap.dedent(
+            """\
+            [pytest]
+            markers =
+                benchmark: benchmark test
+            """
+        )
+    )
+    pytester.makepyfile(test_costs=test_module_costs)
+    args = ["-p", "pytest_plugins.shared.cost_scheduling", "-n", "2"]
+    start_log = pytester.path / "start.log"
+
+    result = pytester.runpytest(*args)
+    result.assert_outcomes(passed=8)
+    assert "test_benchmark" in first_test_of_each_worker(start_log)
+    durations = json.loads(
+        (pytester.path / ".pytest_cache" / "v" / TEST_DURATIONS_CACHE_KEY).read_text()
+    )
+    assert len(durations) == 8
+    assert max(durations, key=durations.get) == "test_costs.py::test_slow"
+
+    start_log.unlink()
+    result = pytester.runpytest(*args)
+    result.assert_outcomes(passed=8)
+    assert "test_slow" in first_test_of_each_worker(start_log)
+
+    start_log.unlink()
+    result = pytester.runpytest(*args, "--no-cost-scheduling")
+    result.assert_outcomes(passed=8)
+    assert "test_slow" not in first_test_of_each_worker(start_log)
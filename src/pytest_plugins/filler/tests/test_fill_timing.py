@@ -0,0 +1,85 @@
+"""Test the fill timing span recorder."""
+
+import threading
+
+import pytest
+
+from .. import fill_timing
+from ..fill_timing import FIXTURE_OUTPUT_SPAN, TEST_FUNCTION_PHASE, FillTimer, fill_timing_span
+
+
+def test_fill_timer_spans() -> None:
+    """
+    Test that nested spans are aggregated per stack, and that spans outside a
+    root span are ignored.
+    """
+    timer = FillTimer()
+    with timer.span("ignored"):
+        pass
+    for _ in range(2):
+        with timer.span("test_a", root=True):
+            with timer.span("generate fixture"):
+                with timer.span("t8n"):
+                    pass
+                with timer.span("t8n"):
+                    pass
+
+    def other_thread() -> None:
+        with timer.span("ignored"):
+            pass
+
+    with timer.span("test_b", root=True):
+        thread = threading.Thread(target=other_thread)
+        thread.start()
+        thread.join()
+    with timer.span(FIXTURE_OUTPUT_SPAN, root=True):
+        pass
+
+    assert timer.calls == {
+        ("test_a",): 2,
+        ("test_a", "generate fixture"): 2,
+        ("test_a", "generate fixture", "t8n"): 4,
+        ("test_b",): 1,
+        (FIXTURE_OUTPUT_SPAN,): 1,
+    }
+    self_durations = timer.self_durations()
+    assert self_durations[("test_a",)] == pytest.approx(
+        timer.durations[("test_a",)] - timer.durations[("test_a", "generate fixture")]
+    )
+
+    phases = {phase: calls for phase, calls, _, _ in timer.phase_summary()}
+    assert phases == {
+        TEST_FUNCTION_PHASE: 3,
+        "generate fixture": 2,
+        "generate fixture > t8n": 4,
+        FIXTURE_OUTPUT_SPAN: 1,
+    }
+
+
+def test_fill_timer_merge_and_collapsed_stacks() -> None:
+    """
+    Test that the spans of several processes are merged, and that the
+    collapsed stacks contain the self duration in microseconds.
+    """
+    timer = FillTimer()
+    timer.add(("test_a",), 3.0, 1)
+    timer.add(("test_a", "t8n"), 2.0, 1)
+    other_timer = FillTimer()
+    other_timer.add(("test_a", "t8n"), 0.5, 2)
+    timer.merge_json(other_timer.to_json())
+
+    assert timer.calls[("test_a", "t8n")] == 3
+    assert timer.collapsed_stacks() == ["test_a 500000", "test_a;t8n 2500000"]
+
+
+def test_fill_timing_span_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that spans are only recorded when fill timing is enabled."""
+    monkeypatch.setattr(fill_timing, "_fill_timer", None)
+    with fill_timing_span("test_a", root=True):
+        pass
+
+    timer = FillTimer()
+    monkeypatch.setattr(fill_timing, "_fill_timer", timer)
+    with fill_timing_span("test_a", root=True), fill_timing_span("t8n"):
+        pass
+    assert set(timer.calls) == {("test_a",), ("test_a", "t8n")}
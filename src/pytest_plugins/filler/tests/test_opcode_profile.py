@@ -0,0 +1,133 @@
+"""Test the opcode profile summary of filled tests."""
+
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from ethereum_clis import OpcodeCount, OpcodeGas, OpcodeProfile
+from ethereum_test_forks import Osaka, Prague
+
+from ..opcode_profile import (
+    OPCODE_COUNT_COLUMN_PREFIX,
+    OPCODE_GAS_COLUMN_PREFIX,
+    SUMMARY_COLUMNS,
+    opcode_columns,
+    opcode_profile_row,
+    read_opcode_profile_summary,
+    write_opcode_profile_summary,
+)
+
+
+def test_opcode_profile_summary_round_trip(tmp_path: Path) -> None:
+    """
+    Test that the summary rows survive the round-trip through the summary
+    file, and that rows with different opcodes share the same columns.
+    """
+    with_gas = opcode_profile_row(
+        test="tests/test_a.py::test_a[fork_Prague-benchmark-gas-value_1M]",
+        fork=Prague,
+        gas_benchmark_value=1_000_000,
+        profile=OpcodeProfile(
+            opcode_count=OpcodeCount.model_validate({"ADD": 10, "STOP": 1}),
+            opcode_gas=OpcodeGas.model_validate({"ADD": 30, "STOP": 0}),
+            gas_used=21_030,
+            t8n_calls=1,
+            t8n_time=0.5,
+        ),
+    )
+    without_gas = opcode_profile_row(
+        test="tests/test_a.py::test_a[fork_Osaka-benchmark-gas-value_1M]",
+        fork=Osaka,
+        gas_benchmark_value=1_000_000,
+        profile=OpcodeProfile(
+            opcode_count=OpcodeCount.model_validate({"MUL": 2}),
+            gas_used=21_010,
+            t8n_calls=2,
+        ),
+    )
+    summary_path = tmp_path / "opcode_profile.csv"
+    write_opcode_profile_summary(summary_path, [with_gas, without_gas])
+
+    header = summary_path.read_text().splitlines()[0].split(",")
+    assert header[: len(SUMMARY_COLUMNS)] == SUMMARY_COLUMNS
+    assert header[len(SUMMARY_COLUMNS) :] == [
+        "count:ADD",
+        "count:MUL",
+        "count:STOP",
+        "gas:ADD",
+        "gas:STOP",
+    ]
+
+    rows = read_opcode_profile_summary(summary_path)
+    assert list(rows) == sorted([with_gas["test"], without_gas["test"]])
+    row = rows[with_gas["test"]]
+    assert row["fork"] == "Prague"
+    assert row["t8n_time"] == "0.500000"
+    assert opcode_columns(row, OPCODE_COUNT_COLUMN_PREFIX) == {"ADD": 10, "STOP": 1}
+    assert opcode_columns(row, OPCODE_GAS_COLUMN_PREFIX) == {"ADD": 30, "STOP": 0}
+    row = rows[without_gas["test"]]
+    assert opcode_columns(row, OPCODE_COUNT_COLUMN_PREFIX) == {"MUL": 2}
+    assert opcode_columns(row, OPCODE_GAS_COLUMN_PREFIX) == {}
+
+
+def test_opcode_profile_summary_only_has_session_rows(pytester: pytest.Pytester) -> None:
+    """
+    Test that the rows of a previous session are dropped from the summary
+    file, while the rows of every worker of the session are merged into it.
+    """
+    pytester.makeconftest(
+        textwrap.dedent(
+            """\
+            import pytest
+
+            from ethereum_test_forks import Prague
+
+
+            @pytest.fixture
+            def fork():
+                return Prague
+
+
+            @pytest.fixture
+            def gas_benchmark_value():
+                return 1_000_000
+            """
+        )
+    )
+    pytester.makepyfile(
+        test_profiled=textwrap.dedent(
+            """\
+            import pytest
+
+
+            @pytest.mark.parametrize("gas_used", [1, 2, 3, 4])
+            def test_profiled(opcode_profile, gas_used):
+                opcode_profile.t8n_calls = 1
+                opcode_profile.gas_used = gas_used
+            """
+        )
+    )
+    summary_path = pytester.path / "opcode_profile.csv"
+    write_opcode_profile_summary(
+        summary_path,
+        [
+            opcode_profile_row(
+                test="test_removed.py::test_removed",
+                fork=Prague,
+                gas_benchmark_value=1_000_000,
+                profile=OpcodeProfile(t8n_calls=1),
+            )
+        ],
+    )
+    result = pytester.runpytest(
+        "-p",
+        "pytest_plugins.filler.opcode_profile",
+        "-n",
+        "2",
+        "--opcode-profile",
+        f"--opcode-profile-output={summary_path}",
+    )
+    result.assert_outcomes(passed=4)
+    rows = read_opcode_profile_summary(summary_path)
+    assert sorted(row["gas_used"] for row in rows.values()) == ["1", "2", "3", "4"]
@@ -0,0 +1,140 @@
+"""Test the static filler plugin's collection cache."""
+
+import json
+import textwrap
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from ..static_filler import StaticTestMetadata, decode_mark, encode_mark
+
+static_filler_dummy = textwrap.dedent(
+    """\
+    DummyStaticTest:
+      env:
+        currentCoinbase: a94f5374fce5edbc8e2a8697c15331677e6ebf0b
+        currentDifficulty: 1
+        currentGasLimit: 1000000
+        currentNumber: 1
+        currentTimestamp: 1000
+      expect:
+        - indexes:
+            data: !!int -1
+          network:
+            - ">=Cancun"
+          result: {}
+      pre:
+        a94f5374fce5edbc8e2a8697c15331677e6ebf0b:
+          nonce: 0
+          balance: 100000000000000
+          storage: {}
+          code: ''
+      transaction:
+        data:
+          - ':raw 0x00'
+          - ':raw 0x01'
+        gasLimit:
+          - 90000
+        gasPrice: 10
+        nonce: 0
+        secretKey: 45a915e4d060149eb4365960e6a7a45f334393093061116b197e3240065ff2d8
+        to: ''
+        value:
+          - 0
+    """
+)
+
+
+def test_mark_encoding_round_trip() -> None:
+    """Test that marks survive the round-trip through the cache encoding."""
+
+    @pytest.mark.valid_at("Cancun", "Prague")
+    @pytest.mark.parametrize(
+        "d,g,v",
+        [
+            pytest.param(0, 0, 0, id="d0"),
+            pytest.param(1, 0, 0, marks=[pytest.mark.exception_test], id="d1"),
+        ],
+    )
+    @pytest.mark.pre_alloc_group("separate", reason="Uses hard-coded addresses")
+    def test_func(state_test: None, pre: None, d: int, g: int, v: int) -> None:
+        del state_test, pre, d, g, v
+
+    metadata = StaticTestMetadata.from_fill_function(test_func)
+    assert metadata.function_parameters == ["state_test", "pre", "d", "g", "v"]
+
+    entry = json.loads(json.dumps(metadata.to_cache_entry()))
+    decoded = StaticTestMetadata.from_cache_entry(entry)
+    assert decoded.function_parameters == metadata.function_parameters
+    assert [(m.name, m.kwargs) for m in decoded.function_marks] == [
+        (m.name, m.kwargs) for m in metadata.function_marks
+    ]
+    for original, cached in zip(metadata.function_marks, decoded.function_marks, strict=True):
+        if original.name != "parametrize":
+            assert cached == original
+            continue
+        assert cached.args[0] == original.args[0]
+        for original_param, cached_param in zip(original.args[1], cached.args[1], strict=True):
+            assert tuple(cached_param.values) == tuple(original_param.values)
+            assert cached_param.id == original_param.id
+            assert [m.name for m in cached_param.marks] == [m.name for m in original_param.marks]
+
+
+def test_encode_mark_unsupported_argument() -> None:
+    """Test that marks with non-serializable arguments are rejected."""
+    with pytest.raises(TypeError):
+        encode_mark(pytest.mark.parametrize("x", [object()]))
+    assert decode_mark(encode_mark(pytest.mark.slow)) == pytest.mark.slow.mark
+
+
+def collected_test_ids(result: pytest.RunResult) -> List[str]:
+    """Return the collected test ids from a `--collect-only -q` run."""
+    return sorted(line for line in result.outlines if "::" in line)
+
+
+def test_static_filler_collection_cache(pytester: pytest.Pytester) -> None:
+    """
+    Test that a second collection of static files uses the cache and produces
+    the same test items, and that a modified file invalidates the cache.
+    """
+    tests_dir = pytester.mkdir("tests")
+    static_dir = tests_dir / "static"
+    static_dir.mkdir()
+    (static_dir / "__init__.py").write_text("")
+    filler_file = static_dir / "DummyStaticTestFiller.yml"
+    filler_file.write_text(static_filler_dummy)
+
+    pytester.copy_example(name="src/cli/pytest_commands/pytest_ini_files/pytest-fill.ini")
+    args = [
+        "-c",
+        "pytest-fill.ini",
+        "--fill-static-tests",
+        "--fork",
+        "Cancun",
+        "tests/static/",
+        "--collect-only",
+        "-q",
+    ]
+
+    result = pytester.runpytest(*args)
+    assert result.ret == 0, f"Fill command failed:\n{result.outlines}"
+    test_ids = collected_test_ids(result)
+    assert any("DummyStaticTest[fork_Cancun-state_test-d1]" in i for i in test_ids), test_ids
+
+    cache_entries = list(Path(pytester.path / ".pytest_cache" / "v" / "static_filler").iterdir())
+    assert len(cache_entries) == 1
+
+    result = pytester.runpytest(*args)
+    assert result.ret == 0, f"Fill command failed:\n{result.outlines}"
+    assert collected_test_ids(result) == test_ids
+
+    # Extend the transaction data, the cached metadata must be invalidated.
+    filler_file.write_text(
+        static_filler_dummy.replace("- ':raw 0x01'", "- ':raw 0x01'\n      - ':raw 0x02'")
+    )
+    result = pytester.runpytest(*args)
+    assert result.ret == 0, f"Fill command failed:\n{result.outlines}"
+    assert any(
+        "DummyStaticTest[fork_Cancun-state_test-d2]" in i for i in collected_test_ids(result)
+    )
@@ -0,0 +1,56 @@
+"""Test the witness-filler interface of the witness plugin."""
+
+import json
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+from ..witness import run_witness_filler
+
+FAKE_WITNESS_FILLER = """#!{python}
+import json
+import sys
+import time
+
+fixture = json.load(sys.stdin)
+if fixture.get("hang"):
+    time.sleep(60)
+if fixture.get("fail"):
+    print(f"cannot witness {{fixture['name']}}", file=sys.stderr)
+    sys.exit(1)
+print(json.dumps([dict(state=[fixture["name"]], codes=[], keys=[], headers=[])]))
+"""
+
+
+@pytest.fixture
+def witness_filler(tmp_path: Path) -> str:
+    """Write a fake witness-filler tool and return its path."""
+    binary = tmp_path / "witness-filler"
+    binary.write_text(FAKE_WITNESS_FILLER.format(python=sys.executable))
+    binary.chmod(binary.stat().st_mode | stat.S_IEXEC)
+    return str(binary)
+
+
+def fixture_json(name: str, **kwargs: bool) -> str:
+    """Return the JSON of a fake fixture."""
+    return json.dumps({"name": name, **kwargs})
+
+
+def test_run_witness_filler(witness_filler: str) -> None:
+    """Test that the witnesses written by the tool are parsed."""
+    witnesses = run_witness_filler(fixture_json("a"), binary=witness_filler)
+    assert [witness.state for witness in witnesses] == [["a"]]
+
+
+def test_run_witness_filler_failure(witness_filler: str) -> None:
+    """Test that a failure of the tool reports its stderr."""
+    with pytest.raises(RuntimeError, match="exit code 1.*cannot witness b"):
+        run_witness_filler(fixture_json("b", fail=True), binary=witness_filler)
+
+
+def test_run_witness_filler_timeout(witness_filler: str) -> None:
+    """Test that a hung tool is stopped after the timeout."""
+    with pytest.raises(RuntimeError, match="did not finish within 0.5 seconds"):
+        run_witness_filler(fixture_json("c", hang=True), binary=witness_filler, timeout=0.5)
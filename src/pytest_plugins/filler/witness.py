@@ -16,6 +16,10 @@ from ethereum_test_base_types import EthereumTestRootModel
 from ethereum_test_fixtures.blockchain import BlockchainFixture, FixtureBlock, WitnessChunk
 from ethereum_test_forks import Paris
 
+WITNESS_FILLER_BINARY = "witness-filler"
+WITNESS_FILLER_TIMEOUT = 600
+"""Seconds after which a witness-filler run is considered hung."""
+
 
 class WitnessFillerResult(EthereumTestRootModel[List[WitnessChunk]]):
     """
@@ -62,7 +66,7 @@ def pytest_configure(config: pytest.Config) -> None:
     """
     if config.getoption("witness"):
         # Check if witness-filler binary is available in PATH
-        if not shutil.which("witness-filler"):
+        if not shutil.which(WITNESS_FILLER_BINARY):
             pytest.exit(
                 "witness-filler tool not found in PATH. Please build and install witness-filler "
                 "from https://github.com/kevaundray/reth.git before using --witness flag.\n"
@@ -72,6 +76,42 @@ def pytest_configure(config: pytest.Config) -> None:
             )
 
 
+def run_witness_filler(
+    fixture_json: str,
+    *,
+    binary: str = WITNESS_FILLER_BINARY,
+    timeout: float = WITNESS_FILLER_TIMEOUT,
+) -> List[WitnessChunk]:
+    """
+    Run the witness-filler tool on a fixture serialized to JSON and return the
+    witnesses of its blocks.
+    """
+    try:
+        result = subprocess.run(
+            [binary],
+            input=fixture_json,
+            text=True,
+            capture_output=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired as e:
+        raise RuntimeError(f"witness-filler tool did not finish within {timeout} seconds") from e
+
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"witness-filler tool failed with exit code {result.returncode}. "
+            f"stderr: {result.stderr}"
+        )
+
+    try:
+        return WitnessFillerResult.model_validate_json(result.stdout).root
+    except Exception as e:
+        raise RuntimeError(
+            f"Failed to parse witness data from witness-filler tool. "
+            f"Output was: {result.stdout[:500]}{'...' if len(result.stdout) > 500 else ''}"
+        ) from e
+
+
 @pytest.fixture
 def witness_generator(
     request: pytest.FixtureRequest,
@@ -101,35 +141,16 @@ def witness_generator(
             fixture.fork = Merge
 
         try:
-            result = subprocess.run(
-                ["witness-filler"],
-                input=fixture.model_dump_json(by_alias=True),
-                text=True,
-                capture_output=True,
-            )
+            fixture_json = fixture.model_dump_json(by_alias=True)
         finally:
             if original_fork is not None:
                 fixture.fork = original_fork
 
-        if result.returncode != 0:
-            raise RuntimeError(
-                f"witness-filler tool failed with exit code {result.returncode}. "
-                f"stderr: {result.stderr}"
-            )
-
-        try:
-            result_model = WitnessFillerResult.model_validate_json(result.stdout)
-            witnesses = result_model.root
-
-            for i, witness in enumerate(witnesses):
-                if i < len(fixture.blocks):
-                    block = fixture.blocks[i]
-                    if isinstance(block, FixtureBlock):
-                        block.execution_witness = witness
-        except Exception as e:
-            raise RuntimeError(
-                f"Failed to parse witness data from witness-filler tool. "
-                f"Output was: {result.stdout[:500]}{'...' if len(result.stdout) > 500 else ''}"
-            ) from e
+        witnesses = run_witness_filler(fixture_json)
+        for i, witness in enumerate(witnesses):
+            if i < len(fixture.blocks):
+                block = fixture.blocks[i]
+                if isinstance(block, FixtureBlock):
+                    block.execution_witness = witness
 
     return generate_witness
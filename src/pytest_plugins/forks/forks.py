@@ -1,5 +1,6 @@
 """Pytest plugin to enable fork range configuration for the test session."""
 
+import functools
 import itertools
 import re
 import sys
@@ -7,7 +8,19 @@ import textwrap
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from types import FunctionType
-from typing import Any, Callable, ClassVar, Dict, Iterable, Iterator, List, Set, Tuple, Type
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Set,
+    Tuple,
+    Type,
+)
 
 import pytest
 from _pytest.mark.structures import ParameterSet
@@ -254,6 +267,18 @@ class CovariantDescriptor:
         )
 
 
+@functools.cache
+def get_fork_covariant_values(fork: Fork, fork_attribute_name: str) -> Tuple[Any, ...]:
+    """
+    Return the values of a fork method used to parametrize a covariant
+    decorator.
+
+    Forks are immutable classes, so the values are only computed once per fork
+    and method during the whole collection instead of once per test function.
+    """
+    return tuple(getattr(fork, fork_attribute_name)(block_number=0, timestamp=0))
+
+
 class CovariantDecorator(CovariantDescriptor):
     """
     A marker used to parametrize a function by a covariant parameter with the
@@ -317,7 +342,7 @@ class CovariantDecorator(CovariantDescriptor):
             raise ValueError(f"Unknown arguments to {self.marker_name}: {kwargs}")
 
         def fn(fork: Fork) -> List[Any]:
-            return getattr(fork, self.fork_attribute_name)(block_number=0, timestamp=0)
+            return list(get_fork_covariant_values(fork, self.fork_attribute_name))
 
         super().__init__(
             argnames=self.marker_parameter_names,
@@ -587,6 +612,7 @@ def session_fork(request: pytest.FixtureRequest) -> Fork | None:
 
 
 ALL_VALIDITY_MARKERS: Dict[str, "Type[ValidityMarker]"] = {}
+VALIDITY_MARKERS_FORK_SET_CACHE: Dict[Tuple[Any, ...], FrozenSet[Fork]] = {}
 MARKER_NAME_REGEX = re.compile(r"(?<!^)(?=[A-Z])")
 
 
@@ -633,6 +659,7 @@ class ValidityMarker(ABC):
         if marker_name in ALL_VALIDITY_MARKERS:
             raise ValueError(f"Duplicate validity marker class: {cls}")
         ALL_VALIDITY_MARKERS[marker_name] = cls
+        VALIDITY_MARKERS_FORK_SET_CACHE.clear()
 
     def __post_init__(self) -> None:
         """Post-initialize the validity marker."""
@@ -702,8 +729,30 @@ class ValidityMarker(ABC):
         """
         Get the set of forks where a test is valid using the markers applied to
         the test.
+
+        The resulting fork set only depends on the validity markers and their
+        arguments, so it is memoized for all the tests that share the same
+        markers (e.g. all tests marked with `valid_from("Cancun")`).
         """
-        return ValidityMarker.get_test_fork_set(ValidityMarker.get_all_validity_markers(markers))
+        validity_markers = [marker for marker in markers if marker.name in ALL_VALIDITY_MARKERS]
+        try:
+            cache_key = tuple(
+                (marker.name, marker.args, tuple(sorted(marker.kwargs.items())))
+                for marker in validity_markers
+            )
+            hash(cache_key)
+        except TypeError:
+            # Unhashable marker arguments, skip the cache.
+            return ValidityMarker.get_test_fork_set(
+                ValidityMarker.get_all_validity_markers(iter(validity_markers))
+            )
+        if cache_key not in VALIDITY_MARKERS_FORK_SET_CACHE:
+            VALIDITY_MARKERS_FORK_SET_CACHE[cache_key] = frozenset(
+                ValidityMarker.get_test_fork_set(
+                    ValidityMarker.get_all_validity_markers(iter(validity_markers))
+                )
+            )
+        return set(VALIDITY_MARKERS_FORK_SET_CACHE[cache_key])
 
     @staticmethod
     def get_test_fork_set_from_metafunc(
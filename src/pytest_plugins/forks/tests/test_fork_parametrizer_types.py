@@ -5,11 +5,13 @@ from typing import List
 import pytest
 from _pytest.mark.structures import ParameterSet
 
-from ethereum_test_forks import Frontier
+from ethereum_test_forks import Berlin, Frontier, London, Paris
 
 from ..forks import (
     ForkCovariantParameter,
     ForkParametrizer,
+    ValidityMarker,
+    get_fork_covariant_values,
     parameters_from_fork_parametrizer_list,
 )
 
@@ -201,3 +203,26 @@ def test_fork_parametrizer(
         assert len(values[i].marks) == len(expected_parameter_sets[i].marks)
         for j in range(len(values[i].marks)):
             assert values[i].marks[j] == expected_parameter_sets[i].marks[j]  # type: ignore
+
+
+def test_memoized_validity_marker_fork_set() -> None:
+    """
+    Test that memoized fork sets of validity markers are equal to freshly
+    computed ones and are returned as independent copies.
+    """
+    markers = [pytest.mark.valid_from("Berlin").mark, pytest.mark.valid_until("Paris").mark]
+    expected = ValidityMarker.get_test_fork_set(
+        ValidityMarker.get_all_validity_markers(iter(markers))
+    )
+    fork_set = ValidityMarker.get_test_fork_set_from_markers(iter(markers))
+    assert fork_set == expected == {Berlin, London, Paris}
+    fork_set.clear()
+    assert ValidityMarker.get_test_fork_set_from_markers(iter(markers)) == expected
+
+
+def test_memoized_fork_covariant_values() -> None:
+    """Test that the memoized fork covariant values match the fork method."""
+    assert list(get_fork_covariant_values(Frontier, "tx_types")) == Frontier.tx_types()
+    assert get_fork_covariant_values(Frontier, "tx_types") is get_fork_covariant_values(
+        Frontier, "tx_types"
+    )
@@ -0,0 +1 @@
+"""A pytest plugin providing common functionality for Hive simulators."""
@@ -0,0 +1,842 @@
+"""
+Local stand-in for the execution clients started by hive.
+
+A `LocalClient` serves the Engine API on port 8551, and a subset of the `eth`
+namespace on port 8545, of its own loopback address, as the client containers
+started by hive do, and executes the blocks it receives with a transition
+tool.
+
+Blocks are validated by computing their header from the transition tool
+output, as `fill` does, and comparing its hash against the hash of the
+received block. Only the header checks that are cheap to perform without
+a client are done on top of the transition tool ones, so the local client
+is meant to exercise and benchmark the simulators, not to stand in for a
+client under test.
+"""
+
+import json
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, ClassVar, Dict, List, Mapping, Sequence, Tuple
+
+from ethereum_rlp import rlp
+from pydantic import ValidationError
+
+from ethereum_clis import TransitionTool
+from ethereum_test_base_types import (
+    AccessList,
+    Account,
+    Address,
+    Bytes,
+    Hash,
+    to_json,
+)
+from ethereum_test_exceptions import (
+    BlockException,
+    EngineAPIError,
+    ExceptionBase,
+    ExceptionMapper,
+    TransactionException,
+)
+from ethereum_test_fixtures.blockchain import FixtureExecutionPayload, FixtureHeader
+from ethereum_test_forks import Fork
+from ethereum_test_rpc.rpc_types import JSONRPCError, PayloadStatusEnum
+from ethereum_test_types import (
+    Alloc,
+    AuthorizationTuple,
+    Environment,
+    Requests,
+    Transaction,
+    Withdrawal,
+)
+
+from ..consume.simulators.helpers.ruleset import ruleset
+from ..custom_logging import get_logger
+
+logger = get_logger(__name__)
+
+LOCAL_CLIENT_NAME = "local-t8n"
+ETH_PORT = 8545
+ENGINE_PORT = 8551
+BLOCK_HASHES_WINDOW = 256
+MAX_EXTRA_DATA_SIZE = 32
+MIN_GAS_LIMIT = 5_000
+GAS_LIMIT_BOUND_DIVISOR = 1_024
+
+NUMERIC_FIELDS = {
+    "chain_id",
+    "nonce",
+    "gas_price",
+    "max_priority_fee_per_gas",
+    "max_fee_per_gas",
+    "gas_limit",
+    "value",
+    "max_fee_per_blob_gas",
+    "v",
+    "r",
+    "s",
+    "difficulty",
+    "number",
+    "gas_used",
+    "timestamp",
+    "base_fee_per_gas",
+    "blob_gas_used",
+    "excess_blob_gas",
+}
+"""Fields of the transactions and headers that are RLP encoded as integers."""
+
+TRANSACTION_FIELDS: Dict[int, List[str]] = {
+    0: ["nonce", "gas_price", "gas_limit", "to", "value", "data", "v", "r", "s"],
+    1: [
+        "chain_id",
+        "nonce",
+        "gas_price",
+        "gas_limit",
+        "to",
+        "value",
+        "data",
+        "access_list",
+        "v",
+        "r",
+        "s",
+    ],
+    2: [
+        "chain_id",
+        "nonce",
+        "max_priority_fee_per_gas",
+        "max_fee_per_gas",
+        "gas_limit",
+        "to",
+        "value",
+        "data",
+        "access_list",
+        "v",
+        "r",
+        "s",
+    ],
+    3: [
+        "chain_id",
+        "nonce",
+        "max_priority_fee_per_gas",
+        "max_fee_per_gas",
+        "gas_limit",
+        "to",
+        "value",
+        "data",
+        "access_list",
+        "max_fee_per_blob_gas",
+        "blob_versioned_hashes",
+        "v",
+        "r",
+        "s",
+    ],
+    4: [
+        "chain_id",
+        "nonce",
+        "max_priority_fee_per_gas",
+        "max_fee_per_gas",
+        "gas_limit",
+        "to",
+        "value",
+        "data",
+        "access_list",
+        "authorization_list",
+        "v",
+        "r",
+        "s",
+    ],
+}
+"""RLP fields of each supported transaction type, in encoding order."""
+
+HEADER_FIELD_EXCEPTIONS: Dict[str, ExceptionBase] = {
+    "state_root": BlockException.INVALID_STATE_ROOT,
+    "transactions_trie": BlockException.INVALID_TRANSACTIONS_ROOT,
+    "receipts_root": BlockException.INVALID_RECEIPTS_ROOT,
+    "logs_bloom": BlockException.INVALID_LOG_BLOOM,
+    "ommers_hash": BlockException.INVALID_UNCLES_HASH,
+    "difficulty": BlockException.INVALID_DIFFICULTY,
+    "gas_used": BlockException.INVALID_GAS_USED,
+    "base_fee_per_gas": BlockException.INVALID_BASEFEE_PER_GAS,
+    "withdrawals_root": BlockException.INVALID_WITHDRAWALS_ROOT,
+    "blob_gas_used": BlockException.INCORRECT_BLOB_GAS_USED,
+    "excess_blob_gas": BlockException.INCORRECT_EXCESS_BLOB_GAS,
+    "requests_hash": BlockException.INVALID_REQUESTS,
+    "block_access_list_hash": BlockException.INVALID_BAL_HASH,
+}
+"""Exception reported when a header field differs from the computed one."""
+
+
+class LocalClientExceptionMapper(ExceptionMapper):
+    """
+    Exception mapper of the local client, whose validation errors start with
+    the exceptions that the transition tool errors were mapped to.
+    """
+
+    mapping_substring: ClassVar[Dict[ExceptionBase, str]] = {}
+    mapping_regex: ClassVar[Dict[ExceptionBase, str]] = {
+        exception: rf"\b{exception_class.__name__}\.{exception.name}\b"
+        for exception_class in (TransactionException, BlockException)
+        for exception in exception_class
+    }
+
+
+class InvalidBlockError(Exception):
+    """Block found invalid by the local client."""
+
+    def __init__(self, exception: ExceptionBase | None, message: str) -> None:
+        """
+        Initialize the error with the exception matching the failure, if not
+        already included in the message, in the format of the validation
+        errors of the local client.
+        """
+        super().__init__(f"[{exception}] {message}" if exception is not None else message)
+
+
+def rlp_int(value: bytes) -> int:
+    """Decode an RLP encoded integer."""
+    return int.from_bytes(value, "big")
+
+
+def fork_from_environment(environment: Mapping[str, str]) -> Fork:
+    """Return the fork of the hive ruleset matching a client environment."""
+    ruleset_keys = {key for rules in ruleset.values() for key in rules}
+    fork_environment = {key: value for key, value in environment.items() if key in ruleset_keys}
+    for fork, rules in ruleset.items():
+        if {key: f"{value:d}" for key, value in rules.items()} == fork_environment:
+            return fork
+    raise ValueError(f"No fork in the hive ruleset matches the environment: {environment}")
+
+
+def decode_transaction(encoded: bytes | Sequence[Any]) -> Transaction:
+    """
+    Decode a signed transaction from its network encoding: the RLP list of a
+    legacy transaction, or the type byte followed by the RLP list of a typed
+    transaction.
+
+    Legacy transactions are also accepted already RLP decoded, as found in the
+    body of a block.
+    """
+    values: Any
+    if isinstance(encoded, bytes) and encoded and encoded[0] < 0x80:
+        ty = encoded[0]
+        values = rlp.decode(encoded[1:])
+    else:
+        ty = 0
+        values = rlp.decode(encoded) if isinstance(encoded, bytes) else encoded
+    if ty not in TRANSACTION_FIELDS:
+        raise ValueError(f"Unsupported transaction type: {ty}")
+    field_names = TRANSACTION_FIELDS[ty]
+    if not isinstance(values, Sequence) or len(values) != len(field_names):
+        raise ValueError(f"Invalid number of fields of a type {ty} transaction")
+
+    fields: Dict[str, Any] = {"ty": ty}
+    for name, value in zip(field_names, values, strict=True):
+        if name in NUMERIC_FIELDS:
+            fields[name] = rlp_int(value)
+        elif name == "to":
+            fields[name] = Address(value) if value else None
+        elif name == "access_list":
+            fields[name] = [
+                AccessList(address=Address(address), storage_keys=[Hash(key) for key in keys])
+                for address, keys in value
+            ]
+        elif name == "blob_versioned_hashes":
+            fields[name] = [Hash(versioned_hash) for versioned_hash in value]
+        elif name == "authorization_list":
+            fields[name] = [
+                AuthorizationTuple(
+                    chain_id=rlp_int(chain_id),
+                    address=Address(address),
+                    nonce=rlp_int(nonce),
+                    v=rlp_int(v),
+                    r=rlp_int(r),
+                    s=rlp_int(s),
+                )
+                for chain_id, address, nonce, v, r, s in value
+            ]
+        else:
+            fields[name] = Bytes(value)
+    if ty == 0:
+        if fields["v"] in (27, 28):
+            fields["protected"] = False
+        else:
+            fields["chain_id"] = (fields["v"] - 35) // 2
+    return Transaction(**fields).with_signature_and_sender()
+
+
+def decode_header(values: Sequence[bytes]) -> FixtureHeader:
+    """Decode a block header from its RLP decoded list of fields."""
+    field_names = [name for name in FixtureHeader.model_fields if name != "fork"]
+    if len(values) > len(field_names):
+        raise ValueError("Too many block header fields")
+    fields = {
+        name: rlp_int(value) if name in NUMERIC_FIELDS else value
+        for name, value in zip(field_names, values, strict=False)
+    }
+    return FixtureHeader(**fields)
+
+
+def decode_block(
+    encoded: bytes,
+) -> Tuple[FixtureHeader, List[Transaction], List[Withdrawal] | None]:
+    """Decode the header, transactions and withdrawals of an RLP block."""
+    decoded: Any = rlp.decode(encoded)
+    header, transactions, _ommers, *body = decoded
+    withdrawals = None
+    if body:
+        withdrawals = [
+            Withdrawal(
+                index=rlp_int(index),
+                validator_index=rlp_int(validator_index),
+                address=Address(address),
+                amount=rlp_int(amount),
+            )
+            for index, validator_index, address, amount in body[0]
+        ]
+    return (
+        decode_header(header),
+        [decode_transaction(transaction) for transaction in transactions],
+        withdrawals,
+    )
+
+
+@dataclass(kw_only=True)
+class LocalBlock:
+    """Valid block known to the local client, with its post-state."""
+
+    header: FixtureHeader
+    alloc: Alloc
+
+
+class LocalClientServer(ThreadingHTTPServer):
+    """HTTP server of one of the JSON-RPC ports of a local client."""
+
+    daemon_threads = True
+    client: "LocalClient"
+
+
+class LocalClientRequestHandler(BaseHTTPRequestHandler):
+    """Handle the JSON-RPC requests, single or batched, to a local client."""
+
+    protocol_version = "HTTP/1.1"
+    server: LocalClientServer
+
+    def do_POST(self) -> None:  # noqa: N802
+        """Serve a JSON-RPC request after the configured latency."""
+        client = self.server.client
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if client.latency:
+            time.sleep(client.latency)
+        response: Any
+        try:
+            request = json.loads(body)
+        except ValueError as e:
+            response = {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {"code": EngineAPIError.ParseError, "message": str(e)},
+            }
+        else:
+            if isinstance(request, list):
+                response = [client.handle_request(item) for item in request]
+            else:
+                response = client.handle_request(request)
+        data = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Silence the per-request logging of the HTTP server."""
+        pass
+
+
+class LocalClient:
+    """
+    Execution client stand-in that executes blocks with a transition tool.
+
+    The transition tool is shared by all the clients of a local hive, so its
+    evaluations are serialized with the given lock.
+    """
+
+    client_id: str
+    ip: str
+    fork: Fork
+    chain_id: int
+    latency: float
+    blocks: Dict[Hash, LocalBlock]
+    invalid_blocks: Dict[Hash, str]
+    head: Hash
+
+    def __init__(
+        self,
+        *,
+        client_id: str,
+        ip: str,
+        fork: Fork,
+        chain_id: int,
+        genesis: FixtureHeader,
+        pre: Alloc,
+        t8n: TransitionTool,
+        t8n_lock: "threading.Lock | None" = None,
+        latency: float = 0.0,
+    ) -> None:
+        """Initialize the client with its genesis block and state."""
+        self.client_id = client_id
+        self.ip = ip
+        self.fork = fork
+        self.chain_id = chain_id
+        self.t8n = t8n
+        self.t8n_lock = t8n_lock if t8n_lock is not None else threading.Lock()
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.blocks = {genesis.block_hash: LocalBlock(header=genesis, alloc=pre)}
+        self.invalid_blocks = {}
+        self.head = genesis.block_hash
+        self.servers: List[LocalClientServer] = []
+        self.eth_methods: Dict[str, Callable[..., Any]] = {
+            "eth_chainId": self.eth_chain_id,
+            "eth_blockNumber": self.eth_block_number,
+            "eth_getBlockByNumber": self.eth_get_block_by_number,
+            "eth_getBlockByHash": self.eth_get_block_by_hash,
+            "eth_getBalance": self.eth_get_balance,
+            "eth_getCode": self.eth_get_code,
+            "eth_getTransactionCount": self.eth_get_transaction_count,
+            "eth_getStorageAt": self.eth_get_storage_at,
+        }
+
+    @classmethod
+    def from_hive_config(
+        cls,
+        *,
+        client_id: str,
+        ip: str,
+        environment: Mapping[str, str],
+        files: Mapping[str, bytes],
+        t8n: TransitionTool,
+        t8n_lock: "threading.Lock | None" = None,
+        latency: float = 0.0,
+    ) -> "LocalClient":
+        """
+        Initialize a client from the environment and files that hive would
+        start the client container with, importing the blocks in the
+        `/blocks` folder, if any, as the hive clients do on start-up.
+        """
+        genesis = json.loads(files["/genesis.json"])
+        alloc = genesis.pop("alloc")
+        client = cls(
+            client_id=client_id,
+            ip=ip,
+            fork=fork_from_environment(environment),
+            chain_id=int(environment["HIVE_CHAIN_ID"], 0),
+            genesis=FixtureHeader.model_validate(genesis),
+            # The genesis allocation addresses lack the `0x` prefix
+            pre=Alloc.model_validate(
+                {f"0x{address.removeprefix('0x')}": account for address, account in alloc.items()}
+            ),
+            t8n=t8n,
+            t8n_lock=t8n_lock,
+            latency=latency,
+        )
+        for path in sorted(path for path in files if path.startswith("/blocks/")):
+            if not client.import_block(files[path]):
+                break
+        return client
+
+    def start(self) -> None:
+        """
+        Start serving the JSON-RPC ports, raising `OSError` if the address of
+        the client cannot be bound.
+        """
+        try:
+            for port in (ETH_PORT, ENGINE_PORT):
+                server = LocalClientServer((self.ip, port), LocalClientRequestHandler)
+                server.client = self
+                self.servers.append(server)
+        except OSError:
+            for server in self.servers:
+                server.server_close()
+            self.servers = []
+            raise
+        for server in self.servers:
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    def stop(self) -> None:
+        """Stop serving the JSON-RPC ports."""
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+        self.servers = []
+
+    def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Process a JSON-RPC request and return its response."""
+        response: Dict[str, Any] = {"jsonrpc": "2.0", "id": request.get("id")}
+        try:
+            with self.lock:
+                response["result"] = self.call(request["method"], request.get("params") or [])
+        except JSONRPCError as e:
+            response["error"] = {"code": e.code, "message": e.message}
+        except Exception as e:
+            logger.exception(f"Local client {self.client_id} failed to process a request")
+            response["error"] = {"code": EngineAPIError.InternalError, "message": str(e)}
+        return response
+
+    def call(self, method: str, params: List[Any]) -> Any:
+        """Call the method of the JSON-RPC request."""
+        if method.startswith("engine_newPayloadV"):
+            return self.engine_new_payload(int(method.removeprefix("engine_newPayloadV")), params)
+        if method.startswith("engine_forkchoiceUpdatedV"):
+            return self.engine_forkchoice_updated(params)
+        if method not in self.eth_methods:
+            raise JSONRPCError(EngineAPIError.MethodNotFound, f"Method not supported: {method}")
+        try:
+            return self.eth_methods[method](*params)
+        except (TypeError, ValueError) as e:
+            raise JSONRPCError(EngineAPIError.InvalidParams, str(e)) from e
+
+    def ancestors(self, block_hash: Hash) -> List[LocalBlock]:
+        """
+        Return the block with the given hash followed by its ancestors, up to
+        the ones accessible with the `BLOCKHASH` opcode.
+        """
+        ancestors: List[LocalBlock] = []
+        while block_hash in self.blocks and len(ancestors) <= BLOCK_HASHES_WINDOW:
+            block = self.blocks[block_hash]
+            ancestors.append(block)
+            block_hash = block.header.parent_hash
+        return ancestors
+
+    def verify_header(self, header: FixtureHeader, parent: FixtureHeader) -> None:
+        """Verify the header fields that do not depend on the execution."""
+        if header.number != parent.number + 1:
+            raise InvalidBlockError(
+                BlockException.INVALID_BLOCK_NUMBER,
+                f"block number {header.number} does not follow parent {parent.number}",
+            )
+        if header.timestamp <= parent.timestamp:
+            raise InvalidBlockError(
+                BlockException.INVALID_BLOCK_TIMESTAMP_OLDER_THAN_PARENT,
+                f"timestamp {header.timestamp} is not after parent {parent.timestamp}",
+            )
+        if len(header.extra_data) > MAX_EXTRA_DATA_SIZE:
+            raise InvalidBlockError(
+                BlockException.EXTRA_DATA_TOO_BIG,
+                f"extra data size {len(header.extra_data)} exceeds {MAX_EXTRA_DATA_SIZE}",
+            )
+        if header.gas_used > header.gas_limit:
+            raise InvalidBlockError(
+                BlockException.INVALID_GAS_USED_ABOVE_LIMIT,
+                f"gas used {header.gas_used} exceeds gas limit {header.gas_limit}",
+            )
+        parent_gas_limit = int(parent.gas_limit)
+        if self.fork.header_base_fee_required(
+            block_number=header.number, timestamp=header.timestamp
+        ) and not self.fork.header_base_fee_required(
+            block_number=parent.number, timestamp=parent.timestamp
+        ):
+            parent_gas_limit *= self.fork.base_fee_elasticity_multiplier(
+                block_number=header.number, timestamp=header.timestamp
+            )
+        if (
+            header.gas_limit < MIN_GAS_LIMIT
+            or abs(header.gas_limit - parent_gas_limit)
+            >= parent_gas_limit // GAS_LIMIT_BOUND_DIVISOR
+        ):
+            raise InvalidBlockError(
+                BlockException.INVALID_GASLIMIT,
+                f"gas limit {header.gas_limit} out of bounds of parent {parent_gas_limit}",
+            )
+
+    def execute_block(
+        self,
+        header: FixtureHeader,
+        block_hash: Hash,
+        transactions: List[Transaction],
+        withdrawals: List[Withdrawal] | None,
+    ) -> LocalBlock:
+        """
+        Execute a block on top of its parent with the transition tool and
+        verify that the header computed from the output matches the block
+        hash, raising `InvalidBlockError` otherwise.
+        """
+        ancestors = self.ancestors(header.parent_hash)
+        assert ancestors, f"Unknown parent {header.parent_hash}"
+        parent = ancestors[0]
+        self.verify_header(header, parent.header)
+
+        env = Environment(
+            fee_recipient=header.fee_recipient,
+            number=header.number,
+            timestamp=header.timestamp,
+            prev_randao=header.prev_randao,
+            gas_limit=header.gas_limit,
+            extra_data=header.extra_data,
+            withdrawals=withdrawals,
+            parent_beacon_block_root=header.parent_beacon_block_root,
+            parent_difficulty=parent.header.difficulty,
+            parent_timestamp=parent.header.timestamp,
+            parent_base_fee_per_gas=parent.header.base_fee_per_gas,
+            parent_blob_gas_used=parent.header.blob_gas_used,
+            parent_excess_blob_gas=parent.header.excess_blob_gas,
+            parent_gas_used=parent.header.gas_used,
+            parent_gas_limit=parent.header.gas_limit,
+            parent_ommers_hash=parent.header.ommers_hash,
+            block_hashes={
+                ancestor.header.number: ancestor.header.block_hash for ancestor in ancestors
+            },
+        ).set_fork_requirements(self.fork)
+        with self.t8n_lock:
+            output = self.t8n.evaluate(
+                transition_tool_data=TransitionTool.TransitionToolData(
+                    alloc=parent.alloc,
+                    txs=transactions,
+                    env=env,
+                    fork=self.fork,
+                    chain_id=self.chain_id,
+                    reward=self.fork.get_reward(block_number=env.number, timestamp=env.timestamp),
+                    blob_schedule=self.fork.blob_schedule(),
+                )
+            )
+        result = output.result
+        if result.rejected_transactions:
+            # The transition tool errors are already mapped to their exceptions
+            raise InvalidBlockError(None, str(result.rejected_transactions[0].error))
+        if result.block_exception is not None:
+            raise InvalidBlockError(None, str(result.block_exception))
+
+        blob_gas_used: int | None = None
+        if (
+            blob_gas_per_blob := self.fork.blob_gas_per_blob(
+                block_number=env.number, timestamp=env.timestamp
+            )
+        ) > 0:
+            blob_gas_used = blob_gas_per_blob * sum(
+                len(transaction.blob_versioned_hashes or []) for transaction in transactions
+            )
+        computed_header = FixtureHeader(
+            **(
+                result.model_dump(
+                    exclude_none=True, exclude={"blob_gas_used", "transactions_trie"}
+                )
+                | env.model_dump(exclude_none=True, exclude={"blob_gas_used"})
+            ),
+            blob_gas_used=blob_gas_used,
+            transactions_trie=Transaction.list_root(transactions),
+            extra_data=header.extra_data,
+            nonce=header.nonce,
+            fork=self.fork,
+        )
+        if computed_header.block_hash != block_hash:
+            for field, exception in HEADER_FIELD_EXCEPTIONS.items():
+                got, computed = getattr(header, field), getattr(computed_header, field)
+                if got != computed:
+                    raise InvalidBlockError(
+                        exception, f"{field} mismatch: got {got}, computed {computed}"
+                    )
+            raise InvalidBlockError(
+                BlockException.INVALID_BLOCK_HASH,
+                f"block hash mismatch: got {block_hash}, computed {computed_header.block_hash}",
+            )
+        return LocalBlock(header=computed_header, alloc=output.alloc)
+
+    def import_block(self, encoded: bytes) -> bool:
+        """
+        Import an RLP encoded block on top of its parent and make it the head
+        of the chain, returning whether it was valid.
+        """
+        try:
+            header, transactions, withdrawals = decode_block(encoded)
+            if header.parent_hash not in self.blocks:
+                raise InvalidBlockError(
+                    BlockException.UNKNOWN_PARENT, f"unknown parent {header.parent_hash}"
+                )
+            block = self.execute_block(header, header.block_hash, transactions, withdrawals)
+        except (InvalidBlockError, ValueError) as e:
+            logger.info(f"Local client {self.client_id} rejected block: {e}")
+            return False
+        self.blocks[header.block_hash] = block
+        self.head = header.block_hash
+        return True
+
+    @staticmethod
+    def payload_status(
+        status: PayloadStatusEnum,
+        latest_valid_hash: Hash | None = None,
+        validation_error: str | None = None,
+    ) -> Dict[str, Any]:
+        """Return the JSON representation of a payload status."""
+        return {
+            "status": status.value,
+            "latestValidHash": str(latest_valid_hash) if latest_valid_hash is not None else None,
+            "validationError": validation_error,
+        }
+
+    def engine_new_payload(self, version: int, params: List[Any]) -> Dict[str, Any]:
+        """`engine_newPayloadVX`: execute a payload on top of its parent."""
+        expected_params = 1 if version <= 2 else 3 if version == 3 else 4
+        if len(params) != expected_params:
+            raise JSONRPCError(
+                EngineAPIError.InvalidParams,
+                f"engine_newPayloadV{version} expects {expected_params} parameters, "
+                f"got {len(params)}",
+            )
+        try:
+            payload = FixtureExecutionPayload.model_validate(params[0])
+        except ValidationError as e:
+            raise JSONRPCError(EngineAPIError.InvalidParams, str(e)) from e
+        expected_version = self.fork.engine_new_payload_version(
+            block_number=payload.number, timestamp=payload.timestamp
+        )
+        if version != expected_version:
+            raise JSONRPCError(
+                EngineAPIError.UnsupportedFork,
+                f"engine_newPayloadV{version} is not supported by block {payload.number}, "
+                f"expected engine_newPayloadV{expected_version}",
+            )
+
+        if payload.block_hash in self.blocks:
+            return self.payload_status(PayloadStatusEnum.VALID, payload.block_hash)
+        if payload.block_hash in self.invalid_blocks:
+            return self.payload_status(
+                PayloadStatusEnum.INVALID,
+                payload.parent_hash,
+                self.invalid_blocks[payload.block_hash],
+            )
+        if payload.parent_hash not in self.blocks:
+            return self.payload_status(PayloadStatusEnum.SYNCING)
+
+        try:
+            try:
+                transactions = [decode_transaction(tx) for tx in payload.transactions]
+            except ValueError as e:
+                raise InvalidBlockError(BlockException.RLP_STRUCTURES_ENCODING, str(e)) from e
+            if version >= 3:
+                versioned_hashes = [Hash(versioned_hash) for versioned_hash in params[1]]
+                if versioned_hashes != [
+                    versioned_hash
+                    for transaction in transactions
+                    for versioned_hash in transaction.blob_versioned_hashes or []
+                ]:
+                    raise InvalidBlockError(
+                        BlockException.INVALID_VERSIONED_HASHES,
+                        "versioned hashes do not match the blob transactions",
+                    )
+            header = FixtureHeader(
+                **payload.model_dump(
+                    exclude={"block_hash", "transactions", "withdrawals", "block_access_list"},
+                    exclude_none=True,
+                ),
+                transactions_trie=Transaction.list_root(transactions),
+                withdrawals_root=(
+                    Withdrawal.list_root(payload.withdrawals)
+                    if payload.withdrawals is not None
+                    else None
+                ),
+                parent_beacon_block_root=Hash(params[2]) if version >= 3 else None,
+                requests_hash=(
+                    Hash(Requests(requests_lists=[Bytes(request) for request in params[3]]))
+                    if version >= 4
+                    else None
+                ),
+                block_access_list_hash=(
+                    payload.block_access_list.keccak256()
+                    if payload.block_access_list is not None
+                    else None
+                ),
+            )
+            block = self.execute_block(
+                header, payload.block_hash, transactions, payload.withdrawals
+            )
+        except InvalidBlockError as e:
+            self.invalid_blocks[payload.block_hash] = str(e)
+            return self.payload_status(PayloadStatusEnum.INVALID, payload.parent_hash, str(e))
+        self.blocks[payload.block_hash] = block
+        return self.payload_status(PayloadStatusEnum.VALID, payload.block_hash)
+
+    def engine_forkchoice_updated(self, params: List[Any]) -> Dict[str, Any]:
+        """`engine_forkchoiceUpdatedVX`: set the head of the chain."""
+        head = Hash(params[0]["headBlockHash"])
+        payload_status: Dict[str, Any]
+        if head in self.invalid_blocks:
+            payload_status = self.payload_status(
+                PayloadStatusEnum.INVALID, validation_error=self.invalid_blocks[head]
+            )
+        elif head not in self.blocks:
+            payload_status = self.payload_status(PayloadStatusEnum.SYNCING)
+        else:
+            self.head = head
+            if len(params) > 1 and params[1] is not None:
+                raise JSONRPCError(
+                    EngineAPIError.InvalidPayloadAttributes,
+                    "Payload building is not supported by the local client",
+                )
+            payload_status = self.payload_status(PayloadStatusEnum.VALID, head)
+        return {"payloadStatus": payload_status, "payloadId": None}
+
+    def canonical_block(self, block: str) -> LocalBlock | None:
+        """Return the canonical block of the given number or tag."""
+        if block in ("latest", "pending", "safe", "finalized"):
+            return self.blocks[self.head]
+        number = 0 if block == "earliest" else int(block, 16)
+        block_hash = self.head
+        while block_hash in self.blocks:
+            local_block = self.blocks[block_hash]
+            if local_block.header.number <= number:
+                return local_block if local_block.header.number == number else None
+            block_hash = local_block.header.parent_hash
+        return None
+
+    def account(self, address: str, block: str) -> Account | None:
+        """Return an account from the state of a canonical block."""
+        local_block = self.canonical_block(block)
+        if local_block is None:
+            raise JSONRPCError(EngineAPIError.ServerError, f"Unknown block: {block}")
+        return local_block.alloc.root.get(Address(address))
+
+    def eth_chain_id(self) -> str:
+        """`eth_chainId`: return the chain ID of the client."""
+        return hex(self.chain_id)
+
+    def eth_block_number(self) -> str:
+        """`eth_blockNumber`: return the number of the head block."""
+        return hex(self.blocks[self.head].header.number)
+
+    def eth_get_block_by_number(self, block: str, full_txs: bool = False) -> Any:
+        """`eth_getBlockByNumber`: return the header of a canonical block."""
+        del full_txs
+        local_block = self.canonical_block(block)
+        return to_json(local_block.header) if local_block is not None else None
+
+    def eth_get_block_by_hash(self, block_hash: str, full_txs: bool = False) -> Any:
+        """`eth_getBlockByHash`: return the header of a block."""
+        del full_txs
+        local_block = self.blocks.get(Hash(block_hash))
+        return to_json(local_block.header) if local_block is not None else None
+
+    def eth_get_balance(self, address: str, block: str = "latest") -> str:
+        """`eth_getBalance`: return the balance of an account."""
+        account = self.account(address, block)
+        return hex(account.balance if account is not None else 0)
+
+    def eth_get_code(self, address: str, block: str = "latest") -> str:
+        """`eth_getCode`: return the code of an account."""
+        account = self.account(address, block)
+        return str(account.code if account is not None else Bytes())
+
+    def eth_get_transaction_count(self, address: str, block: str = "latest") -> str:
+        """`eth_getTransactionCount`: return the nonce of an account."""
+        account = self.account(address, block)
+        return hex(account.nonce if account is not None else 0)
+
+    def eth_get_storage_at(self, address: str, key: str, block: str = "latest") -> str:
+        """`eth_getStorageAt`: return the value of a storage slot."""
+        account = self.account(address, block)
+        try:
+            value = account.storage[Hash(key)] if account is not None else 0
+        except KeyError:
+            value = 0
+        return str(Hash(value))
@@ -0,0 +1,291 @@
+"""
+Local, in-process stand-in for the hive simulator API.
+
+The `LocalHive` serves the endpoints of the hive simulator API used by the
+`hive` python package on a local port, and starts a `LocalClient`, backed by
+a transition tool, instead of a client container when a test starts a client.
+This allows running the consume simulators without hive or docker, e.g. to
+profile and benchmark the simulators themselves.
+
+Hive clients are reached on fixed ports of their container IP address, so each
+local client is served on its own address of the loopback network, which
+requires the whole `127.0.0.0/8` network to be routed to the loopback
+interface, as it is on Linux.
+"""
+
+import errno
+import ipaddress
+import json
+import re
+import threading
+from dataclasses import dataclass, field
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from typing import Any, Dict, Iterator, List
+
+from ethereum_clis import TransitionTool
+
+from ..custom_logging import get_logger
+from .local_client import LOCAL_CLIENT_NAME, LocalClient
+
+logger = get_logger(__name__)
+
+FIRST_CLIENT_ADDRESS = ipaddress.IPv4Address("127.0.0.2")
+CLIENT_ADDRESSES = 2**16
+"""Number of loopback addresses tried, in turn, for the local clients."""
+
+
+@dataclass(kw_only=True)
+class LocalHiveTest:
+    """Test started in the local hive, with its result once ended."""
+
+    name: str
+    description: str
+    result: Dict[str, Any] | None = None
+
+
+@dataclass(kw_only=True)
+class LocalHiveSuite:
+    """Test suite started in the local hive."""
+
+    name: str
+    description: str
+    tests: Dict[int, LocalHiveTest] = field(default_factory=dict)
+
+
+class LocalHiveServer(ThreadingHTTPServer):
+    """HTTP server of the local hive simulator API."""
+
+    daemon_threads = True
+    hive: "LocalHive"
+
+
+class LocalHiveRequestHandler(BaseHTTPRequestHandler):
+    """Handle the hive simulator API requests."""
+
+    server: LocalHiveServer
+
+    def respond(self, status: int, body: Any) -> None:
+        """Send a JSON response."""
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def read_body(self) -> bytes:
+        """Read the body of the request."""
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Serve the client types and the hive instance information."""
+        hive = self.server.hive
+        if self.path == "/clients":
+            self.respond(200, hive.client_types())
+        elif self.path == "/hive":
+            self.respond(200, hive.hive_info())
+        else:
+            self.respond(404, f"Not supported by the local hive: GET {self.path}")
+
+    def do_POST(self) -> None:  # noqa: N802
+        """Start suites, tests and clients, and end tests."""
+        hive = self.server.hive
+        body = self.read_body()
+        if self.path == "/testsuite":
+            request = json.loads(body)
+            self.respond(200, hive.start_suite(request["Name"], request["Description"]))
+        elif match := re.fullmatch(r"/testsuite/(\d+)/test", self.path):
+            request = json.loads(body)
+            self.respond(
+                200, hive.start_test(int(match[1]), request["Name"], request["Description"])
+            )
+        elif match := re.fullmatch(r"/testsuite/(\d+)/test/(\d+)", self.path):
+            hive.end_test(int(match[1]), int(match[2]), json.loads(body))
+            self.respond(200, None)
+        elif re.fullmatch(r"/testsuite/\d+/test/\d+/node", self.path):
+            form = parse_multipart_form(self.headers["Content-Type"], body)
+            config = json.loads(form.pop("config"))
+            try:
+                client = hive.start_client(config["environment"], form)
+            except Exception as e:
+                logger.exception("Local hive failed to start a client")
+                self.respond(500, f"Unable to start the local client: {e}")
+                return
+            self.respond(200, {"id": client.client_id, "ip": client.ip})
+        elif re.fullmatch(r"/testsuite/\d+/test/\d+/node/[^/]+/register/\d+", self.path):
+            self.respond(200, None)
+        else:
+            self.respond(404, f"Not supported by the local hive: POST {self.path}")
+
+    def do_DELETE(self) -> None:  # noqa: N802
+        """End suites and stop clients."""
+        hive = self.server.hive
+        if match := re.fullmatch(r"/testsuite/(\d+)", self.path):
+            hive.end_suite(int(match[1]))
+            self.respond(200, None)
+        elif match := re.fullmatch(r"/testsuite/\d+/test/\d+/node/([^/]+)", self.path):
+            hive.stop_client(match[1])
+            self.respond(200, None)
+        else:
+            self.respond(404, f"Not supported by the local hive: DELETE {self.path}")
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Silence the per-request logging of the HTTP server."""
+        pass
+
+
+def parse_multipart_form(content_type: str, body: bytes) -> Dict[str, bytes]:
+    """Return the fields and files of a `multipart/form-data` body by name."""
+    parser = BytesParser(policy=HTTP)  # type: ignore[arg-type]
+    message = parser.parsebytes(f"Content-Type: {content_type}\r\n\r\n".encode() + body)
+    form: Dict[str, bytes] = {}
+    for part in message.iter_parts():  # type: ignore[attr-defined]
+        name = part.get_param("name", header="content-disposition")
+        form[name] = part.get_payload(decode=True)
+    return form
+
+
+class LocalHive:
+    """
+    In-process stand-in for the hive simulator API, starting local clients
+    backed by a transition tool.
+
+    Suites started by other local hives are accepted, as the xdist workers
+    share the hive test suites and each runs its own local hive.
+    """
+
+    t8n: TransitionTool
+    latency: float
+    suites: Dict[int, LocalHiveSuite]
+    clients: Dict[str, LocalClient]
+
+    def __init__(self, *, t8n: TransitionTool, latency: float = 0.0) -> None:
+        """
+        Initialize the local hive with the transition tool of its clients and
+        the latency, in seconds, added to each JSON-RPC request they serve.
+        """
+        self.t8n = t8n
+        self.latency = latency
+        self.suites = {}
+        self.clients = {}
+        self.lock = threading.Lock()
+        self.t8n_lock = threading.Lock()
+        self.ids = count(1)
+        self.client_addresses = self.iter_client_addresses()
+        self.server: LocalHiveServer | None = None
+
+    @property
+    def url(self) -> str:
+        """Return the URL of the simulator API."""
+        assert self.server is not None, "Local hive not started"
+        host, port = self.server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def start(self) -> None:
+        """Start serving the simulator API on a free local port."""
+        self.server = LocalHiveServer(("127.0.0.1", 0), LocalHiveRequestHandler)
+        self.server.hive = self
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        logger.info(f"Local hive serving the simulator API at {self.url}")
+
+    def stop(self) -> None:
+        """Stop the running clients and the simulator API."""
+        for client_id in list(self.clients):
+            self.stop_client(client_id)
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def client_types(self) -> List[Dict[str, Any]]:
+        """Return the single client type of the local hive."""
+        return [
+            {
+                "name": LOCAL_CLIENT_NAME,
+                "version": self.t8n.version(),
+                "meta": {"roles": ["eth1"]},
+            }
+        ]
+
+    def hive_info(self) -> Dict[str, Any]:
+        """Return the hive instance information."""
+        return {
+            "command": ["local-hive", self.t8n.__class__.__name__],
+            "clientFile": [{"client": LOCAL_CLIENT_NAME}],
+            "commit": "",
+            "date": "",
+        }
+
+    def start_suite(self, name: str, description: str) -> int:
+        """Start a test suite and return its ID."""
+        suite_id = next(self.ids)
+        with self.lock:
+            self.suites[suite_id] = LocalHiveSuite(name=name, description=description)
+        return suite_id
+
+    def end_suite(self, suite_id: int) -> None:
+        """End a test suite."""
+        with self.lock:
+            self.suites.pop(suite_id, None)
+
+    def start_test(self, suite_id: int, name: str, description: str) -> int:
+        """Start a test of a suite and return its ID."""
+        test_id = next(self.ids)
+        with self.lock:
+            suite = self.suites.setdefault(
+                suite_id, LocalHiveSuite(name=f"suite {suite_id}", description="")
+            )
+            suite.tests[test_id] = LocalHiveTest(name=name, description=description)
+        return test_id
+
+    def end_test(self, suite_id: int, test_id: int, result: Dict[str, Any]) -> None:
+        """Record the result of a test."""
+        with self.lock:
+            self.suites[suite_id].tests[test_id].result = result
+
+    def iter_client_addresses(self) -> Iterator[str]:
+        """Iterate over the loopback addresses available to the clients."""
+        for index in count():
+            yield str(FIRST_CLIENT_ADDRESS + index % CLIENT_ADDRESSES)
+
+    def start_client(self, environment: Dict[str, str], files: Dict[str, bytes]) -> LocalClient:
+        """
+        Start a local client on the first loopback address whose ports are
+        free, as the clients of other processes may be using some of them.
+        """
+        client = LocalClient.from_hive_config(
+            client_id=f"local-{next(self.ids)}",
+            ip=str(FIRST_CLIENT_ADDRESS),
+            environment=environment,
+            files=files,
+            t8n=self.t8n,
+            t8n_lock=self.t8n_lock,
+            latency=self.latency,
+        )
+        for _ in range(CLIENT_ADDRESSES):
+            with self.lock:
+                client.ip = next(self.client_addresses)
+            try:
+                client.start()
+            except OSError as e:
+                if e.errno == errno.EADDRNOTAVAIL:
+                    raise Exception(
+                        f"Loopback address {client.ip} is not available; the local hive "
+                        "requires the 127.0.0.0/8 network to be routed to the loopback interface."
+                    ) from e
+                continue
+            with self.lock:
+                self.clients[client.client_id] = client
+            logger.info(f"Local client {client.client_id} started at {client.ip}")
+            return client
+        raise Exception("No loopback address with free client ports found")
+
+    def stop_client(self, client_id: str) -> None:
+        """Stop a running client."""
+        with self.lock:
+            client = self.clients.pop(client_id, None)
+        if client is not None:
+            client.stop()
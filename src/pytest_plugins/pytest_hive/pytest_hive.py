@@ -55,6 +55,8 @@ logger = get_logger(__name__)
 
 def pytest_configure(config: pytest.Config) -> None:  # noqa: D103
     hive_simulator_url = config.getoption("hive_simulator")
+    if config.getoption("local_hive"):
+        hive_simulator_url = start_local_hive(config)
     if hive_simulator_url is None:
         pytest.exit(
             "The HIVE_SIMULATOR environment variable is not set.\n\n"
@@ -98,6 +100,71 @@ def pytest_addoption(parser: pytest.Parser) -> None:  # noqa: D103
             "taken from the HIVE_SIMULATOR environment variable."
         ),
     )
+    pytest_hive_group.addoption(
+        "--local-hive",
+        action="store_true",
+        dest="local_hive",
+        default=False,
+        help=(
+            "Run the simulator against an in-process stand-in for hive, whose clients are backed "
+            "by a transition tool instead of client containers. Overrides --hive-simulator. "
+            "Linux only."
+        ),
+    )
+    pytest_hive_group.addoption(
+        "--local-hive-evm-bin",
+        action="store",
+        dest="local_hive_evm_bin",
+        type=Path,
+        default=None,
+        help=(
+            "Path to the evm executable providing `t8n` used by the --local-hive clients. "
+            "Default: `ethereum-spec-evm-resolver`."
+        ),
+    )
+    pytest_hive_group.addoption(
+        "--local-hive-latency",
+        action="store",
+        dest="local_hive_latency",
+        type=float,
+        default=0.0,
+        help=(
+            "Latency, in seconds, added by the --local-hive clients to each JSON-RPC request, "
+            "to emulate the network round-trip to a client container. Default: 0."
+        ),
+    )
+
+
+def start_local_hive(config: pytest.Config) -> str:
+    """Start the local hive stand-in and return its simulator URL."""
+    from ethereum_clis import TransitionTool
+
+    from .local_hive import LocalHive
+
+    evm_bin = config.getoption("local_hive_evm_bin")
+    try:
+        if evm_bin is None:
+            assert TransitionTool.default_tool is not None, "No default transition tool found"
+            t8n = TransitionTool.default_tool()
+        else:
+            t8n = TransitionTool.from_binary_path(binary_path=evm_bin)
+    except Exception as e:
+        pytest.exit(
+            f"Unable to start the transition tool of the local hive: {e}",
+            returncode=pytest.ExitCode.USAGE_ERROR,
+        )
+    local_hive = LocalHive(t8n=t8n, latency=config.getoption("local_hive_latency"))
+    local_hive.start()
+    config.local_hive = local_hive  # type: ignore[attr-defined]
+    return local_hive.url
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Stop the local hive stand-in and its transition tool, if started."""
+    local_hive = getattr(config, "local_hive", None)
+    if local_hive is not None:
+        local_hive.stop()
+        local_hive.t8n.shutdown()
 
 
 def get_hive_info(simulator: Simulation) -> HiveInfo | None:
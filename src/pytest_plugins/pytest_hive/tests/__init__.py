@@ -0,0 +1 @@
+"""Tests for the pytest hive plugin."""
@@ -0,0 +1,333 @@
+"""Test the local hive stand-in and its transition tool backed clients."""
+
+import io
+import json
+import socket
+import time
+from typing import Any, Generator, List, cast
+
+import pytest
+from hive.client import Client, ClientRole
+from hive.simulation import Simulation
+from hive.testing import HiveTest, HiveTestResult
+
+from ethereum_clis import Result, TransitionTool, TransitionToolOutput
+from ethereum_test_base_types import Account, Address, Hash, TestPrivateKey
+from ethereum_test_exceptions import (
+    BlockException,
+    EngineAPIError,
+    ExceptionBase,
+    TransactionException,
+)
+from ethereum_test_fixtures.blockchain import FixtureEngineNewPayload, FixtureHeader
+from ethereum_test_forks import Cancun, Fork, Prague, Shanghai
+from ethereum_test_rpc import EngineRPC, EthRPC
+from ethereum_test_rpc.rpc_types import ForkchoiceState, JSONRPCError
+from ethereum_test_types import (
+    Alloc,
+    AuthorizationTuple,
+    Environment,
+    Transaction,
+    Withdrawal,
+)
+from ethereum_test_types.trie import EMPTY_TRIE_ROOT
+
+from ...consume.simulators.single_test_client import to_client_environment, to_client_genesis
+from ..local_client import (
+    LOCAL_CLIENT_NAME,
+    LocalClientExceptionMapper,
+    decode_transaction,
+    fork_from_environment,
+)
+from ..local_hive import LocalHive
+
+FORK = Shanghai
+CHAIN_ID = 1
+BASE_FEE = 7
+PRE = Alloc({Address(0x1000): Account(balance=10**18, code=b"\x00", storage={1: 2})})
+
+
+class FakeTransitionTool:
+    """
+    Transition tool stand-in that returns the pre-state unchanged, and the
+    given state root, if any.
+    """
+
+    exception_mapper = LocalClientExceptionMapper()
+
+    def __init__(self) -> None:
+        """Initialize the fake transition tool."""
+        self.state_root: Hash | None = None
+        self.evaluations: List[TransitionTool.TransitionToolData] = []
+
+    def version(self) -> str:
+        """Return the version of the fake transition tool."""
+        return "fake-t8n"
+
+    def evaluate(
+        self, *, transition_tool_data: TransitionTool.TransitionToolData, **kwargs: Any
+    ) -> TransitionToolOutput:
+        """Return the pre-state as the post-state of the block."""
+        del kwargs
+        self.evaluations.append(transition_tool_data)
+        env = transition_tool_data.env
+        return TransitionToolOutput(
+            alloc=transition_tool_data.alloc,
+            result=Result(
+                state_root=self.state_root or transition_tool_data.alloc.state_root(),
+                transactions_trie=EMPTY_TRIE_ROOT,
+                receipts_root=EMPTY_TRIE_ROOT,
+                logs_hash=Hash(0),
+                logs_bloom=0,
+                receipts=[],
+                gas_used=0,
+                base_fee_per_gas=BASE_FEE,
+                withdrawals_root=(
+                    Withdrawal.list_root(env.withdrawals) if env.withdrawals is not None else None
+                ),
+            ),
+        )
+
+
+@pytest.fixture
+def t8n() -> FakeTransitionTool:
+    """Return the fake transition tool of the local clients."""
+    return FakeTransitionTool()
+
+
+@pytest.fixture
+def latency() -> float:
+    """Return the latency of the local clients."""
+    return 0.0
+
+
+@pytest.fixture
+def local_hive(t8n: FakeTransitionTool, latency: float) -> Generator[LocalHive, None, None]:
+    """Start a local hive with the fake transition tool."""
+    local_hive = LocalHive(t8n=cast(TransitionTool, t8n), latency=latency)
+    local_hive.start()
+    yield local_hive
+    local_hive.stop()
+
+
+@pytest.fixture
+def genesis() -> FixtureHeader:
+    """Return the genesis header of the local clients."""
+    env = Environment(number=0, timestamp=0, base_fee_per_gas=BASE_FEE)
+    return FixtureHeader.genesis(FORK, env.set_fork_requirements(FORK), PRE.state_root())
+
+
+@pytest.fixture
+def hive_test(local_hive: LocalHive) -> Generator[HiveTest, None, None]:
+    """Start a hive test on the local hive."""
+    simulator = Simulation(url=local_hive.url)
+    suite = simulator.start_suite(name="local-hive", description="Local hive test suite.")
+    test = suite.start_test(name="test", description="Local hive test.")
+    yield test
+    suite.end()
+
+
+@pytest.fixture
+def client(
+    local_hive: LocalHive, hive_test: HiveTest, genesis: FixtureHeader
+) -> Generator[Client, None, None]:
+    """Start a local client through the hive simulator API."""
+    simulator = Simulation(url=local_hive.url)
+    (client_type,) = simulator.client_types(role=ClientRole.ExecutionClient)
+    genesis_bytes = json.dumps(to_client_genesis(genesis, PRE)).encode()
+    client = hive_test.start_client(
+        client_type=client_type,
+        environment=to_client_environment(FORK, CHAIN_ID, 8551),
+        files={"/genesis.json": io.BufferedReader(cast(io.RawIOBase, io.BytesIO(genesis_bytes)))},
+    )
+    assert client is not None
+    yield client
+    client.stop()
+
+
+def next_payload(
+    parent: FixtureHeader, state_root: Hash | None = None, **kwargs: Any
+) -> FixtureEngineNewPayload:
+    """Return the payload of an empty block on top of the given parent."""
+    header = FixtureHeader(
+        parent_hash=parent.block_hash,
+        fee_recipient=parent.fee_recipient,
+        state_root=state_root or parent.state_root,
+        transactions_trie=EMPTY_TRIE_ROOT,
+        receipts_root=EMPTY_TRIE_ROOT,
+        logs_bloom=0,
+        difficulty=0,
+        number=parent.number + 1,
+        gas_limit=parent.gas_limit,
+        gas_used=0,
+        timestamp=parent.timestamp + 12,
+        extra_data=b"",
+        prev_randao=0,
+        nonce=0,
+        base_fee_per_gas=BASE_FEE,
+        withdrawals_root=Withdrawal.list_root([]),
+        fork=FORK,
+        **kwargs,
+    )
+    return FixtureEngineNewPayload.from_fixture_header(
+        fork=FORK, header=header, transactions=[], withdrawals=[], requests=None
+    )
+
+
+def test_client_types(local_hive: LocalHive) -> None:
+    """Test that the local hive reports its single client type."""
+    simulator = Simulation(url=local_hive.url)
+    (client_type,) = simulator.client_types(role=ClientRole.ExecutionClient)
+    assert client_type.name == LOCAL_CLIENT_NAME
+    assert client_type.version == "fake-t8n"
+    assert simulator.hive_instance()["clientFile"] == [{"client": LOCAL_CLIENT_NAME}]
+
+
+def test_test_result(local_hive: LocalHive, hive_test: HiveTest) -> None:
+    """Test that the local hive records the results of the tests."""
+    hive_test.end(result=HiveTestResult(test_pass=True, details="Test passed."))
+    (suite,) = local_hive.suites.values()
+    (test,) = suite.tests.values()
+    assert test.result == {"pass": True, "details": "Test passed."}
+
+
+def test_genesis(client: Client, genesis: FixtureHeader) -> None:
+    """Test that the client serves its genesis block and state."""
+    eth_rpc = EthRPC(f"http://{client.ip}:8545")
+    assert eth_rpc.chain_id() == CHAIN_ID
+    block = eth_rpc.get_block_by_number(0)
+    assert block is not None
+    assert Hash(block["hash"]) == genesis.block_hash
+    account = PRE.root[Address(0x1000)]
+    assert account is not None
+    assert eth_rpc.get_balance(Address(0x1000)) == account.balance
+    assert eth_rpc.get_code(Address(0x1000)) == account.code
+    assert eth_rpc.get_storage_at(Address(0x1000), Hash(1)) == Hash(2)
+    assert eth_rpc.get_transaction_count(Address(0x2000)) == 0
+
+
+def test_new_payload(client: Client, genesis: FixtureHeader, t8n: FakeTransitionTool) -> None:
+    """Test that valid payloads are executed and can become the head."""
+    engine_rpc = EngineRPC(f"http://{client.ip}:8551")
+    payload = next_payload(genesis)
+    status = engine_rpc.new_payload(*payload.params, version=payload.new_payload_version)
+    assert status.status == "VALID", status.validation_error
+    assert len(t8n.evaluations) == 1
+    assert t8n.evaluations[0].env.block_hashes == {0: genesis.block_hash}
+
+    block_hash = payload.params[0].block_hash
+    response = engine_rpc.forkchoice_updated(
+        ForkchoiceState(head_block_hash=block_hash), version=payload.forkchoice_updated_version
+    )
+    assert response.payload_status.status == "VALID"
+    eth_rpc = EthRPC(f"http://{client.ip}:8545")
+    assert eth_rpc.get_block_by_number("latest")["hash"] == str(block_hash)  # type: ignore[index]
+
+
+def test_invalid_payload(client: Client, genesis: FixtureHeader) -> None:
+    """Test that payloads whose state root mismatches are invalid."""
+    engine_rpc = EngineRPC(
+        f"http://{client.ip}:8551",
+        response_validation_context={"exception_mapper": LocalClientExceptionMapper()},
+    )
+    payload = next_payload(genesis, state_root=Hash(1))
+    status = engine_rpc.new_payload(*payload.params, version=payload.new_payload_version)
+    assert status.status == "INVALID"
+    assert status.latest_valid_hash == genesis.block_hash
+    assert status.validation_error is not None
+    assert BlockException.INVALID_STATE_ROOT in status.validation_error
+
+
+def test_unknown_parent(client: Client, genesis: FixtureHeader) -> None:
+    """Test that payloads with an unknown parent are reported as syncing."""
+    engine_rpc = EngineRPC(f"http://{client.ip}:8551")
+    payload = next_payload(genesis.model_copy(update={"block_hash": Hash(1)}))
+    status = engine_rpc.new_payload(*payload.params, version=payload.new_payload_version)
+    assert status.status == "SYNCING"
+
+
+def test_unsupported_version(client: Client, genesis: FixtureHeader) -> None:
+    """Test that payloads sent with the wrong method version are rejected."""
+    engine_rpc = EngineRPC(f"http://{client.ip}:8551")
+    payload = next_payload(genesis)
+    with pytest.raises(JSONRPCError) as e:
+        engine_rpc.new_payload(*payload.params, version=1)
+    assert e.value.code == EngineAPIError.UnsupportedFork
+
+
+@pytest.mark.parametrize("latency", [0.1])
+def test_latency(client: Client, latency: float) -> None:
+    """Test that the latency is added to each request."""
+    eth_rpc = EthRPC(f"http://{client.ip}:8545")
+    start = time.perf_counter()
+    eth_rpc.chain_id()
+    assert time.perf_counter() - start >= latency
+
+
+@pytest.mark.parametrize("fork", [Shanghai, Cancun, Prague])
+def test_fork_from_environment(fork: Fork) -> None:
+    """Test that the fork of a client is found from its hive environment."""
+    assert fork_from_environment(to_client_environment(fork, CHAIN_ID, 8551)) == fork
+
+
+@pytest.mark.parametrize(
+    "transaction",
+    [
+        Transaction(ty=0, to=0x1000, value=1, protected=False),
+        Transaction(ty=0, to=0x1000, value=1, data=b"\x01"),
+        Transaction(ty=1, to=0x1000, access_list=[]),
+        Transaction(ty=2, to=None, data=b"\x60\x00", max_priority_fee_per_gas=1),
+        Transaction(
+            ty=3,
+            to=0x1000,
+            max_fee_per_blob_gas=1,
+            blob_versioned_hashes=[Hash(0x01 << 248)],
+        ),
+        Transaction(
+            ty=4,
+            to=0x1000,
+            authorization_list=[
+                AuthorizationTuple(chain_id=1, address=0x2000, nonce=0, secret_key=TestPrivateKey)
+            ],
+        ),
+    ],
+    ids=["legacy", "legacy_protected", "access_list", "fee_market", "blob", "set_code"],
+)
+def test_decode_transaction(transaction: Transaction) -> None:
+    """Test that payload transactions are decoded along with their sender."""
+    transaction = transaction.with_signature_and_sender()
+    decoded = decode_transaction(transaction.rlp())
+    assert decoded.rlp() == transaction.rlp()
+    assert decoded.sender == transaction.sender
+
+
+@pytest.mark.parametrize(
+    "message,exception",
+    [
+        (
+            "[BlockException.INVALID_STATE_ROOT] state_root mismatch",
+            BlockException.INVALID_STATE_ROOT,
+        ),
+        (
+            "TransactionException.INSUFFICIENT_ACCOUNT_FUNDS: insufficient funds",
+            TransactionException.INSUFFICIENT_ACCOUNT_FUNDS,
+        ),
+    ],
+)
+def test_exception_mapper(message: str, exception: ExceptionBase) -> None:
+    """Test that the validation errors of the local clients are mapped."""
+    assert LocalClientExceptionMapper().message_to_exception(message) == [exception]
+
+
+def test_client_address_in_use(local_hive: LocalHive, genesis: FixtureHeader) -> None:
+    """Test that clients skip the addresses whose ports are already used."""
+    local_hive.client_addresses = iter(["127.0.99.1", "127.0.99.2"])
+    with socket.socket() as sock:
+        sock.bind(("127.0.99.1", 8551))
+        sock.listen()
+        client = local_hive.start_client(
+            to_client_environment(FORK, CHAIN_ID, 8551),
+            {"/genesis.json": json.dumps(to_client_genesis(genesis, PRE)).encode()},
+        )
+    assert client.ip == "127.0.99.2"
+    assert local_hive.clients == {client.client_id: client}
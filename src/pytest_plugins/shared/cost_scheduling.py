@@ -0,0 +1,335 @@
+"""
+Pytest plugin that schedules the tests across the xdist workers longest-first.
+
+The duration of every executed test is recorded, keyed by node id (which
+includes the fork the test is filled or consumed for), in pytest's cache at
+the end of the session. On the next run with `--dist load` or
+`--dist loadgroup`, the tests (or the xdist groups) are sent to the workers
+in order of decreasing duration, so that the few very long tests start first
+instead of landing late on a single worker.
+
+Tests without recorded duration are estimated from the durations of the same
+test for other forks, and otherwise from heuristics on the collected items
+(the `benchmark` and `slow` markers, and the gas benchmark value).
+"""
+
+import json
+import re
+import shutil
+import statistics
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+import pytest
+from xdist.remote import Producer  # type: ignore[import-untyped]
+from xdist.scheduler import (  # type: ignore[import-untyped]
+    LoadGroupScheduling,
+    LoadScheduling,
+)
+from xdist.workermanage import WorkerController  # type: ignore[import-untyped]
+
+from ethereum_test_types import EnvironmentDefaults
+
+TEST_DURATIONS_CACHE_KEY = "cost_scheduling/test_durations"
+TEST_DURATION_PROPERTY = "test_duration"
+COST_FACTORS_FILE_NAME = "cost_factors.json"
+
+DEFAULT_TEST_COST = 1.0
+BENCHMARK_COST_FACTOR = 20.0
+SLOW_COST_FACTOR = 10.0
+# Number of chunks of the estimated cost of each worker that are sent at most
+# in a single batch, so that long tests are sent one at a time
+CHUNKS_PER_WORKER = 32
+
+# Matches the fork parameter in the ids of the parameters of a test, but not
+# `fork_` within its module or function name.
+FORK_PARAMETER_PATTERN = re.compile(r"(?<=[\[-])fork_[^-\]]+(?=[-\]])")
+
+
+def cost_factor(item: pytest.Item) -> float:
+    """
+    Return the estimated cost of a test relative to an average test, used
+    when the test has no recorded duration.
+    """
+    factor = 1.0
+    if item.get_closest_marker("benchmark") is not None:
+        factor *= BENCHMARK_COST_FACTOR
+        callspec = getattr(item, "callspec", None)
+        gas_benchmark_value = callspec.params.get("gas_benchmark_value") if callspec else None
+        if isinstance(gas_benchmark_value, int):
+            factor *= max(gas_benchmark_value / EnvironmentDefaults.gas_limit, 1.0)
+    if item.get_closest_marker("slow") is not None:
+        factor *= SLOW_COST_FACTOR
+    return factor
+
+
+def fork_agnostic_node_id(node_id: str) -> str:
+    """Return the node id of a test with its fork parameter removed."""
+    return FORK_PARAMETER_PATTERN.sub("fork", node_id)
+
+
+class CostEstimator:
+    """
+    Estimate the cost of the tests from their recorded durations and, when
+    missing, from the durations of the same test for other forks or from the
+    cost factors of the collected items.
+    """
+
+    durations: Dict[str, float]
+    cost_factors_path: Path | None
+    _cost_factors: Dict[str, float] | None
+    _fork_agnostic_durations: Dict[str, float] | None
+
+    def __init__(self, durations: Dict[str, float], cost_factors_path: Path | None) -> None:
+        """Initialize the estimator with the durations of previous runs."""
+        self.durations = durations
+        self.cost_factors_path = cost_factors_path
+        self._cost_factors = None
+        self._fork_agnostic_durations = None
+        self.default_cost = (
+            statistics.median(durations.values()) if durations else DEFAULT_TEST_COST
+        )
+
+    @property
+    def cost_factors(self) -> Dict[str, float]:
+        """
+        Return the cost factors written by the first worker once the
+        collection is complete.
+        """
+        if self._cost_factors is None:
+            cost_factors: Dict[str, float] = {}
+            if self.cost_factors_path is not None and self.cost_factors_path.exists():
+                cost_factors = json.loads(self.cost_factors_path.read_text())
+            self._cost_factors = cost_factors
+        return self._cost_factors
+
+    @property
+    def fork_agnostic_durations(self) -> Dict[str, float]:
+        """Return the mean duration of each test across the recorded forks."""
+        if self._fork_agnostic_durations is None:
+            durations: Dict[str, List[float]] = {}
+            for node_id, duration in self.durations.items():
+                durations.setdefault(fork_agnostic_node_id(node_id), []).append(duration)
+            self._fork_agnostic_durations = {
+                node_id: statistics.fmean(values) for node_id, values in durations.items()
+            }
+        return self._fork_agnostic_durations
+
+    def cost(self, node_id: str) -> float:
+        """Return the estimated cost of a test in seconds."""
+        duration = self.durations.get(node_id)
+        if duration is not None:
+            return duration
+        duration = self.fork_agnostic_durations.get(fork_agnostic_node_id(node_id))
+        if duration is not None:
+            return duration
+        return self.default_cost * self.cost_factors.get(node_id, 1.0)
+
+
+class CostLoadScheduling(LoadScheduling):
+    """
+    Load scheduling that sends the tests to the workers in order of
+    decreasing estimated cost, in batches whose cost is bounded so that the
+    longest tests are sent one at a time to the first idle worker.
+    """
+
+    cost_estimator: CostEstimator
+    costs: List[float] | None
+    max_batch_cost: float
+
+    def __init__(
+        self, config: pytest.Config, log: Producer | None = None, *, cost_estimator: CostEstimator
+    ) -> None:
+        """Initialize the scheduler with the test cost estimator."""
+        super().__init__(config, log)
+        self.cost_estimator = cost_estimator
+        self.costs = None
+        self.max_batch_cost = 0.0
+
+    def _sort_pending(self) -> None:
+        assert self.collection is not None
+        self.costs = [self.cost_estimator.cost(node_id) for node_id in self.collection]
+        costs = self.costs
+        self.pending.sort(key=lambda index: -costs[index])
+        self.max_batch_cost = sum(costs) / (len(self.node2pending) * CHUNKS_PER_WORKER)
+
+    def _send_tests(self, node: WorkerController, num: int) -> None:
+        if self.costs is None:
+            self._sort_pending()
+        assert self.costs is not None
+        # Workers only start a test once the next one is known, so keep at
+        # least two tests pending on each worker.
+        min_num = max(1, 2 - len(self.node2pending[node]))
+        batch_cost = 0.0
+        batch_num = 0
+        for index in self.pending[:num]:
+            if batch_num >= min_num and batch_cost + self.costs[index] > self.max_batch_cost:
+                break
+            batch_cost += self.costs[index]
+            batch_num += 1
+        super()._send_tests(node, batch_num)
+
+
+class CostLoadGroupScheduling(LoadGroupScheduling):
+    """
+    Load group scheduling that sends the xdist groups to the workers in order
+    of decreasing total estimated cost of their tests.
+    """
+
+    cost_estimator: CostEstimator
+    sorted_workqueue: bool
+
+    def __init__(
+        self, config: pytest.Config, log: Producer | None = None, *, cost_estimator: CostEstimator
+    ) -> None:
+        """Initialize the scheduler with the test cost estimator."""
+        super().__init__(config, log)
+        self.cost_estimator = cost_estimator
+        self.sorted_workqueue = False
+
+    def _assign_work_unit(self, node: WorkerController) -> None:
+        if not self.sorted_workqueue:
+            work_units = sorted(
+                self.workqueue.items(),
+                key=lambda item: -sum(self.cost_estimator.cost(node_id) for node_id in item[1]),
+            )
+            self.workqueue.clear()
+            self.workqueue.update(work_units)
+            self.sorted_workqueue = True
+        super()._assign_work_unit(node)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add cost scheduling command-line options to pytest."""
+    cost_scheduling_group = parser.getgroup(
+        "cost scheduling", "Arguments defining the scheduling of tests across xdist workers"
+    )
+    cost_scheduling_group.addoption(
+        "--no-cost-scheduling",
+        action="store_false",
+        dest="cost_scheduling",
+        default=True,
+        help=(
+            "Don't send the tests to the xdist workers longest-first based on the durations "
+            "recorded by previous runs in pytest's cache, and don't record the durations of "
+            "this run."
+        ),
+    )
+
+
+def cost_scheduling_enabled(config: pytest.Config) -> bool:
+    """Return whether cost scheduling is enabled for the session."""
+    return config.getoption("cost_scheduling") and getattr(config, "cache", None) is not None
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    On the main process, record the durations of the tests and, on the xdist
+    controller, create the folder where the first worker writes the cost
+    factors of the collected tests.
+    """
+    config.cost_factors_folder = None  # type: ignore[attr-defined]
+    if not cost_scheduling_enabled(config) or hasattr(config, "workerinput"):
+        return
+    config.pluginmanager.register(DurationRecorder(config), "test-duration-recorder")
+    if config.getoption("dist", "no") in ("load", "loadgroup"):
+        config.cost_factors_folder = Path(  # type: ignore[attr-defined]
+            tempfile.mkdtemp(prefix="pytest-cost-scheduling-")
+        )
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Remove the cost factors folder."""
+    cost_factors_folder: Path | None = getattr(config, "cost_factors_folder", None)
+    if cost_factors_folder is not None:
+        shutil.rmtree(cost_factors_folder, ignore_errors=True)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node: WorkerController) -> None:
+    """Pass the cost factors folder to the xdist workers."""
+    cost_factors_folder: Path | None = node.config.cost_factors_folder
+    if cost_factors_folder is not None:
+        node.workerinput["cost_factors_folder"] = str(cost_factors_folder)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config: pytest.Config, log: Producer) -> Any:
+    """Create a scheduler that sends the tests longest-first."""
+    cost_factors_folder: Path | None = config.cost_factors_folder  # type: ignore[attr-defined]
+    if cost_factors_folder is None:
+        return None
+    assert config.cache is not None
+    cost_estimator = CostEstimator(
+        durations=config.cache.get(TEST_DURATIONS_CACHE_KEY, {}),
+        cost_factors_path=cost_factors_folder / COST_FACTORS_FILE_NAME,
+    )
+    if config.getoption("dist") == "loadgroup":
+        return CostLoadGroupScheduling(config, log, cost_estimator=cost_estimator)
+    return CostLoadScheduling(config, log, cost_estimator=cost_estimator)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(
+    session: pytest.Session, config: pytest.Config, items: List[pytest.Item]
+) -> None:
+    """
+    Write the cost factors of the collected tests for the scheduler of the
+    xdist controller, which doesn't collect the tests itself.
+
+    All workers collect the same tests, so only the first one writes them.
+    """
+    del session
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None or workerinput["workerid"] != "gw0":
+        return
+    cost_factors_folder = workerinput.get("cost_factors_folder")
+    if cost_factors_folder is None:
+        return
+    cost_factors = {item.nodeid: cost_factor(item) for item in items}
+    (Path(cost_factors_folder) / COST_FACTORS_FILE_NAME).write_text(
+        json.dumps({node_id: factor for node_id, factor in cost_factors.items() if factor != 1.0})
+    )
+
+
+def recorded_duration(reports: Sequence[pytest.TestReport]) -> float:
+    """
+    Return the duration of a test from its reports: the duration recorded by
+    the test itself, if any, or the total duration of its phases.
+    """
+    for report in reports:
+        for name, value in report.user_properties:
+            if name == TEST_DURATION_PROPERTY:
+                return float(value)  # type: ignore[arg-type]
+    return sum(report.duration for report in reports)
+
+
+class DurationRecorder:
+    """
+    Record the duration of the tests executed by the session, on the main
+    process, and merge them into pytest's cache at the end of the session.
+    """
+
+    config: pytest.Config
+    reports: Dict[str, List[pytest.TestReport]]
+
+    def __init__(self, config: pytest.Config) -> None:
+        """Initialize the recorder."""
+        self.config = config
+        self.reports = {}
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        """Collect the reports of each test."""
+        self.reports.setdefault(report.nodeid, []).append(report)
+
+    def pytest_sessionfinish(self, session: pytest.Session, exitstatus: int) -> None:
+        """Merge the durations of the tests of this run into the cache."""
+        del session, exitstatus
+        if not self.reports:
+            return
+        assert self.config.cache is not None
+        durations: Dict[str, float] = self.config.cache.get(TEST_DURATIONS_CACHE_KEY, {})
+        for node_id, reports in self.reports.items():
+            durations[node_id] = round(recorded_duration(reports), 6)
+        self.config.cache.set(TEST_DURATIONS_CACHE_KEY, durations)
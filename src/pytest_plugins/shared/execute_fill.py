@@ -245,3 +245,13 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         default=None,
         help=("Enable reading and filling from static test files."),
     )
+    static_filler_group.addoption(
+        "--no-static-filler-cache",
+        action="store_false",
+        dest="static_filler_cache",
+        default=True,
+        help=(
+            "Disable the collection cache of static test files and always fully parse and "
+            "validate every static test during collection."
+        ),
+    )
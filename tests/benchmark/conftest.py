@@ -16,10 +16,10 @@ def pytest_generate_tests(metafunc: Any) -> None:
     tests.
     """
     benchmark_dir = Path(__file__).parent
-    test_file_path = Path(metafunc.definition.fspath)
+    test_file_path = metafunc.definition.path
 
     # Check if this test is in the benchmark directory
-    is_in_benchmark_dir = benchmark_dir in test_file_path.parents
+    is_in_benchmark_dir = test_file_path.is_relative_to(benchmark_dir)
 
     if is_in_benchmark_dir:
         # Add benchmark marker if no valid_from marker exists
@@ -40,7 +40,7 @@ def pytest_collection_modifyitems(config: Any, items: Any) -> None:
     if gen_docs:
         for item in items:
             if (
-                benchmark_dir in Path(item.fspath).parents
+                item.path.is_relative_to(benchmark_dir)
                 and not item.get_closest_marker("benchmark")
                 and not item.get_closest_marker("stateful")
             ):
@@ -57,7 +57,7 @@ def pytest_collection_modifyitems(config: Any, items: Any) -> None:
 
     items_for_removal = []
     for i, item in enumerate(items):
-        is_in_benchmark_dir = benchmark_dir in Path(item.fspath).parents
+        is_in_benchmark_dir = item.path.is_relative_to(benchmark_dir)
         has_stateful_marker = item.get_closest_marker("stateful")
         is_benchmark_test = (
             is_in_benchmark_dir and not has_stateful_marker
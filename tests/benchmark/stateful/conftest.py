@@ -14,9 +14,9 @@ def pytest_generate_tests(metafunc: Any) -> None:
     specification.
     """
     state_dir = Path(__file__).parent
-    test_file_path = Path(metafunc.definition.fspath)
+    test_file_path = metafunc.definition.path
 
-    if state_dir in test_file_path.parents:
+    if test_file_path.is_relative_to(state_dir):
         has_valid_from = any(
             marker.name == "valid_from" for marker in metafunc.definition.iter_markers()
         )
@@ -38,8 +38,7 @@ def pytest_collection_modifyitems(config: Any, items: Any) -> None:
     items_to_remove = []
 
     for i, item in enumerate(items):
-        item_path = Path(item.fspath)
-        is_in_state_dir = state_dir in item_path.parents
+        is_in_state_dir = item.path.is_relative_to(state_dir)
 
         # Add stateful marker to tests in state directory that don't have it
         if is_in_state_dir and not item.get_closest_marker("stateful"):
@@ -62,6 +61,5 @@ def pytest_collection_modifyitems(config: Any, items: Any) -> None:
 def _add_stateful_markers_for_docs(items: Any, state_dir: Any) -> None:
     """Add stateful markers for documentation generation."""
     for item in items:
-        item_path = Path(item.fspath)
-        if state_dir in item_path.parents and not item.get_closest_marker("stateful"):
+        if item.path.is_relative_to(state_dir) and not item.get_closest_marker("stateful"):
             item.add_marker(pytest.mark.stateful)